@@ -0,0 +1,76 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from wms.models import Location, Product, ProductLot, StockMovement, Warehouse
+
+
+class StockBatchApiTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="api-batch")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        warehouse = Warehouse.objects.create(name="API Batch WH", code="ABW")
+        self.location = Location.objects.create(
+            warehouse=warehouse, zone="A", aisle="01", shelf="001"
+        )
+        self.product = Product.objects.create(sku="API-BATCH-001", name="API batch product")
+        self.url = "/api/v1/stock/batch/"
+
+    def _receive(self, quantity):
+        return {
+            "op": "receive",
+            "product_id": self.product.id,
+            "quantity": quantity,
+            "location_id": self.location.id,
+        }
+
+    def test_batch_receives_every_item_and_returns_per_item_results(self):
+        response = self.client.post(
+            self.url,
+            {"operations": [self._receive(2), self._receive(3)]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["committed"])
+        self.assertEqual(response.data["applied"], 2)
+        self.assertEqual([item["quantity"] for item in response.data["results"]], [2, 3])
+        self.assertEqual(ProductLot.objects.filter(product=self.product).count(), 2)
+
+    def test_atomic_failure_returns_400_and_writes_nothing(self):
+        response = self.client.post(
+            self.url,
+            {"operations": [self._receive(2), {"op": "adjust", "lot_id": 999999, "delta": 1}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.data["committed"])
+        self.assertEqual(response.data["results"][1]["detail"], "Lot introuvable.")
+        self.assertFalse(StockMovement.objects.exists())
+
+    def test_partial_mode_applies_valid_items(self):
+        response = self.client.post(
+            self.url,
+            {
+                "mode": "partial",
+                "operations": [self._receive(2), {"op": "adjust", "lot_id": 999999, "delta": 1}],
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data["applied"], response.data["failed"]), (1, 1))
+        self.assertEqual(StockMovement.objects.count(), 1)
+
+    def test_schema_errors_are_reported_per_item(self):
+        response = self.client.post(
+            self.url,
+            {"operations": [self._receive(1), {"op": "transfer", "lot_id": 1}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["operations"][0], {})
+        self.assertIn("location_id", response.data["operations"][1])
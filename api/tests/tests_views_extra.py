@@ -283,3 +283,24 @@ class ApiViewsExtraTests(TestCase):
         event.refresh_from_db()
         self.assertEqual(event.status, IntegrationStatus.PENDING)
         self.assertIsNone(event.processed_at)
+
+    def test_integration_event_partial_update_rejects_notification_outbox_event(self):
+        event = IntegrationEvent.objects.create(
+            direction=IntegrationDirection.OUTBOUND,
+            source="wms.notification",
+            target="email",
+            event_type="notification",
+            status=IntegrationStatus.PENDING,
+            payload={"subject": "Test", "recipients": ["ops@example.com"]},
+        )
+        response = self.integration_client.patch(
+            f"/api/v1/integrations/events/{event.id}/",
+            {"status": IntegrationStatus.PROCESSED},
+            format="json",
+            **self.integration_headers,
+        )
+
+        self.assertEqual(response.status_code, 400)
+        event.refresh_from_db()
+        self.assertEqual(event.status, IntegrationStatus.PENDING)
+        self.assertIsNone(event.processed_at)
@@ -1,5 +1,15 @@
 from rest_framework import serializers
 
+from wms.domain.stock_batch import (
+    STOCK_BATCH_MAX_OPERATIONS,
+    STOCK_BATCH_MODE_ATOMIC,
+    STOCK_BATCH_MODES,
+    STOCK_OPERATION_ADJUST,
+    STOCK_OPERATION_CONSUME,
+    STOCK_OPERATION_INPUTS,
+    STOCK_OPERATION_RECEIVE,
+    STOCK_OPERATION_TRANSFER,
+)
 from wms.models import (
     Destination,
     IntegrationEvent,
@@ -104,6 +114,53 @@ class ReceiveStockSerializer(serializers.Serializer):
     source_receipt_id = serializers.IntegerField(required=False, allow_null=True)
 
 
+class StockBatchOperationSerializer(serializers.Serializer):
+    REQUIRED_FIELDS = {
+        STOCK_OPERATION_RECEIVE: ("product_id", "quantity", "location_id"),
+        STOCK_OPERATION_ADJUST: ("lot_id", "delta"),
+        STOCK_OPERATION_TRANSFER: ("lot_id", "location_id"),
+        STOCK_OPERATION_CONSUME: ("product_id", "quantity"),
+    }
+
+    op = serializers.ChoiceField(choices=sorted(STOCK_OPERATION_INPUTS))
+    product_id = serializers.IntegerField(required=False)
+    lot_id = serializers.IntegerField(required=False)
+    location_id = serializers.IntegerField(required=False)
+    quantity = serializers.IntegerField(required=False, min_value=1)
+    delta = serializers.IntegerField(required=False)
+    lot_code = serializers.CharField(required=False, allow_blank=True)
+    received_on = serializers.DateField(required=False, allow_null=True)
+    expires_on = serializers.DateField(required=False, allow_null=True)
+    status = serializers.ChoiceField(
+        choices=ProductLotStatus.choices,
+        required=False,
+        allow_blank=True,
+        allow_null=True,
+    )
+    storage_conditions = serializers.CharField(required=False, allow_blank=True)
+    source_receipt_id = serializers.IntegerField(required=False, allow_null=True)
+    shipment_id = serializers.IntegerField(required=False, allow_null=True)
+    reason_code = serializers.CharField(required=False, allow_blank=True)
+    reason_notes = serializers.CharField(required=False, allow_blank=True)
+
+    def validate(self, attrs):
+        missing = {
+            field: "Ce champ est obligatoire."
+            for field in self.REQUIRED_FIELDS[attrs["op"]]
+            if attrs.get(field) is None
+        }
+        if missing:
+            raise serializers.ValidationError(missing)
+        return attrs
+
+
+class StockBatchSerializer(serializers.Serializer):
+    mode = serializers.ChoiceField(choices=STOCK_BATCH_MODES, default=STOCK_BATCH_MODE_ATOMIC)
+    operations = StockBatchOperationSerializer(
+        many=True, allow_empty=False, max_length=STOCK_BATCH_MAX_OPERATIONS
+    )
+
+
 class PackCartonSerializer(serializers.Serializer):
     product_id = serializers.IntegerField()
     quantity = serializers.IntegerField(min_value=1)
@@ -35,6 +35,7 @@ from .views import (
     PackCartonView,
     ProductViewSet,
     ReceiveStockView,
+    StockBatchView,
 )
 
 router = DefaultRouter()
@@ -52,6 +53,7 @@ router.register("integrations/events", IntegrationEventViewSet, basename="integr
 
 urlpatterns = [
     path("stock/receive/", ReceiveStockView.as_view(), name="stock-receive"),
+    path("stock/batch/", StockBatchView.as_view(), name="stock-batch"),
     path("pack/", PackCartonView.as_view(), name="pack"),
     path("ui/dashboard/", UiDashboardView.as_view(), name="ui-dashboard"),
     path("ui/cartons/", UiCartonsView.as_view(), name="ui-cartons"),
@@ -10,6 +10,12 @@ from rest_framework.views import APIView
 from wms.domain.dto import PackCartonInput, ReceiveStockInput
 from wms.domain.orders import prepare_order, reserve_stock_for_order
 from wms.domain.stock import StockError, pack_carton_from_input, receive_stock_from_input
+from wms.domain.stock_batch import (
+    RESULT_APPLIED,
+    RESULT_FAILED,
+    apply_stock_batch,
+    stock_operation_from_data,
+)
 from wms.emailing import EMAIL_QUEUE_EVENT_TYPE, EMAIL_QUEUE_SOURCE
 from wms.models import (
     Destination,
@@ -20,6 +26,7 @@ from wms.models import (
     Product,
     Shipment,
 )
+from wms.notification_outbox import OUTBOX_EVENT_TYPE, OUTBOX_SOURCE
 
 from .integration_filters import (
     apply_integration_destination_filters,
@@ -37,8 +44,15 @@ from .serializers import (
     PackCartonSerializer,
     ProductSerializer,
     ReceiveStockSerializer,
+    StockBatchSerializer,
 )
 
+# Queued outbound events owned by the WMS senders; integration clients may only read them.
+READ_ONLY_OUTBOUND_EVENTS = {
+    (EMAIL_QUEUE_SOURCE, EMAIL_QUEUE_EVENT_TYPE),
+    (OUTBOX_SOURCE, OUTBOX_EVENT_TYPE),
+}
+
 
 class ProductAccessPermission(IntegrationKeyOrAuth):
     pass
@@ -101,6 +115,44 @@ class ReceiveStockView(APIView):
         )
 
 
+class StockBatchView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = StockBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        operations = [
+            stock_operation_from_data(item) for item in serializer.validated_data["operations"]
+        ]
+        try:
+            result = apply_stock_batch(
+                user=request.user,
+                operations=operations,
+                mode=serializer.validated_data["mode"],
+            )
+        except StockError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {
+                "mode": result.mode,
+                "committed": result.committed,
+                "applied": result.count(RESULT_APPLIED),
+                "failed": result.count(RESULT_FAILED),
+                "results": [
+                    {
+                        "index": item.index,
+                        "op": item.op,
+                        "status": item.status,
+                        "detail": item.detail,
+                        **item.data,
+                    }
+                    for item in result.results
+                ],
+            },
+            status=status.HTTP_200_OK if result.committed else status.HTTP_400_BAD_REQUEST,
+        )
+
+
 class PackCartonView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -189,11 +241,14 @@ class IntegrationEventViewSet(
         event = serializer.instance
         if (
             event.direction == IntegrationDirection.OUTBOUND
-            and event.source == EMAIL_QUEUE_SOURCE
-            and event.event_type == EMAIL_QUEUE_EVENT_TYPE
+            and (event.source, event.event_type) in READ_ONLY_OUTBOUND_EVENTS
         ):
             raise ValidationError(
-                {"detail": ("Outbound email queue events are read-only via this API.")}
+                {
+                    "detail": (
+                        "Outbound email and notification queue events are read-only via this API."
+                    )
+                }
             )
         status_value = serializer.validated_data.get("status")
         processed_at = serializer.validated_data.get("processed_at")
@@ -196,6 +196,19 @@ SHORT_DATETIME_FORMAT = "d/m/Y H:i"
 
 STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
+# Hashed names need a collectstatic manifest, so development and tests keep plain names.
+STATIC_MANIFEST_STORAGE = _env_bool("STATIC_MANIFEST_STORAGE", not DEBUG and not RUNNING_TESTS)
+STATIC_SERVE_FROM_APP = _env_bool("STATIC_SERVE_FROM_APP", False)
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": (
+            "wms.static_assets.CompressedManifestStaticFilesStorage"
+            if STATIC_MANIFEST_STORAGE
+            else "django.contrib.staticfiles.storage.StaticFilesStorage"
+        )
+    },
+}
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
@@ -264,6 +277,8 @@ PRINT_PACK_TEMPLATE_DIRS = _env_list("PRINT_PACK_TEMPLATE_DIRS")
 if not PRINT_PACK_TEMPLATE_DIRS:
     PRINT_PACK_TEMPLATE_DIRS = [str(BASE_DIR / "data" / "print_templates")]
 PRINT_PACK_XLSX_FALLBACK_ENABLED = _env_bool("PRINT_PACK_XLSX_FALLBACK_ENABLED", False)
+LOCAL_DOCUMENT_HELPER_JOB_DIR = os.environ.get("LOCAL_DOCUMENT_HELPER_JOB_DIR", "").strip()
+LOCAL_DOCUMENT_HELPER_JOB_TTL_SECONDS = _env_int("LOCAL_DOCUMENT_HELPER_JOB_TTL_SECONDS", 600)
 ACCOUNT_REQUEST_THROTTLE_SECONDS = _env_int("ACCOUNT_REQUEST_THROTTLE_SECONDS", 300)
 PORTAL_AUTH_RECOVERY_THROTTLE_SECONDS = _env_int(
     "PORTAL_AUTH_RECOVERY_THROTTLE_SECONDS",
@@ -274,4 +289,13 @@ EMAIL_QUEUE_MAX_ATTEMPTS = _env_int("EMAIL_QUEUE_MAX_ATTEMPTS", 5)
 EMAIL_QUEUE_RETRY_BASE_SECONDS = _env_int("EMAIL_QUEUE_RETRY_BASE_SECONDS", 60)
 EMAIL_QUEUE_RETRY_MAX_SECONDS = _env_int("EMAIL_QUEUE_RETRY_MAX_SECONDS", 3600)
 EMAIL_QUEUE_PROCESSING_TIMEOUT_SECONDS = _env_int("EMAIL_QUEUE_PROCESSING_TIMEOUT_SECONDS", 900)
+# Long-poll requests hold a worker thread: only enable them on threaded or async workers,
+# keep the wait short and the waiter count (per process) below the threads of one worker.
+# 0 disables long-polling (the scan client then polls).
+SCAN_SYNC_LONG_POLL_SECONDS = _env_int("SCAN_SYNC_LONG_POLL_SECONDS", 0)
+SCAN_SYNC_MAX_WAITERS = _env_int("SCAN_SYNC_MAX_WAITERS", 2)
+NOTIFICATION_OUTBOX_DIGEST_WINDOW_SECONDS = _env_int(
+    "NOTIFICATION_OUTBOX_DIGEST_WINDOW_SECONDS",
+    60,
+)
 ENABLE_SHIPMENT_TRACK_LEGACY = _env_bool("ENABLE_SHIPMENT_TRACK_LEGACY", True)
@@ -1,3 +1,5 @@
+import logging
+import os
 from unittest.runner import TextTestResult
 
 from django.conf import settings
@@ -11,6 +13,8 @@ from django.test.runner import (
 )
 from django.utils import translation
 
+from wms.query_workload import capture_query_workload
+
 
 class _LanguageResetMixin:
     def _reset_language(self):
@@ -62,9 +66,30 @@ class LanguageResetParallelTestSuite(ParallelTestSuite):
 class LanguageResetDiscoverRunner(DiscoverRunner):
     parallel_test_suite = LanguageResetParallelTestSuite
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if os.environ.get("WMS_QUERY_WORKLOAD") and self.parallel > 1:
+            # Worker processes would run the queries outside the capture.
+            self.log(
+                "WMS_QUERY_WORKLOAD is set: running the tests serially (--parallel=1) "
+                "so that the query workload is captured.",
+                level=logging.WARNING,
+            )
+            self.parallel = 1
+
     def get_resultclass(self):
         if self.debug_sql:
             return LanguageResetDebugSQLTextTestResult
         if self.pdb:
             return LanguageResetPDBDebugResult
         return LanguageResetTextTestResult
+
+    def run_suite(self, suite, **kwargs):
+        # WMS_QUERY_WORKLOAD=<path> records the normalized SQL workload of the run.
+        output_path = os.environ.get("WMS_QUERY_WORKLOAD", "")
+        if not output_path:
+            return super().run_suite(suite, **kwargs)
+        with capture_query_workload() as workload:
+            result = super().run_suite(suite, **kwargs)
+        workload.write_report(output_path, label="test suite")
+        return result
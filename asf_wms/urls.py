@@ -2,7 +2,8 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.contrib.staticfiles.storage import staticfiles_storage
-from django.urls import include, path
+from django.urls import include, path, re_path
+from django.utils.functional import lazy
 from django.views.generic import TemplateView
 from django.views.generic.base import RedirectView
 
@@ -10,7 +11,9 @@ urlpatterns = [
     path("", TemplateView.as_view(template_name="home.html"), name="home"),
     path(
         "favicon.ico",
-        RedirectView.as_view(url=staticfiles_storage.url("scan/icon.png"), permanent=False),
+        RedirectView.as_view(
+            url=lazy(staticfiles_storage.url, str)("scan/icon-192.png"), permanent=False
+        ),
     ),
     path(
         "password-help/",
@@ -26,5 +29,12 @@ urlpatterns = [
     path("api/", include("api.urls")),
 ]
 
+if settings.STATIC_SERVE_FROM_APP:
+    from wms.static_assets import serve_static_asset
+
+    urlpatterns.append(
+        re_path(rf"^{settings.STATIC_URL.lstrip('/')}(?P<path>.+)$", serve_static_asset)
+    )
+
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
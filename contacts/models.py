@@ -69,7 +69,7 @@ class Contact(models.Model):
                 self.name = full_name
         super().save(*args, **kwargs)
         if self.contact_type == ContactType.PERSON and self.use_organization_address:
-            _sync_contact_address_from_org(self)
+            sync_contact_address_from_org(self)
 
 
 class ContactAddress(models.Model):
@@ -130,7 +130,7 @@ class ContactCapability(models.Model):
         return f"{self.contact.name} / {self.get_capability_display()}"
 
 
-def _sync_contact_address_from_org(contact):
+def sync_contact_address_from_org(contact):
     if not contact.use_organization_address or not contact.organization:
         return
     org_address = (
@@ -153,7 +153,7 @@ def _sync_contact_address_from_org(contact):
 
 def _sync_people_for_org(organization):
     for person in organization.members.filter(use_organization_address=True):
-        _sync_contact_address_from_org(person)
+        sync_contact_address_from_org(person)
 
 
 @receiver(pre_delete, sender=Contact)
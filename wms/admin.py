@@ -61,6 +61,12 @@ from .product_label_printing import (
     render_product_labels_response,
     render_product_qr_labels_response,
 )
+from .qr_codes import (
+    product_qr_data_uri,
+    product_qr_payload,
+    render_qr_codes,
+    shipment_qr_data_uri,
+)
 from .services import (
     StockError,
     adjust_stock,
@@ -177,23 +183,23 @@ class ProductAdmin(admin.ModelAdmin):
         "is_active",
         "photo_preview",
         "qr_code_preview",
-        "qr_code_image",
         "notes",
     )
     inlines = (ProductKitItemInline,)
     actions = (
         "archive_products",
         "unarchive_products",
-        "generate_qr_codes",
+        "warm_qr_code_cache",
         "print_product_labels",
         "print_product_qr_labels",
     )
 
     def qr_code_preview(self, obj):
-        if obj.qr_code_image:
+        qr_url = product_qr_data_uri(obj)
+        if qr_url:
             return format_html(
                 '<img src="{}" style="height: 120px; border: 1px solid #ccc;" />',
-                obj.qr_code_image.url,
+                qr_url,
             )
         return "-"
 
@@ -221,16 +227,13 @@ class ProductAdmin(admin.ModelAdmin):
 
     unarchive_products.short_description = gettext_lazy("Réactiver les produits")
 
-    def generate_qr_codes(self, request, queryset):
-        count = 0
-        for product in queryset:
-            if not product.qr_code_image:
-                product.generate_qr_code()
-                product.save(update_fields=["qr_code_image"])
-                count += 1
-        self.message_user(request, _("%(count)s QR code(s) générés.") % {"count": count})
+    def warm_qr_code_cache(self, request, queryset):
+        count = len(render_qr_codes(product_qr_payload(product) for product in queryset))
+        self.message_user(
+            request, _("%(count)s QR code(s) préparés dans le cache.") % {"count": count}
+        )
 
-    generate_qr_codes.short_description = gettext_lazy("Générer les QR codes")
+    warm_qr_code_cache.short_description = gettext_lazy("Préparer le cache des QR codes")
 
     def print_product_labels(self, request, queryset):
         if not queryset.exists():
@@ -824,6 +827,13 @@ class CartonAdmin(admin.ModelAdmin):
     list_filter = ("status", "current_location__warehouse")
     search_fields = ("code", "shipment__reference")
     list_select_related = ("shipment", "current_location")
+    readonly_fields = (
+        "total_weight_g",
+        "total_volume_cm3",
+        "item_count",
+        "single_product",
+        "dominant_type_code",
+    )
     inlines = (CartonItemInline,)
     actions = ("unpack_cartons",)
 
@@ -936,7 +946,6 @@ class ShipmentAdmin(admin.ModelAdmin):
         "ready_at",
         "created_by",
         "qr_code_preview",
-        "qr_code_image",
         "notes",
     )
     list_display = (
@@ -952,10 +961,11 @@ class ShipmentAdmin(admin.ModelAdmin):
     inlines = (CartonInline, DocumentInline, ShipmentTrackingEventInline)
 
     def qr_code_preview(self, obj):
-        if obj.qr_code_image:
+        qr_url = shipment_qr_data_uri(obj) if obj.pk else ""
+        if qr_url:
             return format_html(
                 '<img src="{}" style="height: 120px; border: 1px solid #ccc;" />',
-                obj.qr_code_image.url,
+                qr_url,
             )
         return "-"
 
@@ -1296,6 +1306,31 @@ class StockMovementAdmin(admin.ModelAdmin):
         )
 
 
+class StockCheckpointLineInline(admin.TabularInline):
+    model = models.StockCheckpointLine
+    extra = 0
+    fields = ("product", "product_lot", "quantity")
+    readonly_fields = fields
+    can_delete = False
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(models.StockCheckpoint)
+class StockCheckpointAdmin(admin.ModelAdmin):
+    list_display = ("as_of", "period", "lot_count", "total_quantity", "created_at")
+    list_filter = ("period",)
+    date_hierarchy = "as_of"
+    inlines = (StockCheckpointLineInline,)
+
+    def get_readonly_fields(self, request, obj=None):
+        return [field.name for field in self.model._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
+
+
 @admin.register(models.VolunteerProfile)
 class VolunteerProfileAdmin(admin.ModelAdmin):
     list_display = (
@@ -1,3 +1,6 @@
+from .stock_ledger import CARTON_SHIPMENT_RECORD_REASON_CODE
+
+
 def sync_carton_shipment_stock_movements(
     *,
     obj,
@@ -43,6 +46,7 @@ def sync_carton_shipment_stock_movements(
             from_location=item.product_lot.location,
             related_carton=obj,
             related_shipment=obj.shipment,
+            reason_code=CARTON_SHIPMENT_RECORD_REASON_CODE,
             created_by=created_by,
         )
 
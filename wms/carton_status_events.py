@@ -1,6 +1,6 @@
 from django.db.models import Model
 
-from .models import CartonStatusEvent
+from .models import Carton, CartonStatusEvent, WmsChange
 from .workflow_observability import log_carton_status_transition
 
 
@@ -74,3 +74,51 @@ def set_carton_status(
         source="set_carton_status",
     )
     return True
+
+
+def bulk_set_carton_status(
+    *,
+    cartons,
+    new_status,
+    user=None,
+    reason="",
+    updates=None,
+):
+    cartons = [
+        carton
+        for carton in cartons
+        if _is_persisted_model_instance(carton) and carton.status != new_status
+    ]
+    if not cartons:
+        return 0
+    updates = dict(updates or {})
+    previous_by_id = {carton.pk: carton.status for carton in cartons}
+    Carton.objects.filter(pk__in=list(previous_by_id)).update(status=new_status, **updates)
+    # Queryset updates bypass post_save, so bump the change counter once for the batch.
+    WmsChange.bump()
+    actor = _resolve_actor(user)
+    events = []
+    for carton in cartons:
+        carton.status = new_status
+        for field_name, value in updates.items():
+            setattr(carton, field_name, value)
+        events.append(
+            CartonStatusEvent(
+                carton=carton,
+                previous_status=previous_by_id[carton.pk],
+                new_status=new_status,
+                reason=reason or "",
+                created_by=actor,
+            )
+        )
+    CartonStatusEvent.objects.bulk_create(events)
+    for carton in cartons:
+        log_carton_status_transition(
+            carton=carton,
+            previous_status=previous_by_id[carton.pk],
+            new_status=new_status,
+            reason=reason,
+            user=user,
+            source="bulk_set_carton_status",
+        )
+    return len(cartons)
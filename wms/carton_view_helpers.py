@@ -53,10 +53,6 @@ def build_cartons_ready_rows(cartons_qs, *, carton_capacity_cm3):
     cartons = []
     for carton in cartons_qs:
         product_totals = {}
-        weight_total_g = 0
-        volume_total_cm3 = 0
-        missing_weight = False
-        missing_volume = False
         for item in carton.cartonitem_set.all():
             product = item.product_lot.product
             lot_code = item.product_lot.lot_code
@@ -67,21 +63,12 @@ def build_cartons_ready_rows(cartons_qs, *, carton_capacity_cm3):
                     "quantity": 0,
                 }
             product_totals[key]["quantity"] += item.quantity
-            if product.weight_g:
-                weight_total_g += product.weight_g * item.quantity
-            else:
-                missing_weight = True
-            if product.volume_cm3:
-                volume_total_cm3 += product.volume_cm3 * item.quantity
-            else:
-                missing_volume = True
         packing_list = sorted(product_totals.values(), key=lambda row: row["label"])
-        if weight_total_g == 0 and missing_weight:
-            weight_kg = None
-        else:
-            weight_kg = weight_total_g / 1000 if weight_total_g else None
-        if carton_capacity_cm3 and volume_total_cm3 and not missing_volume:
-            volume_percent = round(float(volume_total_cm3) / float(carton_capacity_cm3) * 100)
+        weight_kg = carton.total_weight_g / 1000 if carton.total_weight_g else None
+        if carton_capacity_cm3 and carton.total_volume_cm3:
+            volume_percent = round(
+                float(carton.total_volume_cm3) / float(carton_capacity_cm3) * 100
+            )
         else:
             volume_percent = None
         is_assigned = carton.shipment_id is not None
@@ -0,0 +1,103 @@
+"""Change notifications for open scan pages.
+
+Scan pages learn that data changed through the ``WmsChange`` version counter.
+Instead of every tab polling the database, ``wait_for_change`` long-polls: it
+answers at once when the client's version is stale, and otherwise blocks up to
+``SCAN_SYNC_LONG_POLL_SECONDS`` on an in-process condition. Bumps committed by
+this process wake the waiters immediately. No ``CACHES`` backend is configured,
+so the cached version lives in each process's local memory: bumps from other
+processes, and bumps still inside an uncommitted transaction, are seen once it
+expires, after at most ``CHANGE_STATE_CACHE_SECONDS`` plus one
+``CHANGE_WAIT_SLICE_SECONDS``.
+
+Every held request occupies a worker thread, so long-polling is off by default
+and each process holds at most ``SCAN_SYNC_MAX_WAITERS`` requests at once.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import WmsChange
+
+CHANGE_STATE_CACHE_KEY = "wms:change-state"
+CHANGE_STATE_CACHE_SECONDS = 1
+CHANGE_WAIT_SLICE_SECONDS = 1.0
+
+
+class _WaiterSlots:
+    """Long-poll requests held by this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.held = 0
+
+    def acquire(self, limit: int) -> bool:
+        with self._lock:
+            if self.held >= limit:
+                return False
+            self.held += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self.held -= 1
+
+
+_change_condition = threading.Condition()
+_waiter_slots = _WaiterSlots()
+
+
+def current_change_state() -> dict:
+    """``{"version", "changed_at"}`` from the cache, or a read-only query on a miss."""
+    state = cache.get(CHANGE_STATE_CACHE_KEY)
+    if state is None:
+        row = WmsChange.objects.filter(pk=1).values_list("version", "last_changed_at").first()
+        version, changed_at = row or (0, None)
+        state = {
+            "version": version,
+            "changed_at": changed_at.isoformat() if changed_at else None,
+        }
+        cache.set(CHANGE_STATE_CACHE_KEY, state, CHANGE_STATE_CACHE_SECONDS)
+    return state
+
+
+def notify_change() -> None:
+    """Drop this process's cached version and wake its waiters so that they re-read it."""
+    cache.delete(CHANGE_STATE_CACHE_KEY)
+    with _change_condition:
+        _change_condition.notify_all()
+
+
+def wait_for_change(known_version: int | None, *, timeout: float | None = None) -> dict:
+    """Return the change state once it differs from ``known_version`` or ``timeout`` expires.
+
+    ``waited`` tells the client whether the server held the request, i.e. whether
+    it can re-arm immediately; a busy or disabled long-poll answers at once and
+    the client falls back to its polling interval.
+    """
+    if timeout is None:
+        timeout = settings.SCAN_SYNC_LONG_POLL_SECONDS
+    state = current_change_state()
+    if known_version is None or state["version"] != known_version or timeout <= 0:
+        changed = known_version is not None and state["version"] != known_version
+        return {**state, "changed": changed, "waited": False}
+
+    if not _waiter_slots.acquire(settings.SCAN_SYNC_MAX_WAITERS):
+        return {**state, "changed": False, "waited": False}
+    try:
+        deadline = time.monotonic() + timeout
+        while state["version"] == known_version:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            with _change_condition:
+                _change_condition.wait(min(remaining, CHANGE_WAIT_SLICE_SECONDS))
+            state = current_change_state()
+    finally:
+        _waiter_slots.release()
+    return {**state, "changed": state["version"] != known_version, "waited": True}
@@ -1,9 +1,10 @@
 from .be_parser import build_be_contact_dataset, render_review_report
 from .canonical_dataset import BeContactDataset
-from .canonical_writer import apply_be_contact_dataset
+from .canonical_writer import BeContactWriteReport, apply_be_contact_dataset
 
 __all__ = [
     "BeContactDataset",
+    "BeContactWriteReport",
     "apply_be_contact_dataset",
     "build_be_contact_dataset",
     "render_review_report",
@@ -2,13 +2,23 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-
-from openpyxl import load_workbook
+from time import perf_counter
 
 from contacts.capabilities import ContactCapabilityType
 from contacts.models import ContactType
 
+from ..process_pools import can_use_process_pool
+from ..process_pools.be_sheets import (
+    BeSheetRow,
+    load_workbook,
+    normalize_display_name,
+    normalize_iata,
+    normalize_text,
+    read_be_sheet,
+    read_sheet_rows,
+)
 from .canonical_dataset import BeContactDataset
 
 CANONICAL_BE_SHEET_NAMES = ("2024", "2025", "2026")
@@ -30,31 +40,17 @@ PERSON_PREFIXES = {
     "sr",
 }
 EXPEDITEUR_TRANSPORTER_KEY = "expediteur"
-
-
-def _normalize_text(value) -> str:
-    return str(value or "").strip()
+BE_SHEET_PARSE_MAX_WORKERS = 4
 
 
 def _normalize_key(value) -> str:
-    text = unicodedata.normalize("NFKD", _normalize_text(value))
+    text = unicodedata.normalize("NFKD", normalize_text(value))
     text = "".join(char for char in text if not unicodedata.combining(char))
     text = text.lower()
     text = re.sub(r"[^a-z0-9]+", " ", text)
     return re.sub(r"\s+", " ", text).strip()
 
 
-def _normalize_display_name(value) -> str:
-    text = _normalize_text(value)
-    if not text:
-        return ""
-    return re.sub(r"\s+", " ", text).strip()
-
-
-def _normalize_iata(value) -> str:
-    return _normalize_text(value).upper()
-
-
 def _selected_sheet_names(workbook) -> list[str]:
     names = [name for name in CANONICAL_BE_SHEET_NAMES if name in workbook.sheetnames]
     if names:
@@ -62,27 +58,17 @@ def _selected_sheet_names(workbook) -> list[str]:
     return [workbook.active.title]
 
 
-def _iter_sheet_rows(sheet):
-    rows = sheet.iter_rows(values_only=True)
-    headers = next(rows, ())
-    header_map: dict[str, list[int]] = {}
-    for index, header in enumerate(headers or ()):
-        key = _normalize_text(header)
-        if not key:
-            continue
-        header_map.setdefault(key, []).append(index)
-    for row in rows:
-        if not any(_normalize_text(value) for value in row):
-            continue
-        yield row, header_map
-
-
-def _get_cell(row, header_map, name: str) -> str:
-    for index in header_map.get(name, []):
-        value = _normalize_text(row[index])
-        if value:
-            return value
-    return ""
+def _read_be_sheets(path: Path, *, max_workers: int) -> tuple[list[str], list[list[BeSheetRow]]]:
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        source_sheets = _selected_sheet_names(workbook)
+        if not can_use_process_pool(max_workers=max_workers, task_count=len(source_sheets)):
+            return source_sheets, [read_sheet_rows(workbook[name]) for name in source_sheets]
+    finally:
+        workbook.close()
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(source_sheets))) as executor:
+        futures = [executor.submit(read_be_sheet, str(path), name) for name in source_sheets]
+        return source_sheets, [future.result() for future in futures]
 
 
 def _note_conflict(
@@ -215,9 +201,9 @@ def _person_payload(
     last_name: str = "",
     fallback_name: str,
 ) -> dict:
-    normalized_title = _normalize_display_name(title)
-    normalized_first_name = _normalize_display_name(first_name)
-    normalized_last_name = _normalize_display_name(last_name)
+    normalized_title = normalize_display_name(title)
+    normalized_first_name = normalize_display_name(first_name)
+    normalized_last_name = normalize_display_name(last_name)
     email = ""
     if "@" in normalized_last_name and not normalized_first_name:
         email = normalized_last_name
@@ -464,7 +450,7 @@ def _apply_destination_correspondent_overrides(
     correspondents: dict[str, dict],
 ):
     for destination in destinations.values():
-        iata_code = _normalize_iata(destination.get("iata_code"))
+        iata_code = normalize_iata(destination.get("iata_code"))
         override_name = CANONICAL_DESTINATION_CORRESPONDENT_OVERRIDES.get(iata_code, "")
         if not override_name:
             continue
@@ -621,7 +607,15 @@ def render_review_report(review_items: list[dict]) -> str:
     return "\n".join(lines)
 
 
-def build_be_contact_dataset(path: str | Path) -> BeContactDataset:
+def build_be_contact_dataset(
+    path: str | Path, *, max_workers: int | None = None
+) -> BeContactDataset:
+    """Normalize the BE workbook into a canonical contact dataset.
+
+    Sheets are parsed in a process pool (one read-only workbook per worker); the
+    entity merge then runs over the parsed rows in sheet order, so later sheets keep
+    priority exactly as with a single sequential pass.
+    """
     contacts: dict[str, dict] = {}
     donors: dict[str, dict] = {}
     transporters: dict[str, dict] = {}
@@ -633,342 +627,300 @@ def build_be_contact_dataset(path: str | Path) -> BeContactDataset:
     shipment_links: set[tuple[str, str, str]] = set()
     review_items: list[dict] = []
     seen_conflicts: set[tuple[str, str, str]] = set()
-    workbook = load_workbook(Path(path), read_only=True, data_only=True)
+    started = perf_counter()
+    source_sheets, sheet_rows = _read_be_sheets(
+        Path(path),
+        max_workers=BE_SHEET_PARSE_MAX_WORKERS if max_workers is None else max_workers,
+    )
+    read_seconds = perf_counter() - started
+
+    for source_priority, rows in enumerate(sheet_rows):
+        for row in rows:
+            donor_name = row.donor_name
+            transporter_name = row.transporter_name
+            volunteer_name = row.volunteer_name
+            shipper_name = row.shipper_name
+            shipper_country = row.shipper_country
+            recipient_name = row.recipient_name
+            recipient_status = row.recipient_status
+            destination_city = row.destination_city
+            destination_iata = row.destination_iata
+            correspondent_name = row.correspondent_name
+            correspondent_country = row.correspondent_country
+
+            shipper_key = _normalize_key(shipper_name)
+            recipient_key = _normalize_key(recipient_name)
+            correspondent_key = _normalize_key(correspondent_name)
+            destination_key = destination_iata or _normalize_key(
+                f"{destination_city}|{correspondent_country}"
+            )
 
-    try:
-        source_sheets = _selected_sheet_names(workbook)
-        for source_priority, sheet_name in enumerate(source_sheets):
-            sheet = workbook[sheet_name]
-            for row, header_map in _iter_sheet_rows(sheet):
-                donor_name = _normalize_display_name(_get_cell(row, header_map, "BE_DONATEUR"))
-                transporter_name = _normalize_display_name(
-                    _get_cell(row, header_map, "BE_TRANSPORTEUR")
-                )
-                volunteer_name = _normalize_display_name(
-                    _get_cell(row, header_map, "BE_MISE_A_BORD_RESPONSABLE")
+            shipper_contact_key = ""
+            if shipper_key:
+                shipper_contact_key = _ensure_org_contact(
+                    contacts=contacts,
+                    organization_name=shipper_name,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
                 )
-                shipper_name = _normalize_display_name(
-                    _get_cell(row, header_map, "ASSOCIATION_NOM")
+                shipper = _get_or_create_entity(shippers, key=shipper_key)
+                _merge_scalar(
+                    record=shipper,
+                    field_name="name",
+                    value=shipper_name,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                    entity_type="shipper",
+                    key=shipper_key,
                 )
-                shipper_country = _normalize_display_name(
-                    _get_cell(row, header_map, "ASSOCIATION_PAYS")
+                _merge_scalar(
+                    record=shipper,
+                    field_name="country",
+                    value=shipper_country,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                    entity_type="shipper",
+                    key=shipper_key,
                 )
-                recipient_name = _normalize_display_name(
-                    _get_cell(row, header_map, "DESTINATAIRE_STRUCTURE")
+                _merge_scalar(
+                    record=shipper,
+                    field_name="contact_key",
+                    value=shipper_contact_key,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                    entity_type="shipper",
+                    key=shipper_key,
                 )
-                recipient_status = _normalize_display_name(
-                    _get_cell(row, header_map, "DESTINATAIRE_STATUT")
+                shipper_title = row.shipper_title
+                shipper_first_name = row.shipper_first_name
+                shipper_last_name = row.shipper_last_name
+                has_shipper_contact_data = any(
+                    (shipper_title, shipper_first_name, shipper_last_name)
                 )
-                destination_city = _normalize_display_name(
-                    _get_cell(row, header_map, "BE_DESTINATION")
-                )
-                destination_iata = _normalize_iata(_get_cell(row, header_map, "BE_CODE_IATA"))
-                correspondent_name = _normalize_display_name(
-                    " ".join(
-                        part
-                        for part in (
-                            _get_cell(row, header_map, "CORRESPONDANT_PRENOM"),
-                            _get_cell(row, header_map, "CORRESPONDANT_NOM"),
-                        )
-                        if part
-                    )
-                )
-                correspondent_country = _normalize_display_name(
-                    _get_cell(row, header_map, "CORRESPONDANT_PAYS")
-                )
-
-                shipper_key = _normalize_key(shipper_name)
-                recipient_key = _normalize_key(recipient_name)
-                correspondent_key = _normalize_key(correspondent_name)
-                destination_key = destination_iata or _normalize_key(
-                    f"{destination_city}|{correspondent_country}"
-                )
-
-                shipper_contact_key = ""
-                if shipper_key:
-                    shipper_contact_key = _ensure_org_contact(
+                if has_shipper_contact_data or not shipper.get("default_contact_key"):
+                    shipper_default_contact_key, shipper_default_plain_key = _ensure_person_contact(
                         contacts=contacts,
-                        organization_name=shipper_name,
                         source_priority=source_priority,
                         review_items=review_items,
                         seen_conflicts=seen_conflicts,
+                        organization_contact_key=shipper_contact_key,
+                        title=shipper_title,
+                        first_name=shipper_first_name,
+                        last_name=shipper_last_name,
+                        fallback_name=f"Referent {shipper_name}",
                     )
-                    shipper = _get_or_create_entity(shippers, key=shipper_key)
                     _merge_scalar(
                         record=shipper,
-                        field_name="name",
-                        value=shipper_name,
+                        field_name="default_contact_key",
+                        value=shipper_default_contact_key,
                         source_priority=source_priority,
                         review_items=review_items,
                         seen_conflicts=seen_conflicts,
                         entity_type="shipper",
                         key=shipper_key,
                     )
-                    _merge_scalar(
-                        record=shipper,
-                        field_name="country",
-                        value=shipper_country,
-                        source_priority=source_priority,
-                        review_items=review_items,
-                        seen_conflicts=seen_conflicts,
-                        entity_type="shipper",
-                        key=shipper_key,
-                    )
-                    _merge_scalar(
-                        record=shipper,
-                        field_name="contact_key",
-                        value=shipper_contact_key,
-                        source_priority=source_priority,
-                        review_items=review_items,
-                        seen_conflicts=seen_conflicts,
-                        entity_type="shipper",
-                        key=shipper_key,
-                    )
-                    shipper_title = _get_cell(row, header_map, "ASSOCIATION_PRESIDENT_TITRE")
-                    shipper_first_name = _get_cell(row, header_map, "ASSOCIATION_PRESIDENT_PRENOM")
-                    shipper_last_name = _get_cell(row, header_map, "ASSOCIATION_PRESIDENT_NOM")
-                    has_shipper_contact_data = any(
-                        (shipper_title, shipper_first_name, shipper_last_name)
-                    )
-                    if has_shipper_contact_data or not shipper.get("default_contact_key"):
-                        shipper_default_contact_key, shipper_default_plain_key = (
-                            _ensure_person_contact(
-                                contacts=contacts,
-                                source_priority=source_priority,
-                                review_items=review_items,
-                                seen_conflicts=seen_conflicts,
-                                organization_contact_key=shipper_contact_key,
-                                title=shipper_title,
-                                first_name=shipper_first_name,
-                                last_name=shipper_last_name,
-                                fallback_name=f"Referent {shipper_name}",
-                            )
-                        )
-                        _merge_scalar(
-                            record=shipper,
-                            field_name="default_contact_key",
-                            value=shipper_default_contact_key,
-                            source_priority=source_priority,
-                            review_items=review_items,
-                            seen_conflicts=seen_conflicts,
-                            entity_type="shipper",
-                            key=shipper_key,
-                        )
-                        shipper["_default_contact_plain_key"] = shipper_default_plain_key
-
-                if donor_name:
+                    shipper["_default_contact_plain_key"] = shipper_default_plain_key
+
+            if donor_name:
+                _register_generic_capability_contact(
+                    contacts=contacts,
+                    registry=donors,
+                    name=donor_name,
+                    capability=ContactCapabilityType.DONOR,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                    default_contact_type=ContactType.ORGANIZATION,
+                )
+
+            if transporter_name:
+                if _normalize_key(transporter_name) == EXPEDITEUR_TRANSPORTER_KEY and shipper_key:
+                    transporter = _get_or_create_entity(transporters, key=shipper_key)
+                    transporter.setdefault("name", shipper_name)
+                    transporter.setdefault("contact_key", shipper_contact_key)
+                    transporter.setdefault("contact_type", ContactType.ORGANIZATION)
+                else:
                     _register_generic_capability_contact(
                         contacts=contacts,
-                        registry=donors,
-                        name=donor_name,
-                        capability=ContactCapabilityType.DONOR,
+                        registry=transporters,
+                        name=transporter_name,
+                        capability=ContactCapabilityType.TRANSPORTER,
                         source_priority=source_priority,
                         review_items=review_items,
                         seen_conflicts=seen_conflicts,
                         default_contact_type=ContactType.ORGANIZATION,
                     )
 
-                if transporter_name:
-                    if (
-                        _normalize_key(transporter_name) == EXPEDITEUR_TRANSPORTER_KEY
-                        and shipper_key
-                    ):
-                        transporter = _get_or_create_entity(transporters, key=shipper_key)
-                        transporter.setdefault("name", shipper_name)
-                        transporter.setdefault("contact_key", shipper_contact_key)
-                        transporter.setdefault("contact_type", ContactType.ORGANIZATION)
-                    else:
-                        _register_generic_capability_contact(
-                            contacts=contacts,
-                            registry=transporters,
-                            name=transporter_name,
-                            capability=ContactCapabilityType.TRANSPORTER,
-                            source_priority=source_priority,
-                            review_items=review_items,
-                            seen_conflicts=seen_conflicts,
-                            default_contact_type=ContactType.ORGANIZATION,
-                        )
-
-                if volunteer_name:
-                    _register_generic_capability_contact(
-                        contacts=contacts,
-                        registry=volunteers,
-                        name=volunteer_name,
-                        capability=ContactCapabilityType.VOLUNTEER,
-                        source_priority=source_priority,
-                        review_items=review_items,
-                        seen_conflicts=seen_conflicts,
-                        default_contact_type=ContactType.PERSON,
-                    )
+            if volunteer_name:
+                _register_generic_capability_contact(
+                    contacts=contacts,
+                    registry=volunteers,
+                    name=volunteer_name,
+                    capability=ContactCapabilityType.VOLUNTEER,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                    default_contact_type=ContactType.PERSON,
+                )
 
-                if recipient_key:
-                    recipient_contact_key = _ensure_org_contact(
-                        contacts=contacts,
-                        organization_name=recipient_name,
-                        source_priority=source_priority,
-                        review_items=review_items,
-                        seen_conflicts=seen_conflicts,
-                    )
-                    recipient = _get_or_create_entity(recipients, key=recipient_key)
+            if recipient_key:
+                recipient_contact_key = _ensure_org_contact(
+                    contacts=contacts,
+                    organization_name=recipient_name,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                )
+                recipient = _get_or_create_entity(recipients, key=recipient_key)
+                _merge_scalar(
+                    record=recipient,
+                    field_name="name",
+                    value=recipient_name,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                    entity_type="recipient",
+                    key=recipient_key,
+                )
+                _merge_scalar(
+                    record=recipient,
+                    field_name="status",
+                    value=recipient_status,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                    entity_type="recipient",
+                    key=recipient_key,
+                )
+                _merge_scalar(
+                    record=recipient,
+                    field_name="contact_key",
+                    value=recipient_contact_key,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                    entity_type="recipient",
+                    key=recipient_key,
+                )
+                if destination_iata:
                     _merge_scalar(
                         record=recipient,
-                        field_name="name",
-                        value=recipient_name,
+                        field_name="destination_iata",
+                        value=destination_iata,
                         source_priority=source_priority,
                         review_items=review_items,
                         seen_conflicts=seen_conflicts,
                         entity_type="recipient",
                         key=recipient_key,
                     )
-                    _merge_scalar(
-                        record=recipient,
-                        field_name="status",
-                        value=recipient_status,
+                recipient_title = row.recipient_title
+                recipient_first_name = row.recipient_first_name
+                recipient_last_name = row.recipient_last_name
+                has_recipient_contact_data = any(
+                    (recipient_title, recipient_first_name, recipient_last_name)
+                )
+                if has_recipient_contact_data or not recipient.get("default_contact_key"):
+                    default_contact_key, default_plain_key = _ensure_person_contact(
+                        contacts=contacts,
                         source_priority=source_priority,
                         review_items=review_items,
                         seen_conflicts=seen_conflicts,
-                        entity_type="recipient",
-                        key=recipient_key,
+                        organization_contact_key=recipient_contact_key,
+                        title=recipient_title,
+                        first_name=recipient_first_name,
+                        last_name=recipient_last_name,
+                        fallback_name=f"Referent {recipient_name}",
                     )
                     _merge_scalar(
                         record=recipient,
-                        field_name="contact_key",
-                        value=recipient_contact_key,
+                        field_name="default_contact_key",
+                        value=default_contact_key,
                         source_priority=source_priority,
                         review_items=review_items,
                         seen_conflicts=seen_conflicts,
                         entity_type="recipient",
                         key=recipient_key,
                     )
-                    if destination_iata:
-                        _merge_scalar(
-                            record=recipient,
-                            field_name="destination_iata",
-                            value=destination_iata,
-                            source_priority=source_priority,
-                            review_items=review_items,
-                            seen_conflicts=seen_conflicts,
-                            entity_type="recipient",
-                            key=recipient_key,
-                        )
-                    recipient_title = _get_cell(
-                        row,
-                        header_map,
-                        "DESTINATAIRE_STRUCTURE_REPRESENTANT_TITRE",
-                    )
-                    recipient_first_name = _get_cell(
-                        row,
-                        header_map,
-                        "DESTINATAIRE_STRUCTURE_REPRESENTANT_PRENOM",
-                    )
-                    recipient_last_name = _get_cell(
-                        row,
-                        header_map,
-                        "DESTINATAIRE_STRUCTURE_REPRESENTANT_NOM",
-                    )
-                    has_recipient_contact_data = any(
-                        (recipient_title, recipient_first_name, recipient_last_name)
-                    )
-                    if has_recipient_contact_data or not recipient.get("default_contact_key"):
-                        default_contact_key, default_plain_key = _ensure_person_contact(
-                            contacts=contacts,
-                            source_priority=source_priority,
-                            review_items=review_items,
-                            seen_conflicts=seen_conflicts,
-                            organization_contact_key=recipient_contact_key,
-                            title=recipient_title,
-                            first_name=recipient_first_name,
-                            last_name=recipient_last_name,
-                            fallback_name=f"Referent {recipient_name}",
-                        )
-                        _merge_scalar(
-                            record=recipient,
-                            field_name="default_contact_key",
-                            value=default_contact_key,
-                            source_priority=source_priority,
-                            review_items=review_items,
-                            seen_conflicts=seen_conflicts,
-                            entity_type="recipient",
-                            key=recipient_key,
-                        )
-                        recipient["_default_contact_plain_key"] = default_plain_key
-
-                if correspondent_key:
-                    correspondent = _get_or_create_entity(correspondents, key=correspondent_key)
-                    _merge_scalar(
-                        record=correspondent,
-                        field_name="name",
-                        value=correspondent_name,
-                        source_priority=source_priority,
-                        review_items=review_items,
-                        seen_conflicts=seen_conflicts,
-                        entity_type="correspondent",
-                        key=correspondent_key,
-                    )
-                    _merge_scalar(
-                        record=correspondent,
-                        field_name="country",
-                        value=correspondent_country,
-                        source_priority=source_priority,
-                        review_items=review_items,
-                        seen_conflicts=seen_conflicts,
-                        entity_type="correspondent",
-                        key=correspondent_key,
-                    )
+                    recipient["_default_contact_plain_key"] = default_plain_key
+
+            if correspondent_key:
+                correspondent = _get_or_create_entity(correspondents, key=correspondent_key)
+                _merge_scalar(
+                    record=correspondent,
+                    field_name="name",
+                    value=correspondent_name,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                    entity_type="correspondent",
+                    key=correspondent_key,
+                )
+                _merge_scalar(
+                    record=correspondent,
+                    field_name="country",
+                    value=correspondent_country,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                    entity_type="correspondent",
+                    key=correspondent_key,
+                )
 
-                if destination_key and destination_city:
-                    destination = destinations.setdefault(
-                        destination_key,
-                        {
-                            "key": destination_key,
-                            "_field_priorities": {},
-                        },
-                    )
-                    _merge_scalar(
-                        record=destination,
-                        field_name="city",
-                        value=destination_city,
-                        source_priority=source_priority,
-                        review_items=review_items,
-                        seen_conflicts=seen_conflicts,
-                        entity_type="destination",
-                        key=destination_key,
-                    )
-                    _merge_scalar(
-                        record=destination,
-                        field_name="country",
-                        value=correspondent_country,
-                        source_priority=source_priority,
-                        review_items=review_items,
-                        seen_conflicts=seen_conflicts,
-                        entity_type="destination",
-                        key=destination_key,
-                    )
-                    _merge_scalar(
-                        record=destination,
-                        field_name="iata_code",
-                        value=destination_iata,
-                        source_priority=source_priority,
-                        review_items=review_items,
-                        seen_conflicts=seen_conflicts,
-                        entity_type="destination",
-                        key=destination_key,
-                    )
-                    _merge_scalar(
-                        record=destination,
-                        field_name="correspondent_key",
-                        value=correspondent_key,
-                        source_priority=source_priority,
-                        review_items=review_items,
-                        seen_conflicts=seen_conflicts,
-                        entity_type="destination",
-                        key=destination_key,
-                    )
+            if destination_key and destination_city:
+                destination = destinations.setdefault(
+                    destination_key,
+                    {
+                        "key": destination_key,
+                        "_field_priorities": {},
+                    },
+                )
+                _merge_scalar(
+                    record=destination,
+                    field_name="city",
+                    value=destination_city,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                    entity_type="destination",
+                    key=destination_key,
+                )
+                _merge_scalar(
+                    record=destination,
+                    field_name="country",
+                    value=correspondent_country,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                    entity_type="destination",
+                    key=destination_key,
+                )
+                _merge_scalar(
+                    record=destination,
+                    field_name="iata_code",
+                    value=destination_iata,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                    entity_type="destination",
+                    key=destination_key,
+                )
+                _merge_scalar(
+                    record=destination,
+                    field_name="correspondent_key",
+                    value=correspondent_key,
+                    source_priority=source_priority,
+                    review_items=review_items,
+                    seen_conflicts=seen_conflicts,
+                    entity_type="destination",
+                    key=destination_key,
+                )
 
-                if shipper_key and recipient_key and destination_iata:
-                    shipment_links.add((shipper_key, recipient_key, destination_iata))
-    finally:
-        workbook.close()
+            if shipper_key and recipient_key and destination_iata:
+                shipment_links.add((shipper_key, recipient_key, destination_iata))
 
     _apply_destination_correspondent_overrides(
         destinations=destinations,
@@ -1045,4 +997,8 @@ def build_be_contact_dataset(path: str | Path) -> BeContactDataset:
         shipment_links=shipment_links_list,
         review_items=review_items,
         source_sheets=source_sheets,
+        timings={
+            "read": round(read_seconds, 6),
+            "merge": round(perf_counter() - started - read_seconds, 6),
+        },
     )
@@ -16,3 +16,4 @@ class BeContactDataset:
     shipment_links: list[dict] = field(default_factory=list)
     review_items: list[dict] = field(default_factory=list)
     source_sheets: list[str] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from time import perf_counter
+
 from django.db import transaction
 
-from contacts.capabilities import ContactCapabilityType, ensure_contact_capability
-from contacts.models import Contact, ContactType
+from contacts.capabilities import ContactCapabilityType
+from contacts.models import (
+    Contact,
+    ContactCapability,
+    ContactType,
+    sync_contact_address_from_org,
+)
 from wms.models import (
+    AssociationProfile,
     Destination,
     ShipmentAuthorizedRecipientContact,
     ShipmentRecipientContact,
@@ -12,190 +21,343 @@ from wms.models import (
     ShipmentShipper,
     ShipmentShipperRecipientLink,
     ShipmentValidationStatus,
+    WmsChange,
 )
+from wms.shipment_party_registry import clear_shipment_party_graph_cache
+from wms.signals import sync_profile_user_email_from_contact
 
 from .canonical_dataset import BeContactDataset
 
+BE_CONTACT_WRITE_BATCH_SIZE = 500
+CONTACT_VALUE_FIELDS = ("title", "first_name", "last_name", "email")
 
-def _upsert_contact(*, record: dict, contacts_by_key: dict[str, Contact]) -> Contact:
-    organization = contacts_by_key.get(record.get("organization_key", ""))
-    lookup = {
-        "name": record["name"],
-        "contact_type": record["contact_type"],
-    }
-    if record["contact_type"] == ContactType.PERSON:
-        lookup["organization"] = organization
-
-    contact = Contact.objects.filter(**lookup).first()
-    if contact is None:
-        contact = Contact(**lookup)
-
-    updated_fields = []
-    for field_name in ("title", "first_name", "last_name", "email"):
-        value = record.get(field_name, "")
-        if getattr(contact, field_name) != value:
-            setattr(contact, field_name, value)
-            updated_fields.append(field_name)
-
-    if record["contact_type"] == ContactType.PERSON and contact.organization_id != getattr(
-        organization, "id", None
-    ):
-        contact.organization = organization
-        updated_fields.append("organization")
 
-    if not contact.is_active:
-        contact.is_active = True
-        updated_fields.append("is_active")
+@dataclass
+class BeContactWriteReport:
+    dry_run: bool
+    diff: dict[str, dict[str, int]] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
 
-    if contact.pk is None:
-        contact.save()
-    elif updated_fields:
-        contact.save(update_fields=updated_fields)
 
-    contacts_by_key[record["key"]] = contact
-    return contact
+class _DryRunRollback(Exception):
+    pass
 
 
-def _apply_capabilities(*, dataset: BeContactDataset, contacts_by_key: dict[str, Contact]) -> None:
-    for record in dataset.donors:
-        ensure_contact_capability(
-            contacts_by_key[record["contact_key"]],
-            ContactCapabilityType.DONOR,
-        )
-    for record in dataset.transporters:
-        ensure_contact_capability(
-            contacts_by_key[record["contact_key"]],
-            ContactCapabilityType.TRANSPORTER,
-        )
-    for record in dataset.volunteers:
-        ensure_contact_capability(
-            contacts_by_key[record["contact_key"]],
-            ContactCapabilityType.VOLUNTEER,
-        )
+def _batched(values: list, size: int = BE_CONTACT_WRITE_BATCH_SIZE):
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
 
 
-def apply_be_contact_dataset(dataset: BeContactDataset) -> None:
-    with transaction.atomic():
-        contacts_by_key: dict[str, Contact] = {}
+def _row_key(obj, key_fields: tuple[str, ...]) -> tuple:
+    return tuple(getattr(obj, field_name) for field_name in key_fields)
 
-        for record in sorted(dataset.contacts, key=lambda item: item["contact_type"]):
-            _upsert_contact(record=record, contacts_by_key=contacts_by_key)
 
-        _apply_capabilities(dataset=dataset, contacts_by_key=contacts_by_key)
+def _load_rows(model, keys: list[tuple], *, key_fields: tuple[str, ...]) -> dict[tuple, object]:
+    wanted = set(keys)
+    rows: dict[tuple, object] = {}
+    first_values = sorted({key[0] for key in wanted if key[0] is not None})
+    for chunk in _batched(first_values):
+        queryset = model.objects.filter(**{f"{key_fields[0]}__in": chunk}).order_by("pk")
+        for obj in queryset:
+            key = _row_key(obj, key_fields)
+            if key in wanted:
+                rows.setdefault(key, obj)
+    return rows
 
-        destinations_by_iata: dict[str, Destination] = {}
-        for destination_record in dataset.destinations:
-            correspondent_contact = contacts_by_key[destination_record["correspondent_contact_key"]]
-            destination, _created = Destination.objects.get_or_create(
-                iata_code=destination_record["iata_code"],
-                defaults={
-                    "city": destination_record["city"],
-                    "country": destination_record["country"],
-                    "correspondent_contact": correspondent_contact,
-                    "is_active": True,
-                },
-            )
-            updated_fields = []
-            for field_name in ("city", "country"):
-                value = destination_record[field_name]
-                if getattr(destination, field_name) != value:
-                    setattr(destination, field_name, value)
-                    updated_fields.append(field_name)
-            if destination.correspondent_contact_id != correspondent_contact.id:
-                destination.correspondent_contact = correspondent_contact
-                updated_fields.append("correspondent_contact")
-            if not destination.is_active:
-                destination.is_active = True
-                updated_fields.append("is_active")
-            if updated_fields:
-                destination.save(update_fields=updated_fields)
-            destinations_by_iata[destination.iata_code] = destination
-
-        shippers_by_key: dict[str, ShipmentShipper] = {}
-        for shipper_record in dataset.shippers:
-            organization = contacts_by_key[shipper_record["contact_key"]]
-            default_contact = contacts_by_key[shipper_record["default_contact_key"]]
-            shipper, _created = ShipmentShipper.objects.update_or_create(
-                organization=organization,
-                defaults={
-                    "default_contact": default_contact,
-                    "validation_status": ShipmentValidationStatus.VALIDATED,
-                    "can_send_to_all": False,
-                    "is_active": True,
-                },
-            )
-            shippers_by_key[shipper_record["key"]] = shipper
-
-        recipient_orgs_by_key: dict[str, ShipmentRecipientOrganization] = {}
-        recipient_contacts_by_contact_key: dict[str, ShipmentRecipientContact] = {}
-        recipient_orgs_by_contact_key: dict[str, ShipmentRecipientOrganization] = {}
-        for recipient_record in dataset.recipients:
-            organization = contacts_by_key[recipient_record["contact_key"]]
-            destination = destinations_by_iata[recipient_record["destination_iata"]]
-            recipient_org, _created = ShipmentRecipientOrganization.objects.update_or_create(
-                organization=organization,
-                defaults={
-                    "destination": destination,
-                    "validation_status": ShipmentValidationStatus.VALIDATED,
-                    "is_correspondent": bool(recipient_record.get("is_correspondent")),
-                    "is_active": True,
-                },
-            )
-            default_contact = contacts_by_key[recipient_record["default_contact_key"]]
-            recipient_contact, _created = ShipmentRecipientContact.objects.update_or_create(
-                recipient_organization=recipient_org,
-                contact=default_contact,
-                defaults={"is_active": True},
-            )
-            recipient_orgs_by_key[recipient_record["key"]] = recipient_org
-            recipient_orgs_by_contact_key[recipient_record["contact_key"]] = recipient_org
-            recipient_contacts_by_contact_key[recipient_record["default_contact_key"]] = (
-                recipient_contact
-            )
 
-        for correspondent_record in dataset.correspondents:
-            organization_contact_key = correspondent_record.get("organization_contact_key", "")
-            contact_key = correspondent_record.get("contact_key", "")
-            if not organization_contact_key or not contact_key:
-                continue
-            recipient_org = recipient_orgs_by_contact_key.get(organization_contact_key)
-            if recipient_org is None:
-                continue
-            recipient_contact, _created = ShipmentRecipientContact.objects.update_or_create(
-                recipient_organization=recipient_org,
-                contact=contacts_by_key[contact_key],
-                defaults={"is_active": True},
+def _upsert_rows(
+    model,
+    records: dict[tuple, dict],
+    *,
+    key_fields: tuple[str, ...],
+    diff: dict[str, dict[str, int]],
+    bulk: bool = False,
+) -> tuple[dict[tuple, object], list]:
+    """Create or update ``model`` rows keyed on ``key_fields`` from ``records``.
+
+    Existing rows are preloaded in batches and only new or changed rows are written.
+    ``bulk`` writes go through ``bulk_create``/``bulk_update`` and skip ``save()`` and
+    its signals, so callers must replay the side effects they rely on.
+    """
+    rows = _load_rows(model, list(records), key_fields=key_fields)
+    stats = diff.setdefault(model._meta.label, {"created": 0, "updated": 0, "unchanged": 0})
+    to_create = []
+    to_update: list[tuple[object, list[str]]] = []
+    for key, values in records.items():
+        obj = rows.get(key)
+        if obj is None:
+            obj = model(**dict(zip(key_fields, key, strict=True)), **values)
+            to_create.append(obj)
+            rows[key] = obj
+            stats["created"] += 1
+            continue
+        changed_fields = [name for name, value in values.items() if getattr(obj, name) != value]
+        if not changed_fields:
+            stats["unchanged"] += 1
+            continue
+        for name in changed_fields:
+            setattr(obj, name, values[name])
+        to_update.append((obj, changed_fields))
+        stats["updated"] += 1
+
+    if bulk:
+        if to_create:
+            model.objects.bulk_create(to_create, batch_size=BE_CONTACT_WRITE_BATCH_SIZE)
+            # Backends without RETURNING (MySQL) leave the primary keys unset.
+            if any(obj.pk is None for obj in to_create):
+                created_keys = [_row_key(obj, key_fields) for obj in to_create]
+                rows.update(_load_rows(model, created_keys, key_fields=key_fields))
+        if to_update:
+            update_fields = sorted({name for _obj, names in to_update for name in names})
+            model.objects.bulk_update(
+                [obj for obj, _names in to_update],
+                update_fields,
+                batch_size=BE_CONTACT_WRITE_BATCH_SIZE,
             )
-            recipient_contacts_by_contact_key[contact_key] = recipient_contact
-
-        for link_record in dataset.shipment_links:
-            shipper = shippers_by_key[link_record["shipper_key"]]
-            recipient_org = recipient_orgs_by_key[link_record["recipient_key"]]
-            shipment_link, _created = ShipmentShipperRecipientLink.objects.update_or_create(
-                shipper=shipper,
-                recipient_organization=recipient_org,
-                defaults={"is_active": True},
+    else:
+        for obj in to_create:
+            obj.save()
+        for obj, names in to_update:
+            obj.save(update_fields=names)
+    return rows, [obj for obj, _names in to_update]
+
+
+def _record_timing(timings: dict[str, float], stage: str, started: float) -> float:
+    now = perf_counter()
+    timings[stage] = round(now - started, 6)
+    return now
+
+
+def _write_contacts(
+    dataset: BeContactDataset, *, diff: dict[str, dict[str, int]]
+) -> dict[str, Contact]:
+    def contact_values(record: dict) -> dict:
+        values = {field_name: record.get(field_name, "") for field_name in CONTACT_VALUE_FIELDS}
+        values["is_active"] = True
+        return values
+
+    org_records = [
+        record for record in dataset.contacts if record["contact_type"] != ContactType.PERSON
+    ]
+    person_records = [
+        record for record in dataset.contacts if record["contact_type"] == ContactType.PERSON
+    ]
+    org_fields = ("name", "contact_type")
+    org_rows, updated_orgs = _upsert_rows(
+        Contact,
+        {
+            (record["name"], record["contact_type"]): contact_values(record)
+            for record in org_records
+        },
+        key_fields=org_fields,
+        diff=diff,
+        bulk=True,
+    )
+    contacts_by_key = {
+        record["key"]: org_rows[(record["name"], record["contact_type"])] for record in org_records
+    }
+
+    def person_key(record: dict) -> tuple:
+        organization = contacts_by_key.get(record.get("organization_key", ""))
+        return (record["name"], record["contact_type"], getattr(organization, "pk", None))
+
+    person_rows, updated_persons = _upsert_rows(
+        Contact,
+        {person_key(record): contact_values(record) for record in person_records},
+        key_fields=("name", "contact_type", "organization_id"),
+        diff=diff,
+        bulk=True,
+    )
+    for record in person_records:
+        contacts_by_key[record["key"]] = person_rows[person_key(record)]
+
+    # Replay what Contact.save() and its post_save receivers would have done.
+    for person in updated_persons:
+        if person.use_organization_address:
+            sync_contact_address_from_org(person)
+    updated_contacts = [*updated_orgs, *updated_persons]
+    profiled_contact_ids = set(
+        AssociationProfile.objects.filter(
+            contact_id__in=[contact.pk for contact in updated_contacts]
+        ).values_list("contact_id", flat=True)
+    )
+    for contact in updated_contacts:
+        if contact.pk in profiled_contact_ids:
+            sync_profile_user_email_from_contact(contact)
+    return contacts_by_key
+
+
+def _write_capabilities(
+    dataset: BeContactDataset,
+    *,
+    contacts_by_key: dict[str, Contact],
+    diff: dict[str, dict[str, int]],
+) -> None:
+    records: dict[tuple, dict] = {}
+    for capability, capability_records in (
+        (ContactCapabilityType.DONOR, dataset.donors),
+        (ContactCapabilityType.TRANSPORTER, dataset.transporters),
+        (ContactCapabilityType.VOLUNTEER, dataset.volunteers),
+    ):
+        for record in capability_records:
+            contact = contacts_by_key[record["contact_key"]]
+            records[(contact.pk, capability)] = {"is_active": True}
+    _upsert_rows(
+        ContactCapability,
+        records,
+        key_fields=("contact_id", "capability"),
+        diff=diff,
+        bulk=True,
+    )
+
+
+def _write_shipment_parties(
+    dataset: BeContactDataset,
+    *,
+    contacts_by_key: dict[str, Contact],
+    diff: dict[str, dict[str, int]],
+) -> None:
+    destination_rows, _updated = _upsert_rows(
+        Destination,
+        {
+            (record["iata_code"],): {
+                "city": record["city"],
+                "country": record["country"],
+                "correspondent_contact_id": contacts_by_key[record["correspondent_contact_key"]].pk,
+                "is_active": True,
+            }
+            for record in dataset.destinations
+        },
+        key_fields=("iata_code",),
+        diff=diff,
+    )
+
+    shipper_rows, _updated = _upsert_rows(
+        ShipmentShipper,
+        {
+            (contacts_by_key[record["contact_key"]].pk,): {
+                "default_contact_id": contacts_by_key[record["default_contact_key"]].pk,
+                "validation_status": ShipmentValidationStatus.VALIDATED,
+                "can_send_to_all": False,
+                "is_active": True,
+            }
+            for record in dataset.shippers
+        },
+        key_fields=("organization_id",),
+        diff=diff,
+    )
+    shippers_by_key = {
+        record["key"]: shipper_rows[(contacts_by_key[record["contact_key"]].pk,)]
+        for record in dataset.shippers
+    }
+
+    recipient_org_rows, _updated = _upsert_rows(
+        ShipmentRecipientOrganization,
+        {
+            (contacts_by_key[record["contact_key"]].pk,): {
+                "destination_id": destination_rows[(record["destination_iata"],)].pk,
+                "validation_status": ShipmentValidationStatus.VALIDATED,
+                "is_correspondent": bool(record.get("is_correspondent")),
+                "is_active": True,
+            }
+            for record in dataset.recipients
+        },
+        key_fields=("organization_id",),
+        diff=diff,
+    )
+    recipient_orgs_by_key: dict[str, ShipmentRecipientOrganization] = {}
+    recipient_orgs_by_contact_key: dict[str, ShipmentRecipientOrganization] = {}
+    recipient_contact_pairs: dict[str, tuple] = {}
+    for record in dataset.recipients:
+        recipient_org = recipient_org_rows[(contacts_by_key[record["contact_key"]].pk,)]
+        recipient_orgs_by_key[record["key"]] = recipient_org
+        recipient_orgs_by_contact_key[record["contact_key"]] = recipient_org
+        recipient_contact_pairs[record["default_contact_key"]] = (
+            recipient_org.pk,
+            contacts_by_key[record["default_contact_key"]].pk,
+        )
+    for record in dataset.correspondents:
+        organization_contact_key = record.get("organization_contact_key", "")
+        contact_key = record.get("contact_key", "")
+        if not organization_contact_key or not contact_key:
+            continue
+        recipient_org = recipient_orgs_by_contact_key.get(organization_contact_key)
+        if recipient_org is None:
+            continue
+        recipient_contact_pairs[contact_key] = (recipient_org.pk, contacts_by_key[contact_key].pk)
+
+    recipient_contact_rows, _updated = _upsert_rows(
+        ShipmentRecipientContact,
+        {pair: {"is_active": True} for pair in recipient_contact_pairs.values()},
+        key_fields=("recipient_organization_id", "contact_id"),
+        diff=diff,
+    )
+    recipient_contacts_by_contact_key = {
+        contact_key: recipient_contact_rows[pair]
+        for contact_key, pair in recipient_contact_pairs.items()
+    }
+
+    link_rows, _updated = _upsert_rows(
+        ShipmentShipperRecipientLink,
+        {
+            (
+                shippers_by_key[record["shipper_key"]].pk,
+                recipient_orgs_by_key[record["recipient_key"]].pk,
+            ): {"is_active": True}
+            for record in dataset.shipment_links
+        },
+        key_fields=("shipper_id", "recipient_organization_id"),
+        diff=diff,
+    )
+    authorization_records: dict[tuple, dict] = {}
+    for record in dataset.shipment_links:
+        link = link_rows[
+            (
+                shippers_by_key[record["shipper_key"]].pk,
+                recipient_orgs_by_key[record["recipient_key"]].pk,
             )
-            default_contact_key = link_record["default_recipient_contact_key"]
-            for authorized_contact_key in link_record["authorized_recipient_contact_keys"]:
-                recipient_contact = recipient_contacts_by_contact_key[authorized_contact_key]
-                authorization, _created = (
-                    ShipmentAuthorizedRecipientContact.objects.update_or_create(
-                        link=shipment_link,
-                        recipient_contact=recipient_contact,
-                        defaults={
-                            "is_default": authorized_contact_key == default_contact_key,
-                            "is_active": True,
-                        },
-                    )
-                )
-                updated_fields = []
-                expected_is_default = authorized_contact_key == default_contact_key
-                if authorization.is_default != expected_is_default:
-                    authorization.is_default = expected_is_default
-                    updated_fields.append("is_default")
-                if not authorization.is_active:
-                    authorization.is_active = True
-                    updated_fields.append("is_active")
-                if updated_fields:
-                    authorization.save(update_fields=updated_fields)
+        ]
+        for contact_key in record["authorized_recipient_contact_keys"]:
+            recipient_contact = recipient_contacts_by_contact_key[contact_key]
+            authorization_records[(link.pk, recipient_contact.pk)] = {
+                "is_default": contact_key == record["default_recipient_contact_key"],
+                "is_active": True,
+            }
+    _upsert_rows(
+        ShipmentAuthorizedRecipientContact,
+        authorization_records,
+        key_fields=("link_id", "recipient_contact_id"),
+        diff=diff,
+    )
+
+
+def apply_be_contact_dataset(
+    dataset: BeContactDataset, *, dry_run: bool = False
+) -> BeContactWriteReport:
+    """Upsert the canonical dataset and report per-model created/updated/unchanged rows.
+
+    Contacts and capabilities are written in bulk; shipment parties and destinations
+    keep per-row saves because their validation and post_save receivers maintain the
+    default shipper links. A dry run performs the same writes and rolls them back.
+    """
+    report = BeContactWriteReport(dry_run=dry_run)
+    started = perf_counter()
+    stage_started = started
+    try:
+        with transaction.atomic():
+            contacts_by_key = _write_contacts(dataset, diff=report.diff)
+            stage_started = _record_timing(report.timings, "contacts", stage_started)
+            _write_capabilities(dataset, contacts_by_key=contacts_by_key, diff=report.diff)
+            stage_started = _record_timing(report.timings, "capabilities", stage_started)
+            _write_shipment_parties(dataset, contacts_by_key=contacts_by_key, diff=report.diff)
+            _record_timing(report.timings, "shipment_parties", stage_started)
+            if dry_run:
+                raise _DryRunRollback
+            WmsChange.bump(party_registry=True)
+    except _DryRunRollback:
+        pass
+    # Bulk contact writes bypass the party registry receivers, and a rolled back dry
+    # run may have warmed the cache with rows that no longer exist.
+    clear_shipment_party_graph_cache()
+    report.timings["total"] = round(perf_counter() - started, 6)
+    return report
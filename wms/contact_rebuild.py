@@ -1,5 +1,6 @@
 from wms.contact_import import (
     BeContactDataset,
+    BeContactWriteReport,
     apply_be_contact_dataset,
     build_be_contact_dataset,
     render_review_report,
@@ -7,6 +8,7 @@ from wms.contact_import import (
 
 __all__ = [
     "BeContactDataset",
+    "BeContactWriteReport",
     "apply_be_contact_dataset",
     "build_be_contact_dataset",
     "render_review_report",
@@ -34,3 +34,37 @@ class PackCartonInput:
             raise ValueError("Quantité invalide.")
         if self.carton_id and self.carton_code:
             raise ValueError("Choisissez carton_id ou carton_code.")
+
+
+@dataclass(frozen=True)
+class AdjustStockInput:
+    lot_id: int
+    delta: int
+    reason_code: str = ""
+    reason_notes: str = ""
+
+    def validate(self) -> None:
+        if self.delta == 0:
+            raise ValueError("Quantité nulle.")
+
+
+@dataclass(frozen=True)
+class TransferStockInput:
+    lot_id: int
+    location_id: int
+
+    def validate(self) -> None:
+        return None
+
+
+@dataclass(frozen=True)
+class ConsumeStockInput:
+    product_id: int
+    quantity: int
+    shipment_id: int | None = None
+    reason_code: str = ""
+    reason_notes: str = ""
+
+    def validate(self) -> None:
+        if self.quantity <= 0:
+            raise ValueError("Quantité invalide.")
@@ -1,8 +1,9 @@
 from django.db import connection, transaction
+from django.db.models import Count, Min, Sum
 
 from contacts.models import Contact
 
-from ..carton_status_events import set_carton_status
+from ..carton_status_events import bulk_set_carton_status, set_carton_status
 from ..models import (
     Carton,
     CartonFormat,
@@ -34,6 +35,7 @@ from .stock import (
     _prepare_carton,
     ensure_carton_code,
     fefo_lots,
+    refresh_carton_totals,
 )
 
 LOCKED_SHIPMENT_STATUSES = {
@@ -415,10 +417,37 @@ def pack_carton_from_reserved(
         )
     if shipment is not None:
         sync_shipment_ready_state(shipment)
-    ensure_carton_code(carton)
+    refresh_carton_totals(carton)
+    ensure_carton_code(carton, type_code=carton.dominant_type_code or None)
     return carton
 
 
+def ready_single_product_cartons(*, product_ids):
+    """Return (carton_id, code, product_id, quantity) rows for ready single-product cartons.
+
+    Product mix and quantities are aggregated in the database so callers never
+    load carton items into memory.
+    """
+    product_ids = list(product_ids)
+    if not product_ids:
+        return []
+    return list(
+        Carton.objects.filter(status=CartonStatus.PACKED, shipment__isnull=True)
+        .annotate(
+            product_count=Count("cartonitem__product_lot__product_id", distinct=True),
+            carton_product_id=Min("cartonitem__product_lot__product_id"),
+            item_quantity=Sum("cartonitem__quantity"),
+        )
+        .filter(
+            product_count=1,
+            carton_product_id__in=product_ids,
+            item_quantity__gt=0,
+        )
+        .order_by("code")
+        .values_list("id", "code", "carton_product_id", "item_quantity")
+    )
+
+
 @transaction.atomic
 def assign_ready_cartons_to_order(*, order: Order):
     if not order.shipment_id:
@@ -430,46 +459,48 @@ def assign_ready_cartons_to_order(*, order: Order):
         raise StockError("Expédition en litige: affectation des colis impossible.")
     if shipment.status in LOCKED_SHIPMENT_STATUSES:
         raise StockError("Expédition verrouillée: affectation des colis impossible.")
-    line_by_product = {line.product_id: line for line in order.lines.all()}
-    remaining = {line.product_id: line.remaining_quantity for line in order.lines.all()}
-    ready_cartons = (
-        Carton.objects.filter(status=CartonStatus.PACKED, shipment__isnull=True)
-        .prefetch_related("cartonitem_set__product_lot__product")
-        .order_by("code")
-    )
-    assigned = 0
-    for carton in ready_cartons:
-        items = list(carton.cartonitem_set.all())
-        if not items:
-            continue
-        product_ids = {item.product_lot.product_id for item in items}
-        if len(product_ids) != 1:
-            continue
-        product_id = next(iter(product_ids))
-        if product_id not in remaining:
-            continue
-        carton_qty = sum(item.quantity for item in items)
-        if carton_qty <= 0:
-            continue
+    lines = list(order.lines.all())
+    line_by_product = {line.product_id: line for line in lines}
+    remaining = {
+        line.product_id: line.remaining_quantity for line in lines if line.remaining_quantity > 0
+    }
+    selected_cartons = []
+    assigned_quantity_by_product = {}
+    for carton_id, code, product_id, carton_qty in ready_single_product_cartons(
+        product_ids=remaining
+    ):
         if remaining[product_id] < carton_qty:
             continue
-        line = line_by_product[product_id]
-        carton.shipment = shipment
-        set_carton_status(
-            carton=carton,
+        remaining[product_id] -= carton_qty
+        assigned_quantity_by_product[product_id] = (
+            assigned_quantity_by_product.get(product_id, 0) + carton_qty
+        )
+        selected_cartons.append(Carton(pk=carton_id, code=code, status=CartonStatus.PACKED))
+    if selected_cartons:
+        bulk_set_carton_status(
+            cartons=selected_cartons,
             new_status=CartonStatus.ASSIGNED,
-            update_fields=["shipment"],
+            updates={"shipment": shipment},
             reason="order_assign_ready_carton",
             user=order.created_by,
         )
-        line.prepared_quantity += carton_qty
-        line.save(update_fields=["prepared_quantity"])
-        remaining[product_id] -= carton_qty
-        if line.reserved_quantity:
-            release_reserved_stock(line=line, quantity=carton_qty)
-        assigned += 1
+        updated_lines = []
+        for product_id, quantity in assigned_quantity_by_product.items():
+            line = line_by_product[product_id]
+            line.prepared_quantity += quantity
+            updated_lines.append(line)
+        OrderLine.objects.bulk_update(updated_lines, ["prepared_quantity"])
+        for line in updated_lines:
+            if line.reserved_quantity:
+                # A line may be only partly reserved: release what is held, not what was assigned.
+                release_reserved_stock(
+                    line=line,
+                    quantity=min(
+                        assigned_quantity_by_product[line.product_id], line.reserved_quantity
+                    ),
+                )
     sync_shipment_ready_state(shipment)
-    return assigned
+    return len(selected_cartons)
 
 
 @transaction.atomic
@@ -72,10 +72,9 @@ def _root_category_name(product):
     return category.name if category else ""
 
 
-def _dominant_type_code(carton):
+def _dominant_type_code_for_items(items):
     weight_by_type = {}
     qty_by_type = {}
-    items = carton.cartonitem_set.select_related("product_lot__product__category__parent")
     for item in items:
         product = item.product_lot.product
         type_label = _root_category_name(product)
@@ -91,6 +90,88 @@ def _dominant_type_code(carton):
     return max(qty_by_type, key=qty_by_type.get)
 
 
+def _carton_items_for_totals(carton):
+    return carton.cartonitem_set.select_related("product_lot__product__category__parent")
+
+
+def _dominant_type_code(carton):
+    return _dominant_type_code_for_items(_carton_items_for_totals(carton))
+
+
+CARTON_TOTAL_FIELDS = (
+    "total_weight_g",
+    "total_volume_cm3",
+    "item_count",
+    "single_product",
+    "dominant_type_code",
+)
+
+
+def compute_carton_totals(items):
+    items = list(items)
+    weight_total = 0
+    volume_total = 0
+    item_count = 0
+    product_ids = set()
+    for item in items:
+        product = item.product_lot.product
+        weight_total += (product.weight_g or 0) * item.quantity
+        if volume_total is not None and product.volume_cm3:
+            volume_total += product.volume_cm3 * item.quantity
+        else:
+            volume_total = None
+        item_count += item.quantity
+        product_ids.add(product.id)
+    return {
+        "total_weight_g": weight_total,
+        "total_volume_cm3": volume_total,
+        "item_count": item_count,
+        "single_product_id": next(iter(product_ids)) if len(product_ids) == 1 else None,
+        "dominant_type_code": _dominant_type_code_for_items(items) if items else "",
+    }
+
+
+def apply_carton_totals(carton, items):
+    for field_name, value in compute_carton_totals(items).items():
+        setattr(carton, field_name, value)
+    return carton
+
+
+def refresh_carton_totals(carton):
+    """Recompute the stored item aggregates of ``carton`` and save them."""
+    apply_carton_totals(carton, _carton_items_for_totals(carton))
+    carton.save(update_fields=list(CARTON_TOTAL_FIELDS))
+    return carton
+
+
+def rebuild_carton_totals(queryset=None, *, batch_size=500):
+    """Recompute the stored aggregates of every carton in ``queryset``, batch by batch.
+
+    Returns ``(scanned, changed)``; only cartons whose aggregates moved are written.
+    """
+    queryset = Carton.objects.all() if queryset is None else queryset
+    carton_ids = list(queryset.order_by("id").values_list("id", flat=True))
+    scanned = 0
+    changed = 0
+    for start in range(0, len(carton_ids), batch_size):
+        cartons = list(
+            Carton.objects.filter(id__in=carton_ids[start : start + batch_size])
+            .prefetch_related("cartonitem_set__product_lot__product__category__parent")
+            .order_by("id")
+        )
+        stale = []
+        for carton in cartons:
+            totals = compute_carton_totals(carton.cartonitem_set.all())
+            if any(getattr(carton, field_name) != value for field_name, value in totals.items()):
+                apply_carton_totals(carton, carton.cartonitem_set.all())
+                stale.append(carton)
+        if stale:
+            Carton.objects.bulk_update(stale, list(CARTON_TOTAL_FIELDS))
+        scanned += len(cartons)
+        changed += len(stale)
+    return scanned, changed
+
+
 def _resolve_carton_dimensions(*, carton_size=None):
     if carton_size:
         return (
@@ -625,7 +706,8 @@ def pack_carton(
         )
     if shipment is not None:
         sync_shipment_ready_state(shipment)
-    ensure_carton_code(carton)
+    refresh_carton_totals(carton)
+    ensure_carton_code(carton, type_code=carton.dominant_type_code or None)
     return carton
 
 
@@ -661,13 +743,15 @@ def unpack_carton(*, user, carton: Carton):
         )
     carton.cartonitem_set.all().delete()
     carton.shipment = None
-    set_carton_status(
+    apply_carton_totals(carton, [])
+    if not set_carton_status(
         carton=carton,
         new_status=CartonStatus.DRAFT,
-        update_fields=["shipment"],
+        update_fields=["shipment", *CARTON_TOTAL_FIELDS],
         reason="stock_unpack",
         user=user,
-    )
+    ):
+        carton.save(update_fields=list(CARTON_TOTAL_FIELDS))
     if shipment is not None:
         sync_shipment_ready_state(shipment)
     return carton
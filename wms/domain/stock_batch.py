@@ -0,0 +1,251 @@
+"""Batched stock operations.
+
+A scanner unloading a pallet sends hundreds of receive/adjust/transfer/consume
+operations. ``apply_stock_batch`` validates all of them against objects loaded
+with one query per model, then applies them in a single transaction through
+the same domain functions as the single-item endpoints.
+
+In ``atomic`` mode any failure rolls the whole batch back. In ``partial`` mode
+each operation runs in its own savepoint, so failed operations are reported
+and the others are kept.
+"""
+
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+
+from django.db import connection, transaction
+
+from ..models import Location, MovementType, Product, ProductLot, Receipt, Shipment
+from ..signals import coalesce_change_bumps
+from .dto import AdjustStockInput, ConsumeStockInput, ReceiveStockInput, TransferStockInput
+from .stock import StockError, adjust_stock, consume_stock, receive_stock, transfer_stock
+
+STOCK_BATCH_MAX_OPERATIONS = 500
+STOCK_BATCH_MODE_ATOMIC = "atomic"
+STOCK_BATCH_MODE_PARTIAL = "partial"
+STOCK_BATCH_MODES = (STOCK_BATCH_MODE_ATOMIC, STOCK_BATCH_MODE_PARTIAL)
+
+STOCK_OPERATION_RECEIVE = "receive"
+STOCK_OPERATION_ADJUST = "adjust"
+STOCK_OPERATION_TRANSFER = "transfer"
+STOCK_OPERATION_CONSUME = "consume"
+STOCK_OPERATION_INPUTS = {
+    STOCK_OPERATION_RECEIVE: ReceiveStockInput,
+    STOCK_OPERATION_ADJUST: AdjustStockInput,
+    STOCK_OPERATION_TRANSFER: TransferStockInput,
+    STOCK_OPERATION_CONSUME: ConsumeStockInput,
+}
+
+RESULT_APPLIED = "applied"
+RESULT_FAILED = "failed"
+RESULT_ROLLED_BACK = "rolled_back"
+RESULT_SKIPPED = "skipped"
+
+
+@dataclass(frozen=True)
+class StockOperation:
+    op: str
+    payload: ReceiveStockInput | AdjustStockInput | TransferStockInput | ConsumeStockInput
+
+
+@dataclass
+class StockOperationResult:
+    index: int
+    op: str
+    status: str
+    detail: str = ""
+    data: dict = field(default_factory=dict)
+
+
+@dataclass
+class StockBatchResult:
+    mode: str
+    committed: bool
+    results: list[StockOperationResult]
+
+    def count(self, status: str) -> int:
+        return sum(1 for result in self.results if result.status == status)
+
+
+def stock_operation_from_data(data: dict) -> StockOperation:
+    """Build an operation from validated API data (``op`` plus the input fields)."""
+    op = data["op"]
+    input_class = STOCK_OPERATION_INPUTS[op]
+    fields = input_class.__dataclass_fields__
+    return StockOperation(
+        op=op,
+        payload=input_class(**{key: value for key, value in data.items() if key in fields}),
+    )
+
+
+class _BatchObjects:
+    """Every object the batch references, loaded with one query per model."""
+
+    def __init__(self, operations: list[StockOperation]):
+        def ids(attribute):
+            return {
+                value
+                for operation in operations
+                if (value := getattr(operation.payload, attribute, None)) is not None
+            }
+
+        lots = ProductLot.objects.select_related("product", "location")
+        if connection.features.has_select_for_update:
+            lots = lots.select_for_update()
+        self.lots = lots.in_bulk(ids("lot_id"))
+        self.products = Product.objects.in_bulk(ids("product_id"))
+        for lot in self.lots.values():
+            # Share product instances between lots and product-level operations.
+            lot.product = self.products.setdefault(lot.product_id, lot.product)
+        self.locations = Location.objects.in_bulk(ids("location_id"))
+        self.receipts = Receipt.objects.in_bulk(ids("source_receipt_id"))
+        self.shipments = Shipment.objects.in_bulk(ids("shipment_id"))
+
+    @staticmethod
+    def required(objects, object_id, label):
+        if object_id is None:
+            raise StockError(f"{label} requis.")
+        obj = objects.get(object_id)
+        if obj is None:
+            raise StockError(f"{label} introuvable.")
+        return obj
+
+    @classmethod
+    def optional(cls, objects, object_id, label):
+        if object_id is None:
+            return None
+        return cls.required(objects, object_id, label)
+
+
+def _prepare(operation: StockOperation, objects: _BatchObjects, user):
+    """Validate one operation and return the callable that applies it."""
+    payload = operation.payload
+    payload.validate()
+    if operation.op == STOCK_OPERATION_RECEIVE:
+        product = objects.required(objects.products, payload.product_id, "Produit")
+        location = objects.required(objects.locations, payload.location_id, "Emplacement")
+        source_receipt = objects.optional(objects.receipts, payload.source_receipt_id, "Reception")
+
+        def run():
+            lot = receive_stock(
+                user=user,
+                product=product,
+                quantity=payload.quantity,
+                location=location,
+                lot_code=payload.lot_code or "",
+                received_on=payload.received_on,
+                expires_on=payload.expires_on,
+                status=payload.status or None,
+                storage_conditions=payload.storage_conditions,
+                source_receipt=source_receipt,
+            )
+            return {
+                "lot_id": lot.id,
+                "product_id": lot.product_id,
+                "quantity": lot.quantity_on_hand,
+                "location_id": lot.location_id,
+            }
+
+    elif operation.op == STOCK_OPERATION_ADJUST:
+        lot = objects.required(objects.lots, payload.lot_id, "Lot")
+
+        def run():
+            adjust_stock(
+                user=user,
+                lot=lot,
+                delta=payload.delta,
+                reason_code=payload.reason_code,
+                reason_notes=payload.reason_notes,
+            )
+            return {"lot_id": lot.id, "quantity": lot.quantity_on_hand}
+
+    elif operation.op == STOCK_OPERATION_TRANSFER:
+        lot = objects.required(objects.lots, payload.lot_id, "Lot")
+        location = objects.required(objects.locations, payload.location_id, "Emplacement")
+
+        def run():
+            transfer_stock(user=user, lot=lot, to_location=location)
+            return {"lot_id": lot.id, "location_id": lot.location_id}
+
+    elif operation.op == STOCK_OPERATION_CONSUME:
+        product = objects.required(objects.products, payload.product_id, "Produit")
+        shipment = objects.optional(objects.shipments, payload.shipment_id, "Expédition")
+
+        def run():
+            consumed = consume_stock(
+                user=user,
+                product=product,
+                quantity=payload.quantity,
+                movement_type=MovementType.OUT,
+                shipment=shipment,
+                reason_code=payload.reason_code,
+                reason_notes=payload.reason_notes,
+            )
+            for item in consumed:
+                # consume_stock locks its own lot rows; keep the shared instances in step.
+                if item.lot.id in objects.lots:
+                    objects.lots[item.lot.id].quantity_on_hand = item.lot.quantity_on_hand
+            return {
+                "product_id": product.id,
+                "lots": [{"lot_id": item.lot.id, "quantity": item.quantity} for item in consumed],
+            }
+
+    else:
+        raise StockError(f"Opération inconnue: {operation.op}.")
+    return run
+
+
+def _failed(index, operation, exc):
+    return StockOperationResult(index=index, op=operation.op, status=RESULT_FAILED, detail=str(exc))
+
+
+def apply_stock_batch(
+    *, user, operations: list[StockOperation], mode: str = STOCK_BATCH_MODE_ATOMIC
+) -> StockBatchResult:
+    if mode not in STOCK_BATCH_MODES:
+        raise ValueError(f"Unknown stock batch mode: {mode}")
+    if len(operations) > STOCK_BATCH_MAX_OPERATIONS:
+        raise StockError(f"{STOCK_BATCH_MAX_OPERATIONS} opérations maximum par lot.")
+    atomic = mode == STOCK_BATCH_MODE_ATOMIC
+    results: list[StockOperationResult | None] = [None] * len(operations)
+
+    with coalesce_change_bumps(), transaction.atomic():
+        objects = _BatchObjects(operations)
+        runners = {}
+        for index, operation in enumerate(operations):
+            try:
+                runners[index] = _prepare(operation, objects, user)
+            except ValueError as exc:
+                results[index] = _failed(index, operation, exc)
+
+        if atomic and len(runners) < len(operations):
+            runners = {}
+        for index, run in runners.items():
+            operation = operations[index]
+            try:
+                with nullcontext() if atomic else transaction.atomic():
+                    data = run()
+            except ValueError as exc:
+                results[index] = _failed(index, operation, exc)
+                if atomic:
+                    transaction.set_rollback(True)
+                    break
+                continue
+            results[index] = StockOperationResult(
+                index=index, op=operation.op, status=RESULT_APPLIED, data=data
+            )
+
+        committed = not any(
+            result is not None and result.status == RESULT_FAILED for result in results
+        )
+        committed = committed or not atomic
+
+    final_results = []
+    for index, (operation, result) in enumerate(zip(operations, results, strict=True)):
+        if result is None:
+            result = StockOperationResult(index=index, op=operation.op, status=RESULT_SKIPPED)
+        elif result.status == RESULT_APPLIED and not committed:
+            result.status = RESULT_ROLLED_BACK
+            result.data = {}
+        final_results.append(result)
+    return StockBatchResult(mode=mode, committed=committed, results=final_results)
@@ -35,6 +35,7 @@ EMAIL_QUEUE_DEFAULT_PROCESSING_TIMEOUT_SECONDS = 900
 EMAIL_DELIVERY_MODE_DIRECT_OR_QUEUE = "direct_or_queue"
 EMAIL_DELIVERY_MODE_DIRECT_ONLY = "direct_only"
 ORDER_NOTIFICATION_GROUP_DEFAULT = "Mail_Order_Staff"
+SHIPMENT_STATUS_UPDATE_GROUP_DEFAULT = "Shipment_Status_Update"
 
 EMAIL_PAYLOAD_SUBJECT_KEY = "subject"
 EMAIL_PAYLOAD_MESSAGE_KEY = "message"
@@ -49,7 +50,7 @@ PROCESS_RESULT_RETRIED = "retried"
 PROCESS_RESULT_DEFERRED = "deferred"
 
 
-def _email_delivery_mode():
+def get_email_delivery_mode():
     configured_value = getattr(
         settings,
         "EMAIL_DELIVERY_MODE",
@@ -81,7 +82,7 @@ def get_group_emails(group_name, *, require_staff=True):
     }
     if require_staff:
         filters["is_staff"] = True
-    return _normalize_recipients(
+    return normalize_recipients(
         list(User.objects.filter(**filters).exclude(email="").values_list("email", flat=True))
     )
 
@@ -92,12 +93,23 @@ def get_order_admin_emails():
         "ORDER_NOTIFICATION_GROUP_NAME",
         ORDER_NOTIFICATION_GROUP_DEFAULT,
     )
-    return _normalize_recipients(
+    return normalize_recipients(
         get_admin_emails() + get_group_emails(group_name, require_staff=True)
     )
 
 
-def _normalize_recipients(recipient):
+def get_shipment_status_admin_emails():
+    group_name = getattr(
+        settings,
+        "SHIPMENT_STATUS_UPDATE_GROUP_NAME",
+        SHIPMENT_STATUS_UPDATE_GROUP_DEFAULT,
+    )
+    return normalize_recipients(
+        get_admin_emails() + get_group_emails(group_name, require_staff=True)
+    )
+
+
+def normalize_recipients(recipient):
     recipients = recipient
     if isinstance(recipients, str):
         recipients = [recipients]
@@ -140,7 +152,7 @@ def _safe_int(value, *, default, minimum):
     return max(minimum, int_value)
 
 
-def _email_queue_config(
+def email_queue_config(
     *,
     max_attempts=None,
     retry_base_seconds=None,
@@ -214,7 +226,7 @@ def _set_queue_meta(payload, *, attempts, next_attempt_at):
     }
 
 
-def _compute_retry_delay_seconds(*, attempts, retry_base_seconds, retry_max_seconds):
+def compute_retry_delay_seconds(*, attempts, retry_base_seconds, retry_max_seconds):
     power = max(0, attempts - 1)
     delay = retry_base_seconds * (2**power)
     return min(retry_max_seconds, delay)
@@ -322,7 +334,7 @@ def _apply_send_result(*, event, payload, meta, queue_config):
         )
         return PROCESS_RESULT_FAILED
 
-    retry_delay = _compute_retry_delay_seconds(
+    retry_delay = compute_retry_delay_seconds(
         attempts=attempts,
         retry_base_seconds=queue_config["retry_base_seconds"],
         retry_max_seconds=queue_config["retry_max_seconds"],
@@ -416,7 +428,7 @@ def _send_with_brevo(*, subject, message, recipients, html_message=None, tags=No
 
 
 def send_email_safe(*, subject, message, recipient, html_message=None, tags=None):
-    recipients = _normalize_recipients(recipient)
+    recipients = normalize_recipients(recipient)
     if not recipients:
         return False
     subject_text = _coerce_queue_text(subject)
@@ -464,7 +476,7 @@ def send_or_enqueue_email_safe(
         tags=tags,
     ):
         return True
-    if _email_delivery_mode() == EMAIL_DELIVERY_MODE_DIRECT_ONLY:
+    if get_email_delivery_mode() == EMAIL_DELIVERY_MODE_DIRECT_ONLY:
         return False
     return enqueue_email_safe(
         subject=subject,
@@ -476,10 +488,10 @@ def send_or_enqueue_email_safe(
 
 
 def enqueue_email_safe(*, subject, message, recipient, html_message=None, tags=None):
-    recipients = _normalize_recipients(recipient)
+    recipients = normalize_recipients(recipient)
     if not recipients:
         return False
-    if _email_delivery_mode() == EMAIL_DELIVERY_MODE_DIRECT_ONLY:
+    if get_email_delivery_mode() == EMAIL_DELIVERY_MODE_DIRECT_ONLY:
         return send_email_safe(
             subject=subject,
             message=message,
@@ -516,7 +528,7 @@ def process_email_queue(
     processing_timeout_seconds=None,
 ):
     safe_limit = _coerce_process_limit(limit)
-    queue_config = _email_queue_config(
+    queue_config = email_queue_config(
         max_attempts=max_attempts,
         retry_base_seconds=retry_base_seconds,
         retry_max_seconds=retry_max_seconds,
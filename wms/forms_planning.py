@@ -6,6 +6,7 @@ from .models import (
     CommunicationDraft,
     CommunicationDraftStatus,
     PlanningAssignment,
+    PlanningParameterSet,
     PlanningRun,
     PlanningVersionStatus,
 )
@@ -101,6 +102,41 @@ class PlanningVersionCloneForm(forms.Form):
     )
 
 
+class PlanningScenarioForm(forms.Form):
+    parameter_sets = forms.ModelMultipleChoiceField(
+        queryset=PlanningParameterSet.objects.none(),
+        required=False,
+        label=_("Jeux de parametres a comparer"),
+        widget=forms.CheckboxSelectMultiple,
+    )
+    seeds = forms.CharField(
+        required=False,
+        label=_("Graines solveur"),
+        help_text=_("Valeurs separees par des virgules, ex. 7,42"),
+    )
+
+    def __init__(self, *args, run=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        queryset = PlanningParameterSet.objects.order_by("name", "id")
+        if run is not None and run.parameter_set_id:
+            queryset = queryset.exclude(pk=run.parameter_set_id)
+        self.fields["parameter_sets"].queryset = queryset
+
+    def clean_seeds(self):
+        seeds = []
+        for raw in self.cleaned_data["seeds"].split(","):
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                seeds.append(int(raw))
+            except ValueError as exc:
+                raise forms.ValidationError(
+                    _("Graine invalide : %(value)s"), params={"value": raw}
+                ) from exc
+        return seeds
+
+
 class PlanningCommunicationDraftForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -3,27 +3,23 @@ import csv
 import io
 import re
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
 from io import BytesIO
 
-try:
-    from openpyxl import load_workbook
-except ImportError:  # pragma: no cover - optional dependency at runtime
-    load_workbook = None
+from .lazy_imports import lazy_attribute, lazy_module
+from .process_pools import can_use_process_pool
 
-try:
-    import xlrd
-except ImportError:  # pragma: no cover - optional dependency at runtime
-    xlrd = None
-
-try:
-    import pdfplumber
-except ImportError:  # pragma: no cover - optional dependency at runtime
-    pdfplumber = None
+load_workbook = lazy_attribute("openpyxl", "load_workbook")
+xlrd = lazy_module("xlrd")
+pdfplumber = lazy_module("pdfplumber")
 
 
 TRUE_VALUES = {"true", "1", "yes", "y", "oui", "o", "vrai"}
 FALSE_VALUES = {"false", "0", "no", "n", "non", "faux"}
+PDF_EXTRACT_MAX_WORKERS = 4
+PDF_PAGES_PER_CHUNK = 10
+PDF_PARALLEL_MIN_PAGES = 20
 
 
 def normalize_header(value):
@@ -97,7 +93,7 @@ def iter_csv_rows(data, delimiter=";"):
 
 
 def iter_xlsx_rows(data):
-    if load_workbook is None:
+    if not load_workbook:
         raise ValueError("openpyxl is required to import Excel files.")
     workbook = load_workbook(BytesIO(data), data_only=True)
     sheet = workbook.active
@@ -117,7 +113,7 @@ def iter_xlsx_rows(data):
 
 
 def iter_xls_rows(data):
-    if xlrd is None:
+    if not xlrd:
         raise ValueError("xlrd is required to import .xls files.")
     workbook = xlrd.open_workbook(file_contents=data)
     sheet = workbook.sheet_by_index(0)
@@ -184,7 +180,7 @@ def _extract_csv_table(data):
 
 
 def _extract_xlsx_table(data, sheet_name=None, header_row=1):
-    if load_workbook is None:
+    if not load_workbook:
         raise ValueError("openpyxl est requis pour importer .xlsx/.xlsm.")
     workbook = load_workbook(BytesIO(data), data_only=True)
     if sheet_name:
@@ -215,7 +211,7 @@ def _extract_xlsx_table(data, sheet_name=None, header_row=1):
 
 
 def _extract_xls_table(data, sheet_name=None, header_row=1):
-    if xlrd is None:
+    if not xlrd:
         raise ValueError("xlrd est requis pour importer .xls.")
     workbook = xlrd.open_workbook(file_contents=data)
     if sheet_name:
@@ -239,49 +235,94 @@ def _extract_xls_table(data, sheet_name=None, header_row=1):
     return headers, rows
 
 
-def _extract_pdf_table(data, page_start=None, page_end=None):
-    if pdfplumber is None:
+def _pdf_page_table(page):
+    table = page.extract_table()
+    if table and len(table) > 1:
+        return table
+    text = page.extract_text() or ""
+    if text:
+        lines = [line for line in text.splitlines() if line.strip()]
+        if len(lines) > 1:
+            return [re.split(r"\s{2,}", line.strip()) for line in lines]
+    return None
+
+
+def _extract_pdf_page_range(data, start, end):
+    # Process-pool entry point: this module must stay importable without Django.
+    with pdfplumber.open(BytesIO(data), pages=list(range(start, end + 1))) as pdf:
+        return [_pdf_page_table(page) for page in pdf.pages]
+
+
+def _pdf_page_chunks(start, end):
+    for chunk_start in range(start, end + 1, PDF_PAGES_PER_CHUNK):
+        yield chunk_start, min(chunk_start + PDF_PAGES_PER_CHUNK - 1, end)
+
+
+def _iter_pdf_page_tables(data, page_start=None, page_end=None, max_workers=None):
+    """Yield one raw table (or ``None``) per selected page, in page order.
+
+    Long ranges are split into chunks parsed in a process pool; results are yielded
+    as soon as the next chunk in order is ready.
+    """
+    if not pdfplumber:
         raise ValueError("pdfplumber est requis pour importer des PDF texte.")
+    if max_workers is None:
+        max_workers = PDF_EXTRACT_MAX_WORKERS
     with pdfplumber.open(BytesIO(data)) as pdf:
         total_pages = len(pdf.pages)
         start = page_start or 1
         end = page_end or total_pages
         if start < 1 or end < start or end > total_pages:
             raise ValueError("Plage de pages PDF invalide.")
-        pages = pdf.pages[start - 1 : end]
-        tables = []
-        for page in pages:
-            table = page.extract_table()
-            if table and len(table) > 1:
-                tables.append(table)
-                continue
-            text = page.extract_text() or ""
-            if text:
-                lines = [line for line in text.splitlines() if line.strip()]
-                if len(lines) > 1:
-                    split_rows = [re.split(r"\s{2,}", line.strip()) for line in lines]
-                    tables.append(split_rows)
-        if not tables:
-            raise ValueError("PDF scanne non supporte (aucun texte detecte).")
+        if not can_use_process_pool(
+            max_workers=max_workers,
+            task_count=end - start + 1,
+            min_tasks=PDF_PARALLEL_MIN_PAGES,
+        ):
+            for page in pdf.pages[start - 1 : end]:
+                yield _pdf_page_table(page)
+            return
+    chunks = list(_pdf_page_chunks(start, end))
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        futures = [
+            executor.submit(_extract_pdf_page_range, data, chunk_start, chunk_end)
+            for chunk_start, chunk_end in chunks
+        ]
+        for future in futures:
+            yield from future.result()
+
+
+def _extract_pdf_table(data, page_start=None, page_end=None, max_workers=None):
     headers = None
     rows = []
-    for table in tables:
+    max_len = 0
+    found_table = False
+    for table in _iter_pdf_page_tables(data, page_start, page_end, max_workers):
+        if table is None:
+            continue
+        found_table = True
         if not table:
             continue
+        first_row = [_coerce_cell(cell) for cell in table[0]]
+        # The header is detected once; pages repeating it only contribute their body.
         if headers is None:
-            headers = table[0]
-            rows.extend(table[1:])
+            headers = first_row
+            body = table[1:]
         else:
-            rows.extend(table[1:] if table[0] == headers else table)
+            body = table[1:] if first_row == headers else table
+        for row in body:
+            row = [_coerce_cell(cell) for cell in row]
+            max_len = max(max_len, len(row))
+            rows.append(row)
+    if not found_table:
+        raise ValueError("PDF scanne non supporte (aucun texte detecte).")
     if headers is None:
         raise ValueError("Impossible d'extraire un tableau du PDF.")
-    max_len = max(len(headers), *(len(row) for row in rows)) if rows else len(headers)
-    headers = _sanitize_headers(headers, row_length=max_len)
-    normalized_rows = []
+    max_len = max(max_len, len(headers))
     for row in rows:
-        padded = list(row) + [""] * (max_len - len(row))
-        normalized_rows.append([_coerce_cell(cell) for cell in padded])
-    return headers, normalized_rows
+        if len(row) < max_len:
+            row.extend([""] * (max_len - len(row)))
+    return _sanitize_headers(headers, row_length=max_len), rows
 
 
 def extract_tabular_data(data, extension, sheet_name=None, header_row=1, pdf_pages=None):
@@ -301,7 +342,7 @@ def extract_tabular_data(data, extension, sheet_name=None, header_row=1, pdf_pag
 
 
 def get_pdf_page_count(data):
-    if pdfplumber is None:
+    if not pdfplumber:
         raise ValueError("pdfplumber est requis pour importer des PDF texte.")
     with pdfplumber.open(BytesIO(data)) as pdf:
         return len(pdf.pages)
@@ -309,14 +350,14 @@ def get_pdf_page_count(data):
 
 def list_excel_sheets(data, extension):
     if extension in {".xlsx", ".xlsm"}:
-        if load_workbook is None:
+        if not load_workbook:
             raise ValueError("openpyxl est requis pour importer .xlsx/.xlsm.")
         workbook = load_workbook(BytesIO(data), data_only=True)
         sheet_names = list(workbook.sheetnames)
         workbook.close()
         return sheet_names
     if extension == ".xls":
-        if xlrd is None:
+        if not xlrd:
             raise ValueError("xlrd est requis pour importer .xls.")
         workbook = xlrd.open_workbook(file_contents=data)
         return workbook.sheet_names()
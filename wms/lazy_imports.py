@@ -0,0 +1,77 @@
+"""Deferred imports for heavy optional dependencies.
+
+openpyxl, pdfplumber, pypdf, xlrd, OR-Tools, qrcode/Pillow and pandas cost
+seconds of import time that every web worker and ``manage.py`` run would pay
+even though only a few code paths use them. Modules bind these names at import
+time through ``lazy_module``/``lazy_attribute``; the dependency is imported on
+first attribute access or call.
+
+A proxy is truthy only when its dependency is installed, so the existing
+``if not dependency: raise ...`` guards keep working, as does patching the
+module-level name in tests.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from functools import cache
+
+
+@cache
+def is_available(module_name: str) -> bool:
+    # Only the top-level package is located so that the check never imports anything.
+    return importlib.util.find_spec(module_name.partition(".")[0]) is not None
+
+
+class LazyModule:
+    def __init__(self, module_name: str):
+        self._module_name = module_name
+        self._module = None
+
+    def resolve(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._module_name)
+        return self._module
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __bool__(self) -> bool:
+        return is_available(self._module_name)
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self._module_name!r}>"
+
+
+class LazyAttribute:
+    def __init__(self, module_name: str, attribute: str):
+        self._module = LazyModule(module_name)
+        self._attribute = attribute
+
+    def resolve(self):
+        return getattr(self._module.resolve(), self._attribute)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __bool__(self) -> bool:
+        return bool(self._module)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._module._module_name}.{self._attribute}>"
+
+
+def lazy_module(module_name: str) -> LazyModule:
+    return LazyModule(module_name)
+
+
+def lazy_attribute(module_name: str, attribute: str) -> LazyAttribute:
+    return LazyAttribute(module_name, attribute)
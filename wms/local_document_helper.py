@@ -1,13 +1,41 @@
 from __future__ import annotations
 
-from django.http import Http404, HttpResponse, JsonResponse
+import json
+import re
+import secrets
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core import signing
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 
 from .print_pack_xlsx import XLSX_CONTENT_TYPE
 
 HELPER_REQUEST_PARAM = "helper"
 HELPER_DOCUMENT_PARAM = "helper_document"
+HELPER_JOB_PARAM = "helper_job"
+HELPER_JOB_TOKEN_SALT = "wms.local_document_helper.job"  # nosec B105
+HELPER_JOB_MANIFEST_NAME = "manifest.json"
+DEFAULT_HELPER_JOB_TTL_SECONDS = 600
+HELPER_JOB_STREAM_CHUNK_SIZE = 64 * 1024
 LOCAL_DOCUMENT_HELPER_ORIGIN = "127.0.0.1:38555"
 
+_HELPER_JOB_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+_BYTE_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class _RangeNotSatisfiable(Exception):
+    pass
+
 
 def is_local_helper_job_request(request) -> bool:
     return str(request.GET.get(HELPER_REQUEST_PARAM) or "").strip() == "1"
@@ -35,12 +63,17 @@ def build_local_helper_job_response(
     carton=None,
 ) -> JsonResponse:
     documents = list(render_documents())
+    job_token = _helper_job_token(request, store_helper_job(documents))
     merge = len(documents) > 1
     payload = {
         "documents": [
             {
                 "filename": entry.filename,
-                "download_url": _helper_document_download_url(request, index),
+                "download_url": _helper_document_download_url(
+                    request,
+                    index,
+                    job_token=job_token,
+                ),
             }
             for index, entry in enumerate(documents)
         ],
@@ -65,6 +98,12 @@ def build_local_helper_document_response(
     if document_index is None:
         raise Http404("Helper document index is required.")
 
+    stored_document = _load_stored_helper_document(request, document_index)
+    if stored_document is not None:
+        path, filename = stored_document
+        return _stored_helper_document_response(request, path=path, filename=filename)
+
+    # Links without a (still valid) job token fall back to rendering the whole pack.
     documents = list(render_documents())
     if document_index >= len(documents):
         raise Http404("Helper document was not found.")
@@ -75,10 +114,158 @@ def build_local_helper_document_response(
     return response
 
 
-def _helper_document_download_url(request, document_index: int) -> str:
+def store_helper_job(documents) -> str:
+    """Persist rendered helper documents on disk and return the new job id.
+
+    Jobs older than ``LOCAL_DOCUMENT_HELPER_JOB_TTL_SECONDS`` are purged first, so the
+    store never grows beyond the documents requested within one TTL window.
+    """
+    purge_expired_helper_jobs()
+    job_id = secrets.token_hex(16)
+    job_dir = _helper_job_root() / job_id
+    job_dir.mkdir(parents=True)
+    manifest = []
+    for index, document in enumerate(documents):
+        (job_dir / f"{index}.xlsx").write_bytes(document.payload)
+        manifest.append({"filename": document.filename, "size": len(document.payload)})
+    (job_dir / HELPER_JOB_MANIFEST_NAME).write_text(
+        json.dumps({"documents": manifest}),
+        encoding="utf-8",
+    )
+    return job_id
+
+
+def purge_expired_helper_jobs(*, now: float | None = None) -> int:
+    root = _helper_job_root()
+    if not root.is_dir():
+        return 0
+    cutoff = (time.time() if now is None else now) - _helper_job_ttl_seconds()
+    removed = 0
+    for job_dir in root.iterdir():
+        if not _HELPER_JOB_ID_RE.match(job_dir.name):
+            continue
+        try:
+            expired = job_dir.stat().st_mtime < cutoff
+        except FileNotFoundError:
+            continue
+        if expired:
+            shutil.rmtree(job_dir, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+def _helper_job_root() -> Path:
+    configured = str(getattr(settings, "LOCAL_DOCUMENT_HELPER_JOB_DIR", "") or "").strip()
+    if configured:
+        return Path(configured)
+    return Path(tempfile.gettempdir()) / "asf-wms-helper-jobs"
+
+
+def _helper_job_ttl_seconds() -> int:
+    ttl = getattr(settings, "LOCAL_DOCUMENT_HELPER_JOB_TTL_SECONDS", DEFAULT_HELPER_JOB_TTL_SECONDS)
+    try:
+        return max(1, int(ttl))
+    except (TypeError, ValueError):
+        return DEFAULT_HELPER_JOB_TTL_SECONDS
+
+
+def _helper_job_token(request, job_id: str) -> str:
+    return signing.dumps({"job": job_id, "path": request.path}, salt=HELPER_JOB_TOKEN_SALT)
+
+
+def _load_stored_helper_document(request, document_index: int) -> tuple[Path, str] | None:
+    raw_token = str(request.GET.get(HELPER_JOB_PARAM) or "").strip()
+    if not raw_token:
+        return None
+    try:
+        payload = signing.loads(
+            raw_token,
+            salt=HELPER_JOB_TOKEN_SALT,
+            max_age=_helper_job_ttl_seconds(),
+        )
+    except signing.BadSignature:
+        return None
+    job_id = str(payload.get("job") or "")
+    if payload.get("path") != request.path or not _HELPER_JOB_ID_RE.match(job_id):
+        return None
+    job_dir = _helper_job_root() / job_id
+    try:
+        manifest = json.loads((job_dir / HELPER_JOB_MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+    documents = manifest.get("documents") or []
+    if document_index >= len(documents):
+        raise Http404("Helper document was not found.")
+    path = job_dir / f"{document_index}.xlsx"
+    if not path.is_file():
+        return None
+    return path, str(documents[document_index].get("filename") or path.name)
+
+
+def _parse_byte_range(header: str, size: int) -> tuple[int, int] | None:
+    match = _BYTE_RANGE_RE.match(str(header or "").strip())
+    if match is None:
+        return None
+    raw_start, raw_end = match.groups()
+    if not raw_start and not raw_end:
+        return None
+    if not raw_start:
+        suffix_length = int(raw_end)
+        if suffix_length == 0:
+            raise _RangeNotSatisfiable
+        return max(0, size - suffix_length), size - 1
+    start = int(raw_start)
+    end = min(int(raw_end), size - 1) if raw_end else size - 1
+    if start >= size or end < start:
+        raise _RangeNotSatisfiable
+    return start, end
+
+
+def _iter_file_range(handle, length: int):
+    try:
+        while length > 0:
+            chunk = handle.read(min(HELPER_JOB_STREAM_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        handle.close()
+
+
+def _stored_helper_document_response(request, *, path: Path, filename: str) -> HttpResponse:
+    size = path.stat().st_size
+    try:
+        byte_range = _parse_byte_range(request.headers.get("Range"), size)
+    except _RangeNotSatisfiable:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    handle = path.open("rb")
+    if byte_range is None:
+        response = FileResponse(handle, content_type=XLSX_CONTENT_TYPE)
+    else:
+        start, end = byte_range
+        handle.seek(start)
+        response = StreamingHttpResponse(
+            _iter_file_range(handle, end - start + 1),
+            status=206,
+            content_type=XLSX_CONTENT_TYPE,
+        )
+        response["Content-Length"] = str(end - start + 1)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    response["Accept-Ranges"] = "bytes"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def _helper_document_download_url(request, document_index: int, *, job_token: str = "") -> str:
     params = request.GET.copy()
     params.pop(HELPER_REQUEST_PARAM, None)
     params[HELPER_DOCUMENT_PARAM] = str(document_index)
+    if job_token:
+        params[HELPER_JOB_PARAM] = job_token
     return f"{request.path}?{params.urlencode()}"
 
 
@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from wms.models import StockCheckpointPeriod
+from wms.stock_ledger import (
+    backfill_stock_checkpoints,
+    local_day_start,
+    pending_checkpoint_boundaries,
+)
+
+
+def _parse_day_option(options, name):
+    value = options[name]
+    if not value:
+        return None
+    parsed = parse_date(value)
+    if parsed is None:
+        raise CommandError(f"Invalid --{name} date.")
+    return parsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the missing stock ledger checkpoints from the first stock movement "
+        "(or --since) up to today (or --until)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--period",
+            choices=StockCheckpointPeriod.values,
+            default=StockCheckpointPeriod.DAILY,
+        )
+        parser.add_argument("--since", default="", help="First day to cover (YYYY-MM-DD).")
+        parser.add_argument("--until", default="", help="Last day to cover (YYYY-MM-DD).")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List the missing checkpoints without writing them.",
+        )
+        parser.add_argument(
+            "--apply",
+            action="store_true",
+            help="Write the missing checkpoints.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = bool(options.get("dry_run"))
+        apply = bool(options.get("apply"))
+        if dry_run and apply:
+            raise CommandError("Choose either --dry-run or --apply, not both.")
+        since_day = _parse_day_option(options, "since")
+        until_day = _parse_day_option(options, "until")
+        if since_day and until_day and until_day < since_day:
+            raise CommandError("--until must be after or equal to --since.")
+
+        since = local_day_start(since_day) if since_day else None
+        until = timezone.now()
+        if until_day:
+            until = min(until, local_day_start(until_day + timedelta(days=1)))
+        period = options["period"]
+
+        self.stdout.write(f"Stock checkpoints [{'APPLY' if apply else 'DRY RUN'}] ({period})")
+        if not apply:
+            pending = pending_checkpoint_boundaries(period, since=since, until=until)
+            self.stdout.write(f"Missing checkpoints: {len(pending)}")
+            if pending:
+                self.stdout.write(
+                    f"Range: {pending[0]:%Y-%m-%d %H:%M} -> {pending[-1]:%Y-%m-%d %H:%M}"
+                )
+            return
+
+        checkpoints = backfill_stock_checkpoints(period, since=since, until=until)
+        for checkpoint in checkpoints:
+            self.stdout.write(
+                f"- {timezone.localtime(checkpoint.as_of):%Y-%m-%d %H:%M}: "
+                f"{checkpoint.lot_count} lot(s), {checkpoint.total_quantity} unit(s)"
+            )
+        self.stdout.write(f"Checkpoints written: {len(checkpoints)}")
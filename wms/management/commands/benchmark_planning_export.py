@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+import platform
+import tempfile
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from wms.lazy_imports import lazy_attribute
+from wms.planning.exports import (
+    PLANNING_EXPORT_HEADERS,
+    PLANNING_SHEET_TITLE,
+    write_planning_workbook,
+)
+
+Workbook = lazy_attribute("openpyxl", "Workbook")
+
+BENCHMARK_FORMAT_VERSION = 1
+BENCHMARK_WEEK_START = date(2026, 3, 9)
+BENCHMARK_DESTINATIONS = ("ABJ", "DKR", "NSI")
+
+
+def _synthetic_rows(row_count: int):
+    for index in range(row_count):
+        yield [
+            (BENCHMARK_WEEK_START + timedelta(days=index % 7)).isoformat(),
+            f"AF{800 + index % 40}",
+            BENCHMARK_DESTINATIONS[index % len(BENCHMARK_DESTINATIONS)],
+            "10:15",
+            f"Volunteer {index % 60:03d}",
+            str(260000 + index),
+            f"Shipper {index % 25}",
+            1 + index % 6,
+            "proposed",
+            "solver",
+            "",
+        ]
+
+
+def _write_in_memory_workbook(rows, file_path: Path) -> Path:
+    """The regular openpyxl workbook the export used before streaming."""
+    workbook = Workbook()
+    try:
+        sheet = workbook.active
+        sheet.title = PLANNING_SHEET_TITLE
+        sheet.append(list(PLANNING_EXPORT_HEADERS))
+        for row in rows:
+            sheet.append(row)
+        workbook.save(file_path)
+    finally:
+        workbook.close()
+    return file_path
+
+
+def _measure(repeat: int, writer, row_count: int, file_path: Path) -> dict[str, float | int]:
+    best = None
+    for _iteration in range(repeat):
+        started = perf_counter()
+        writer(_synthetic_rows(row_count), file_path)
+        elapsed = perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    try:
+        writer(_synthetic_rows(row_count), file_path)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "seconds": round(best, 6),
+        "peak_bytes": peak,
+        "file_bytes": file_path.stat().st_size,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the streaming (write-only) planning workbook export against a regular "
+        "in-memory openpyxl workbook (time and peak memory) and print the report as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5000)
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--output", default="", help="Write the JSON report to this path")
+
+    def handle(self, *args, **options):
+        for option_name in ("rows", "repeat"):
+            if options[option_name] < 1:
+                raise CommandError(f"--{option_name} must be at least 1.")
+
+        row_count = options["rows"]
+        with tempfile.TemporaryDirectory(prefix="asf_wms_export_bench_") as tmp_dir:
+            results = {
+                "in_memory": _measure(
+                    options["repeat"],
+                    _write_in_memory_workbook,
+                    row_count,
+                    Path(tmp_dir) / "in-memory.xlsx",
+                ),
+                "streaming": _measure(
+                    options["repeat"],
+                    write_planning_workbook,
+                    row_count,
+                    Path(tmp_dir) / "streaming.xlsx",
+                ),
+            }
+
+        in_memory_peak = results["in_memory"]["peak_bytes"]
+        streaming_peak = results["streaming"]["peak_bytes"]
+        report = {
+            "format_version": BENCHMARK_FORMAT_VERSION,
+            "benchmark": "planning_export",
+            "generated_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "dataset": {"rows": row_count},
+            "results": results,
+            "peak_memory_ratio": round(in_memory_peak / streaming_peak, 2)
+            if streaming_peak
+            else None,
+        }
+
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+        if options["output"]:
+            Path(options["output"]).write_text(f"{rendered}\n", encoding="utf-8")
+        self.stdout.write(rendered)
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import json
+import platform
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from wms.planning.config import LEGACY_EQUIV_CAPACITY_PER_VOLUNTEER
+from wms.planning.payload_model import PlanningPayload
+from wms.planning.rules import (
+    compute_compatibility,
+    shipment_is_compatible_with_flight,
+    volunteer_is_compatible_with_flight,
+)
+
+BENCHMARK_FORMAT_VERSION = 1
+BENCHMARK_WEEK_START = date(2026, 3, 9)
+BENCHMARK_DESTINATIONS = ("ABJ", "DKR", "NSI")
+BENCHMARK_DEPARTURE_TIMES = ("09:40", "10:15", "13:30", "16:05", "23:10")
+
+
+def _synthetic_payload(*, shipment_count: int, volunteer_count: int, flight_count: int) -> dict:
+    week = [(BENCHMARK_WEEK_START + timedelta(days=day)).isoformat() for day in range(7)]
+    flights = []
+    for index in range(flight_count):
+        departure_date = week[index % 7]
+        departure_time = BENCHMARK_DEPARTURE_TIMES[index % len(BENCHMARK_DEPARTURE_TIMES)]
+        flight_number = f"AF{800 + index}"
+        flights.append(
+            {
+                "snapshot_id": 3000 + index,
+                "flight_number": flight_number,
+                "departure_date": departure_date,
+                "departure_time": departure_time,
+                "origin_iata": "CDG",
+                "destination_iata": BENCHMARK_DESTINATIONS[index % len(BENCHMARK_DESTINATIONS)],
+                "routing": "CDG-ABJ",
+                "route_pos": 1,
+                "physical_flight_key": f"{departure_date}|{departure_time}|{flight_number}",
+                "capacity_units": 10 + (index % 4) * 4,
+                "max_cartons_per_flight": 12,
+                "weekly_frequency": 3,
+                "allowed_weekdays": ["mon", "tue", "wed", "thu", "fri", "sat"],
+                "payload": {},
+            }
+        )
+    shipments = [
+        {
+            "snapshot_id": 1000 + index,
+            "reference": str(260000 + index),
+            "shipper_name": f"Shipper {index % 5}",
+            "destination_iata": BENCHMARK_DESTINATIONS[index % len(BENCHMARK_DESTINATIONS)],
+            "priority": index % 4,
+            "priority_rank": index % 6,
+            "carton_count": 1 + index % 6,
+            "equivalent_units": 1 + index % 8,
+            "payload": {
+                "legacy_date_impression": week[index % 7],
+                "legacy_date_conditionnement": week[(index + 2) % 7],
+                "legacy_date_depart_mag": "",
+            },
+        }
+        for index in range(shipment_count)
+    ]
+    volunteers = [
+        {
+            "snapshot_id": 2000 + index,
+            "label": f"Volunteer {index:03d}",
+            "max_colis_vol": None if index % 4 == 0 else 6 + (index % 3) * 4,
+            "availability_summary": {
+                "slots": [
+                    {"date": day, "start_time": "06:00", "end_time": "18:00"}
+                    for offset, day in enumerate(week)
+                    if (offset + index) % 3 != 0
+                ],
+                "unavailable_dates": [week[index % 7]] if index % 5 == 0 else [],
+            },
+            "payload": {"legacy_id": index},
+        }
+        for index in range(volunteer_count)
+    ]
+    return {
+        "run_id": 1,
+        "shipments": shipments,
+        "volunteers": volunteers,
+        "flights": flights,
+        "destination_rules_by_iata": {},
+    }
+
+
+def _dict_compatibility(payload: dict) -> dict[int, list[tuple[int, int]]]:
+    """Pair-by-pair evaluation on the JSON dicts, as compatibility was computed before."""
+    compatibility = {}
+    for shipment in payload["shipments"]:
+        pairs = []
+        for flight in payload["flights"]:
+            if not shipment_is_compatible_with_flight(shipment, flight):
+                continue
+            for volunteer in payload["volunteers"]:
+                capacity = volunteer.get("max_colis_vol")
+                if capacity is None:
+                    capacity = LEGACY_EQUIV_CAPACITY_PER_VOLUNTEER
+                if shipment["equivalent_units"] > int(capacity):
+                    continue
+                if not volunteer_is_compatible_with_flight(volunteer, flight):
+                    continue
+                pairs.append((flight["snapshot_id"], volunteer["snapshot_id"]))
+        compatibility[shipment["snapshot_id"]] = pairs
+    return compatibility
+
+
+def _best_seconds(repeat: int, func, *args) -> float:
+    best = None
+    for _iteration in range(repeat):
+        started = perf_counter()
+        func(*args)
+        elapsed = perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _allocated_bytes(func, *args) -> tuple[object, int]:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = func(*args)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    return result, sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the compact planning payload model against the JSON dict payload "
+        "(build time, compatibility time, memory) and print the report as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--shipments", type=int, default=120)
+        parser.add_argument("--volunteers", type=int, default=40)
+        parser.add_argument("--flights", type=int, default=30)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--output", default="", help="Write the JSON report to this path")
+
+    def handle(self, *args, **options):
+        for option_name in ("shipments", "volunteers", "flights", "repeat"):
+            if options[option_name] < 1:
+                raise CommandError(f"--{option_name} must be at least 1.")
+
+        payload = _synthetic_payload(
+            shipment_count=options["shipments"],
+            volunteer_count=options["volunteers"],
+            flight_count=options["flights"],
+        )
+        stored = json.dumps(payload)
+        repeat = options["repeat"]
+
+        dict_payload, dict_bytes = _allocated_bytes(json.loads, stored)
+        planning, model_bytes = _allocated_bytes(PlanningPayload.from_dict, dict_payload)
+        if json.loads(json.dumps(planning.to_dict())) != payload:
+            raise CommandError("Planning payload model does not round-trip to the stored JSON.")
+
+        dict_compatibility = _dict_compatibility(dict_payload)
+        model_compatibility = compute_compatibility(planning)
+        if {key: sorted(pairs) for key, pairs in dict_compatibility.items()} != {
+            key: sorted(pairs) for key, pairs in model_compatibility.items()
+        }:
+            raise CommandError("Planning payload model compatibility differs from the dict rules.")
+
+        timings = {
+            "model_build": _best_seconds(repeat, PlanningPayload.from_dict, dict_payload),
+            "model_to_dict": _best_seconds(repeat, planning.to_dict),
+            "dict_compatibility": _best_seconds(repeat, _dict_compatibility, dict_payload),
+            "model_compatibility": _best_seconds(repeat, compute_compatibility, planning),
+        }
+        dict_total = timings["dict_compatibility"]
+        model_total = timings["model_build"] + timings["model_compatibility"]
+        report = {
+            "format_version": BENCHMARK_FORMAT_VERSION,
+            "benchmark": "planning_payload",
+            "generated_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "dataset": {
+                "shipments": len(payload["shipments"]),
+                "volunteers": len(payload["volunteers"]),
+                "flights": len(payload["flights"]),
+                "candidate_pairs": sum(len(pairs) for pairs in model_compatibility.values()),
+                "stored_json_bytes": len(stored),
+            },
+            "memory": {
+                "dict_payload_bytes": dict_bytes,
+                "model_extra_bytes": model_bytes,
+            },
+            "timings": {phase: round(seconds, 6) for phase, seconds in sorted(timings.items())},
+            "compatibility_speedup": round(dict_total / model_total, 2) if model_total else None,
+        }
+
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+        if options["output"]:
+            Path(options["output"]).write_text(f"{rendered}\n", encoding="utf-8")
+        self.stdout.write(rendered)
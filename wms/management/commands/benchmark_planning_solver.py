@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import json
+import platform
+from datetime import UTC, datetime, time, timedelta
+from pathlib import Path
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from wms.management.commands.seed_planning_demo_data import (
+    DEMO_WEEK_START,
+    DemoShipmentSpec,
+)
+from wms.management.commands.seed_planning_demo_data import (
+    Command as SeedPlanningDemoDataCommand,
+)
+from wms.models import Flight, PlanningRunStatus
+from wms.planning.config import (
+    PLANNING_SOLVER_MAX_TIME_SECONDS,
+    PLANNING_SOLVER_NUM_SEARCH_WORKERS,
+    PLANNING_SOLVER_RANDOM_SEED,
+)
+from wms.planning.payload_model import PlanningPayload
+from wms.planning.rules import (
+    compile_run_solver_payload,
+    compute_compatibility,
+    materialize_solver_snapshots,
+)
+from wms.planning.snapshots import prepare_run_inputs
+from wms.planning.solver import _build_candidates, _solve_candidates
+
+BENCHMARK_FORMAT_VERSION = 1
+BENCHMARK_DESTINATIONS = ("ABJ", "DKR")
+BENCHMARK_PRODUCTS = ("Wheelchair Kit", "School Kit")
+BENCHMARK_DEPARTURE_TIMES = (time(9, 40), time(10, 15), time(13, 30), time(16, 5))
+
+
+class _BenchmarkRollback(Exception):
+    pass
+
+
+def _parse_workers(value: str) -> list[int]:
+    workers = []
+    for raw in str(value or "").split(","):
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            parsed = int(raw)
+        except ValueError as exc:
+            raise CommandError(f"Invalid --workers value: {raw}") from exc
+        if parsed < 1:
+            raise CommandError("--workers values must be positive integers.")
+        workers.append(parsed)
+    return workers or [PLANNING_SOLVER_NUM_SEARCH_WORKERS]
+
+
+def _timed(timings: dict, phase: str, func, *args, **kwargs):
+    started = perf_counter()
+    result = func(*args, **kwargs)
+    timings[phase] = perf_counter() - started
+    return result
+
+
+def _round_timings(timings: dict) -> dict:
+    return {phase: round(seconds, 6) for phase, seconds in sorted(timings.items())}
+
+
+class Command(BaseCommand):
+    help = "Benchmark the planning solver on a synthetic week and print per-phase timings as JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scenario", default="benchmark")
+        parser.add_argument("--shipments", type=int, default=40)
+        parser.add_argument("--volunteers", type=int, default=10)
+        parser.add_argument("--flights", type=int, default=14)
+        parser.add_argument(
+            "--workers",
+            default=str(PLANNING_SOLVER_NUM_SEARCH_WORKERS),
+            help="Comma-separated num_search_workers values to sweep (e.g. 1,4,8)",
+        )
+        parser.add_argument("--seed", type=int, default=PLANNING_SOLVER_RANDOM_SEED)
+        parser.add_argument(
+            "--max-time-seconds",
+            type=float,
+            default=PLANNING_SOLVER_MAX_TIME_SECONDS,
+        )
+        parser.add_argument("--output", default="", help="Write the JSON report to this path")
+        parser.add_argument(
+            "--keep-data",
+            action="store_true",
+            help="Keep the generated synthetic week instead of rolling it back",
+        )
+
+    def handle(self, *args, **options):
+        for option_name in ("shipments", "volunteers", "flights"):
+            if options[option_name] < 1:
+                raise CommandError(f"--{option_name} must be at least 1.")
+        workers = _parse_workers(options["workers"])
+        scenario_slug = slugify(options["scenario"]).strip("-") or "benchmark"
+
+        report = None
+        try:
+            with transaction.atomic():
+                report = self._run_benchmark(
+                    scenario_slug=scenario_slug,
+                    shipment_count=options["shipments"],
+                    volunteer_count=options["volunteers"],
+                    flight_count=options["flights"],
+                    workers=workers,
+                    seed=options["seed"],
+                    max_time_seconds=options["max_time_seconds"],
+                )
+                if not options["keep_data"]:
+                    raise _BenchmarkRollback
+        except _BenchmarkRollback:
+            pass
+
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+        if options["output"]:
+            Path(options["output"]).write_text(f"{rendered}\n", encoding="utf-8")
+        self.stdout.write(rendered)
+
+    def _run_benchmark(
+        self,
+        *,
+        scenario_slug,
+        shipment_count,
+        volunteer_count,
+        flight_count,
+        workers,
+        seed,
+        max_time_seconds,
+    ):
+        setup_timings = {}
+        dataset = _timed(
+            setup_timings,
+            "dataset_seed",
+            self._seed_synthetic_week,
+            scenario_slug=scenario_slug,
+            shipment_count=shipment_count,
+            volunteer_count=volunteer_count,
+            flight_count=flight_count,
+        )
+        run = dataset["run"]
+        _timed(setup_timings, "prepare_run_inputs", prepare_run_inputs, run)
+        run.refresh_from_db()
+        if run.status != PlanningRunStatus.READY:
+            raise CommandError(f"Synthetic week failed validation: {run.validation_summary}")
+
+        phases = {}
+        payload = _timed(phases, "payload_compile", compile_run_solver_payload, run)
+        planning = _timed(phases, "payload_model", PlanningPayload.from_dict, payload)
+        compatibility = _timed(phases, "compatibility", compute_compatibility, planning)
+        candidates = _timed(phases, "candidate_build", _build_candidates, planning, compatibility)
+        _timed(phases, "snapshot_materialize", materialize_solver_snapshots, run)
+
+        sweep = []
+        for num_search_workers in workers:
+            solver_timings = {}
+            entry = {"num_search_workers": num_search_workers}
+            started = perf_counter()
+            try:
+                assignments, result = _solve_candidates(
+                    payload=planning,
+                    compatibility=compatibility,
+                    candidates=candidates,
+                    solver_options={
+                        "num_search_workers": num_search_workers,
+                        "random_seed": seed,
+                        "max_time_seconds": max_time_seconds,
+                    },
+                    timings=solver_timings,
+                )
+            except RuntimeError as exc:
+                entry.update({"status": "ERROR", "error": str(exc)})
+            else:
+                entry.update(
+                    {
+                        "status": result.get("status", ""),
+                        "assignment_count": len(assignments),
+                        "unassigned_count": len(result.get("unassigned_shipment_snapshot_ids", [])),
+                    }
+                )
+            solver_timings["total"] = perf_counter() - started
+            entry["timings"] = _round_timings(solver_timings)
+            sweep.append(entry)
+
+        return {
+            "format_version": BENCHMARK_FORMAT_VERSION,
+            "benchmark": "planning_solver",
+            "generated_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "scenario": scenario_slug,
+            "dataset": {
+                "shipments": len(payload["shipments"]),
+                "volunteers": len(payload["volunteers"]),
+                "flights": len(payload["flights"]),
+                "candidate_pairs": sum(len(pairs) for pairs in compatibility.values()),
+            },
+            "solver": {
+                "random_seed": seed,
+                "max_time_seconds": max_time_seconds,
+            },
+            "setup_timings": _round_timings(setup_timings),
+            "timings": _round_timings(phases),
+            "sweep": sweep,
+        }
+
+    def _seed_synthetic_week(
+        self,
+        *,
+        scenario_slug,
+        shipment_count,
+        volunteer_count,
+        flight_count,
+    ):
+        seeder = SeedPlanningDemoDataCommand()
+        dataset = seeder._seed_dataset(scenario_slug)
+        ref_prefix = dataset["ref_prefix"]
+        destinations = dataset["destinations"]
+
+        for index in range(shipment_count):
+            destination_iata = BENCHMARK_DESTINATIONS[index % len(BENCHMARK_DESTINATIONS)]
+            product_name = BENCHMARK_PRODUCTS[index % len(BENCHMARK_PRODUCTS)]
+            seeder._upsert_shipment(
+                ref_prefix=f"{ref_prefix}-BENCH",
+                spec=DemoShipmentSpec(
+                    suffix=f"{index + 1:04d}",
+                    destination_iata=destination_iata,
+                    ready_at=datetime.combine(
+                        DEMO_WEEK_START + timedelta(days=index % 3),
+                        time(8, 0),
+                        tzinfo=UTC,
+                    ),
+                    carton_codes=tuple(
+                        f"{ref_prefix}-BENCH-{index + 1:04d}-C{carton}"
+                        for carton in range(1, 1 + (index % 3) + 1)
+                    ),
+                    item_quantity=1 + (index % 2),
+                    product_name=product_name,
+                ),
+                shipper_contact=dataset["shipper_contact"],
+                destination=destinations[destination_iata],
+                product_lot=dataset["lots"][product_name],
+                created_by=dataset["planner"],
+            )
+
+        for index in range(volunteer_count):
+            user = seeder._get_or_create_user(
+                username=f"bench-volunteer-{scenario_slug}-{index + 1:03d}",
+                email=f"bench-volunteer-{index + 1:03d}-{scenario_slug}@example.com",
+                first_name="Bench",
+                last_name=f"Volunteer {index + 1:03d}",
+            )
+            seeder._upsert_volunteer(
+                user=user,
+                scenario_slug=scenario_slug,
+                city="Paris",
+                max_colis_vol=6 + (index % 3) * 4,
+                availability_specs=tuple(
+                    (DEMO_WEEK_START + timedelta(days=day), time(6, 0), time(18, 0))
+                    for day in range(7)
+                    if (day + index) % 3 != 0
+                ),
+            )
+
+        for index in range(flight_count):
+            destination_iata = BENCHMARK_DESTINATIONS[index % len(BENCHMARK_DESTINATIONS)]
+            Flight.objects.update_or_create(
+                batch=dataset["batch"],
+                flight_number=f"AF{800 + index}",
+                departure_date=DEMO_WEEK_START + timedelta(days=index % 7),
+                defaults={
+                    "departure_time": BENCHMARK_DEPARTURE_TIMES[
+                        index % len(BENCHMARK_DEPARTURE_TIMES)
+                    ],
+                    "origin_iata": "CDG",
+                    "destination_iata": destination_iata,
+                    "destination": destinations[destination_iata],
+                    "capacity_units": 10 + (index % 4) * 4,
+                },
+            )
+        return dataset
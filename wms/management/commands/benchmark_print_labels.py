@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+import platform
+from pathlib import Path
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from wms.print_context import build_sample_product_label_context
+from wms.print_layouts import DEFAULT_LAYOUTS
+from wms.print_renderer import clear_compiled_layout_cache
+from wms.print_utils import build_label_pages
+
+BENCHMARK_FORMAT_VERSION = 1
+
+
+def _label_contexts(count: int) -> list[dict]:
+    sample = build_sample_product_label_context()
+    return [
+        {**sample, "product_name": f"{sample['product_name']} #{index + 1:04d}"}
+        for index in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    help = "Benchmark product label rendering through build_label_pages and print timings as JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--labels", type=int, default=500)
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument(
+            "--layout",
+            default="product_label",
+            choices=sorted(DEFAULT_LAYOUTS),
+            help="Default layout to render",
+        )
+        parser.add_argument("--output", default="", help="Write the JSON report to this path")
+
+    def handle(self, *args, **options):
+        if options["labels"] < 1:
+            raise CommandError("--labels must be at least 1.")
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be at least 1.")
+
+        layout = DEFAULT_LAYOUTS[options["layout"]]
+        contexts = _label_contexts(options["labels"])
+        runs = []
+        for iteration in range(options["repeat"]):
+            cold = iteration == 0
+            if cold:
+                clear_compiled_layout_cache()
+            started = perf_counter()
+            pages, _page_style = build_label_pages(layout, contexts, block_type=options["layout"])
+            runs.append(
+                {
+                    "cold_cache": cold,
+                    "pages": len(pages),
+                    "seconds": round(perf_counter() - started, 6),
+                }
+            )
+
+        report = {
+            "format_version": BENCHMARK_FORMAT_VERSION,
+            "benchmark": "print_labels",
+            "generated_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "layout": options["layout"],
+            "labels": options["labels"],
+            "runs": runs,
+            "per_label_ms": round(
+                min(run["seconds"] for run in runs) * 1000 / options["labels"],
+                4,
+            ),
+        }
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+        if options["output"]:
+            Path(options["output"]).write_text(f"{rendered}\n", encoding="utf-8")
+        self.stdout.write(rendered)
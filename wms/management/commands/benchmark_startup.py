@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import platform
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from wms.startup_profile import profile_startup, startup_budget_ms
+
+BENCHMARK_FORMAT_VERSION = 1
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure cold process startup (django.setup() plus URL configuration) in a fresh "
+        "interpreter and print the slowest imports as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--limit", type=int, default=15, help="Slowest imports to report")
+        parser.add_argument(
+            "--budget-ms",
+            type=float,
+            default=None,
+            help="Fail when the fastest run exceeds this many milliseconds",
+        )
+        parser.add_argument("--output", default="", help="Write the JSON report to this path")
+
+    def handle(self, *args, **options):
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be at least 1.")
+        if options["limit"] < 1:
+            raise CommandError("--limit must be at least 1.")
+        budget_ms = options["budget_ms"]
+        if budget_ms is None:
+            budget_ms = startup_budget_ms()
+
+        profiles = [profile_startup() for _iteration in range(options["repeat"])]
+        fastest = min(profiles, key=lambda profile: profile.elapsed_ms)
+        heavy_modules = sorted({name for profile in profiles for name in profile.heavy_modules})
+
+        report = {
+            "format_version": BENCHMARK_FORMAT_VERSION,
+            "benchmark": "startup",
+            "generated_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "runs": [{"milliseconds": profile.elapsed_ms} for profile in profiles],
+            "startup_ms": fastest.elapsed_ms,
+            "budget_ms": budget_ms,
+            "heavy_modules": heavy_modules,
+            "slowest_imports": [
+                {
+                    "module": timing.module,
+                    "self_ms": round(timing.self_us / 1000, 3),
+                    "cumulative_ms": round(timing.cumulative_us / 1000, 3),
+                }
+                for timing in fastest.slowest(options["limit"])
+            ],
+        }
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+        if options["output"]:
+            Path(options["output"]).write_text(f"{rendered}\n", encoding="utf-8")
+        self.stdout.write(rendered)
+
+        if heavy_modules:
+            raise CommandError(f"Deferred modules imported at startup: {', '.join(heavy_modules)}.")
+        if fastest.elapsed_ms > budget_ms:
+            raise CommandError(
+                f"Startup took {fastest.elapsed_ms:.0f} ms, over the {budget_ms:.0f} ms budget."
+            )
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import platform
+from pathlib import Path
+from time import perf_counter
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from api.v1.views import ReceiveStockView, StockBatchView
+from wms.models import Location, Product, Warehouse
+
+BENCHMARK_FORMAT_VERSION = 1
+
+
+class _BenchmarkRollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark receiving stock through one API call per item against the batch "
+        "endpoint and print timings as JSON. Data is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=200)
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--output", default="", help="Write the JSON report to this path")
+
+    def handle(self, *args, **options):
+        if options["items"] < 1:
+            raise CommandError("--items must be at least 1.")
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be at least 1.")
+
+        report = None
+        try:
+            with transaction.atomic():
+                report = self._run_benchmark(items=options["items"], repeat=options["repeat"])
+                raise _BenchmarkRollback
+        except _BenchmarkRollback:
+            pass
+
+        rendered = json.dumps(report, indent=2, sort_keys=True)
+        if options["output"]:
+            Path(options["output"]).write_text(f"{rendered}\n", encoding="utf-8")
+        self.stdout.write(rendered)
+
+    def _run_benchmark(self, *, items: int, repeat: int) -> dict:
+        user = get_user_model().objects.create_user(username="benchmark-stock-batch")
+        warehouse = Warehouse.objects.create(name="Benchmark", code="BENCH-BATCH")
+        location = Location.objects.create(warehouse=warehouse, zone="B", aisle="01", shelf="001")
+        product = Product.objects.create(sku="BENCH-BATCH-001", name="Benchmark batch product")
+        operations = [
+            {
+                "product_id": product.id,
+                "quantity": 1 + index % 5,
+                "location_id": location.id,
+                "lot_code": f"BENCH-{index:05d}",
+            }
+            for index in range(items)
+        ]
+        factory = APIRequestFactory()
+        single_view = ReceiveStockView.as_view()
+        batch_view = StockBatchView.as_view()
+
+        def post(view, path, data):
+            request = factory.post(path, data, format="json")
+            force_authenticate(request, user=user)
+            response = view(request)
+            if response.status_code >= 400:
+                raise CommandError(f"{path} failed: {response.data}")
+
+        runs = []
+        for _iteration in range(repeat):
+            started = perf_counter()
+            for operation in operations:
+                post(single_view, "/api/v1/stock/receive/", operation)
+            single_seconds = perf_counter() - started
+
+            started = perf_counter()
+            post(
+                batch_view,
+                "/api/v1/stock/batch/",
+                {"operations": [{"op": "receive", **operation} for operation in operations]},
+            )
+            batch_seconds = perf_counter() - started
+            runs.append(
+                {
+                    "single_seconds": round(single_seconds, 6),
+                    "batch_seconds": round(batch_seconds, 6),
+                }
+            )
+
+        best_single = min(run["single_seconds"] for run in runs)
+        best_batch = min(run["batch_seconds"] for run in runs)
+        return {
+            "format_version": BENCHMARK_FORMAT_VERSION,
+            "benchmark": "stock_batch",
+            "generated_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "items": items,
+            "runs": runs,
+            "single_per_item_ms": round(best_single * 1000 / items, 4),
+            "batch_per_item_ms": round(best_batch * 1000 / items, 4),
+            "speedup": round(best_single / best_batch, 2) if best_batch else None,
+        }
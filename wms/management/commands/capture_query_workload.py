@@ -0,0 +1,36 @@
+import argparse
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from wms.query_workload import QUERY_WORKLOAD_DEFAULT_LIMIT, capture_query_workload
+
+
+class Command(BaseCommand):
+    help = (
+        "Run another management command (typically a benchmark) and report its SQL "
+        "workload as normalized statements with call counts and timings."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=QUERY_WORKLOAD_DEFAULT_LIMIT)
+        parser.add_argument("--output", default="", help="Write the JSON report to this path")
+        parser.add_argument("target", help="Management command to run")
+        parser.add_argument("target_args", nargs=argparse.REMAINDER)
+
+    def handle(self, *args, **options):
+        if options["limit"] < 1:
+            raise CommandError("--limit must be at least 1.")
+        target = options["target"]
+        if target == "capture_query_workload":
+            raise CommandError("capture_query_workload cannot capture itself.")
+
+        with capture_query_workload() as workload:
+            call_command(target, *options["target_args"], stdout=self.stderr)
+
+        label = " ".join([target, *options["target_args"]])
+        if options["output"]:
+            rendered = workload.write_report(options["output"], label=label, limit=options["limit"])
+        else:
+            rendered = workload.render_report(label=label, limit=options["limit"])
+        self.stdout.write(rendered)
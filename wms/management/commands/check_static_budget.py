@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from wms.static_assets import STATIC_PAGE_BUDGETS, critical_page_assets
+
+
+class Command(BaseCommand):
+    help = (
+        "Check the compressed size of the blocking JS/CSS each page layout loads "
+        "against its budget."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page",
+            action="append",
+            choices=sorted(STATIC_PAGE_BUDGETS),
+            help="Page layout to check (repeatable, default: all)",
+        )
+
+    def handle(self, *args, **options):
+        pages = options["page"] or sorted(STATIC_PAGE_BUDGETS)
+        over_budget = []
+        for page in pages:
+            assets = critical_page_assets(page)
+            total = sum(asset.compressed_bytes for asset in assets)
+            budget = STATIC_PAGE_BUDGETS[page]
+            status = "OK" if total <= budget else "OVER"
+            self.stdout.write(f"{page}: {total} / {budget} bytes gzip [{status}]")
+            for asset in assets:
+                self.stdout.write(
+                    f"  {asset.name}: {asset.raw_bytes} bytes, {asset.compressed_bytes} gzip"
+                )
+            if total > budget:
+                over_budget.append(page)
+        if over_budget:
+            raise CommandError(f"Static budget exceeded: {', '.join(over_budget)}.")
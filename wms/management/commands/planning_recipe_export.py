@@ -4,7 +4,12 @@ from pathlib import Path
 from django.core.management.base import BaseCommand, CommandError
 from django.utils.dateparse import parse_date
 
-from wms.planning.recipe_export import build_planning_recipe_export
+from wms.planning.recipe_export import (
+    DEFAULT_RECIPE_EXPORT_CHUNK_SIZE,
+    RECIPE_EXPORT_STREAM_FORMATS,
+    build_planning_recipe_export,
+    write_planning_recipe_export_stream,
+)
 
 
 class Command(BaseCommand):
@@ -26,6 +31,17 @@ class Command(BaseCommand):
             action="store_true",
             default=False,
         )
+        parser.add_argument(
+            "--format",
+            choices=("json", *RECIPE_EXPORT_STREAM_FORMATS),
+            default="json",
+            help="json writes one document; jsonl and zip stream sections in bounded memory.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_RECIPE_EXPORT_CHUNK_SIZE,
+        )
 
     def handle(self, *args, **options):
         week_start = parse_date(options["week_start"])
@@ -36,27 +52,39 @@ class Command(BaseCommand):
             raise CommandError("Invalid --week-end date.")
         if week_end < week_start:
             raise CommandError("--week-end must be after or equal to --week-start.")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1.")
 
-        export = build_planning_recipe_export(
-            week_start=week_start,
-            week_end=week_end,
-            parameter_set_id=options.get("parameter_set_id"),
-            parameter_set_name=options.get("parameter_set_name"),
-            include_flight_batches=options["include_flight_batches"],
-            anonymize=not options["no_anonymize"],
-        )
+        selection = {
+            "week_start": week_start,
+            "week_end": week_end,
+            "parameter_set_id": options.get("parameter_set_id"),
+            "parameter_set_name": options.get("parameter_set_name"),
+            "include_flight_batches": options["include_flight_batches"],
+            "anonymize": not options["no_anonymize"],
+        }
         output_path = Path(options["output"]).expanduser()
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(
-            json.dumps(export.to_dict(), indent=2, sort_keys=True),
-            encoding="utf-8",
-        )
+        if options["format"] == "json":
+            export = build_planning_recipe_export(**selection)
+            output_path.write_text(
+                json.dumps(export.to_dict(), indent=2, sort_keys=True),
+                encoding="utf-8",
+            )
+            summary = export.summary
+        else:
+            summary = write_planning_recipe_export_stream(
+                output_path,
+                output_format=options["format"],
+                chunk_size=options["chunk_size"],
+                **selection,
+            )
         self.stdout.write(
             self.style.SUCCESS(
                 "Wrote planning recipe export to "
                 f"{output_path} "
-                f"(shipments={export.summary['shipments']}, "
-                f"flights={export.summary['flights']}, "
-                f"volunteers={export.summary['volunteers']})"
+                f"(shipments={summary['shipments']}, "
+                f"flights={summary['flights']}, "
+                f"volunteers={summary['volunteers']})"
             )
         )
@@ -1,10 +1,14 @@
 from django.core.management.base import BaseCommand
 
 from wms.emailing import process_email_queue
+from wms.notification_outbox import notification_outbox_stats, process_notification_outbox
 
 
 class Command(BaseCommand):
-    help = "Process pending outbound email events from IntegrationEvent queue."
+    help = (
+        "Drain the workflow notification outbox, then process pending outbound email "
+        "events from IntegrationEvent queue."
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -37,6 +41,12 @@ class Command(BaseCommand):
             default=None,
             help="Override timeout (seconds) to reclaim stale processing events.",
         )
+        parser.add_argument(
+            "--outbox-window-seconds",
+            type=int,
+            default=None,
+            help="Override the digest window (seconds) of the notification outbox.",
+        )
         parser.add_argument(
             "--include-failed",
             action="store_true",
@@ -44,6 +54,21 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
+        outbox_result = process_notification_outbox(
+            digest_window_seconds=options["outbox_window_seconds"],
+        )
+        outbox_stats = notification_outbox_stats()
+        self.stdout.write(
+            "Notification outbox drained: "
+            f"events={outbox_result['selected']}, "
+            f"emails={outbox_result['emails']}, "
+            f"failed={outbox_result['failed']}, "
+            f"retried={outbox_result['retried']}, "
+            f"fan_out_ratio={outbox_result['fan_out_ratio']}, "
+            f"max_lag_seconds={outbox_result['max_lag_seconds']}, "
+            f"pending={outbox_stats['pending']}, "
+            f"oldest_pending_age_seconds={outbox_stats['oldest_pending_age_seconds']}."
+        )
         result = process_email_queue(
             limit=options["limit"],
             include_failed=options["include_failed"],
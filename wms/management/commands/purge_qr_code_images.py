@@ -0,0 +1,107 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from wms.models import Product, Shipment
+from wms.qr_codes import (
+    QR_CODE_CACHE_MAX_AGE_DAYS,
+    iter_stale_qr_code_files,
+    product_qr_payload,
+    prune_qr_code_cache,
+    render_qr_code,
+    shipment_qr_payload,
+)
+
+DEFAULT_BATCH_SIZE = 500
+QR_IMAGE_MODELS = (
+    (Product, product_qr_payload),
+    (Shipment, shipment_qr_payload),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the legacy qr_code_image files written on product and shipment save "
+        "and the QR cache files unused for --cache-max-age-days; QR codes are now "
+        "rendered on demand."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the stored QR images without deleting anything.",
+        )
+        parser.add_argument(
+            "--apply",
+            action="store_true",
+            help="Delete the files and clear qr_code_image.",
+        )
+        parser.add_argument(
+            "--warm-cache",
+            action="store_true",
+            help="Render each purged payload into the QR cache before deleting its file.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Rows cleared per update (default: {DEFAULT_BATCH_SIZE}).",
+        )
+        parser.add_argument(
+            "--cache-max-age-days",
+            type=int,
+            default=QR_CODE_CACHE_MAX_AGE_DAYS,
+            help=(
+                "Delete QR cache files unused for this many days "
+                f"(default: {QR_CODE_CACHE_MAX_AGE_DAYS})."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        dry_run = bool(options.get("dry_run"))
+        apply = bool(options.get("apply"))
+        if dry_run and apply:
+            raise CommandError("Choose either --dry-run or --apply, not both.")
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        cache_max_age_days = options["cache_max_age_days"]
+        if cache_max_age_days < 1:
+            raise CommandError("--cache-max-age-days must be at least 1.")
+        warm_cache = bool(options.get("warm_cache"))
+
+        self.stdout.write(f"Purge QR code images [{'APPLY' if apply else 'DRY RUN'}]")
+        for model, payload_for in QR_IMAGE_MODELS:
+            storage = model._meta.get_field("qr_code_image").storage
+            queryset = model.objects.exclude(qr_code_image="").order_by("pk")
+            stored = queryset.count()
+            deleted_files = 0
+            warmed = 0
+            last_pk = 0
+            while apply:
+                batch = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+                if not batch:
+                    break
+                for obj in batch:
+                    if warm_cache:
+                        payload = payload_for(obj)
+                        if payload:
+                            render_qr_code(payload)
+                            warmed += 1
+                    if storage.exists(obj.qr_code_image.name):
+                        storage.delete(obj.qr_code_image.name)
+                        deleted_files += 1
+                model.objects.filter(pk__in=[obj.pk for obj in batch]).update(qr_code_image="")
+                last_pk = batch[-1].pk
+            line = f"{model._meta.label}: {stored} stored image(s)"
+            if apply:
+                line += f", {deleted_files} file(s) deleted"
+                if warm_cache:
+                    line += f", {warmed} cached"
+            self.stdout.write(line)
+
+        if apply:
+            pruned = prune_qr_code_cache(max_age_days=cache_max_age_days)
+            self.stdout.write(f"QR cache: {pruned} stale file(s) deleted")
+        else:
+            stale = sum(1 for _path in iter_stale_qr_code_files(max_age_days=cache_max_age_days))
+            self.stdout.write(f"QR cache: {stale} stale file(s)")
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from wms.domain.stock import rebuild_carton_totals
+from wms.models import Carton
+
+
+class Command(BaseCommand):
+    help = "Recalcule les totaux stockes des colis (poids, volume, quantites, famille dominante)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Nombre de colis recalcules par lot.",
+        )
+        parser.add_argument(
+            "--code",
+            action="append",
+            default=[],
+            help="Limiter le recalcul a ce code colis (option repetable).",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        queryset = Carton.objects.all()
+        if options["code"]:
+            queryset = queryset.filter(code__in=options["code"])
+        scanned, changed = rebuild_carton_totals(queryset, batch_size=options["batch_size"])
+        self.stdout.write(f"Cartons scanned: {scanned}, totals updated: {changed}")
@@ -4,6 +4,7 @@ from pathlib import Path
 
 from django.core.management.base import BaseCommand, CommandError
 
+from wms.contact_import.be_parser import BE_SHEET_PARSE_MAX_WORKERS
 from wms.contact_rebuild import (
     apply_be_contact_dataset,
     build_be_contact_dataset,
@@ -39,7 +40,15 @@ class Command(BaseCommand):
         parser.add_argument(
             "--dry-run",
             action="store_true",
-            help="Normalize and report planned writes without touching the database.",
+            help="Normalize and report the dataset without writing to the database.",
+        )
+        parser.add_argument(
+            "--diff",
+            action="store_true",
+            help=(
+                "With --dry-run, also report the created/updated/unchanged rows by "
+                "performing the writes in a transaction that is rolled back."
+            ),
         )
         parser.add_argument(
             "--apply",
@@ -51,6 +60,15 @@ class Command(BaseCommand):
             default=DEFAULT_REPORT_PATH,
             help=f"Path to the markdown review report (default: {DEFAULT_REPORT_PATH}).",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=BE_SHEET_PARSE_MAX_WORKERS,
+            help=(
+                "Processes used to parse workbook sheets "
+                f"(default: {BE_SHEET_PARSE_MAX_WORKERS}; 1 parses sequentially)."
+            ),
+        )
 
     def handle(self, *args, **options):
         dry_run = bool(options.get("dry_run"))
@@ -63,13 +81,17 @@ class Command(BaseCommand):
 
         if not source_path.exists():
             raise CommandError(f"Workbook source not found: {source_path}")
+        workers = options["workers"]
+        if workers < 1:
+            raise CommandError("--workers must be at least 1.")
 
-        dataset = build_be_contact_dataset(source_path)
+        dataset = build_be_contact_dataset(source_path, max_workers=workers)
         report_path.parent.mkdir(parents=True, exist_ok=True)
         report_path.write_text(render_review_report(dataset.review_items), encoding="utf-8")
 
-        if apply:
-            apply_be_contact_dataset(dataset)
+        write_report = None
+        if apply or options.get("diff"):
+            write_report = apply_be_contact_dataset(dataset, dry_run=not apply)
 
         self.stdout.write(f"Rebuild contacts from BE workbook [{'APPLY' if apply else 'DRY RUN'}]")
         self.stdout.write(f"Source: {source_path}")
@@ -85,3 +107,14 @@ class Command(BaseCommand):
         self.stdout.write(f"Destinations: {len(dataset.destinations)}")
         self.stdout.write(f"Shipment links: {len(dataset.shipment_links)}")
         self.stdout.write(f"Review items: {len(dataset.review_items)}")
+        timings = dict(dataset.timings)
+        if write_report is not None:
+            self.stdout.write("Write diff (created / updated / unchanged):")
+            for label, stats in write_report.diff.items():
+                self.stdout.write(
+                    f"  {label}: {stats['created']} / {stats['updated']} / {stats['unchanged']}"
+                )
+            timings.update(write_report.timings)
+        self.stdout.write(
+            "Timings: " + ", ".join(f"{stage}={seconds:.3f}s" for stage, seconds in timings.items())
+        )
@@ -1,6 +1,10 @@
 from django.core.management.base import BaseCommand, CommandError
 
-from wms.reset_operational_data import render_reset_summary, reset_operational_data
+from wms.reset_operational_data import (
+    DEFAULT_RESET_CHUNK_SIZE,
+    render_reset_summary,
+    reset_operational_data,
+)
 
 
 class Command(BaseCommand):
@@ -17,13 +21,30 @@ class Command(BaseCommand):
             action="store_true",
             help="Apply the reset for real.",
         )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_RESET_CHUNK_SIZE,
+            help="Rows deleted per committed chunk.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore checkpoints left by an interrupted reset instead of resuming.",
+        )
 
     def handle(self, *args, **options):
         dry_run = bool(options.get("dry_run"))
         apply = bool(options.get("apply"))
         if dry_run and apply:
             raise CommandError("Choose either --dry-run or --apply, not both.")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1.")
 
-        summary = reset_operational_data(apply=apply)
+        summary = reset_operational_data(
+            apply=apply,
+            chunk_size=options["chunk_size"],
+            restart=bool(options.get("restart")),
+        )
         for line in render_reset_summary(summary):
             self.stdout.write(line)
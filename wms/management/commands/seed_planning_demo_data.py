@@ -9,6 +9,7 @@ from django.db import transaction
 from django.utils.text import slugify
 
 from contacts.models import Contact, ContactType
+from wms.domain.stock import refresh_carton_totals
 from wms.models import (
     AssociationPortalContact,
     AssociationProfile,
@@ -460,6 +461,12 @@ class Command(BaseCommand):
             "shipments": shipments,
             "volunteers": volunteers,
             "flights": flights,
+            "batch": batch,
+            "destinations": destinations,
+            "lots": lots,
+            "planner": planner,
+            "shipper_contact": shipper_contact,
+            "ref_prefix": ref_prefix,
         }
 
     def _get_or_create_user(self, *, username: str, email: str, first_name: str, last_name: str):
@@ -530,6 +537,7 @@ class Command(BaseCommand):
                 product_lot=product_lot,
                 defaults={"quantity": spec.item_quantity},
             )
+            refresh_carton_totals(carton)
         return shipment
 
     def _upsert_volunteer(
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from wms.stock_ledger import verify_stock_ledger
+
+DEFAULT_DRIFT_DISPLAY_LIMIT = 50
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the stock ledger (latest checkpoint plus later movements) with "
+        "ProductLot.quantity_on_hand."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full-replay",
+            action="store_true",
+            help="Ignore checkpoints and replay every stock movement.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=DEFAULT_DRIFT_DISPLAY_LIMIT,
+            help=f"Drifting lots listed (default: {DEFAULT_DRIFT_DISPLAY_LIMIT}).",
+        )
+        parser.add_argument(
+            "--fail-on-drift",
+            action="store_true",
+            help="Exit with an error when at least one lot drifts.",
+        )
+
+    def handle(self, *args, **options):
+        if options["limit"] < 0:
+            raise CommandError("--limit must be at least 0.")
+        drifts = verify_stock_ledger(use_checkpoints=not options["full_replay"])
+        self.stdout.write(f"Stock ledger drift: {len(drifts)} lot(s)")
+        for drift in drifts[: options["limit"]]:
+            self.stdout.write(
+                f"- lot #{drift.product_lot_id} (product #{drift.product_id}): "
+                f"ledger {drift.ledger_quantity}, on hand {drift.quantity_on_hand} "
+                f"({drift.difference:+d})"
+            )
+        if drifts and options["fail_on_drift"]:
+            raise CommandError(f"{len(drifts)} lot(s) drift from the stock ledger.")
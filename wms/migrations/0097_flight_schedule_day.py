@@ -0,0 +1,48 @@
+# Generated by Django 5.2.12 on 2026-10-19 02:43
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wms", "0096_remove_org_roles_runtime"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FlightScheduleDay",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("provider", models.CharField(max_length=40)),
+                ("origin_iata", models.CharField(max_length=10)),
+                ("operating_airline_code", models.CharField(blank=True, max_length=10)),
+                ("service_date", models.DateField()),
+                ("etag", models.CharField(blank=True, max_length=255)),
+                ("last_modified", models.CharField(blank=True, max_length=64)),
+                ("checksum", models.CharField(blank=True, max_length=64)),
+                ("records", models.JSONField(blank=True, default=list)),
+                ("fetched_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("changed_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "ordering": ["service_date", "provider", "origin_iata"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "provider",
+                            "origin_iata",
+                            "operating_airline_code",
+                            "service_date",
+                        ),
+                        name="wms_flight_schedule_day_unique_key",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.12 on 2026-10-19 03:17
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wms", "0097_flight_schedule_day"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="wmschange",
+            name="party_registry_changed_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name="wmschange",
+            name="party_registry_version",
+            field=models.PositiveBigIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,129 @@
+# Generated by Django 5.2.12 on 2026-10-19 03:22
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def _type_code(label):
+    normalized = unicodedata.normalize("NFKD", label or "")
+    ascii_value = normalized.encode("ascii", "ignore").decode("ascii")
+    words = [word for word in re.split(r"[^A-Za-z0-9]+", ascii_value) if word]
+    if not words:
+        return "XX"
+    code = f"{words[0][0]}{words[1][0]}" if len(words) >= 2 else words[0][:2]
+    return code.upper().ljust(2, "X")[:2]
+
+
+def backfill_carton_totals(apps, schema_editor):
+    Carton = apps.get_model("wms", "Carton")
+    CartonItem = apps.get_model("wms", "CartonItem")
+    ProductCategory = apps.get_model("wms", "ProductCategory")
+
+    categories = {
+        category_id: (parent_id, name)
+        for category_id, parent_id, name in ProductCategory.objects.values_list(
+            "id", "parent_id", "name"
+        )
+    }
+
+    def root_name(category_id):
+        name = ""
+        seen = set()
+        while category_id in categories and category_id not in seen:
+            seen.add(category_id)
+            category_id, name = categories[category_id]
+        return name
+
+    totals_by_carton_id = {}
+    for (
+        carton_id,
+        quantity,
+        product_id,
+        category_id,
+        weight_g,
+        volume_cm3,
+    ) in CartonItem.objects.order_by("carton_id", "id").values_list(
+        "carton_id",
+        "quantity",
+        "product_lot__product_id",
+        "product_lot__product__category_id",
+        "product_lot__product__weight_g",
+        "product_lot__product__volume_cm3",
+    ):
+        totals = totals_by_carton_id.setdefault(
+            carton_id,
+            {"weight": 0, "volume": 0, "count": 0, "products": set(), "types": {}},
+        )
+        totals["weight"] += (weight_g or 0) * quantity
+        totals["volume"] = (
+            totals["volume"] + volume_cm3 * quantity
+            if volume_cm3 and totals["volume"] is not None
+            else None
+        )
+        totals["count"] += quantity
+        totals["products"].add(product_id)
+        type_weight, type_quantity = totals["types"].get(_type_code(root_name(category_id)), (0, 0))
+        totals["types"][_type_code(root_name(category_id))] = (
+            type_weight + (weight_g or 0) * quantity,
+            type_quantity + quantity,
+        )
+
+    for carton_id, totals in totals_by_carton_id.items():
+        types = totals["types"]
+        if max(weight for weight, _quantity in types.values()) > 0:
+            dominant = max(types, key=lambda code: types[code][0])
+        else:
+            dominant = max(types, key=lambda code: types[code][1])
+        Carton.objects.filter(pk=carton_id).update(
+            total_weight_g=totals["weight"],
+            total_volume_cm3=totals["volume"],
+            item_count=totals["count"],
+            single_product_id=(
+                next(iter(totals["products"])) if len(totals["products"]) == 1 else None
+            ),
+            dominant_type_code=dominant,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wms", "0098_wmschange_party_registry_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="carton",
+            name="dominant_type_code",
+            field=models.CharField(blank=True, max_length=2),
+        ),
+        migrations.AddField(
+            model_name="carton",
+            name="item_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="carton",
+            name="single_product",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="wms.product",
+            ),
+        ),
+        migrations.AddField(
+            model_name="carton",
+            name="total_volume_cm3",
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="carton",
+            name="total_weight_g",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_carton_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.12 on 2026-10-19 04:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wms", "0099_carton_totals"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="planningversion",
+            name="publication_stats",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
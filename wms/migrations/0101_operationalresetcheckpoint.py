@@ -0,0 +1,31 @@
+# Generated by Django 5.2.12 on 2026-10-19 04:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wms", "0100_planningversion_publication_stats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OperationalResetCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("model_label", models.CharField(max_length=100, unique=True)),
+                ("last_pk", models.BigIntegerField(blank=True, null=True)),
+                ("deleted_rows", models.PositiveBigIntegerField(default=0)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ["id"],
+            },
+        ),
+    ]
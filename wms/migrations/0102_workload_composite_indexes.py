@@ -0,0 +1,46 @@
+# Generated by Django 5.2.12 on 2026-10-19 05:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contacts", "0009_contactcapability"),
+        ("wms", "0101_operationalresetcheckpoint"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="integrationevent",
+            name="wms_integra_source_0fb495_idx",
+        ),
+        migrations.AddIndex(
+            model_name="integrationevent",
+            index=models.Index(
+                fields=["direction", "source", "event_type", "status", "created_at"],
+                name="wms_integration_claim_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="productlot",
+            index=models.Index(
+                fields=["product", "status", "expires_on", "received_on"], name="wms_lot_fefo_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="shipment",
+            index=models.Index(fields=["archived_at", "created_at"], name="wms_shipment_list_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="shipment",
+            index=models.Index(
+                fields=["archived_at", "status", "closed_at"], name="wms_shipment_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="stockmovement",
+            index=models.Index(fields=["product", "created_at"], name="wms_movement_product_idx"),
+        ),
+    ]
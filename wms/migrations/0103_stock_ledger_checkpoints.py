@@ -0,0 +1,84 @@
+# Generated by Django 5.2.12 on 2026-10-19 05:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wms", "0102_workload_composite_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StockCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("as_of", models.DateTimeField(unique=True)),
+                (
+                    "period",
+                    models.CharField(
+                        choices=[("daily", "Daily"), ("monthly", "Monthly")],
+                        default="daily",
+                        max_length=20,
+                    ),
+                ),
+                ("lot_count", models.PositiveIntegerField(default=0)),
+                ("total_quantity", models.IntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["-as_of"],
+            },
+        ),
+        migrations.CreateModel(
+            name="StockCheckpointLine",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("quantity", models.IntegerField()),
+                (
+                    "checkpoint",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="lines",
+                        to="wms.stockcheckpoint",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="wms.product"
+                    ),
+                ),
+                (
+                    "product_lot",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="wms.productlot"
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["checkpoint", "product"], name="wms_checkpoint_product_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("checkpoint", "product_lot"),
+                        name="wms_stock_checkpoint_line_unique_lot",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.12 on 2026-10-19 09:12
+
+from django.db import migrations
+
+CARTON_SHIPMENT_RECORD_REASON_CODE = "carton_shipment_record"
+
+
+def mark_carton_shipment_records(apps, schema_editor):
+    StockMovement = apps.get_model("wms", "StockMovement")
+    StockCheckpoint = apps.get_model("wms", "StockCheckpoint")
+
+    precondition_carton_ids = StockMovement.objects.filter(
+        movement_type="precondition",
+        related_carton__isnull=False,
+    ).values("related_carton_id")
+    marked = StockMovement.objects.filter(
+        movement_type="out",
+        reason_code="",
+        related_carton_id__in=precondition_carton_ids,
+    ).update(reason_code=CARTON_SHIPMENT_RECORD_REASON_CODE)
+    if marked:
+        # Checkpoints written before counted those rows twice; rebuild them with
+        # ``manage.py backfill_stock_checkpoints --apply``.
+        StockCheckpoint.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wms", "0103_stock_ledger_checkpoints"),
+    ]
+
+    operations = [
+        migrations.RunPython(mark_carton_shipment_records, migrations.RunPython.noop),
+    ]
@@ -40,6 +40,7 @@ from .models_domain.integration import (
     IntegrationDirection,
     IntegrationEvent,
     IntegrationStatus,
+    OperationalResetCheckpoint,
     WmsChange,
     WmsRuntimeSettings,
     WmsRuntimeSettingsAudit,
@@ -68,6 +69,7 @@ from .models_domain.planning import (
     CommunicationFamily,
     CommunicationTemplate,
     Flight,
+    FlightScheduleDay,
     FlightSourceBatch,
     FlightSourceBatchStatus,
     PlanningArtifact,
@@ -144,6 +146,11 @@ from .models_domain.shipment_parties import (
     ShipmentShipperRecipientLink,
     ShipmentValidationStatus,
 )
+from .models_domain.stock_ledger import (
+    StockCheckpoint,
+    StockCheckpointLine,
+    StockCheckpointPeriod,
+)
 from .models_domain.volunteer import (
     VolunteerAccountRequest,
     VolunteerAccountRequestStatus,
@@ -276,6 +283,9 @@ __all__ = [
     "CartonItem",
     "MovementType",
     "StockMovement",
+    "StockCheckpointPeriod",
+    "StockCheckpoint",
+    "StockCheckpointLine",
     "DocumentType",
     "Document",
     "PrintPageFormat",
@@ -295,6 +305,7 @@ __all__ = [
     "IntegrationDirection",
     "IntegrationStatus",
     "IntegrationEvent",
+    "OperationalResetCheckpoint",
     "VolunteerAccountRequest",
     "VolunteerAccountRequestStatus",
     "VolunteerAvailability",
@@ -305,6 +316,7 @@ __all__ = [
     "PlanningDestinationRule",
     "FlightSourceBatch",
     "Flight",
+    "FlightScheduleDay",
     "PlanningRun",
     "PlanningIssue",
     "PlanningShipmentSnapshot",
@@ -1,11 +1,8 @@
 import uuid
 from decimal import ROUND_HALF_UP, Decimal
-from io import BytesIO
 
-import qrcode
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.core.files.base import ContentFile
 from django.core.validators import MinValueValidator
 from django.db import models
 
@@ -140,18 +137,6 @@ class Product(models.Model):
         temp = uuid.uuid4().hex[:8].upper()
         return f"{prefix}-{temp}"
 
-    def generate_qr_code(self):
-        if not self.sku:
-            return
-        qr = qrcode.QRCode(border=2)
-        qr.add_data(self.sku)
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white")
-        buffer = BytesIO()
-        img.save(buffer, format="PNG")
-        filename = f"qr_{self.sku}.png"
-        self.qr_code_image.save(filename, ContentFile(buffer.getvalue()), save=False)
-
     def _compute_pu_ttc(self):
         if self.pu_ht is None or self.tva is None:
             return None
@@ -167,7 +152,6 @@ class Product(models.Model):
     def save(self, *args, **kwargs):
         update_fields = kwargs.get("update_fields")
         update_set = set(update_fields) if update_fields is not None else None
-        creating = self.pk is None
         if self.name:
             normalized = normalize_title(self.name)
             if normalized != self.name:
@@ -182,8 +166,6 @@ class Product(models.Model):
                     update_set.add("brand")
         if not self.sku:
             self.sku = self.generate_sku()
-        if creating and not self.qr_code_image:
-            self.generate_qr_code()
         if self.tva is not None and self.tva > Decimal("1"):
             normalized = (self.tva / Decimal("100")).quantize(
                 Decimal("0.0001"), rounding=ROUND_HALF_UP
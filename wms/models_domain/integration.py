@@ -9,19 +9,39 @@ from ..design_tokens import PRIORITY_ONE_TOKEN_DEFAULTS
 class WmsChange(models.Model):
     version = models.PositiveBigIntegerField(default=1)
     last_changed_at = models.DateTimeField(default=timezone.now)
+    party_registry_version = models.PositiveBigIntegerField(default=1)
+    party_registry_changed_at = models.DateTimeField(default=timezone.now)
 
     def __str__(self) -> str:
         return f"WMS change v{self.version}"
 
     @classmethod
-    def bump(cls) -> None:
+    def bump(cls, *, party_registry: bool = False) -> None:
         now = timezone.now()
-        updated = cls.objects.filter(pk=1).update(
-            version=F("version") + 1,
-            last_changed_at=now,
-        )
+        changes = {"version": F("version") + 1, "last_changed_at": now}
+        if party_registry:
+            changes["party_registry_version"] = F("party_registry_version") + 1
+            changes["party_registry_changed_at"] = now
+        updated = cls.objects.filter(pk=1).update(**changes)
         if not updated:
-            cls.objects.create(pk=1, version=1, last_changed_at=now)
+            cls.objects.create(
+                pk=1,
+                version=1,
+                last_changed_at=now,
+                party_registry_version=1,
+                party_registry_changed_at=now,
+            )
+        from ..change_notifications import notify_change
+
+        notify_change()
+
+    @classmethod
+    def get_party_registry_key(cls):
+        return (
+            cls.objects.filter(pk=1)
+            .values_list("party_registry_version", "party_registry_changed_at")
+            .first()
+        )
 
     @classmethod
     def get_state(cls):
@@ -33,6 +53,20 @@ class WmsChange(models.Model):
         return obj
 
 
+class OperationalResetCheckpoint(models.Model):
+    model_label = models.CharField(max_length=100, unique=True)
+    last_pk = models.BigIntegerField(null=True, blank=True)
+    deleted_rows = models.PositiveBigIntegerField(default=0)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["id"]
+
+    def __str__(self) -> str:
+        return f"{self.model_label} > {self.last_pk}"
+
+
 class IntegrationDirection(models.TextChoices):
     INBOUND = "inbound", "Inbound"
     OUTBOUND = "outbound", "Outbound"
@@ -69,7 +103,10 @@ class IntegrationEvent(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["direction", "status", "created_at"]),
-            models.Index(fields=["source", "event_type"]),
+            models.Index(
+                fields=["direction", "source", "event_type", "status", "created_at"],
+                name="wms_integration_claim_idx",
+            ),
         ]
 
     def __str__(self) -> str:
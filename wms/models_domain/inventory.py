@@ -119,6 +119,12 @@ class ProductLot(models.Model):
         ordering = ["product", "expires_on"]
         verbose_name = "Product Availability"
         verbose_name_plural = "Product Availability"
+        indexes = [
+            models.Index(
+                fields=["product", "status", "expires_on", "received_on"],
+                name="wms_lot_fefo_idx",
+            )
+        ]
 
     def __str__(self) -> str:
         return f"{self.product} ({self.lot_code or 'lot'})"
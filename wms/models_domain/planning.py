@@ -184,6 +184,31 @@ class Flight(models.Model):
         return f"{self.flight_number} {self.departure_date}"
 
 
+class FlightScheduleDay(models.Model):
+    provider = models.CharField(max_length=40)
+    origin_iata = models.CharField(max_length=10)
+    operating_airline_code = models.CharField(max_length=10, blank=True)
+    service_date = models.DateField()
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True)
+    checksum = models.CharField(max_length=64, blank=True)
+    records = models.JSONField(default=list, blank=True)
+    fetched_at = models.DateTimeField(default=timezone.now)
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["service_date", "provider", "origin_iata"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["provider", "origin_iata", "operating_airline_code", "service_date"],
+                name="wms_flight_schedule_day_unique_key",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.provider} {self.origin_iata} {self.service_date}"
+
+
 class PlanningRun(models.Model):
     week_start = models.DateField()
     week_end = models.DateField()
@@ -365,6 +390,7 @@ class PlanningVersion(models.Model):
         related_name="planning_versions_created",
     )
     published_at = models.DateTimeField(null=True, blank=True)
+    publication_stats = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -1,10 +1,7 @@
 import uuid
 from decimal import Decimal
-from io import BytesIO
 
-import qrcode
 from django.conf import settings
-from django.core.files.base import ContentFile
 from django.core.validators import MinValueValidator
 from django.db import models
 from django.urls import reverse
@@ -92,6 +89,16 @@ class Shipment(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["archived_at", "created_at"],
+                name="wms_shipment_list_idx",
+            ),
+            models.Index(
+                fields=["archived_at", "status", "closed_at"],
+                name="wms_shipment_status_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.reference
@@ -114,26 +121,6 @@ class Shipment(models.Model):
             return f"{base_url.rstrip('/')}{path}"
         return path
 
-    def generate_qr_code(self, *, request=None) -> None:
-        payload = self.get_tracking_url(request=request)
-        if not payload:
-            return
-        qr = qrcode.QRCode(border=2)
-        qr.add_data(payload)
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white")
-        buffer = BytesIO()
-        img.save(buffer, format="PNG")
-        filename = f"qr_shipment_{self.reference}.png"
-        self.qr_code_image.save(filename, ContentFile(buffer.getvalue()), save=False)
-
-    def ensure_qr_code(self, *, request=None) -> None:
-        if self.qr_code_image:
-            return
-        self.generate_qr_code(request=request)
-        if self.qr_code_image:
-            self.save(update_fields=["qr_code_image"])
-
     @staticmethod
     def _merge_update_fields(update_fields, *fields):
         if update_fields is None:
@@ -167,9 +154,6 @@ class Shipment(models.Model):
             merged_update_fields = self._merge_update_fields(update_fields, "reference")
             if merged_update_fields is not None:
                 kwargs["update_fields"] = merged_update_fields
-        creating = self.pk is None
-        if creating and not self.qr_code_image:
-            self.generate_qr_code()
         super().save(*args, **kwargs)
 
 
@@ -285,6 +269,19 @@ class Carton(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     notes = models.TextField(blank=True)
+    # Aggregates of the carton items, maintained by the pack/unpack domain functions
+    # and rebuilt by the rebuild_carton_totals command.
+    total_weight_g = models.PositiveBigIntegerField(default=0)
+    total_volume_cm3 = models.PositiveBigIntegerField(null=True, blank=True)
+    item_count = models.PositiveIntegerField(default=0)
+    single_product = models.ForeignKey(
+        Product,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    dominant_type_code = models.CharField(max_length=2, blank=True)
 
     class Meta:
         ordering = ["-created_at"]
@@ -370,6 +367,12 @@ class StockMovement(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["product", "created_at"],
+                name="wms_movement_product_idx",
+            )
+        ]
 
     def __str__(self) -> str:
         return f"{self.movement_type} {self.product} ({self.quantity})"
@@ -0,0 +1,55 @@
+from django.db import models
+
+from .catalog import Product
+from .inventory import ProductLot
+
+
+class StockCheckpointPeriod(models.TextChoices):
+    DAILY = "daily", "Daily"
+    MONTHLY = "monthly", "Monthly"
+
+
+class StockCheckpoint(models.Model):
+    """On-hand quantities of every lot at ``as_of`` (movements strictly before it)."""
+
+    as_of = models.DateTimeField(unique=True)
+    period = models.CharField(
+        max_length=20,
+        choices=StockCheckpointPeriod.choices,
+        default=StockCheckpointPeriod.DAILY,
+    )
+    lot_count = models.PositiveIntegerField(default=0)
+    total_quantity = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-as_of"]
+
+    def __str__(self) -> str:
+        return f"Stock checkpoint {self.as_of:%Y-%m-%d %H:%M} ({self.get_period_display()})"
+
+
+class StockCheckpointLine(models.Model):
+    """One lot with a non-zero quantity at its checkpoint; absent lots were at zero."""
+
+    checkpoint = models.ForeignKey(StockCheckpoint, on_delete=models.CASCADE, related_name="lines")
+    product_lot = models.ForeignKey(ProductLot, on_delete=models.CASCADE)
+    product = models.ForeignKey(Product, on_delete=models.CASCADE)
+    quantity = models.IntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["checkpoint", "product_lot"],
+                name="wms_stock_checkpoint_line_unique_lot",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["checkpoint", "product"],
+                name="wms_checkpoint_product_idx",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.checkpoint} - {self.product_lot}: {self.quantity}"
@@ -0,0 +1,303 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Min, Q
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+from .emailing import (
+    EMAIL_DELIVERY_MODE_DIRECT_ONLY,
+    compute_retry_delay_seconds,
+    email_queue_config,
+    get_email_delivery_mode,
+    normalize_recipients,
+    send_or_enqueue_email_safe,
+)
+from .models import IntegrationDirection, IntegrationEvent, IntegrationStatus
+
+LOGGER = logging.getLogger(__name__)
+
+OUTBOX_SOURCE = "wms.notification"
+OUTBOX_TARGET = "email"
+OUTBOX_EVENT_TYPE = "notification"
+OUTBOX_DEFAULT_DIGEST_WINDOW_SECONDS = 60
+OUTBOX_DIGEST_SEPARATOR = "\n\n----------------------------------------\n\n"
+
+OUTBOX_PAYLOAD_TEMPLATE_KEY = "template"
+OUTBOX_PAYLOAD_SUBJECT_KEY = "subject"
+OUTBOX_PAYLOAD_CONTEXT_KEY = "context"
+OUTBOX_PAYLOAD_RECIPIENTS_KEY = "recipients"
+OUTBOX_PAYLOAD_TIMESTAMP_KEY = "timestamp_key"
+OUTBOX_PAYLOAD_ATTEMPTS_KEY = "attempts"
+
+OUTBOX_RESULT_SELECTED = "selected"
+OUTBOX_RESULT_PROCESSED = "processed"
+OUTBOX_RESULT_FAILED = "failed"
+OUTBOX_RESULT_RETRIED = "retried"
+OUTBOX_RESULT_DEFERRED = "deferred"
+OUTBOX_RESULT_EMAILS = "emails"
+OUTBOX_RESULT_FAN_OUT_RATIO = "fan_out_ratio"
+OUTBOX_RESULT_MAX_LAG_SECONDS = "max_lag_seconds"
+
+
+def _safe_int(value, *, default, minimum):
+    try:
+        int_value = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(minimum, int_value)
+
+
+def _digest_window_seconds(value=None):
+    return _safe_int(
+        (
+            getattr(
+                settings,
+                "NOTIFICATION_OUTBOX_DIGEST_WINDOW_SECONDS",
+                OUTBOX_DEFAULT_DIGEST_WINDOW_SECONDS,
+            )
+            if value is None
+            else value
+        ),
+        default=OUTBOX_DEFAULT_DIGEST_WINDOW_SECONDS,
+        minimum=0,
+    )
+
+
+def _base_outbox_queryset():
+    return IntegrationEvent.objects.filter(
+        direction=IntegrationDirection.OUTBOUND,
+        source=OUTBOX_SOURCE,
+        event_type=OUTBOX_EVENT_TYPE,
+    )
+
+
+def _coerce_context(context):
+    return {str(key): "" if value is None else str(value) for key, value in context.items()}
+
+
+def enqueue_notification(*, subject, template, context, recipients, timestamp_key=""):
+    """Write one outbox row; rendering and delivery happen in ``process_notification_outbox``.
+
+    The row is written in the caller's transaction, so a rolled back status change never
+    notifies anybody. ``timestamp_key`` names the context entry filled with the row date.
+    """
+    normalized_recipients = normalize_recipients(recipients)
+    if not normalized_recipients:
+        return None
+    payload = {
+        OUTBOX_PAYLOAD_SUBJECT_KEY: str(subject or ""),
+        OUTBOX_PAYLOAD_TEMPLATE_KEY: template,
+        OUTBOX_PAYLOAD_CONTEXT_KEY: _coerce_context(context),
+        OUTBOX_PAYLOAD_RECIPIENTS_KEY: normalized_recipients,
+    }
+    if timestamp_key:
+        payload[OUTBOX_PAYLOAD_TIMESTAMP_KEY] = timestamp_key
+    event = IntegrationEvent.objects.create(
+        direction=IntegrationDirection.OUTBOUND,
+        source=OUTBOX_SOURCE,
+        target=OUTBOX_TARGET,
+        event_type=OUTBOX_EVENT_TYPE,
+        payload=payload,
+        status=IntegrationStatus.PENDING,
+    )
+    if get_email_delivery_mode() == EMAIL_DELIVERY_MODE_DIRECT_ONLY:
+        # Without a queue worker the row is drained right after commit, as before.
+        transaction.on_commit(
+            lambda: process_notification_outbox(event_ids=[event.id], digest_window_seconds=0)
+        )
+    return event
+
+
+def _render_event(event):
+    payload = event.payload or {}
+    context = dict(payload.get(OUTBOX_PAYLOAD_CONTEXT_KEY) or {})
+    timestamp_key = payload.get(OUTBOX_PAYLOAD_TIMESTAMP_KEY)
+    if timestamp_key:
+        context[timestamp_key] = timezone.localtime(event.created_at)
+    return (
+        payload.get(OUTBOX_PAYLOAD_SUBJECT_KEY) or "",
+        render_to_string(payload.get(OUTBOX_PAYLOAD_TEMPLATE_KEY), context),
+    )
+
+
+def _build_digest(rendered_messages):
+    if len(rendered_messages) == 1:
+        return rendered_messages[0]
+    subject = _("ASF WMS - %(count)s notifications") % {"count": len(rendered_messages)}
+    message = OUTBOX_DIGEST_SEPARATOR.join(
+        f"{item_subject}\n\n{item_message}" for item_subject, item_message in rendered_messages
+    )
+    return subject, message
+
+
+def _attempts(event):
+    return _safe_int((event.payload or {}).get(OUTBOX_PAYLOAD_ATTEMPTS_KEY), default=0, minimum=0)
+
+
+def _retry_is_due(event, *, now, queue_config):
+    attempts = _attempts(event)
+    if not attempts or event.status != IntegrationStatus.PENDING:
+        return True
+    retry_delay = compute_retry_delay_seconds(
+        attempts=attempts,
+        retry_base_seconds=queue_config["retry_base_seconds"],
+        retry_max_seconds=queue_config["retry_max_seconds"],
+    )
+    return event.processed_at is None or event.processed_at + timedelta(seconds=retry_delay) <= now
+
+
+def _claim_outbox_events(*, limit, event_ids, now, settled_before, queue_config):
+    stale_processing_before = now - timedelta(seconds=queue_config["processing_timeout_seconds"])
+    queryset = _base_outbox_queryset().filter(
+        Q(status=IntegrationStatus.PENDING)
+        | Q(status=IntegrationStatus.PROCESSING, processed_at__lte=stale_processing_before)
+    )
+    if event_ids is not None:
+        queryset = queryset.filter(pk__in=event_ids)
+    settled = queryset.filter(created_at__lte=settled_before)
+    # Rows waiting for a retry keep ``processed_at`` at their last attempt; the
+    # shortest retry delay already rules most of them out in SQL.
+    waiting_retry = Q(
+        status=IntegrationStatus.PENDING,
+        processed_at__gt=now - timedelta(seconds=queue_config["retry_base_seconds"]),
+    )
+    with transaction.atomic():
+        candidates = list(
+            settled.exclude(waiting_retry)
+            .select_for_update(skip_locked=True)
+            .order_by("created_at", "id")[:limit]
+        )
+        events = [
+            event
+            for event in candidates
+            if _retry_is_due(event, now=now, queue_config=queue_config)
+        ]
+        if events:
+            IntegrationEvent.objects.filter(pk__in=[event.pk for event in events]).update(
+                status=IntegrationStatus.PROCESSING,
+                processed_at=timezone.now(),
+            )
+    deferred = (
+        queryset.filter(created_at__gt=settled_before).count()
+        + settled.filter(waiting_retry).count()
+        + len(candidates)
+        - len(events)
+    )
+    return events, deferred
+
+
+def _apply_failure(event, *, error_message, queue_config):
+    """Leave the row pending for a later retry, or fail it once attempts run out."""
+    attempts = _attempts(event) + 1
+    event.payload = {**(event.payload or {}), OUTBOX_PAYLOAD_ATTEMPTS_KEY: attempts}
+    if attempts >= queue_config["max_attempts"]:
+        event.status = IntegrationStatus.FAILED
+        event.error_message = f"{error_message} ({attempts} attempt(s))"
+        return OUTBOX_RESULT_FAILED
+    event.status = IntegrationStatus.PENDING
+    event.error_message = f"{error_message} (retry {attempts}/{queue_config['max_attempts']})"
+    return OUTBOX_RESULT_RETRIED
+
+
+def process_notification_outbox(*, limit=500, digest_window_seconds=None, event_ids=None):
+    """Render and send settled outbox rows, one digest email per recipient.
+
+    Rows younger than the digest window stay pending so later events for the same
+    recipient land in the same email. Rows whose delivery fails stay pending and are
+    retried with the email queue backoff until its attempt limit marks them failed.
+    """
+    now = timezone.now()
+    window_seconds = _digest_window_seconds(digest_window_seconds)
+    queue_config = email_queue_config()
+    events, deferred = _claim_outbox_events(
+        limit=_safe_int(limit, default=500, minimum=1),
+        event_ids=event_ids,
+        now=now,
+        settled_before=now - timedelta(seconds=window_seconds),
+        queue_config=queue_config,
+    )
+    result = {
+        OUTBOX_RESULT_SELECTED: len(events),
+        OUTBOX_RESULT_PROCESSED: 0,
+        OUTBOX_RESULT_FAILED: 0,
+        OUTBOX_RESULT_RETRIED: 0,
+        OUTBOX_RESULT_DEFERRED: deferred,
+        OUTBOX_RESULT_EMAILS: 0,
+        OUTBOX_RESULT_FAN_OUT_RATIO: 0.0,
+        OUTBOX_RESULT_MAX_LAG_SECONDS: 0.0,
+    }
+    if not events:
+        return result
+
+    rendered_by_event_id = {}
+    event_ids_by_recipient = {}
+    recipient_labels = {}
+    errors_by_event_id = {}
+    for event in events:
+        try:
+            rendered_by_event_id[event.id] = _render_event(event)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            LOGGER.warning("Notification outbox render failed for event %s: %s", event.id, exc)
+            errors_by_event_id[event.id] = f"render failed: {exc}"
+            continue
+        recipients = (event.payload or {}).get(OUTBOX_PAYLOAD_RECIPIENTS_KEY) or []
+        for recipient in normalize_recipients(recipients):
+            key = recipient.lower()
+            recipient_labels.setdefault(key, recipient)
+            event_ids_by_recipient.setdefault(key, []).append(event.id)
+
+    for key, recipient_event_ids in event_ids_by_recipient.items():
+        subject, message = _build_digest(
+            [rendered_by_event_id[event_id] for event_id in recipient_event_ids]
+        )
+        result[OUTBOX_RESULT_EMAILS] += 1
+        if not send_or_enqueue_email_safe(
+            subject=subject,
+            message=message,
+            recipient=[recipient_labels[key]],
+        ):
+            for event_id in recipient_event_ids:
+                errors_by_event_id[event_id] = "send_or_enqueue_email_safe returned False."
+
+    processed_at = timezone.now()
+    for event in events:
+        event.processed_at = processed_at
+        error_message = errors_by_event_id.get(event.id)
+        if error_message:
+            outcome = _apply_failure(event, error_message=error_message, queue_config=queue_config)
+        else:
+            event.status = IntegrationStatus.PROCESSED
+            event.error_message = ""
+            outcome = OUTBOX_RESULT_PROCESSED
+        result[outcome] += 1
+    IntegrationEvent.objects.bulk_update(
+        events, ["status", "error_message", "processed_at", "payload"]
+    )
+
+    result[OUTBOX_RESULT_FAN_OUT_RATIO] = round(result[OUTBOX_RESULT_EMAILS] / len(events), 2)
+    result[OUTBOX_RESULT_MAX_LAG_SECONDS] = round(
+        (processed_at - min(event.created_at for event in events)).total_seconds(), 3
+    )
+    LOGGER.info(
+        "notification_outbox_drained",
+        extra={"notification_outbox": dict(result)},
+    )
+    return result
+
+
+def notification_outbox_stats():
+    """Return the pending row count and the age of the oldest pending row, in seconds."""
+    pending = _base_outbox_queryset().filter(status=IntegrationStatus.PENDING)
+    oldest_created_at = pending.aggregate(oldest=Min("created_at"))["oldest"]
+    return {
+        "pending": pending.count(),
+        "oldest_pending_age_seconds": (
+            round((timezone.now() - oldest_created_at).total_seconds(), 3)
+            if oldest_created_at
+            else 0.0
+        ),
+    }
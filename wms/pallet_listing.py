@@ -1,3 +1,5 @@
+import hashlib
+import json
 from pathlib import Path
 
 from .import_services import extract_product_identity, find_product_matches
@@ -280,10 +282,43 @@ def build_listing_columns(headers, rows, mapping):
     return columns
 
 
-def load_listing_table(pending_data):
-    data = Path(pending_data["file_path"]).read_bytes()
-    return extract_tabular_data(
-        data,
-        pending_data["extension"],
-        **pending_listing_extract_options(pending_data),
+def _listing_table_path(file_path, data, extension, extract_options):
+    fingerprint = hashlib.sha256(data)
+    fingerprint.update(repr((extension, sorted(extract_options.items()))).encode())
+    return Path(f"{file_path}.{fingerprint.hexdigest()}.json")
+
+
+def store_listing_table(file_path, data, extension, table, **extract_options):
+    """Write the parsed table next to the pending upload, keyed by its content hash.
+
+    The mapping, review and confirm steps then read it back instead of parsing the
+    upload again; changing the extract options changes the key.
+    """
+    headers, rows = table
+    _listing_table_path(file_path, data, extension, extract_options).write_text(
+        json.dumps([headers, rows]), encoding="utf-8"
     )
+
+
+def discard_listing_tables(file_path):
+    path = Path(file_path)
+    for table_path in path.parent.glob(f"{path.name}.*.json"):
+        table_path.unlink(missing_ok=True)
+
+
+def load_listing_table(pending_data):
+    file_path = pending_data["file_path"]
+    extension = pending_data["extension"]
+    extract_options = pending_listing_extract_options(pending_data)
+    data = Path(file_path).read_bytes()
+    try:
+        headers, rows = json.loads(
+            _listing_table_path(file_path, data, extension, extract_options).read_text(
+                encoding="utf-8"
+            )
+        )
+    except (OSError, ValueError):
+        table = extract_tabular_data(data, extension, **extract_options)
+        store_listing_table(file_path, data, extension, table, **extract_options)
+        return table
+    return headers, rows
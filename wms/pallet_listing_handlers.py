@@ -25,7 +25,9 @@ from .pallet_listing import (
     build_listing_extract_options,
     build_listing_mapping_defaults,
     build_listing_review_rows,
+    discard_listing_tables,
     load_listing_table,
+    store_listing_table,
 )
 from .scan_helpers import resolve_default_warehouse
 
@@ -54,6 +56,7 @@ def clear_pending_listing(request):
     if pending_data and pending_data.get("file_path"):
         try:
             Path(pending_data["file_path"]).unlink(missing_ok=True)
+            discard_listing_tables(pending_data["file_path"])
         except OSError:
             pass
 
@@ -243,6 +246,9 @@ def handle_pallet_listing_action(
                     with tempfile.NamedTemporaryFile(delete=False, suffix=extension) as temp_file:
                         temp_file.write(data)
                         temp_path = temp_file.name
+                    store_listing_table(
+                        temp_path, data, extension, (headers, rows), **extract_options
+                    )
                     mapping_defaults = build_listing_mapping_defaults(headers)
                     pending = {
                         "token": uuid.uuid4().hex,
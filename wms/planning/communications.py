@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from datetime import date
+from time import perf_counter
 
 from django.core.exceptions import ValidationError
 from django.template import Context, Template
@@ -145,16 +146,21 @@ def _default_body(version: PlanningVersion, plan_item) -> str:
     return ""
 
 
-def _template_for_family(plan_item) -> CommunicationTemplate | None:
-    return (
-        CommunicationTemplate.objects.filter(
-            is_active=True,
-            scope=plan_item.family,
-            channel=plan_item.channel,
-        )
-        .order_by("id")
-        .first()
-    )
+PUBLICATION_STATS_COMMUNICATION_DRAFTS_KEY = "communication_drafts"
+
+
+def _active_templates_by_family() -> dict[tuple[str, str], CommunicationTemplate]:
+    templates: dict[tuple[str, str], CommunicationTemplate] = {}
+    for template in CommunicationTemplate.objects.filter(is_active=True).order_by("id"):
+        templates.setdefault((template.scope, template.channel), template)
+    return templates
+
+
+def _template_for_family(
+    plan_item,
+    templates: dict[tuple[str, str], CommunicationTemplate],
+) -> CommunicationTemplate | None:
+    return templates.get((plan_item.family, plan_item.channel))
 
 
 def _build_plan_item_context(version: PlanningVersion, plan_item) -> dict[str, object]:
@@ -190,12 +196,17 @@ def generate_version_drafts(version: PlanningVersion) -> list[CommunicationDraft
     if version.status != PlanningVersionStatus.PUBLISHED:
         raise ValidationError("Communication drafts can only be generated for published versions.")
 
+    timings: dict[str, float] = {}
+    started = perf_counter()
     CommunicationDraft.objects.filter(version=version).delete()
     plan = build_version_communication_plan(version)
+    templates = _active_templates_by_family()
     generated_drafts: list[CommunicationDraft] = []
+    timings["plan"] = round(perf_counter() - started, 6)
+    render_started = perf_counter()
 
     for plan_item in plan.items:
-        template = _template_for_family(plan_item)
+        template = _template_for_family(plan_item, templates)
         if template is not None:
             context = _build_plan_item_context(version, plan_item)
             subject = _render_text(template.subject, context)
@@ -217,8 +228,20 @@ def generate_version_drafts(version: PlanningVersion) -> list[CommunicationDraft
             )
         )
 
+    timings["render"] = round(perf_counter() - render_started, 6)
+    write_started = perf_counter()
     if generated_drafts:
         CommunicationDraft.objects.bulk_create(generated_drafts)
+    timings["write"] = round(perf_counter() - write_started, 6)
+    timings["total"] = round(perf_counter() - started, 6)
+    version.publication_stats = {
+        **(version.publication_stats or {}),
+        PUBLICATION_STATS_COMMUNICATION_DRAFTS_KEY: {
+            "drafts": len(generated_drafts),
+            "timings": timings,
+        },
+    }
+    version.save(update_fields=["publication_stats"])
     return list(
         CommunicationDraft.objects.filter(version=version).order_by(
             "family",
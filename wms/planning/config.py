@@ -3,3 +3,6 @@ LEGACY_MISSION_LEAD_HOURS = 3
 PLANNING_SOLVER_MAX_TIME_SECONDS = 30.0
 PLANNING_SOLVER_NUM_SEARCH_WORKERS = 8
 PLANNING_SOLVER_RANDOM_SEED = 0
+PLANNING_FLIGHT_DISTRIBUTION_MAX_STATES = 50_000
+PLANNING_SCENARIO_MAX_VARIANTS = 6
+PLANNING_SCENARIO_MAX_WORKERS = 4
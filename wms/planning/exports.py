@@ -2,12 +2,33 @@ from __future__ import annotations
 
 import os
 import tempfile
+from collections.abc import Iterable
+from functools import cache
 from pathlib import Path
 
-from openpyxl import Workbook
-
+from wms.lazy_imports import lazy_attribute
 from wms.models import PlanningArtifact, PlanningVersion
 
+Workbook = lazy_attribute("openpyxl", "Workbook")
+WriteOnlyCell = lazy_attribute("openpyxl.cell", "WriteOnlyCell")
+Font = lazy_attribute("openpyxl.styles", "Font")
+
+PLANNING_SHEET_TITLE = "Planning"
+PLANNING_EXPORT_HEADERS = (
+    "Date",
+    "Flight",
+    "Destination",
+    "DepartureTime",
+    "Volunteer",
+    "Shipment",
+    "Shipper",
+    "Cartons",
+    "Status",
+    "Source",
+    "Notes",
+)
+EXPORT_ITERATOR_CHUNK_SIZE = 500
+
 
 def _planning_output_dir() -> Path:
     base_dir = Path(os.getenv("ASF_TMP_DIR") or tempfile.gettempdir())
@@ -16,54 +37,79 @@ def _planning_output_dir() -> Path:
     return output_dir
 
 
-def export_version_workbook(version: PlanningVersion) -> PlanningArtifact:
-    workbook = Workbook()
-    try:
-        sheet = workbook.active
-        sheet.title = "Planning"
-        sheet.append(
-            [
-                "Date",
-                "Flight",
-                "Destination",
-                "DepartureTime",
-                "Volunteer",
-                "Shipment",
-                "Shipper",
-                "Cartons",
-                "Status",
-                "Source",
-                "Notes",
-            ]
-        )
-        for assignment in version.assignments.select_related(
+@cache
+def _header_font():
+    # One style object for every header cell, registered once in the workbook style table.
+    return Font(bold=True)
+
+
+def _header_row(sheet) -> list:
+    row = []
+    for title in PLANNING_EXPORT_HEADERS:
+        cell = WriteOnlyCell(sheet, value=title)
+        cell.font = _header_font()
+        row.append(cell)
+    return row
+
+
+def iter_version_rows(version: PlanningVersion) -> Iterable[list]:
+    assignments = (
+        version.assignments.select_related(
             "shipment_snapshot",
             "volunteer_snapshot",
             "flight_snapshot",
-        ).order_by("sequence", "id"):
-            flight = assignment.flight_snapshot
-            shipment = assignment.shipment_snapshot
-            volunteer = assignment.volunteer_snapshot
-            sheet.append(
-                [
-                    str(flight.departure_date) if flight else "",
-                    flight.flight_number if flight else "",
-                    flight.destination_iata if flight else "",
-                    ((flight.payload or {}).get("departure_time", "") if flight else ""),
-                    volunteer.volunteer_label if volunteer else "",
-                    shipment.shipment_reference if shipment else "",
-                    shipment.shipper_name if shipment else "",
-                    assignment.assigned_carton_count,
-                    assignment.status,
-                    assignment.source,
-                    assignment.notes,
-                ]
-            )
-
-        file_path = _planning_output_dir() / f"planning-run-{version.run_id}-v{version.number}.xlsx"
-        workbook.save(file_path)
+        )
+        .order_by("sequence", "id")
+        .iterator(chunk_size=EXPORT_ITERATOR_CHUNK_SIZE)
+    )
+    for assignment in assignments:
+        flight = assignment.flight_snapshot
+        shipment = assignment.shipment_snapshot
+        volunteer = assignment.volunteer_snapshot
+        yield [
+            str(flight.departure_date) if flight else "",
+            flight.flight_number if flight else "",
+            flight.destination_iata if flight else "",
+            ((flight.payload or {}).get("departure_time", "") if flight else ""),
+            volunteer.volunteer_label if volunteer else "",
+            shipment.shipment_reference if shipment else "",
+            shipment.shipper_name if shipment else "",
+            assignment.assigned_carton_count,
+            assignment.status,
+            assignment.source,
+            assignment.notes,
+        ]
+
+
+def write_planning_workbook(rows: Iterable[list], file_path: Path) -> Path:
+    """Stream ``rows`` into a write-only workbook saved at ``file_path``.
+
+    Rows are serialized as they are appended, so memory stays flat whatever the week size. The
+    workbook is written next to ``file_path`` and moved into place once complete.
+    """
+    file_path = Path(file_path)
+    partial_path = file_path.with_name(f".{file_path.name}.partial")
+    workbook = Workbook(write_only=True)
+    try:
+        sheet = workbook.create_sheet(PLANNING_SHEET_TITLE)
+        sheet.append(_header_row(sheet))
+        for row in rows:
+            sheet.append(row)
+        workbook.save(partial_path)
+    except Exception:
+        partial_path.unlink(missing_ok=True)
+        raise
     finally:
         workbook.close()
+    os.replace(partial_path, file_path)
+    return file_path
+
+
+def export_version_workbook(version: PlanningVersion) -> PlanningArtifact:
+    file_path = write_planning_workbook(
+        iter_version_rows(version),
+        _planning_output_dir() / f"planning-run-{version.run_id}-v{version.number}.xlsx",
+    )
 
     artifact = version.artifacts.filter(artifact_type="planning_workbook").order_by("id").first()
     if artifact is None:
@@ -1,4 +1,5 @@
 from .base import (
+    FlightScheduleDayResult,
     PlanningFlightProvider,
     PlanningFlightProviderConfigurationError,
     PlanningFlightProviderError,
@@ -6,6 +7,7 @@ from .base import (
 )
 
 __all__ = [
+    "FlightScheduleDayResult",
     "PlanningFlightProvider",
     "PlanningFlightProviderConfigurationError",
     "PlanningFlightProviderError",
@@ -5,6 +5,7 @@ from urllib import error, parse, request
 from django.utils.dateparse import parse_datetime
 
 from .base import (
+    FlightScheduleDayResult,
     PlanningFlightProvider,
     PlanningFlightProviderConfigurationError,
     PlanningFlightProviderError,
@@ -57,27 +58,43 @@ class AirFranceKlmFlightProvider(PlanningFlightProvider):
         separator = "&" if "?" in self.base_url else "?"
         return f"{self.base_url}{separator}{query}"
 
-    def _read_payload(self, *, start_date, end_date):
+    @property
+    def cache_key(self):
+        return {
+            "provider": "airfrance_klm",
+            "origin_iata": self.origin_iata,
+            "operating_airline_code": self.operating_airline_code,
+        }
+
+    def _request_payload(self, *, start_date, end_date, etag="", last_modified=""):
         if not self.api_key:
             raise PlanningFlightProviderConfigurationError(
                 "PLANNING_FLIGHT_API_KEY is required for planning API imports."
             )
 
+        headers = {
+            "API-Key": self.api_key,
+            "Accept": "application/hal+json",
+            "User-Agent": "ASF-WMS/planning-flight-client",
+        }
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
         req = request.Request(
             self._build_url(start_date=start_date, end_date=end_date),
             method="GET",
-            headers={
-                "API-Key": self.api_key,
-                "Accept": "application/hal+json",
-                "User-Agent": "ASF-WMS/planning-flight-client",
-            },
+            headers=headers,
         )
         try:
             with request.urlopen(req, timeout=self.timeout_seconds) as response:  # nosec B310
                 body = response.read().decode("utf-8")
+                response_headers = getattr(response, "headers", None) or {}
         except error.HTTPError as exc:
+            if exc.code == 304:
+                return None, {}
             if exc.code == 404:
-                return {"operationalFlights": []}
+                return {"operationalFlights": []}, {}
             message = ""
             try:
                 message = exc.read().decode("utf-8", errors="ignore")
@@ -95,6 +112,10 @@ class AirFranceKlmFlightProvider(PlanningFlightProvider):
             raise PlanningFlightProviderError("Planning flight API returned invalid JSON.") from exc
         if not isinstance(payload, dict):
             raise PlanningFlightProviderError("Planning flight API returned an unexpected payload.")
+        return payload, response_headers
+
+    def _read_payload(self, *, start_date, end_date):
+        payload, _headers = self._request_payload(start_date=start_date, end_date=end_date)
         return payload
 
     def fetch_flights(self, *, start_date, end_date):
@@ -105,6 +126,29 @@ class AirFranceKlmFlightProvider(PlanningFlightProvider):
             operating_airline_code=self.operating_airline_code,
         )
 
+    def fetch_day(self, *, service_date, etag="", last_modified=""):
+        payload, headers = self._request_payload(
+            start_date=service_date,
+            end_date=service_date,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        if payload is None:
+            return FlightScheduleDayResult(
+                etag=etag,
+                last_modified=last_modified,
+                not_modified=True,
+            )
+        return FlightScheduleDayResult(
+            records=_extract_records(
+                payload,
+                origin_iata=self.origin_iata,
+                operating_airline_code=self.operating_airline_code,
+            ),
+            etag=str(headers.get("ETag") or ""),
+            last_modified=str(headers.get("Last-Modified") or ""),
+        )
+
 
 def _pick_departure_iso_from_leg(leg):
     departure_info = leg.get("departureInformation", {}) if isinstance(leg, dict) else {}
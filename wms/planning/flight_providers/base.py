@@ -1,3 +1,6 @@
+from dataclasses import dataclass, field
+
+
 class PlanningFlightProviderError(RuntimeError):
     """Raised when a planning flight provider fails to fetch or normalize data."""
 
@@ -13,3 +16,11 @@ class UnknownPlanningFlightProviderError(PlanningFlightProviderConfigurationErro
 class PlanningFlightProvider:
     def fetch_flights(self, *, start_date, end_date):
         raise NotImplementedError("Configure a concrete planning flight provider.")
+
+
+@dataclass(frozen=True)
+class FlightScheduleDayResult:
+    records: list = field(default_factory=list)
+    etag: str = ""
+    last_modified: str = ""
+    not_modified: bool = False
@@ -0,0 +1,164 @@
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from wms.models import FlightScheduleDay
+from wms.planning.flight_providers import PlanningFlightProviderError
+
+DEFAULT_FLIGHT_SCHEDULE_MAX_CONCURRENCY = 4
+DEFAULT_FLIGHT_SCHEDULE_MAX_AGE_SECONDS = 6 * 3600
+
+
+@dataclass(frozen=True)
+class FlightScheduleSyncReport:
+    days_total: int
+    days_fetched: int
+    days_changed: int
+    days_reused: int
+
+    def as_note(self):
+        return (
+            f"Flight schedule cache: {self.days_total} day(s), "
+            f"{self.days_fetched} fetched, {self.days_changed} changed, "
+            f"{self.days_reused} reused"
+        )
+
+
+def _iter_days(start_date, end_date):
+    current = start_date
+    while current <= end_date:
+        yield current
+        current += timedelta(days=1)
+
+
+def _records_checksum(records):
+    encoded = json.dumps(records, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _is_fresh(day, *, now, max_age_seconds):
+    if day is None or max_age_seconds <= 0:
+        return False
+    return day.fetched_at >= now - timedelta(seconds=max_age_seconds)
+
+
+def _fetch_days(client, stale_days, *, max_concurrency):
+    def _fetch(entry):
+        service_date, cached = entry
+        return client.fetch_day(
+            service_date=service_date,
+            etag=cached.etag if cached else "",
+            last_modified=cached.last_modified if cached else "",
+        )
+
+    # Only HTTP runs in worker threads; every database write stays on the caller's thread.
+    workers = max(1, min(max_concurrency, len(stale_days)))
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [(entry, executor.submit(_fetch, entry)) for entry in stale_days]
+        for (service_date, cached), future in futures:
+            try:
+                results.append((service_date, cached, future.result(), None))
+            except PlanningFlightProviderError as exc:
+                results.append((service_date, cached, None, exc))
+    return results
+
+
+def _store_day(*, cache_key, service_date, cached, result, now):
+    if cached is not None and result.not_modified:
+        cached.fetched_at = now
+        cached.save(update_fields=["fetched_at"])
+        return cached, False
+    records = list(result.records)
+    checksum = _records_checksum(records)
+    if cached is not None and cached.checksum == checksum:
+        cached.etag = result.etag
+        cached.last_modified = result.last_modified
+        cached.fetched_at = now
+        cached.save(update_fields=["etag", "last_modified", "fetched_at"])
+        return cached, False
+    day, _created = FlightScheduleDay.objects.update_or_create(
+        service_date=service_date,
+        **cache_key,
+        defaults={
+            "etag": result.etag,
+            "last_modified": result.last_modified,
+            "checksum": checksum,
+            "records": records,
+            "fetched_at": now,
+            "changed_at": now,
+        },
+    )
+    return day, True
+
+
+def sync_flight_schedule(
+    *,
+    client,
+    start_date,
+    end_date,
+    max_concurrency=DEFAULT_FLIGHT_SCHEDULE_MAX_CONCURRENCY,
+    max_age_seconds=DEFAULT_FLIGHT_SCHEDULE_MAX_AGE_SECONDS,
+    now=None,
+):
+    """Refresh the cached schedule days of ``client`` and return their provider records.
+
+    Days fetched less than ``max_age_seconds`` ago are reused without any request;
+    other days are re-fetched in parallel with conditional ETag/Last-Modified headers.
+    """
+    now = now or timezone.now()
+    cache_key = dict(client.cache_key)
+    days = list(_iter_days(start_date, end_date))
+    cached_by_date = {
+        day.service_date: day
+        for day in FlightScheduleDay.objects.filter(
+            service_date__gte=start_date,
+            service_date__lte=end_date,
+            **cache_key,
+        )
+    }
+    stale_days = [
+        (service_date, cached_by_date.get(service_date))
+        for service_date in days
+        if not _is_fresh(
+            cached_by_date.get(service_date),
+            now=now,
+            max_age_seconds=max_age_seconds,
+        )
+    ]
+    fetched = _fetch_days(client, stale_days, max_concurrency=max_concurrency)
+
+    changed = 0
+    first_error = None
+    with transaction.atomic():
+        for service_date, cached, result, exc in fetched:
+            if exc is not None:
+                first_error = first_error or exc
+                continue
+            day, day_changed = _store_day(
+                cache_key=cache_key,
+                service_date=service_date,
+                cached=cached,
+                result=result,
+                now=now,
+            )
+            cached_by_date[service_date] = day
+            changed += int(day_changed)
+    if first_error is not None:
+        raise first_error
+
+    records = []
+    for service_date in days:
+        records.extend(cached_by_date[service_date].records)
+    report = FlightScheduleSyncReport(
+        days_total=len(days),
+        days_fetched=len(fetched),
+        days_changed=changed,
+        days_reused=len(days) - len(fetched),
+    )
+    return records, report
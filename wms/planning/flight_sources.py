@@ -5,12 +5,19 @@ from pathlib import Path
 from django.utils.dateparse import parse_date, parse_time
 
 from wms.import_utils import extract_tabular_data, get_value, normalize_header, parse_int, parse_str
-from wms.models import Flight, FlightSourceBatch, FlightSourceBatchStatus, PlanningRunFlightMode
+from wms.models import (
+    Destination,
+    Flight,
+    FlightSourceBatch,
+    FlightSourceBatchStatus,
+    PlanningRunFlightMode,
+)
 from wms.planning.flight_providers import (
     PlanningFlightProviderError,
     UnknownPlanningFlightProviderError,
 )
 from wms.planning.flight_providers.airfrance_klm import AirFranceKlmFlightProvider
+from wms.planning.flight_schedule_cache import sync_flight_schedule
 from wms.runtime_settings import get_planning_flight_api_config
 
 FLIGHTS_SHEET_NAME = "Flights"
@@ -61,7 +68,14 @@ def _infer_route_pos(*, routing, destination_iata):
     return None
 
 
-def normalize_flight_record(row):
+def _destinations_by_iata():
+    destinations = {}
+    for destination in Destination.objects.exclude(iata_code=""):
+        destinations.setdefault(destination.iata_code.upper(), destination)
+    return destinations
+
+
+def normalize_flight_record(row, *, destinations_by_iata=None):
     flight_number = parse_str(get_value(row, "flight_number", "numero_vol", "numero_de_vol"))
     if not flight_number:
         raise ValueError("Each flight row must contain a flight number.")
@@ -84,11 +98,10 @@ def normalize_flight_record(row):
     origin_iata = origin_iata.upper()
     if route_pos is None:
         route_pos = _infer_route_pos(routing=routing, destination_iata=destination_iata)
-    destination = (
-        Flight._meta.get_field("destination")
-        .remote_field.model.objects.filter(iata_code__iexact=destination_iata)
-        .first()
-    )
+    if destinations_by_iata is not None:
+        destination = destinations_by_iata.get(destination_iata)
+    else:
+        destination = Destination.objects.filter(iata_code__iexact=destination_iata).first()
     return {
         "flight_number": flight_number.strip().upper(),
         "departure_date": departure_date,
@@ -164,14 +177,27 @@ def build_planning_flight_api_client():
 
 def import_api_flights(*, start_date, end_date, client=None):
     api_client = client or build_planning_flight_api_client()
+    notes = f"Imported for {start_date.isoformat()} -> {end_date.isoformat()}"
+    if hasattr(api_client, "fetch_day"):
+        config = get_planning_flight_api_config()
+        rows, report = sync_flight_schedule(
+            client=api_client,
+            start_date=start_date,
+            end_date=end_date,
+            max_concurrency=config.max_concurrency,
+            max_age_seconds=config.cache_max_age_seconds,
+        )
+        notes = f"{notes}\n{report.as_note()}"
+    else:
+        rows = api_client.fetch_flights(start_date=start_date, end_date=end_date)
+    destinations_by_iata = _destinations_by_iata()
     records = [
-        normalize_flight_record(row)
-        for row in api_client.fetch_flights(start_date=start_date, end_date=end_date)
+        normalize_flight_record(row, destinations_by_iata=destinations_by_iata) for row in rows
     ]
     return _persist_batch(
         source="api",
         records=records,
-        notes=f"Imported for {start_date.isoformat()} -> {end_date.isoformat()}",
+        notes=notes,
     )
 
 
@@ -0,0 +1,257 @@
+"""Per-version index of the assignments behind the manual-assignment pickers.
+
+Opening the picker colours every flight (remaining capacity) and every volunteer/flight pair
+(availability, 2h30 conflict margin). ``OperatorIndex`` keeps what those checks need from the
+version's assignments: assignments and used units by flight, and each volunteer's departures as
+a sorted interval list searched with ``bisect``. Indexes are cached in-process per version and
+revision (assignment count and latest ``updated_at``). ``operator_mutations`` patches the cached
+index after each committed edit when it was built from the revision the edit started from, and
+drops it otherwise so that the next read rebuilds from the database.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from operator import itemgetter
+
+from django.db.models import Count, Max
+
+CONFLICT_MARGIN_MINUTES = 150
+OPERATOR_INDEX_CACHE_SIZE = 32
+
+_operator_indexes = OrderedDict()
+_operator_indexes_lock = threading.Lock()
+
+_departure_of = itemgetter(0)
+
+
+def _normalize_flight_number(value: str) -> str:
+    return re.sub(r"[^A-Z0-9]", "", str(value or "").strip().upper())
+
+
+def _flight_departure_dt(flight: dict) -> datetime | None:
+    departure_date = str(flight.get("departure_date") or "").strip()
+    departure_time = str(flight.get("departure_time") or "").strip()
+    if not departure_date or not departure_time:
+        return None
+    try:
+        return datetime.fromisoformat(f"{departure_date}T{departure_time}")
+    except ValueError:
+        return None
+
+
+def _flight_physical_key(flight: dict) -> str:
+    return "{date}|{time}|{number}".format(
+        date=str(flight.get("departure_date") or ""),
+        time=str(flight.get("departure_time") or ""),
+        number=_normalize_flight_number(flight.get("flight_number") or ""),
+    )
+
+
+def _flight_departures(flights: dict[int, dict]) -> dict[int, tuple[datetime | None, str]]:
+    return {
+        int(flight_id): (_flight_departure_dt(flight), _flight_physical_key(flight))
+        for flight_id, flight in flights.items()
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedAssignment:
+    assignment_id: int
+    volunteer_snapshot_id: int | None
+    flight_snapshot_id: int | None
+    equivalent_units: int
+
+
+class OperatorIndex:
+    __slots__ = (
+        "revision",
+        "flight_departures",
+        "assignments",
+        "assignment_ids_by_flight",
+        "used_units_by_flight",
+        "departures_by_volunteer",
+    )
+
+    def __init__(self, *, revision, flight_departures: dict[int, tuple[datetime | None, str]]):
+        self.revision = revision
+        self.flight_departures = flight_departures
+        self.assignments: dict[int, IndexedAssignment] = {}
+        self.assignment_ids_by_flight: dict[int, set[int]] = {}
+        self.used_units_by_flight: dict[int, int] = {}
+        # volunteer id -> [(departure, assignment id, physical key)] sorted by departure.
+        self.departures_by_volunteer: dict[int, list[tuple[datetime, int, str]]] = {}
+
+    @classmethod
+    def build(cls, version, *, flights: dict[int, dict], revision=None) -> OperatorIndex:
+        index = cls(
+            revision=revision if revision is not None else operator_index_revision(version),
+            flight_departures=_flight_departures(flights),
+        )
+        rows = version.assignments.values_list(
+            "pk",
+            "volunteer_snapshot_id",
+            "flight_snapshot_id",
+            "shipment_snapshot__equivalent_units",
+        )
+        for assignment_id, volunteer_id, flight_id, equivalent_units in rows:
+            index.add(
+                IndexedAssignment(
+                    assignment_id=assignment_id,
+                    volunteer_snapshot_id=volunteer_id,
+                    flight_snapshot_id=flight_id,
+                    equivalent_units=int(equivalent_units or 0),
+                )
+            )
+        return index
+
+    def add(self, entry: IndexedAssignment) -> None:
+        self.discard(entry.assignment_id)
+        self.assignments[entry.assignment_id] = entry
+        flight_id = entry.flight_snapshot_id
+        if flight_id is None:
+            return
+        self.assignment_ids_by_flight.setdefault(flight_id, set()).add(entry.assignment_id)
+        self.used_units_by_flight[flight_id] = (
+            self.used_units_by_flight.get(flight_id, 0) + entry.equivalent_units
+        )
+        departure, physical_key = self.flight_departures.get(flight_id, (None, ""))
+        if entry.volunteer_snapshot_id is None or departure is None:
+            return
+        insort(
+            self.departures_by_volunteer.setdefault(entry.volunteer_snapshot_id, []),
+            (departure, entry.assignment_id, physical_key),
+        )
+
+    def discard(self, assignment_id: int) -> None:
+        entry = self.assignments.pop(assignment_id, None)
+        if entry is None or entry.flight_snapshot_id is None:
+            return
+        flight_id = entry.flight_snapshot_id
+        flight_assignment_ids = self.assignment_ids_by_flight[flight_id]
+        flight_assignment_ids.discard(assignment_id)
+        if flight_assignment_ids:
+            self.used_units_by_flight[flight_id] -= entry.equivalent_units
+        else:
+            del self.assignment_ids_by_flight[flight_id]
+            del self.used_units_by_flight[flight_id]
+        departures = self.departures_by_volunteer.get(entry.volunteer_snapshot_id)
+        if departures:
+            remaining = [item for item in departures if item[1] != assignment_id]
+            if remaining:
+                self.departures_by_volunteer[entry.volunteer_snapshot_id] = remaining
+            else:
+                del self.departures_by_volunteer[entry.volunteer_snapshot_id]
+
+    def has_assignments(self, flight_snapshot_id: int) -> bool:
+        return bool(self.assignment_ids_by_flight.get(flight_snapshot_id))
+
+    def used_units(
+        self, flight_snapshot_id: int, *, ignore_assignment_id: int | None = None
+    ) -> int:
+        used = self.used_units_by_flight.get(flight_snapshot_id, 0)
+        ignored = self.assignments.get(ignore_assignment_id)
+        if ignored is not None and ignored.flight_snapshot_id == flight_snapshot_id:
+            used -= ignored.equivalent_units
+        return used
+
+    def volunteer_has_conflict(
+        self,
+        volunteer_snapshot_id: int,
+        flight_snapshot_id: int,
+        *,
+        ignore_assignment_id: int | None = None,
+    ) -> bool:
+        departure, physical_key = self.flight_departures.get(flight_snapshot_id, (None, ""))
+        departures = self.departures_by_volunteer.get(volunteer_snapshot_id)
+        if departure is None or not departures:
+            return False
+        margin = timedelta(minutes=CONFLICT_MARGIN_MINUTES)
+        start = bisect_right(departures, departure - margin, key=_departure_of)
+        end = bisect_left(departures, departure + margin, key=_departure_of)
+        return any(
+            assignment_id != ignore_assignment_id and other_key != physical_key
+            for _other, assignment_id, other_key in departures[start:end]
+        )
+
+
+def operator_index_revision(version) -> tuple[int, datetime | None]:
+    summary = version.assignments.aggregate(count=Count("id"), latest=Max("updated_at"))
+    return summary["count"], summary["latest"]
+
+
+def get_operator_index(version, *, flights: dict[int, dict]) -> OperatorIndex:
+    revision = operator_index_revision(version)
+    with _operator_indexes_lock:
+        index = _operator_indexes.get(version.pk)
+        if index is not None and index.revision == revision:
+            if index.flight_departures == _flight_departures(flights):
+                _operator_indexes.move_to_end(version.pk)
+                return index
+
+    index = OperatorIndex.build(version, flights=flights, revision=revision)
+    with _operator_indexes_lock:
+        _operator_indexes[version.pk] = index
+        while len(_operator_indexes) > OPERATOR_INDEX_CACHE_SIZE:
+            _operator_indexes.popitem(last=False)
+    return index
+
+
+def _patchable_index(version, previous_revision) -> OperatorIndex | None:
+    # Caller holds the lock. An index built from another revision misses edits committed by
+    # other processes: patching it would keep it stale under a fresh-looking revision.
+    index = _operator_indexes.get(version.pk)
+    if index is not None and index.revision != previous_revision:
+        del _operator_indexes[version.pk]
+        return None
+    return index
+
+
+def record_saved_assignment(version, assignment, *, created: bool, previous_revision) -> None:
+    with _operator_indexes_lock:
+        index = _patchable_index(version, previous_revision)
+        if index is None:
+            return
+        count, latest = index.revision
+        index.add(
+            IndexedAssignment(
+                assignment_id=assignment.pk,
+                volunteer_snapshot_id=assignment.volunteer_snapshot_id,
+                flight_snapshot_id=assignment.flight_snapshot_id,
+                equivalent_units=int(
+                    assignment.shipment_snapshot.equivalent_units
+                    if assignment.shipment_snapshot_id
+                    else 0
+                ),
+            )
+        )
+        index.revision = (
+            count + 1 if created else count,
+            max(latest, assignment.updated_at) if latest else assignment.updated_at,
+        )
+
+
+def record_deleted_assignment(
+    version, *, assignment_id: int, updated_at: datetime, previous_revision
+) -> None:
+    with _operator_indexes_lock:
+        index = _patchable_index(version, previous_revision)
+        if index is None:
+            return
+        count, latest = index.revision
+        if latest is None or updated_at >= latest:
+            # The next latest ``updated_at`` is unknown here: rebuild on the next read.
+            del _operator_indexes[version.pk]
+            return
+        index.discard(assignment_id)
+        index.revision = (count - 1, latest)
+
+
+def clear_operator_index_cache() -> None:
+    with _operator_indexes_lock:
+        _operator_indexes.clear()
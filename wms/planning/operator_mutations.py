@@ -1,8 +1,19 @@
 from __future__ import annotations
 
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
-from wms.models import PlanningAssignment, PlanningAssignmentSource, PlanningVersionStatus
+from wms.models import (
+    PlanningAssignment,
+    PlanningAssignmentSource,
+    PlanningVersion,
+    PlanningVersionStatus,
+)
+from wms.planning.operator_index import (
+    operator_index_revision,
+    record_deleted_assignment,
+    record_saved_assignment,
+)
 from wms.planning.operator_options import (
     build_operator_option_context,
     explain_flight_rejection,
@@ -15,6 +26,12 @@ def _ensure_draft(version) -> None:
         raise ValidationError("Seules les versions brouillon sont modifiables.")
 
 
+def _lock_revision(version):
+    """Serialize edits of ``version`` and return the assignment revision they start from."""
+    PlanningVersion.objects.select_for_update().filter(pk=version.pk).exists()
+    return operator_index_revision(version)
+
+
 def _validate_manual_assignment(
     version,
     *,
@@ -69,17 +86,30 @@ def _validate_manual_assignment(
         raise ValidationError("Le benevole selectionne est indisponible pour ce vol.")
 
 
+@transaction.atomic
 def delete_assignment(*, version, assignment) -> None:
     _ensure_draft(version)
     if assignment.version_id != version.pk:
         raise ValidationError("Affectation introuvable pour cette version.")
+    previous_revision = _lock_revision(version)
+    assignment_id, updated_at = assignment.pk, assignment.updated_at
     assignment.delete()
+    transaction.on_commit(
+        lambda: record_deleted_assignment(
+            version,
+            assignment_id=assignment_id,
+            updated_at=updated_at,
+            previous_revision=previous_revision,
+        )
+    )
 
 
+@transaction.atomic
 def update_assignment(*, version, assignment, volunteer_snapshot, flight_snapshot):
     _ensure_draft(version)
     if assignment.version_id != version.pk:
         raise ValidationError("Affectation introuvable pour cette version.")
+    previous_revision = _lock_revision(version)
     _validate_manual_assignment(
         version,
         shipment_snapshot=assignment.shipment_snapshot,
@@ -98,11 +128,18 @@ def update_assignment(*, version, assignment, volunteer_snapshot, flight_snapsho
             "updated_at",
         ]
     )
+    transaction.on_commit(
+        lambda: record_saved_assignment(
+            version, assignment, created=False, previous_revision=previous_revision
+        )
+    )
     return assignment
 
 
+@transaction.atomic
 def assign_unassigned_shipment(*, version, shipment_snapshot, volunteer_snapshot, flight_snapshot):
     _ensure_draft(version)
+    previous_revision = _lock_revision(version)
     _validate_manual_assignment(
         version,
         shipment_snapshot=shipment_snapshot,
@@ -113,7 +150,7 @@ def assign_unassigned_shipment(*, version, shipment_snapshot, volunteer_snapshot
         version.assignments.order_by("-sequence", "-id").values_list("sequence", flat=True).first()
         or 0
     ) + 1
-    return PlanningAssignment.objects.create(
+    assignment = PlanningAssignment.objects.create(
         version=version,
         shipment_snapshot=shipment_snapshot,
         volunteer_snapshot=volunteer_snapshot,
@@ -122,3 +159,9 @@ def assign_unassigned_shipment(*, version, shipment_snapshot, volunteer_snapshot
         source=PlanningAssignmentSource.MANUAL,
         sequence=sequence,
     )
+    transaction.on_commit(
+        lambda: record_saved_assignment(
+            version, assignment, created=True, previous_revision=previous_revision
+        )
+    )
+    return assignment
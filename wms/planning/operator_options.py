@@ -1,22 +1,17 @@
 from __future__ import annotations
 
-import re
 from collections import defaultdict
-from datetime import datetime, timedelta
 
 from wms.models import PlanningVersion
-from wms.planning.rules import (
-    compile_run_solver_payload,
-    volunteer_is_compatible_with_flight,
-)
+from wms.planning.operator_index import get_operator_index
+from wms.planning.payload_model import PlanningPayload
+from wms.planning.rules import compile_run_solver_payload
 from wms.planning.version_dashboard import (
     _format_flight_date,
     _format_flight_number,
     _format_flight_time,
 )
 
-CONFLICT_MARGIN_MINUTES = 150
-
 TONE_STYLE = {
     "green": "background-color: #e6f6ea;",
     "orange": "background-color: #fff1db;",
@@ -40,19 +35,17 @@ VOLUNTEER_REASON_LABELS = {
 
 def build_operator_option_context(version: PlanningVersion) -> dict[str, object]:
     payload = compile_run_solver_payload(version.run)
-    assignments = list(
-        version.assignments.select_related(
-            "shipment_snapshot",
-            "volunteer_snapshot",
-            "flight_snapshot",
-        ).order_by("sequence", "id")
-    )
+    flights = {int(item["snapshot_id"]): item for item in payload.get("flights", [])}
     return {
         "payload": payload,
+        "model": PlanningPayload.from_dict(payload),
         "shipments": {int(item["snapshot_id"]): item for item in payload.get("shipments", [])},
         "volunteers": {int(item["snapshot_id"]): item for item in payload.get("volunteers", [])},
-        "flights": {int(item["snapshot_id"]): item for item in payload.get("flights", [])},
-        "assignments": assignments,
+        "flights": flights,
+        "sorted_flights": sorted(flights.values(), key=_flight_sort_key),
+        "index": get_operator_index(version, flights=flights),
+        # Volunteer option rows without an ignored assignment, shared by every picker.
+        "volunteer_rows": {},
     }
 
 
@@ -64,10 +57,6 @@ def _normalize_iata(value: str) -> str:
     return str(value or "").strip().upper()
 
 
-def _normalize_flight_number(value: str) -> str:
-    return re.sub(r"[^A-Z0-9]", "", str(value or "").strip().upper())
-
-
 def _flight_sort_key(flight: dict) -> tuple[str, str, str]:
     return (
         str(flight.get("departure_date") or ""),
@@ -76,33 +65,6 @@ def _flight_sort_key(flight: dict) -> tuple[str, str, str]:
     )
 
 
-def _flight_departure_dt(flight: dict) -> datetime | None:
-    departure_date = str(flight.get("departure_date") or "").strip()
-    departure_time = str(flight.get("departure_time") or "").strip()
-    if not departure_date or not departure_time:
-        return None
-    try:
-        return datetime.fromisoformat(f"{departure_date}T{departure_time}")
-    except ValueError:
-        return None
-
-
-def _flight_physical_key(flight: dict) -> str:
-    return "{date}|{time}|{number}".format(
-        date=str(flight.get("departure_date") or ""),
-        time=str(flight.get("departure_time") or ""),
-        number=_normalize_flight_number(flight.get("flight_number") or ""),
-    )
-
-
-def _assignments_for_flight(context: dict[str, object], *, flight_snapshot_id: int) -> list:
-    return [
-        assignment
-        for assignment in context["assignments"]
-        if assignment.flight_snapshot_id == flight_snapshot_id
-    ]
-
-
 def _remaining_capacity(
     context: dict[str, object],
     *,
@@ -113,12 +75,10 @@ def _remaining_capacity(
     capacity = flight.get("capacity_units")
     if capacity is None:
         return None
-    used_equivalent_units = 0
-    for assignment in _assignments_for_flight(context, flight_snapshot_id=int(flight_snapshot_id)):
-        if ignore_assignment_id is not None and assignment.pk == ignore_assignment_id:
-            continue
-        if assignment.shipment_snapshot_id:
-            used_equivalent_units += assignment.shipment_snapshot.equivalent_units
+    used_equivalent_units = context["index"].used_units(
+        int(flight_snapshot_id),
+        ignore_assignment_id=ignore_assignment_id,
+    )
     return int(capacity) - int(used_equivalent_units)
 
 
@@ -134,15 +94,8 @@ def explain_flight_rejection(
     ):
         return "destination_mismatch"
 
-    allowed_weekdays = [
-        str(value or "").strip().lower() for value in flight.get("allowed_weekdays") or []
-    ]
-    if allowed_weekdays:
-        departure_date = str(flight.get("departure_date") or "").strip()
-        if departure_date:
-            weekday_code = datetime.fromisoformat(departure_date).strftime("%a").lower()[:3]
-            if weekday_code not in allowed_weekdays:
-                return "weekday_not_allowed"
+    if not _flight_record(context, flight).weekday_allowed:
+        return "weekday_not_allowed"
 
     shipment_carton_count = int(shipment.get("carton_count") or 0)
     max_cartons_per_flight = flight.get("max_cartons_per_flight")
@@ -183,14 +136,24 @@ def _flight_tone_for_shipment(
         ignore_assignment_id=ignore_assignment_id,
     ):
         return "red"
-    if _assignments_for_flight(context, flight_snapshot_id=int(flight["snapshot_id"])):
+    if context["index"].has_assignments(int(flight["snapshot_id"])):
         return "orange"
     return "green"
 
 
-def _has_availability_info(volunteer: dict) -> bool:
-    availability = volunteer.get("availability_summary") or {}
-    return bool((availability.get("slots") or []) or (availability.get("unavailable_dates") or []))
+def _flight_record(context: dict[str, object], flight: dict):
+    return context["model"].flight_by_id[int(flight["snapshot_id"])]
+
+
+def _volunteer_record(context: dict[str, object], volunteer: dict):
+    return context["model"].volunteer_by_id[int(volunteer["snapshot_id"])]
+
+
+def _volunteer_is_available(context: dict[str, object], *, volunteer: dict, flight: dict) -> bool:
+    return context["model"].volunteer_available_for(
+        _volunteer_record(context, volunteer),
+        _flight_record(context, flight),
+    )
 
 
 def _volunteer_has_conflict(
@@ -200,26 +163,11 @@ def _volunteer_has_conflict(
     flight: dict,
     ignore_assignment_id: int | None = None,
 ) -> bool:
-    candidate_dt = _flight_departure_dt(flight)
-    if candidate_dt is None:
-        return False
-    candidate_key = _flight_physical_key(flight)
-    for assignment in context["assignments"]:
-        if assignment.volunteer_snapshot_id != volunteer_snapshot_id:
-            continue
-        if ignore_assignment_id is not None and assignment.pk == ignore_assignment_id:
-            continue
-        other_flight = context["flights"].get(int(assignment.flight_snapshot_id or 0))
-        if not other_flight:
-            continue
-        if _flight_physical_key(other_flight) == candidate_key:
-            continue
-        other_dt = _flight_departure_dt(other_flight)
-        if other_dt is None:
-            continue
-        if abs(candidate_dt - other_dt) < timedelta(minutes=CONFLICT_MARGIN_MINUTES):
-            return True
-    return False
+    return context["index"].volunteer_has_conflict(
+        int(volunteer_snapshot_id),
+        int(flight["snapshot_id"]),
+        ignore_assignment_id=ignore_assignment_id,
+    )
 
 
 def _volunteer_tone_for_flight(
@@ -229,9 +177,9 @@ def _volunteer_tone_for_flight(
     flight: dict,
     ignore_assignment_id: int | None = None,
 ) -> str:
-    if not _has_availability_info(volunteer):
+    if not _volunteer_record(context, volunteer).has_availability_info:
         return "none"
-    if not volunteer_is_compatible_with_flight(volunteer, flight):
+    if not _volunteer_is_available(context, volunteer=volunteer, flight=flight):
         return "red"
     if _volunteer_has_conflict(
         context,
@@ -250,9 +198,9 @@ def explain_volunteer_rejection(
     flight: dict,
     ignore_assignment_id: int | None = None,
 ) -> str | None:
-    if not _has_availability_info(volunteer):
+    if not _volunteer_record(context, volunteer).has_availability_info:
         return None
-    if not volunteer_is_compatible_with_flight(volunteer, flight):
+    if not _volunteer_is_available(context, volunteer=volunteer, flight=flight):
         return "unavailable"
     if _volunteer_has_conflict(
         context,
@@ -296,7 +244,7 @@ def _build_flight_options(
     ignore_assignment_id: int | None = None,
 ) -> list[dict[str, object]]:
     options = []
-    for flight in sorted(context["flights"].values(), key=_flight_sort_key):
+    for flight in context["sorted_flights"]:
         tone = _flight_tone_for_shipment(
             context,
             shipment=shipment,
@@ -331,6 +279,37 @@ def _build_flight_options(
     return options
 
 
+VOLUNTEER_REASON_BY_TONE = {"red": "unavailable", "orange": "conflict"}
+
+
+def _volunteer_flight_tones(
+    context: dict[str, object],
+    *,
+    volunteer: dict,
+    ignore_assignment_id: int | None = None,
+) -> tuple[dict[str, str], dict[str, str]]:
+    volunteer_id = int(volunteer["snapshot_id"])
+    ignored = context["index"].assignments.get(ignore_assignment_id)
+    shared = ignored is None or ignored.volunteer_snapshot_id != volunteer_id
+    if shared and volunteer_id in context["volunteer_rows"]:
+        return context["volunteer_rows"][volunteer_id]
+    tones_by_flight = {}
+    reasons_by_flight = {}
+    for flight in context["sorted_flights"]:
+        flight_key = str(flight["snapshot_id"])
+        tone = _volunteer_tone_for_flight(
+            context,
+            volunteer=volunteer,
+            flight=flight,
+            ignore_assignment_id=ignore_assignment_id,
+        )
+        tones_by_flight[flight_key] = tone
+        reasons_by_flight[flight_key] = VOLUNTEER_REASON_BY_TONE.get(tone, "")
+    if shared:
+        context["volunteer_rows"][volunteer_id] = (tones_by_flight, reasons_by_flight)
+    return tones_by_flight, reasons_by_flight
+
+
 def _build_volunteer_options(
     context: dict[str, object],
     *,
@@ -340,25 +319,12 @@ def _build_volunteer_options(
 ) -> list[dict[str, object]]:
     options = []
     selected_flight_id = str(selected_flight["snapshot_id"]) if selected_flight else ""
-    flights = sorted(context["flights"].values(), key=_flight_sort_key)
     for volunteer in context["volunteers"].values():
-        tones_by_flight = {}
-        reasons_by_flight = {}
-        for flight in flights:
-            flight_key = str(flight["snapshot_id"])
-            tones_by_flight[flight_key] = _volunteer_tone_for_flight(
-                context,
-                volunteer=volunteer,
-                flight=flight,
-                ignore_assignment_id=ignore_assignment_id,
-            )
-            reason_code = explain_volunteer_rejection(
-                context,
-                volunteer=volunteer,
-                flight=flight,
-                ignore_assignment_id=ignore_assignment_id,
-            )
-            reasons_by_flight[flight_key] = reason_code or ""
+        tones_by_flight, reasons_by_flight = _volunteer_flight_tones(
+            context,
+            volunteer=volunteer,
+            ignore_assignment_id=ignore_assignment_id,
+        )
         tone = tones_by_flight.get(selected_flight_id, "none") if selected_flight else "none"
         options.append(
             {
@@ -366,8 +332,8 @@ def _build_volunteer_options(
                 "label": volunteer.get("label") or "",
                 "tone": tone,
                 "option_style": _option_style(tone),
-                "tones_by_flight": tones_by_flight,
-                "reasons_by_flight": reasons_by_flight,
+                "tones_by_flight": dict(tones_by_flight),
+                "reasons_by_flight": dict(reasons_by_flight),
                 "selected": int(volunteer["snapshot_id"]) == int(selected_volunteer_id or 0),
             }
         )
@@ -392,13 +358,14 @@ def _pick_preferred_volunteer_id(
     if flight is None:
         return None
     ranked_candidates: list[tuple[int, str, int]] = []
+    flight_key = str(flight["snapshot_id"])
     for volunteer in context["volunteers"].values():
-        tone = _volunteer_tone_for_flight(
+        tones_by_flight, _reasons_by_flight = _volunteer_flight_tones(
             context,
             volunteer=volunteer,
-            flight=flight,
             ignore_assignment_id=ignore_assignment_id,
         )
+        tone = tones_by_flight[flight_key]
         rank = _volunteer_selection_rank(tone)
         if rank <= 0:
             continue
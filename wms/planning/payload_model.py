@@ -0,0 +1,523 @@
+"""Compact, index-based view of a compiled planning payload.
+
+``compile_run_solver_payload`` returns plain JSON lists so the payload can be stored on the
+run. ``PlanningPayload`` is what the rules, the solver and the operator options work on: every
+shipment, flight and volunteer becomes a slotted record with a stable integer index, dates and
+times are parsed once (legacy dates as ordinals, departures as minutes), capacities live in
+``array`` columns and compatibility is precomputed as per-record flight bitsets.
+``PlanningPayload.to_dict`` returns the stored JSON layout unchanged.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, time
+
+from wms.planning.config import (
+    LEGACY_EQUIV_CAPACITY_PER_VOLUNTEER,
+    LEGACY_MISSION_LEAD_HOURS,
+)
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def coerce_int(value: object) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_time_value(value: str | None) -> time | None:
+    if not value:
+        return None
+    parts = str(value).strip().split(":")
+    if len(parts) < 2:
+        return None
+    try:
+        hour = int(parts[0])
+        minute = int(parts[1])
+    except (TypeError, ValueError):
+        return None
+    return time(hour=hour, minute=minute)
+
+
+def _minute_of_day(value: time | None) -> int | None:
+    if value is None:
+        return None
+    return value.hour * 60 + value.minute
+
+
+def _coerce_iso_date_ordinal(value: object) -> int:
+    text = str(value or "").strip()
+    if not text:
+        return -1
+    try:
+        return datetime.fromisoformat(text).date().toordinal()
+    except ValueError:
+        return -1
+
+
+def _flight_datetime_key(flight: dict) -> datetime:
+    departure_date = str(flight.get("departure_date") or "").strip()
+    departure_time = str(flight.get("departure_time") or "").strip() or "00:00"
+    try:
+        return datetime.fromisoformat(f"{departure_date}T{departure_time}")
+    except ValueError:
+        return datetime.max
+
+
+def shipment_weight(shipment: dict) -> int:
+    equivalent_units = int(shipment.get("equivalent_units") or 0)
+    priority = int(shipment.get("priority_rank") or shipment.get("priority") or 0)
+    legacy_priority_bonus = max(0, 10 - priority)
+    return equivalent_units * legacy_priority_bonus
+
+
+def _volunteer_availability_minutes(volunteer: dict) -> int:
+    availability = volunteer.get("availability_summary") or {}
+    total = 0
+    for slot in availability.get("slots") or []:
+        date_value = str(slot.get("date") or "").strip()
+        start_value = str(slot.get("start_time") or "").strip()
+        end_value = str(slot.get("end_time") or "").strip()
+        if not date_value or not start_value or not end_value:
+            continue
+        try:
+            start_dt = datetime.fromisoformat(f"{date_value}T{start_value}")
+            end_dt = datetime.fromisoformat(f"{date_value}T{end_value}")
+        except ValueError:
+            continue
+        delta = int((end_dt - start_dt).total_seconds() / 60)
+        if delta > 0:
+            total += delta
+    return total
+
+
+def _volunteer_slot_bounds_by_date(volunteer: dict) -> dict[str, tuple[datetime, datetime]]:
+    """Return the slot ending last on each date, as solver post-processing compares them."""
+    availability = volunteer.get("availability_summary") or {}
+    bounds = {}
+    for slot in availability.get("slots") or []:
+        date_value = str(slot.get("date") or "").strip()
+        start_value = str(slot.get("start_time") or "").strip()
+        end_value = str(slot.get("end_time") or "").strip()
+        if not start_value or not end_value:
+            continue
+        try:
+            start_dt = datetime.fromisoformat(f"{date_value}T{start_value}")
+            end_dt = datetime.fromisoformat(f"{date_value}T{end_value}")
+        except ValueError:
+            continue
+        if end_dt <= start_dt:
+            continue
+        best_slot = bounds.get(date_value)
+        if best_slot is None or end_dt > best_slot[1]:
+            bounds[date_value] = (start_dt, end_dt)
+    return bounds
+
+
+def _volunteer_slot_windows(volunteer: dict) -> dict[str, tuple[tuple[int, int], ...]]:
+    """Group parseable slots as ``(start, end)`` minutes of day by their raw date."""
+    availability = volunteer.get("availability_summary") or {}
+    windows = {}
+    for slot in availability.get("slots") or []:
+        start_minute = _minute_of_day(parse_time_value(slot.get("start_time")))
+        end_minute = _minute_of_day(parse_time_value(slot.get("end_time")))
+        if start_minute is None or end_minute is None:
+            continue
+        windows.setdefault(slot.get("date"), []).append((start_minute, end_minute))
+    return {date_value: tuple(items) for date_value, items in windows.items()}
+
+
+def _shipment_reference_sort_key(shipment: dict) -> tuple:
+    reference = str(shipment.get("reference") or "").strip()
+    reference_number = coerce_int(reference)
+    if reference_number is not None:
+        return (0, reference_number, reference)
+    return (1, reference)
+
+
+def _shipment_has_legacy_tie_break_metadata(shipment: dict) -> bool:
+    payload = shipment.get("payload") or {}
+    return any(
+        str(payload.get(key) or "").strip()
+        for key in (
+            "legacy_date_depart_mag",
+            "legacy_date_impression",
+            "legacy_date_conditionnement",
+        )
+    )
+
+
+def _shipment_legacy_tie_break_key(shipment: dict) -> tuple:
+    payload = shipment.get("payload") or {}
+    return (
+        1 if str(payload.get("legacy_date_depart_mag") or "").strip() else 0,
+        _coerce_iso_date_ordinal(payload.get("legacy_date_impression")),
+        _coerce_iso_date_ordinal(payload.get("legacy_date_conditionnement")),
+        -(coerce_int(shipment.get("reference")) or 10**9),
+        str(shipment.get("reference") or ""),
+    )
+
+
+def _shipment_legacy_assignment_key(shipment: dict) -> tuple:
+    payload = shipment.get("payload") or {}
+    return (
+        int(shipment.get("priority") or 0),
+        0 if str(payload.get("legacy_date_depart_mag") or "").strip() else 1,
+        _coerce_iso_date_ordinal(payload.get("legacy_date_conditionnement")),
+        _coerce_iso_date_ordinal(payload.get("legacy_date_impression")),
+        _shipment_reference_sort_key(shipment),
+    )
+
+
+def _volunteer_assignment_order_key(volunteer: dict) -> tuple:
+    payload = volunteer.get("payload") or {}
+    legacy_id = coerce_int(payload.get("legacy_id"))
+    label = str(volunteer.get("label") or "")
+    snapshot_id = coerce_int(volunteer.get("snapshot_id")) or 0
+    if legacy_id is not None:
+        return (0, legacy_id, label, snapshot_id)
+    return (1, label, snapshot_id)
+
+
+def _weekday_allowed(flight: dict) -> bool:
+    allowed_weekdays = [
+        str(value or "").strip().lower() for value in flight.get("allowed_weekdays") or []
+    ]
+    if not allowed_weekdays:
+        return True
+    departure_date = str(flight.get("departure_date") or "").strip()
+    if not departure_date:
+        return True
+    weekday_code = datetime.fromisoformat(departure_date).strftime("%a").lower()[:3]
+    return weekday_code in allowed_weekdays
+
+
+@dataclass(frozen=True, slots=True)
+class ShipmentRecord:
+    index: int
+    snapshot_id: int
+    reference: str
+    shipper_name: str
+    destination_iata: str
+    priority: int
+    priority_rank: int
+    carton_count: int
+    equivalent_units: int
+    payload: dict | None
+    destination_key: str
+    weight: int
+    has_legacy_tie_break_metadata: bool
+    legacy_tie_break_key: tuple
+    legacy_assignment_key: tuple
+
+    @classmethod
+    def from_dict(cls, index: int, data: dict) -> ShipmentRecord:
+        priority = data.get("priority") or 0
+        return cls(
+            index=index,
+            snapshot_id=data["snapshot_id"],
+            reference=data.get("reference") or "",
+            shipper_name=data.get("shipper_name") or "",
+            destination_iata=data.get("destination_iata") or "",
+            priority=priority,
+            priority_rank=data.get("priority_rank", priority),
+            carton_count=data.get("carton_count") or 0,
+            equivalent_units=data.get("equivalent_units") or 0,
+            payload=data.get("payload"),
+            destination_key=str(data.get("destination_iata") or "").upper(),
+            weight=shipment_weight(data),
+            has_legacy_tie_break_metadata=_shipment_has_legacy_tie_break_metadata(data),
+            legacy_tie_break_key=_shipment_legacy_tie_break_key(data),
+            legacy_assignment_key=_shipment_legacy_assignment_key(data),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "snapshot_id": self.snapshot_id,
+            "reference": self.reference,
+            "shipper_name": self.shipper_name,
+            "destination_iata": self.destination_iata,
+            "priority": self.priority,
+            "priority_rank": self.priority_rank,
+            "carton_count": self.carton_count,
+            "equivalent_units": self.equivalent_units,
+            "payload": self.payload,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class FlightRecord:
+    index: int
+    snapshot_id: int
+    flight_number: str
+    departure_date: str
+    departure_time: str
+    origin_iata: str
+    destination_iata: str
+    routing: str
+    route_pos: int
+    physical_flight_key: str
+    capacity_units: int | None
+    max_cartons_per_flight: int | None
+    weekly_frequency: int | None
+    allowed_weekdays: list
+    payload: dict | None
+    destination_key: str
+    departure_key: datetime
+    departure_minute: int | None
+    mission_start_minute: int | None
+    weekday_allowed: bool
+
+    @classmethod
+    def from_dict(cls, index: int, data: dict) -> FlightRecord:
+        departure_minute = _minute_of_day(parse_time_value(data.get("departure_time")))
+        mission_start_minute = None
+        if departure_minute is not None:
+            mission_start_minute = (
+                departure_minute - LEGACY_MISSION_LEAD_HOURS * 60
+            ) % MINUTES_PER_DAY
+        return cls(
+            index=index,
+            snapshot_id=data["snapshot_id"],
+            flight_number=data.get("flight_number") or "",
+            departure_date=str(data.get("departure_date") or ""),
+            departure_time=data.get("departure_time") or "",
+            origin_iata=data.get("origin_iata") or "",
+            destination_iata=data.get("destination_iata") or "",
+            routing=data.get("routing") or "",
+            route_pos=int(data.get("route_pos") or 1),
+            physical_flight_key=data.get("physical_flight_key") or "",
+            capacity_units=data.get("capacity_units"),
+            max_cartons_per_flight=data.get("max_cartons_per_flight"),
+            weekly_frequency=data.get("weekly_frequency"),
+            allowed_weekdays=list(data.get("allowed_weekdays") or []),
+            payload=data.get("payload"),
+            destination_key=str(data.get("destination_iata") or "").upper(),
+            departure_key=_flight_datetime_key(data),
+            departure_minute=departure_minute,
+            mission_start_minute=mission_start_minute,
+            weekday_allowed=_weekday_allowed(data),
+        )
+
+    @property
+    def physical_key(self) -> str:
+        return self.physical_flight_key or str(self.snapshot_id)
+
+    def to_dict(self) -> dict:
+        return {
+            "snapshot_id": self.snapshot_id,
+            "flight_number": self.flight_number,
+            "departure_date": self.departure_date,
+            "departure_time": self.departure_time,
+            "origin_iata": self.origin_iata,
+            "destination_iata": self.destination_iata,
+            "routing": self.routing,
+            "route_pos": self.route_pos,
+            "physical_flight_key": self.physical_flight_key,
+            "capacity_units": self.capacity_units,
+            "max_cartons_per_flight": self.max_cartons_per_flight,
+            "weekly_frequency": self.weekly_frequency,
+            "allowed_weekdays": list(self.allowed_weekdays),
+            "payload": self.payload,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class VolunteerRecord:
+    index: int
+    snapshot_id: int
+    label: str
+    max_colis_vol: int | None
+    availability_summary: dict | None
+    payload: dict | None
+    capacity: int
+    unavailable_dates: frozenset
+    has_slots: bool
+    has_availability_info: bool
+    slot_windows: dict
+    slot_bounds: dict
+    availability_minutes: int
+    assignment_order_key: tuple
+
+    @classmethod
+    def from_dict(cls, index: int, data: dict) -> VolunteerRecord:
+        availability = data.get("availability_summary") or {}
+        max_colis_vol = data.get("max_colis_vol")
+        slots = availability.get("slots") or []
+        unavailable_dates = availability.get("unavailable_dates") or []
+        return cls(
+            index=index,
+            snapshot_id=data["snapshot_id"],
+            label=data.get("label") or "",
+            max_colis_vol=max_colis_vol,
+            availability_summary=data.get("availability_summary"),
+            payload=data.get("payload"),
+            capacity=int(
+                LEGACY_EQUIV_CAPACITY_PER_VOLUNTEER if max_colis_vol is None else max_colis_vol
+            ),
+            unavailable_dates=frozenset(unavailable_dates),
+            has_slots=bool(slots),
+            has_availability_info=bool(slots or unavailable_dates),
+            slot_windows=_volunteer_slot_windows(data),
+            slot_bounds=_volunteer_slot_bounds_by_date(data),
+            availability_minutes=_volunteer_availability_minutes(data),
+            assignment_order_key=_volunteer_assignment_order_key(data),
+        )
+
+    def is_available_for(self, flight: FlightRecord) -> bool:
+        """Same rule as ``volunteer_is_compatible_with_flight``, on parsed minutes."""
+        if flight.departure_date in self.unavailable_dates:
+            return False
+        if not self.has_slots:
+            return True
+        for start_minute, end_minute in self.slot_windows.get(flight.departure_date, ()):
+            if flight.departure_minute is None:
+                return True
+            if (
+                start_minute <= flight.mission_start_minute
+                and end_minute >= flight.departure_minute
+            ):
+                return True
+        return False
+
+    def to_dict(self) -> dict:
+        return {
+            "snapshot_id": self.snapshot_id,
+            "label": self.label,
+            "max_colis_vol": self.max_colis_vol,
+            "availability_summary": self.availability_summary,
+            "payload": self.payload,
+        }
+
+
+class PlanningPayload:
+    """Integer-indexed planning payload shared by rules, solver and operator options.
+
+    ``shipment_flight_masks[s]`` has bit ``f`` set when shipment ``s`` may fly on flight ``f``
+    (destination, allowed weekday, carton limit, flight capacity) and
+    ``volunteer_flight_masks[v]`` when volunteer ``v`` is available for it.
+    """
+
+    __slots__ = (
+        "run_id",
+        "shipments",
+        "flights",
+        "volunteers",
+        "destination_rules_by_iata",
+        "shipment_by_id",
+        "flight_by_id",
+        "volunteer_by_id",
+        "flight_index",
+        "volunteer_index",
+        "shipment_units",
+        "volunteer_capacities",
+        "shipment_flight_masks",
+        "volunteer_flight_masks",
+        "volunteers_by_flight",
+        "flights_by_route_order",
+    )
+
+    def __init__(
+        self,
+        *,
+        run_id=None,
+        shipments: tuple[ShipmentRecord, ...] = (),
+        flights: tuple[FlightRecord, ...] = (),
+        volunteers: tuple[VolunteerRecord, ...] = (),
+        destination_rules_by_iata: dict | None = None,
+    ):
+        self.run_id = run_id
+        self.shipments = tuple(shipments)
+        self.flights = tuple(flights)
+        self.volunteers = tuple(volunteers)
+        self.destination_rules_by_iata = destination_rules_by_iata or {}
+        self.shipment_by_id = {record.snapshot_id: record for record in self.shipments}
+        self.flight_by_id = {record.snapshot_id: record for record in self.flights}
+        self.volunteer_by_id = {record.snapshot_id: record for record in self.volunteers}
+        self.flight_index = {record.snapshot_id: record.index for record in self.flights}
+        self.volunteer_index = {record.snapshot_id: record.index for record in self.volunteers}
+        self.shipment_units = array("q", (record.equivalent_units for record in self.shipments))
+        self.volunteer_capacities = array("q", (record.capacity for record in self.volunteers))
+        self.shipment_flight_masks = tuple(
+            self._shipment_flight_mask(shipment) for shipment in self.shipments
+        )
+        self.volunteer_flight_masks = tuple(
+            sum(1 << flight.index for flight in self.flights if volunteer.is_available_for(flight))
+            for volunteer in self.volunteers
+        )
+        self.volunteers_by_flight = tuple(
+            tuple(
+                volunteer
+                for volunteer in self.volunteers
+                if self.volunteer_flight_masks[volunteer.index] >> flight.index & 1
+            )
+            for flight in self.flights
+        )
+        self.flights_by_route_order = tuple(
+            sorted(self.flights, key=lambda flight: (flight.route_pos, str(flight.flight_number)))
+        )
+
+    def _shipment_flight_mask(self, shipment: ShipmentRecord) -> int:
+        mask = 0
+        for flight in self.flights:
+            if (
+                shipment.destination_key
+                and flight.destination_key
+                and shipment.destination_key != flight.destination_key
+            ):
+                continue
+            if not flight.weekday_allowed:
+                continue
+            if (
+                flight.max_cartons_per_flight is not None
+                and shipment.carton_count > flight.max_cartons_per_flight
+            ):
+                continue
+            if (
+                flight.capacity_units is not None
+                and shipment.equivalent_units > flight.capacity_units
+            ):
+                continue
+            mask |= 1 << flight.index
+        return mask
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> PlanningPayload:
+        return cls(
+            run_id=payload.get("run_id"),
+            shipments=tuple(
+                ShipmentRecord.from_dict(index, item)
+                for index, item in enumerate(payload.get("shipments", []))
+            ),
+            flights=tuple(
+                FlightRecord.from_dict(index, item)
+                for index, item in enumerate(payload.get("flights", []))
+            ),
+            volunteers=tuple(
+                VolunteerRecord.from_dict(index, item)
+                for index, item in enumerate(payload.get("volunteers", []))
+            ),
+            destination_rules_by_iata=payload.get("destination_rules_by_iata"),
+        )
+
+    @classmethod
+    def coerce(cls, payload: dict | PlanningPayload) -> PlanningPayload:
+        if isinstance(payload, cls):
+            return payload
+        return cls.from_dict(payload)
+
+    def to_dict(self) -> dict:
+        return {
+            "run_id": self.run_id,
+            "shipments": [record.to_dict() for record in self.shipments],
+            "volunteers": [record.to_dict() for record in self.volunteers],
+            "flights": [record.to_dict() for record in self.flights],
+            "destination_rules_by_iata": self.destination_rules_by_iata,
+        }
+
+    def volunteer_available_for(self, volunteer: VolunteerRecord, flight: FlightRecord) -> bool:
+        return bool(self.volunteer_flight_masks[volunteer.index] >> flight.index & 1)
@@ -8,6 +8,7 @@ from django.db import transaction
 from django.utils.text import slugify
 
 from contacts.models import Contact, ContactType
+from wms.domain.stock import refresh_carton_totals
 from wms.models import (
     AssociationPortalContact,
     AssociationProfile,
@@ -674,6 +675,7 @@ def _create_shipment(
         product_lot=product_lot,
         quantity=spec.quantity,
     )
+    refresh_carton_totals(carton)
     return shipment
 
 
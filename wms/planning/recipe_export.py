@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import json
+import zipfile
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date, datetime, time
 from decimal import Decimal
+from pathlib import Path
 from typing import Any
 
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q, QuerySet
 from django.utils import timezone
 
 from contacts.models import Contact, ContactType
@@ -34,6 +38,9 @@ from wms.models import (
 )
 from wms.planning.sources import ELIGIBLE_SHIPMENT_STATUSES, build_shipper_reference
 
+RECIPE_EXPORT_STREAM_FORMATS = ("jsonl", "zip")
+DEFAULT_RECIPE_EXPORT_CHUNK_SIZE = 2000
+
 
 @dataclass
 class PlanningRecipeExport:
@@ -57,20 +64,80 @@ class PlanningRecipeExport:
 
 
 class _AliasRegistry:
+    """Stable ``PREFIX-NNN`` aliases, stored packed as ``ordinal << 4 | prefix index``.
+
+    Only integers are kept per aliased row; alias strings are rendered on demand.
+    """
+
+    _PREFIX_BITS = 4
+
     def __init__(self) -> None:
-        self._maps: dict[str, dict[int, str]] = {}
+        self._prefixes: list[str] = []
+        self._maps: dict[str, dict[int, int]] = {}
 
     def get(self, *, kind: str, source_pk: int | None, prefix: str) -> str:
         if source_pk is None:
             return ""
         mapping = self._maps.setdefault(kind, {})
-        if source_pk not in mapping:
-            mapping[source_pk] = f"{prefix}-{len(mapping) + 1:03d}"
-        return mapping[source_pk]
+        packed = mapping.get(source_pk)
+        if packed is None:
+            packed = ((len(mapping) + 1) << self._PREFIX_BITS) | self._prefix_index(prefix)
+            mapping[source_pk] = packed
+        return self._render(packed)
+
+    def iter_aliases(self) -> Iterator[tuple[str, int, str]]:
+        for kind, mapping in self._maps.items():
+            for source_pk, packed in mapping.items():
+                yield kind, source_pk, self._render(packed)
 
     @property
     def maps(self) -> dict[str, dict[int, str]]:
-        return {kind: dict(mapping) for kind, mapping in self._maps.items()}
+        return {
+            kind: {source_pk: self._render(packed) for source_pk, packed in mapping.items()}
+            for kind, mapping in self._maps.items()
+        }
+
+    def _prefix_index(self, prefix: str) -> int:
+        if prefix not in self._prefixes:
+            if len(self._prefixes) >= 1 << self._PREFIX_BITS:
+                raise ValueError("Too many alias prefixes.")
+            self._prefixes.append(prefix)
+        return self._prefixes.index(prefix)
+
+    def _render(self, packed: int) -> str:
+        prefix = self._prefixes[packed & ((1 << self._PREFIX_BITS) - 1)]
+        return f"{prefix}-{packed >> self._PREFIX_BITS:03d}"
+
+
+@dataclass
+class _RecipeScope:
+    week_start: date
+    week_end: date
+    parameter_set: PlanningParameterSet | None
+    include_flight_batches: bool
+    anonymize: bool
+    chunk_size: int
+    shipments: QuerySet
+    flights: QuerySet
+    flight_batches: QuerySet
+    volunteers: QuerySet
+    volunteer_constraints: QuerySet
+    volunteer_availabilities: QuerySet
+    volunteer_unavailabilities: QuerySet
+    parameter_rules: QuerySet
+    destinations: QuerySet
+    contacts: QuerySet
+    association_profiles: QuerySet
+    portal_contacts: QuerySet
+    users: QuerySet
+    cartons: QuerySet
+    carton_items: QuerySet
+    product_lots: QuerySet
+    products: QuerySet
+    categories: list[dict[str, Any]]
+    equivalence_rules: QuerySet
+    locations: QuerySet
+    warehouses: QuerySet
 
 
 def build_planning_recipe_export(
@@ -82,281 +149,326 @@ def build_planning_recipe_export(
     include_flight_batches: bool = True,
     anonymize: bool = True,
 ) -> PlanningRecipeExport:
-    parameter_set = _resolve_parameter_set(
+    scope = _build_scope(
+        week_start=week_start,
+        week_end=week_end,
         parameter_set_id=parameter_set_id,
         parameter_set_name=parameter_set_name,
+        include_flight_batches=include_flight_batches,
+        anonymize=anonymize,
+        chunk_size=DEFAULT_RECIPE_EXPORT_CHUNK_SIZE,
     )
-    shipments = list(
-        Shipment.objects.select_related(
-            "destination",
-            "shipper_contact_ref",
-            "recipient_contact_ref",
-            "correspondent_contact_ref",
-            "created_by",
-        )
-        .filter(
-            status__in=ELIGIBLE_SHIPMENT_STATUSES,
-            ready_at__date__gte=week_start,
-            ready_at__date__lte=week_end,
-            archived_at__isnull=True,
-        )
-        .order_by("ready_at", "reference", "id")
-    )
-    flights = list(
-        Flight.objects.select_related("batch", "destination")
-        .filter(
-            departure_date__gte=week_start,
-            departure_date__lte=week_end,
-        )
-        .order_by("departure_date", "flight_number", "id")
-    )
-    volunteers = list(
-        VolunteerProfile.objects.select_related("user", "contact")
-        .filter(is_active=True)
-        .order_by("volunteer_id", "id")
-    )
-    volunteer_ids = [volunteer.pk for volunteer in volunteers]
-    volunteer_constraints = list(
-        VolunteerConstraint.objects.filter(volunteer_id__in=volunteer_ids)
-        .select_related("volunteer")
-        .order_by("volunteer_id")
+    alias_registry = _AliasRegistry()
+    fixtures = {
+        section: list(records)
+        for section, records in _iter_fixture_sections(scope, alias_registry=alias_registry)
+    }
+    selection = {
+        **_selection(scope),
+        "shipment_ids": [item["source_pk"] for item in fixtures["shipments"]],
+        "flight_ids": [item["source_pk"] for item in fixtures["flights"]],
+        "volunteer_ids": [item["source_pk"] for item in fixtures["volunteer_profiles"]],
+    }
+    return PlanningRecipeExport(
+        meta=_meta(scope),
+        selection=selection,
+        summary=_summary({section: len(records) for section, records in fixtures.items()}),
+        fixtures=fixtures,
+        alias_map=alias_registry.maps,
     )
-    volunteer_availabilities = list(
-        VolunteerAvailability.objects.filter(
-            volunteer_id__in=volunteer_ids,
-            date__gte=week_start,
-            date__lte=week_end,
-        ).order_by("volunteer_id", "date", "start_time", "id")
+
+
+def write_planning_recipe_export_stream(
+    output_path: Path,
+    *,
+    week_start: date,
+    week_end: date,
+    output_format: str = "jsonl",
+    parameter_set_id: int | None = None,
+    parameter_set_name: str | None = None,
+    include_flight_batches: bool = True,
+    anonymize: bool = True,
+    chunk_size: int = DEFAULT_RECIPE_EXPORT_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Write the recipe export section by section and return its summary.
+
+    Rows are read through ``values()`` projections and ``iterator()`` chunks and
+    written as soon as they are serialized, so memory stays bounded by the chunk
+    size and the alias registry. ``jsonl`` writes one ``{"section", "data"}`` line
+    per record; ``zip`` writes one ``fixtures/<section>.jsonl`` member per section
+    plus ``alias_map.jsonl`` and a ``manifest.json`` carrying meta and summary.
+    """
+    if output_format not in RECIPE_EXPORT_STREAM_FORMATS:
+        raise ValueError(f"Unsupported recipe export format: {output_format}.")
+    scope = _build_scope(
+        week_start=week_start,
+        week_end=week_end,
+        parameter_set_id=parameter_set_id,
+        parameter_set_name=parameter_set_name,
+        include_flight_batches=include_flight_batches,
+        anonymize=anonymize,
+        chunk_size=chunk_size,
     )
-    volunteer_unavailabilities = list(
-        VolunteerUnavailability.objects.filter(
-            volunteer_id__in=volunteer_ids,
-            date__gte=week_start,
-            date__lte=week_end,
-        ).order_by("volunteer_id", "date", "id")
-    )
-
-    shipment_ids = [shipment.pk for shipment in shipments]
-    cartons = list(
-        Carton.objects.filter(shipment_id__in=shipment_ids)
-        .select_related("shipment", "current_location__warehouse", "prepared_by")
-        .order_by("code", "id")
-    )
-    carton_ids = [carton.pk for carton in cartons]
-    carton_items = list(
-        CartonItem.objects.filter(carton_id__in=carton_ids)
-        .select_related(
-            "carton",
-            "product_lot__product__category",
-            "product_lot__location__warehouse",
+    alias_registry = _AliasRegistry()
+    meta = {**_meta(scope), "format": output_format}
+    selection = _selection(scope)
+    if output_format == "zip":
+        counts = _write_zip_stream(
+            output_path,
+            scope=scope,
+            alias_registry=alias_registry,
+            meta=meta,
+            selection=selection,
         )
-        .order_by("carton_id", "id")
-    )
-    product_lot_ids = sorted({item.product_lot_id for item in carton_items})
-    product_lots = list(
-        ProductLot.objects.filter(id__in=product_lot_ids)
-        .select_related("product__category__parent", "location__warehouse")
-        .order_by("id")
-    )
-    product_ids = sorted({lot.product_id for lot in product_lots})
-    products = list(
-        Product.objects.filter(id__in=product_ids)
-        .select_related("category__parent", "default_location__warehouse")
-        .order_by("id")
-    )
-    categories = _collect_categories(products)
-    category_ids = [category.pk for category in categories]
-    locations = _collect_locations(cartons, product_lots, products)
-    warehouses = _collect_warehouses(locations)
-    equivalence_rules = list(
-        ShipmentUnitEquivalenceRule.objects.filter(
-            is_active=True,
+    else:
+        counts = _write_jsonl_stream(
+            output_path,
+            scope=scope,
+            alias_registry=alias_registry,
+            meta=meta,
+            selection=selection,
         )
-        .filter(Q(category_id__in=category_ids) | Q(category__isnull=True))
-        .select_related("category")
-        .order_by("priority", "id")
-    )
+    return _summary(counts)
 
-    parameter_rules = []
-    if parameter_set is not None:
-        parameter_rules = list(
-            PlanningDestinationRule.objects.filter(parameter_set=parameter_set)
-            .select_related("destination")
-            .order_by("priority", "id")
+
+def _write_jsonl_stream(
+    output_path: Path,
+    *,
+    scope: _RecipeScope,
+    alias_registry: _AliasRegistry,
+    meta: dict[str, Any],
+    selection: dict[str, Any],
+) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    with output_path.open("w", encoding="utf-8") as handle:
+        handle.write(_json_line({"section": "meta", "data": meta}))
+        handle.write(_json_line({"section": "selection", "data": selection}))
+        for section, records in _iter_fixture_sections(scope, alias_registry=alias_registry):
+            counts[section] = 0
+            for record in records:
+                handle.write(_json_line({"section": section, "data": record}))
+                counts[section] += 1
+        for alias_record in _iter_alias_records(alias_registry):
+            handle.write(_json_line({"section": "alias_map", "data": alias_record}))
+        handle.write(_json_line({"section": "summary", "data": _summary(counts)}))
+    return counts
+
+
+def _write_zip_stream(
+    output_path: Path,
+    *,
+    scope: _RecipeScope,
+    alias_registry: _AliasRegistry,
+    meta: dict[str, Any],
+    selection: dict[str, Any],
+) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for section, records in _iter_fixture_sections(scope, alias_registry=alias_registry):
+            counts[section] = 0
+            with archive.open(f"fixtures/{section}.jsonl", "w", force_zip64=True) as member:
+                for record in records:
+                    member.write(_json_line(record).encode("utf-8"))
+                    counts[section] += 1
+        with archive.open("alias_map.jsonl", "w", force_zip64=True) as member:
+            for alias_record in _iter_alias_records(alias_registry):
+                member.write(_json_line(alias_record).encode("utf-8"))
+        manifest = {
+            "meta": meta,
+            "selection": selection,
+            "summary": _summary(counts),
+            "sections": list(counts),
+        }
+        archive.writestr(
+            "manifest.json", json.dumps(_json_safe(manifest), indent=2, sort_keys=True)
         )
+    return counts
 
-    flight_batches = []
-    if include_flight_batches:
-        batch_ids = sorted({flight.batch_id for flight in flights if flight.batch_id})
-        flight_batches = list(FlightSourceBatch.objects.filter(id__in=batch_ids).order_by("id"))
 
-    destinations = _collect_destinations(shipments, flights, parameter_rules)
-    destination_ids = [destination.pk for destination in destinations]
-    shipper_contact_ids = {
-        shipment.shipper_contact_ref_id for shipment in shipments if shipment.shipper_contact_ref_id
-    }
-    correspondent_contact_ids = {
-        destination.correspondent_contact_id
-        for destination in destinations
-        if destination.correspondent_contact_id
-    }
-    contact_ids = set()
-    for shipment in shipments:
-        for contact_id in (
-            shipment.shipper_contact_ref_id,
-            shipment.recipient_contact_ref_id,
-            shipment.correspondent_contact_ref_id,
-        ):
-            if contact_id:
-                contact_ids.add(contact_id)
-    for volunteer in volunteers:
-        if volunteer.contact_id:
-            contact_ids.add(volunteer.contact_id)
-    contact_ids.update(correspondent_contact_ids)
-    contacts = list(Contact.objects.filter(id__in=sorted(contact_ids)).order_by("name", "id"))
-    association_profiles = list(
-        AssociationProfile.objects.filter(contact_id__in=sorted(contact_ids))
-        .select_related("user", "contact")
-        .order_by("id")
-    )
-    association_profile_ids = [profile.pk for profile in association_profiles]
-    portal_contacts = list(
-        AssociationPortalContact.objects.filter(profile_id__in=association_profile_ids)
-        .select_related("profile")
-        .order_by("profile_id", "position", "id")
-    )
-
-    user_ids = set()
-    for volunteer in volunteers:
-        if volunteer.user_id:
-            user_ids.add(volunteer.user_id)
-    for profile in association_profiles:
-        if profile.user_id:
-            user_ids.add(profile.user_id)
-    for shipment in shipments:
-        if shipment.created_by_id:
-            user_ids.add(shipment.created_by_id)
-    if parameter_set and parameter_set.created_by_id:
-        user_ids.add(parameter_set.created_by_id)
-    user_model = get_user_model()
-    users = list(user_model.objects.filter(id__in=sorted(user_ids)).order_by("id"))
+def _json_line(value: dict[str, Any]) -> str:
+    return json.dumps(_json_safe(value), sort_keys=True) + "\n"
 
-    alias_registry = _AliasRegistry()
-    fixtures = {
-        "users": [
-            _serialize_user(user, anonymize=anonymize, alias_registry=alias_registry)
-            for user in users
-        ],
-        "contacts": [
-            _serialize_contact(
-                contact,
-                anonymize=anonymize,
-                alias_registry=alias_registry,
-                shipper_contact_ids=shipper_contact_ids,
-                correspondent_contact_ids=correspondent_contact_ids,
-            )
-            for contact in contacts
-        ],
-        "destinations": [_serialize_destination(destination) for destination in destinations],
-        "planning_parameter_sets": [
-            _serialize_parameter_set(parameter_set)
-            for parameter_set in [parameter_set]
-            if parameter_set is not None
-        ],
-        "planning_destination_rules": [
-            _serialize_destination_rule(rule)
-            for rule in parameter_rules
-            if rule.destination_id in destination_ids
-        ],
-        "shipment_unit_equivalence_rules": [
-            _serialize_equivalence_rule(rule) for rule in equivalence_rules
-        ],
-        "flight_source_batches": [_serialize_flight_batch(batch) for batch in flight_batches],
-        "flights": [_serialize_flight(flight) for flight in flights],
-        "association_profiles": [
-            _serialize_association_profile(
-                profile,
-                anonymize=anonymize,
-                alias_registry=alias_registry,
-            )
-            for profile in association_profiles
-        ],
-        "association_portal_contacts": [
-            _serialize_portal_contact(
-                portal_contact,
-                anonymize=anonymize,
-                alias_registry=alias_registry,
-            )
-            for portal_contact in portal_contacts
-        ],
-        "volunteer_profiles": [
-            _serialize_volunteer(
-                volunteer,
-                anonymize=anonymize,
-                alias_registry=alias_registry,
-            )
-            for volunteer in volunteers
-        ],
-        "volunteer_constraints": [
-            _serialize_volunteer_constraint(constraint) for constraint in volunteer_constraints
-        ],
-        "volunteer_availabilities": [
-            _serialize_volunteer_availability(availability)
-            for availability in volunteer_availabilities
-        ],
-        "volunteer_unavailabilities": [
-            _serialize_volunteer_unavailability(unavailability)
-            for unavailability in volunteer_unavailabilities
-        ],
-        "product_categories": [_serialize_category(category) for category in categories],
-        "warehouses": [_serialize_warehouse(warehouse) for warehouse in warehouses],
-        "locations": [_serialize_location(location) for location in locations],
-        "products": [_serialize_product(product) for product in products],
-        "product_lots": [_serialize_product_lot(product_lot) for product_lot in product_lots],
-        "shipments": [
-            _serialize_shipment(
-                shipment,
-                anonymize=anonymize,
-                alias_registry=alias_registry,
-            )
-            for shipment in shipments
-        ],
-        "cartons": [_serialize_carton(carton) for carton in cartons],
-        "carton_items": [_serialize_carton_item(carton_item) for carton_item in carton_items],
+
+def _iter_alias_records(alias_registry: _AliasRegistry) -> Iterator[dict[str, Any]]:
+    for kind, source_pk, alias in alias_registry.iter_aliases():
+        yield {"kind": kind, "source_pk": source_pk, "alias": alias}
+
+
+def _meta(scope: _RecipeScope) -> dict[str, Any]:
+    return {
+        "generated_at": timezone.now(),
+        "generator": "planning_recipe_export",
+        "schema_version": 1,
+        "anonymized": scope.anonymize,
     }
 
-    selection = {
-        "week_start": week_start.isoformat(),
-        "week_end": week_end.isoformat(),
+
+def _selection(scope: _RecipeScope) -> dict[str, Any]:
+    parameter_set = scope.parameter_set
+    return {
+        "week_start": scope.week_start.isoformat(),
+        "week_end": scope.week_end.isoformat(),
         "parameter_set_id": parameter_set.pk if parameter_set is not None else None,
         "parameter_set_name": parameter_set.name if parameter_set is not None else "",
-        "anonymized": anonymize,
-        "shipment_ids": shipment_ids,
-        "flight_ids": [flight.pk for flight in flights],
-        "volunteer_ids": volunteer_ids,
-    }
-    summary = {
-        "shipments": len(shipments),
-        "flights": len(flights),
-        "flight_batches": len(flight_batches),
-        "volunteers": len(volunteers),
-        "destinations": len(destinations),
-        "contacts": len(contacts),
-        "association_profiles": len(association_profiles),
-        "portal_contacts": len(portal_contacts),
+        "anonymized": scope.anonymize,
     }
-    meta = {
-        "generated_at": timezone.now(),
-        "generator": "planning_recipe_export",
-        "schema_version": 1,
-        "anonymized": anonymize,
+
+
+def _summary(counts: dict[str, int]) -> dict[str, int]:
+    return {
+        "shipments": counts.get("shipments", 0),
+        "flights": counts.get("flights", 0),
+        "flight_batches": counts.get("flight_source_batches", 0),
+        "volunteers": counts.get("volunteer_profiles", 0),
+        "destinations": counts.get("destinations", 0),
+        "contacts": counts.get("contacts", 0),
+        "association_profiles": counts.get("association_profiles", 0),
+        "portal_contacts": counts.get("association_portal_contacts", 0),
     }
-    return PlanningRecipeExport(
-        meta=meta,
-        selection=selection,
-        summary=summary,
-        fixtures=fixtures,
-        alias_map=alias_registry.maps,
+
+
+def _build_scope(
+    *,
+    week_start: date,
+    week_end: date,
+    parameter_set_id: int | None,
+    parameter_set_name: str | None,
+    include_flight_batches: bool,
+    anonymize: bool,
+    chunk_size: int,
+) -> _RecipeScope:
+    parameter_set = _resolve_parameter_set(
+        parameter_set_id=parameter_set_id,
+        parameter_set_name=parameter_set_name,
+    )
+    shipments = Shipment.objects.filter(
+        status__in=ELIGIBLE_SHIPMENT_STATUSES,
+        ready_at__date__gte=week_start,
+        ready_at__date__lte=week_end,
+        archived_at__isnull=True,
+    ).order_by("ready_at", "reference", "id")
+    flights = Flight.objects.filter(
+        departure_date__gte=week_start,
+        departure_date__lte=week_end,
+    ).order_by("departure_date", "flight_number", "id")
+    volunteers = VolunteerProfile.objects.filter(is_active=True).order_by("volunteer_id", "id")
+    volunteer_ids = volunteers.values("id")
+
+    if parameter_set is not None:
+        parameter_rules = PlanningDestinationRule.objects.filter(
+            parameter_set=parameter_set
+        ).order_by("priority", "id")
+    else:
+        parameter_rules = PlanningDestinationRule.objects.none()
+    if include_flight_batches:
+        flight_batches = FlightSourceBatch.objects.filter(
+            id__in=flights.values("batch_id")
+        ).order_by("id")
+    else:
+        flight_batches = FlightSourceBatch.objects.none()
+
+    destination_filter = Q(id__in=shipments.values("destination_id")) | Q(
+        id__in=flights.values("destination_id")
+    )
+    if parameter_set is not None:
+        destination_filter |= Q(id__in=parameter_rules.values("destination_id"))
+    destinations = Destination.objects.filter(destination_filter).order_by("city", "id")
+
+    contact_filter = (
+        Q(id__in=shipments.values("shipper_contact_ref_id"))
+        | Q(id__in=shipments.values("recipient_contact_ref_id"))
+        | Q(id__in=shipments.values("correspondent_contact_ref_id"))
+        | Q(id__in=volunteers.values("contact_id"))
+        | Q(id__in=destinations.values("correspondent_contact_id"))
+    )
+    contacts = (
+        Contact.objects.filter(contact_filter)
+        .annotate(
+            is_shipper=Exists(shipments.filter(shipper_contact_ref_id=OuterRef("pk"))),
+            is_correspondent=Exists(destinations.filter(correspondent_contact_id=OuterRef("pk"))),
+        )
+        .order_by("name", "id")
+    )
+    association_profiles = AssociationProfile.objects.filter(
+        contact_id__in=Contact.objects.filter(contact_filter).values("id")
+    ).order_by("id")
+    portal_contacts = AssociationPortalContact.objects.filter(
+        profile_id__in=association_profiles.values("id")
+    ).order_by("profile_id", "position", "id")
+
+    user_filter = (
+        Q(id__in=volunteers.values("user_id"))
+        | Q(id__in=association_profiles.values("user_id"))
+        | Q(id__in=shipments.values("created_by_id"))
+    )
+    if parameter_set is not None and parameter_set.created_by_id:
+        user_filter |= Q(id=parameter_set.created_by_id)
+    users = get_user_model().objects.filter(user_filter).order_by("id")
+
+    cartons = Carton.objects.filter(shipment_id__in=shipments.values("id")).order_by("code", "id")
+    carton_items = CartonItem.objects.filter(carton_id__in=cartons.values("id")).order_by(
+        "carton_id", "id"
+    )
+    product_lots = ProductLot.objects.filter(id__in=carton_items.values("product_lot_id")).order_by(
+        "id"
+    )
+    products = Product.objects.filter(id__in=product_lots.values("product_id")).order_by("id")
+    categories = _collect_category_rows(products)
+    equivalence_rules = (
+        ShipmentUnitEquivalenceRule.objects.filter(is_active=True)
+        .filter(
+            Q(category_id__in=[category["id"] for category in categories])
+            | Q(category__isnull=True)
+        )
+        .order_by("priority", "id")
+    )
+    locations = Location.objects.filter(
+        Q(id__in=cartons.values("current_location_id"))
+        | Q(id__in=product_lots.values("location_id"))
+        | Q(id__in=products.values("default_location_id"))
+    ).order_by("warehouse__name", "zone", "aisle", "shelf", "id")
+    warehouses = Warehouse.objects.filter(id__in=locations.values("warehouse_id")).order_by(
+        "name", "id"
+    )
+
+    return _RecipeScope(
+        week_start=week_start,
+        week_end=week_end,
+        parameter_set=parameter_set,
+        include_flight_batches=include_flight_batches,
+        anonymize=anonymize,
+        chunk_size=chunk_size,
+        shipments=shipments,
+        flights=flights,
+        flight_batches=flight_batches,
+        volunteers=volunteers,
+        volunteer_constraints=VolunteerConstraint.objects.filter(
+            volunteer_id__in=volunteer_ids
+        ).order_by("volunteer_id"),
+        volunteer_availabilities=VolunteerAvailability.objects.filter(
+            volunteer_id__in=volunteer_ids,
+            date__gte=week_start,
+            date__lte=week_end,
+        ).order_by("volunteer_id", "date", "start_time", "id"),
+        volunteer_unavailabilities=VolunteerUnavailability.objects.filter(
+            volunteer_id__in=volunteer_ids,
+            date__gte=week_start,
+            date__lte=week_end,
+        ).order_by("volunteer_id", "date", "id"),
+        parameter_rules=parameter_rules,
+        destinations=destinations,
+        contacts=contacts,
+        association_profiles=association_profiles,
+        portal_contacts=portal_contacts,
+        users=users,
+        cartons=cartons,
+        carton_items=carton_items,
+        product_lots=product_lots,
+        products=products,
+        categories=categories,
+        equivalence_rules=equivalence_rules,
+        locations=locations,
+        warehouses=warehouses,
     )
 
 
@@ -375,134 +487,384 @@ def _resolve_parameter_set(
     return PlanningParameterSet.objects.order_by("-is_current", "name", "id").first()
 
 
-def _collect_categories(products: list[Product]) -> list[ProductCategory]:
-    category_map: dict[int, ProductCategory] = {}
-    pending_ids = {product.category_id for product in products if product.category_id}
-    while pending_ids:
-        batch = list(
-            ProductCategory.objects.filter(id__in=sorted(pending_ids))
-            .select_related("parent")
-            .order_by("id")
-        )
-        pending_ids = set()
-        for category in batch:
-            if category.pk in category_map:
+def _collect_category_rows(products: QuerySet) -> list[dict[str, Any]]:
+    category_rows: dict[int, dict[str, Any]] = {}
+    pending = ProductCategory.objects.filter(id__in=products.values("category_id"))
+    while True:
+        parent_ids = set()
+        for row in pending.order_by("id").values("id", "name", "parent_id"):
+            if row["id"] in category_rows:
                 continue
-            category_map[category.pk] = category
-            if category.parent_id and category.parent_id not in category_map:
-                pending_ids.add(category.parent_id)
-    return list(category_map.values())
+            category_rows[row["id"]] = row
+            if row["parent_id"] and row["parent_id"] not in category_rows:
+                parent_ids.add(row["parent_id"])
+        if not parent_ids:
+            return list(category_rows.values())
+        pending = ProductCategory.objects.filter(id__in=sorted(parent_ids))
 
 
-def _collect_locations(
-    cartons: list[Carton],
-    product_lots: list[ProductLot],
-    products: list[Product],
-) -> list[Location]:
-    location_ids = {carton.current_location_id for carton in cartons if carton.current_location_id}
-    location_ids.update(
-        product_lot.location_id for product_lot in product_lots if product_lot.location_id
+def _iter_rows(queryset: QuerySet, *fields: str, chunk_size: int) -> Iterator[dict[str, Any]]:
+    for row in queryset.values("id", *fields).iterator(chunk_size=chunk_size):
+        row["source_pk"] = row.pop("id")
+        yield row
+
+
+def _iter_fixture_sections(
+    scope: _RecipeScope,
+    *,
+    alias_registry: _AliasRegistry,
+) -> Iterator[tuple[str, Iterator[dict[str, Any]]]]:
+    """Yield ``(section, records)`` pairs in fixture order.
+
+    Records are lazy and aliases are handed out while they are consumed, so each
+    section must be exhausted before the next one is requested.
+    """
+    anonymize = scope.anonymize
+    chunk_size = scope.chunk_size
+    yield (
+        "users",
+        (
+            _serialize_user(row, anonymize=anonymize, alias_registry=alias_registry)
+            for row in _iter_rows(
+                scope.users,
+                "username",
+                "email",
+                "first_name",
+                "last_name",
+                "is_active",
+                "is_staff",
+                chunk_size=chunk_size,
+            )
+        ),
     )
-    location_ids.update(
-        product.default_location_id for product in products if product.default_location_id
+    yield (
+        "contacts",
+        (
+            _serialize_contact(row, anonymize=anonymize, alias_registry=alias_registry)
+            for row in _iter_rows(
+                scope.contacts,
+                "contact_type",
+                "name",
+                "first_name",
+                "last_name",
+                "email",
+                "email2",
+                "phone",
+                "phone2",
+                "is_active",
+                "organization_id",
+                "is_shipper",
+                "is_correspondent",
+                chunk_size=chunk_size,
+            )
+        ),
     )
-    return list(
-        Location.objects.filter(id__in=sorted(location_ids))
-        .select_related("warehouse")
-        .order_by("warehouse__name", "zone", "aisle", "shelf", "id")
+    yield (
+        "destinations",
+        _iter_rows(
+            scope.destinations,
+            "city",
+            "iata_code",
+            "country",
+            "correspondent_contact_id",
+            "is_active",
+            chunk_size=chunk_size,
+        ),
     )
-
-
-def _collect_warehouses(locations: list[Location]) -> list[Warehouse]:
-    warehouse_ids = sorted(
-        {location.warehouse_id for location in locations if location.warehouse_id}
+    yield (
+        "planning_parameter_sets",
+        (
+            [_serialize_parameter_set(scope.parameter_set)]
+            if scope.parameter_set is not None
+            else []
+        ),
+    )
+    yield (
+        "planning_destination_rules",
+        (
+            _serialize_destination_rule(row)
+            for row in _iter_rows(
+                scope.parameter_rules.filter(destination__isnull=False),
+                "parameter_set_id",
+                "destination_id",
+                "label",
+                "weekly_frequency",
+                "max_cartons_per_flight",
+                "allowed_weekdays",
+                "priority",
+                "notes",
+                "is_active",
+                chunk_size=chunk_size,
+            )
+        ),
+    )
+    yield (
+        "shipment_unit_equivalence_rules",
+        _iter_rows(
+            scope.equivalence_rules,
+            "label",
+            "category_id",
+            "applies_to_hors_format",
+            "units_per_item",
+            "priority",
+            "is_active",
+            "notes",
+            chunk_size=chunk_size,
+        ),
+    )
+    yield (
+        "flight_source_batches",
+        _iter_rows(
+            scope.flight_batches,
+            "source",
+            "period_start",
+            "period_end",
+            "file_name",
+            "checksum",
+            "status",
+            "imported_at",
+            "notes",
+            chunk_size=chunk_size,
+        ),
+    )
+    yield (
+        "flights",
+        _iter_rows(
+            scope.flights,
+            "batch_id",
+            "flight_number",
+            "departure_date",
+            "departure_time",
+            "arrival_time",
+            "origin_iata",
+            "destination_iata",
+            "routing",
+            "route_pos",
+            "destination_id",
+            "capacity_units",
+            "quality_notes",
+            chunk_size=chunk_size,
+        ),
+    )
+    yield (
+        "association_profiles",
+        (
+            _serialize_association_profile(
+                profile,
+                anonymize=anonymize,
+                alias_registry=alias_registry,
+            )
+            for profile in scope.association_profiles.select_related("user", "contact").iterator(
+                chunk_size=chunk_size
+            )
+        ),
+    )
+    yield (
+        "association_portal_contacts",
+        (
+            _serialize_portal_contact(row, anonymize=anonymize, alias_registry=alias_registry)
+            for row in _iter_rows(
+                scope.portal_contacts,
+                "profile_id",
+                "position",
+                "title",
+                "first_name",
+                "last_name",
+                "email",
+                "phone",
+                "is_administrative",
+                "is_shipping",
+                "is_billing",
+                "is_active",
+                chunk_size=chunk_size,
+            )
+        ),
+    )
+    yield (
+        "volunteer_profiles",
+        (
+            _serialize_volunteer(row, anonymize=anonymize, alias_registry=alias_registry)
+            for row in _iter_rows(
+                scope.volunteers,
+                "user_id",
+                "contact_id",
+                "volunteer_id",
+                "short_name",
+                "phone",
+                "city",
+                "country",
+                "is_active",
+                "user__first_name",
+                "user__last_name",
+                "user__email",
+                chunk_size=chunk_size,
+            )
+        ),
+    )
+    yield (
+        "volunteer_constraints",
+        _iter_rows(
+            scope.volunteer_constraints,
+            "volunteer_id",
+            "max_days_per_week",
+            "max_expeditions_per_week",
+            "max_expeditions_per_day",
+            "max_colis_vol",
+            "max_wait_hours",
+            chunk_size=chunk_size,
+        ),
+    )
+    yield (
+        "volunteer_availabilities",
+        _iter_rows(
+            scope.volunteer_availabilities,
+            "volunteer_id",
+            "date",
+            "start_time",
+            "end_time",
+            chunk_size=chunk_size,
+        ),
+    )
+    yield (
+        "volunteer_unavailabilities",
+        _iter_rows(
+            scope.volunteer_unavailabilities,
+            "volunteer_id",
+            "date",
+            chunk_size=chunk_size,
+        ),
+    )
+    yield (
+        "product_categories",
+        (
+            {"source_pk": row["id"], "name": row["name"], "parent_id": row["parent_id"]}
+            for row in scope.categories
+        ),
+    )
+    yield "warehouses", _iter_rows(scope.warehouses, "name", "code", chunk_size=chunk_size)
+    yield (
+        "locations",
+        _iter_rows(
+            scope.locations,
+            "warehouse_id",
+            "zone",
+            "aisle",
+            "shelf",
+            "notes",
+            chunk_size=chunk_size,
+        ),
+    )
+    yield (
+        "products",
+        _iter_rows(
+            scope.products,
+            "sku",
+            "name",
+            "category_id",
+            "default_location_id",
+            "is_active",
+            chunk_size=chunk_size,
+        ),
+    )
+    yield (
+        "product_lots",
+        _iter_rows(
+            scope.product_lots,
+            "product_id",
+            "lot_code",
+            "expires_on",
+            "received_on",
+            "status",
+            "quantity_on_hand",
+            "quantity_reserved",
+            "location_id",
+            chunk_size=chunk_size,
+        ),
+    )
+    yield (
+        "shipments",
+        (
+            _serialize_shipment(
+                shipment,
+                anonymize=anonymize,
+                alias_registry=alias_registry,
+            )
+            for shipment in scope.shipments.select_related(
+                "destination",
+                "shipper_contact_ref",
+                "recipient_contact_ref",
+                "correspondent_contact_ref",
+            ).iterator(chunk_size=chunk_size)
+        ),
+    )
+    yield (
+        "cartons",
+        _iter_rows(
+            scope.cartons,
+            "code",
+            "status",
+            "shipment_id",
+            "current_location_id",
+            "prepared_by_id",
+            chunk_size=chunk_size,
+        ),
+    )
+    yield (
+        "carton_items",
+        _iter_rows(
+            scope.carton_items,
+            "carton_id",
+            "product_lot_id",
+            "quantity",
+            chunk_size=chunk_size,
+        ),
     )
-    return list(Warehouse.objects.filter(id__in=warehouse_ids).order_by("name", "id"))
-
-
-def _collect_destinations(
-    shipments: list[Shipment],
-    flights: list[Flight],
-    parameter_rules: list[PlanningDestinationRule],
-) -> list[Destination]:
-    destination_ids = {shipment.destination_id for shipment in shipments if shipment.destination_id}
-    destination_ids.update(flight.destination_id for flight in flights if flight.destination_id)
-    destination_ids.update(rule.destination_id for rule in parameter_rules if rule.destination_id)
-    return list(Destination.objects.filter(id__in=sorted(destination_ids)).order_by("city", "id"))
 
 
-def _serialize_user(user, *, anonymize: bool, alias_registry: _AliasRegistry) -> dict[str, Any]:
-    alias = alias_registry.get(kind="user", source_pk=user.pk, prefix="USER")
-    username = user.username
-    email = user.email
-    first_name = user.first_name
-    last_name = user.last_name
+def _serialize_user(
+    row: dict[str, Any],
+    *,
+    anonymize: bool,
+    alias_registry: _AliasRegistry,
+) -> dict[str, Any]:
+    alias = alias_registry.get(kind="user", source_pk=row["source_pk"], prefix="USER")
     if anonymize:
-        username = alias.lower()
-        email = _alias_email(alias)
-        first_name = alias
-        last_name = ""
-    return {
-        "source_pk": user.pk,
-        "username": username,
-        "email": email,
-        "first_name": first_name,
-        "last_name": last_name,
-        "is_active": user.is_active,
-        "is_staff": user.is_staff,
-    }
+        row.update(
+            username=alias.lower(),
+            email=_alias_email(alias),
+            first_name=alias,
+            last_name="",
+        )
+    return row
 
 
 def _serialize_contact(
-    contact: Contact,
+    row: dict[str, Any],
     *,
     anonymize: bool,
     alias_registry: _AliasRegistry,
-    shipper_contact_ids: set[int],
-    correspondent_contact_ids: set[int],
 ) -> dict[str, Any]:
     alias = alias_registry.get(
         kind="contact",
-        source_pk=contact.pk,
+        source_pk=row["source_pk"],
         prefix=_contact_prefix(
-            contact=contact,
-            shipper_contact_ids=shipper_contact_ids,
-            correspondent_contact_ids=correspondent_contact_ids,
+            contact_type=row["contact_type"],
+            is_shipper=row.pop("is_shipper"),
+            is_correspondent=row.pop("is_correspondent"),
         ),
     )
-    name = alias if anonymize else contact.name
-    first_name = (
-        alias if anonymize and contact.contact_type == ContactType.PERSON else contact.first_name
-    )
-    last_name = (
-        "" if anonymize and contact.contact_type == ContactType.PERSON else contact.last_name
-    )
-    email = _alias_email(alias) if anonymize and alias else contact.email
-    email2 = _alias_email(f"{alias}-ALT") if anonymize and contact.email2 else contact.email2
-    return {
-        "source_pk": contact.pk,
-        "contact_type": contact.contact_type,
-        "name": name,
-        "first_name": first_name,
-        "last_name": last_name,
-        "email": email,
-        "email2": email2,
-        "phone": contact.phone,
-        "phone2": contact.phone2,
-        "is_active": contact.is_active,
-        "organization_id": contact.organization_id,
-    }
-
-
-def _serialize_destination(destination: Destination) -> dict[str, Any]:
-    return {
-        "source_pk": destination.pk,
-        "city": destination.city,
-        "iata_code": destination.iata_code,
-        "country": destination.country,
-        "correspondent_contact_id": destination.correspondent_contact_id,
-        "is_active": destination.is_active,
-    }
+    if not anonymize:
+        return row
+    is_person = row["contact_type"] == ContactType.PERSON
+    row["name"] = alias
+    if is_person:
+        row["first_name"] = alias
+        row["last_name"] = ""
+    if alias:
+        row["email"] = _alias_email(alias)
+    if row["email2"]:
+        row["email2"] = _alias_email(f"{alias}-ALT")
+    return row
 
 
 def _serialize_parameter_set(parameter_set: PlanningParameterSet) -> dict[str, Any]:
@@ -517,64 +879,9 @@ def _serialize_parameter_set(parameter_set: PlanningParameterSet) -> dict[str, A
     }
 
 
-def _serialize_destination_rule(rule: PlanningDestinationRule) -> dict[str, Any]:
-    return {
-        "source_pk": rule.pk,
-        "parameter_set_id": rule.parameter_set_id,
-        "destination_id": rule.destination_id,
-        "label": rule.label,
-        "weekly_frequency": rule.weekly_frequency,
-        "max_cartons_per_flight": rule.max_cartons_per_flight,
-        "allowed_weekdays": list(rule.allowed_weekdays or []),
-        "priority": rule.priority,
-        "notes": rule.notes,
-        "is_active": rule.is_active,
-    }
-
-
-def _serialize_equivalence_rule(rule: ShipmentUnitEquivalenceRule) -> dict[str, Any]:
-    return {
-        "source_pk": rule.pk,
-        "label": rule.label,
-        "category_id": rule.category_id,
-        "applies_to_hors_format": rule.applies_to_hors_format,
-        "units_per_item": rule.units_per_item,
-        "priority": rule.priority,
-        "is_active": rule.is_active,
-        "notes": rule.notes,
-    }
-
-
-def _serialize_flight_batch(batch: FlightSourceBatch) -> dict[str, Any]:
-    return {
-        "source_pk": batch.pk,
-        "source": batch.source,
-        "period_start": batch.period_start,
-        "period_end": batch.period_end,
-        "file_name": batch.file_name,
-        "checksum": batch.checksum,
-        "status": batch.status,
-        "imported_at": batch.imported_at,
-        "notes": batch.notes,
-    }
-
-
-def _serialize_flight(flight: Flight) -> dict[str, Any]:
-    return {
-        "source_pk": flight.pk,
-        "batch_id": flight.batch_id,
-        "flight_number": flight.flight_number,
-        "departure_date": flight.departure_date,
-        "departure_time": flight.departure_time,
-        "arrival_time": flight.arrival_time,
-        "origin_iata": flight.origin_iata,
-        "destination_iata": flight.destination_iata,
-        "routing": flight.routing,
-        "route_pos": flight.route_pos,
-        "destination_id": flight.destination_id,
-        "capacity_units": flight.capacity_units,
-        "quality_notes": flight.quality_notes,
-    }
+def _serialize_destination_rule(row: dict[str, Any]) -> dict[str, Any]:
+    row["allowed_weekdays"] = list(row["allowed_weekdays"] or [])
+    return row
 
 
 def _serialize_association_profile(
@@ -607,134 +914,31 @@ def _serialize_association_profile(
 
 
 def _serialize_portal_contact(
-    portal_contact: AssociationPortalContact,
+    row: dict[str, Any],
     *,
     anonymize: bool,
     alias_registry: _AliasRegistry,
 ) -> dict[str, Any]:
-    alias = alias_registry.get(kind="portal_contact", source_pk=portal_contact.pk, prefix="PORTAL")
-    return {
-        "source_pk": portal_contact.pk,
-        "profile_id": portal_contact.profile_id,
-        "position": portal_contact.position,
-        "title": portal_contact.title,
-        "first_name": alias if anonymize else portal_contact.first_name,
-        "last_name": "" if anonymize else portal_contact.last_name,
-        "email": _alias_email(alias) if anonymize else portal_contact.email,
-        "phone": portal_contact.phone,
-        "is_administrative": portal_contact.is_administrative,
-        "is_shipping": portal_contact.is_shipping,
-        "is_billing": portal_contact.is_billing,
-        "is_active": portal_contact.is_active,
-    }
+    alias = alias_registry.get(kind="portal_contact", source_pk=row["source_pk"], prefix="PORTAL")
+    if anonymize:
+        row.update(first_name=alias, last_name="", email=_alias_email(alias))
+    return row
 
 
 def _serialize_volunteer(
-    volunteer: VolunteerProfile,
+    row: dict[str, Any],
     *,
     anonymize: bool,
     alias_registry: _AliasRegistry,
 ) -> dict[str, Any]:
-    alias = alias_registry.get(kind="volunteer", source_pk=volunteer.pk, prefix="VOL")
-    display_name = (
-        alias if anonymize else volunteer.user.get_full_name().strip() or volunteer.user.email
-    )
-    email = _alias_email(alias) if anonymize else volunteer.user.email
-    return {
-        "source_pk": volunteer.pk,
-        "user_id": volunteer.user_id,
-        "contact_id": volunteer.contact_id,
-        "volunteer_id": volunteer.volunteer_id,
-        "display_name": display_name,
-        "email": email,
-        "short_name": alias if anonymize else volunteer.short_name,
-        "phone": volunteer.phone,
-        "city": volunteer.city,
-        "country": volunteer.country,
-        "is_active": volunteer.is_active,
-    }
-
-
-def _serialize_volunteer_constraint(constraint: VolunteerConstraint) -> dict[str, Any]:
-    return {
-        "source_pk": constraint.pk,
-        "volunteer_id": constraint.volunteer_id,
-        "max_days_per_week": constraint.max_days_per_week,
-        "max_expeditions_per_week": constraint.max_expeditions_per_week,
-        "max_expeditions_per_day": constraint.max_expeditions_per_day,
-        "max_colis_vol": constraint.max_colis_vol,
-        "max_wait_hours": constraint.max_wait_hours,
-    }
-
-
-def _serialize_volunteer_availability(availability: VolunteerAvailability) -> dict[str, Any]:
-    return {
-        "source_pk": availability.pk,
-        "volunteer_id": availability.volunteer_id,
-        "date": availability.date,
-        "start_time": availability.start_time,
-        "end_time": availability.end_time,
-    }
-
-
-def _serialize_volunteer_unavailability(unavailability: VolunteerUnavailability) -> dict[str, Any]:
-    return {
-        "source_pk": unavailability.pk,
-        "volunteer_id": unavailability.volunteer_id,
-        "date": unavailability.date,
-    }
-
-
-def _serialize_category(category: ProductCategory) -> dict[str, Any]:
-    return {
-        "source_pk": category.pk,
-        "name": category.name,
-        "parent_id": category.parent_id,
-    }
-
-
-def _serialize_warehouse(warehouse: Warehouse) -> dict[str, Any]:
-    return {
-        "source_pk": warehouse.pk,
-        "name": warehouse.name,
-        "code": warehouse.code,
-    }
-
-
-def _serialize_location(location: Location) -> dict[str, Any]:
-    return {
-        "source_pk": location.pk,
-        "warehouse_id": location.warehouse_id,
-        "zone": location.zone,
-        "aisle": location.aisle,
-        "shelf": location.shelf,
-        "notes": location.notes,
-    }
-
-
-def _serialize_product(product: Product) -> dict[str, Any]:
-    return {
-        "source_pk": product.pk,
-        "sku": product.sku,
-        "name": product.name,
-        "category_id": product.category_id,
-        "default_location_id": product.default_location_id,
-        "is_active": product.is_active,
-    }
-
-
-def _serialize_product_lot(product_lot: ProductLot) -> dict[str, Any]:
-    return {
-        "source_pk": product_lot.pk,
-        "product_id": product_lot.product_id,
-        "lot_code": product_lot.lot_code,
-        "expires_on": product_lot.expires_on,
-        "received_on": product_lot.received_on,
-        "status": product_lot.status,
-        "quantity_on_hand": product_lot.quantity_on_hand,
-        "quantity_reserved": product_lot.quantity_reserved,
-        "location_id": product_lot.location_id,
-    }
+    alias = alias_registry.get(kind="volunteer", source_pk=row["source_pk"], prefix="VOL")
+    user_email = row.pop("user__email")
+    full_name = f"{row.pop('user__first_name')} {row.pop('user__last_name')}".strip()
+    if anonymize:
+        row.update(display_name=alias, email=_alias_email(alias), short_name=alias)
+    else:
+        row.update(display_name=full_name or user_email, email=user_email)
+    return row
 
 
 def _serialize_shipment(
@@ -785,37 +989,12 @@ def _serialize_shipment(
     }
 
 
-def _serialize_carton(carton: Carton) -> dict[str, Any]:
-    return {
-        "source_pk": carton.pk,
-        "code": carton.code,
-        "status": carton.status,
-        "shipment_id": carton.shipment_id,
-        "current_location_id": carton.current_location_id,
-        "prepared_by_id": carton.prepared_by_id,
-    }
-
-
-def _serialize_carton_item(carton_item: CartonItem) -> dict[str, Any]:
-    return {
-        "source_pk": carton_item.pk,
-        "carton_id": carton_item.carton_id,
-        "product_lot_id": carton_item.product_lot_id,
-        "quantity": carton_item.quantity,
-    }
-
-
-def _contact_prefix(
-    *,
-    contact: Contact,
-    shipper_contact_ids: set[int],
-    correspondent_contact_ids: set[int],
-) -> str:
-    if contact.pk in shipper_contact_ids:
+def _contact_prefix(*, contact_type: str, is_shipper: bool, is_correspondent: bool) -> str:
+    if is_shipper:
         return "SHIPPER"
-    if contact.pk in correspondent_contact_ids:
+    if is_correspondent:
         return "CORRESP"
-    if contact.contact_type == ContactType.PERSON:
+    if contact_type == ContactType.PERSON:
         return "PERSON"
     return "CONTACT"
 
@@ -1,4 +1,4 @@
-from datetime import datetime, time, timedelta
+from datetime import datetime, timedelta
 
 from wms.models import (
     PlanningFlightSnapshot,
@@ -6,38 +6,15 @@ from wms.models import (
     PlanningShipmentSnapshot,
     PlanningVolunteerSnapshot,
 )
-from wms.planning.config import (
-    LEGACY_EQUIV_CAPACITY_PER_VOLUNTEER,
-    LEGACY_MISSION_LEAD_HOURS,
-)
-from wms.planning.validation import get_destination_rule_map
-
-
-def _parse_time_value(value: str | None) -> time | None:
-    if not value:
-        return None
-    parts = str(value).strip().split(":")
-    if len(parts) < 2:
-        return None
-    try:
-        hour = int(parts[0])
-        minute = int(parts[1])
-    except (TypeError, ValueError):
-        return None
-    return time(hour=hour, minute=minute)
+from wms.planning.config import LEGACY_MISSION_LEAD_HOURS
+from wms.planning.payload_model import PlanningPayload, coerce_int, parse_time_value
+from wms.planning.validation import get_destination_rule_map, get_parameter_set_rule_map
 
 
 def _normalize_flight_number(value: str) -> str:
     return "".join(ch for ch in str(value or "").strip().upper() if ch.isalnum())
 
 
-def _coerce_int(value: object) -> int | None:
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return None
-
-
 def _infer_route_pos(*, routing: str, destination_iata: str) -> int:
     parts = [
         part.strip().upper() for part in str(routing or "").replace(",", "-").split("-") if part
@@ -58,8 +35,7 @@ def build_physical_flight_key(flight: dict) -> str:
     )
 
 
-def compile_run_solver_payload(run: PlanningRun) -> dict:
-    destination_rule_map = get_destination_rule_map(run)
+def build_destination_rules_by_iata(destination_rule_map: dict) -> dict[str, dict]:
     destination_rules_by_iata = {}
     for rule in destination_rule_map.values():
         if rule.destination_id and rule.destination and rule.destination.iata_code:
@@ -69,23 +45,61 @@ def compile_run_solver_payload(run: PlanningRun) -> dict:
                 "max_cartons_per_flight": rule.max_cartons_per_flight,
                 "allowed_weekdays": list(rule.allowed_weekdays or []),
             }
+    return destination_rules_by_iata
 
-    shipments = [
-        {
-            "snapshot_id": snapshot.pk,
-            "reference": snapshot.shipment_reference,
-            "shipper_name": snapshot.shipper_name,
-            "destination_iata": snapshot.destination_iata,
-            "priority": snapshot.priority,
-            "priority_rank": _coerce_int((snapshot.payload or {}).get("legacy_type_priority"))
-            or snapshot.priority
-            or 0,
-            "carton_count": snapshot.carton_count,
-            "equivalent_units": snapshot.equivalent_units,
-            "payload": snapshot.payload,
-        }
-        for snapshot in run.shipment_snapshots.order_by("-priority", "shipment_reference", "id")
-    ]
+
+def _compile_shipment(snapshot: PlanningShipmentSnapshot, *, priority: int) -> dict:
+    return {
+        "snapshot_id": snapshot.pk,
+        "reference": snapshot.shipment_reference,
+        "shipper_name": snapshot.shipper_name,
+        "destination_iata": snapshot.destination_iata,
+        "priority": priority,
+        "priority_rank": coerce_int((snapshot.payload or {}).get("legacy_type_priority"))
+        or priority
+        or 0,
+        "carton_count": snapshot.carton_count,
+        "equivalent_units": snapshot.equivalent_units,
+        "payload": snapshot.payload,
+    }
+
+
+def compile_run_solver_payload(run: PlanningRun, *, parameter_set=None) -> dict:
+    """Compile the run snapshots into the solver payload.
+
+    With ``parameter_set``, the snapshots are compiled under that set's destination rules
+    instead of the run's: flight rules and shipment priorities come from the set, as if the
+    run inputs had been prepared with it.
+    """
+    if parameter_set is None:
+        destination_rule_map = get_destination_rule_map(run)
+    else:
+        destination_rule_map = get_parameter_set_rule_map(parameter_set)
+    destination_rules_by_iata = build_destination_rules_by_iata(destination_rule_map)
+
+    shipment_snapshots = run.shipment_snapshots.order_by("-priority", "shipment_reference", "id")
+    if parameter_set is None:
+        shipments = [
+            _compile_shipment(snapshot, priority=snapshot.priority)
+            for snapshot in shipment_snapshots
+        ]
+    else:
+        shipments = [
+            _compile_shipment(
+                snapshot,
+                priority=destination_rules_by_iata.get(
+                    snapshot.destination_iata.upper(), {"priority": 0}
+                )["priority"],
+            )
+            for snapshot in shipment_snapshots
+        ]
+        shipments.sort(
+            key=lambda shipment: (
+                -shipment["priority"],
+                shipment["reference"],
+                shipment["snapshot_id"],
+            )
+        )
     volunteers = [
         {
             "snapshot_id": snapshot.pk,
@@ -170,12 +184,12 @@ def volunteer_is_compatible_with_flight(volunteer: dict, flight: dict) -> bool:
     if not slots:
         return True
 
-    departure_time = _parse_time_value(flight.get("departure_time"))
+    departure_time = parse_time_value(flight.get("departure_time"))
     for slot in slots:
         if slot.get("date") != departure_date:
             continue
-        start_time = _parse_time_value(slot.get("start_time"))
-        end_time = _parse_time_value(slot.get("end_time"))
+        start_time = parse_time_value(slot.get("start_time"))
+        end_time = parse_time_value(slot.get("end_time"))
         if start_time is None or end_time is None:
             continue
         if departure_time is None:
@@ -212,58 +226,44 @@ def shipment_is_compatible_with_flight(shipment: dict, flight: dict) -> bool:
     return True
 
 
-def compute_compatibility(payload: dict) -> dict[int, list[tuple[int, int]]]:
+def compute_compatibility(
+    payload: dict | PlanningPayload,
+) -> dict[int, list[tuple[int, int]]]:
+    model = PlanningPayload.coerce(payload)
     compatibility = {}
-    flight_metadata = {
-        flight["snapshot_id"]: (
-            int(flight.get("route_pos") or 1),
-            str(flight.get("flight_number") or ""),
-        )
-        for flight in payload["flights"]
-    }
-    for shipment in payload["shipments"]:
+    for shipment in model.shipments:
+        flight_mask = model.shipment_flight_masks[shipment.index]
+        equivalent_units = model.shipment_units[shipment.index]
         pairs = []
-        for flight in payload["flights"]:
-            if not shipment_is_compatible_with_flight(shipment, flight):
+        for flight in model.flights_by_route_order:
+            if not flight_mask >> flight.index & 1:
                 continue
-            for volunteer in payload["volunteers"]:
-                volunteer_equiv_capacity = volunteer.get("max_colis_vol")
-                if volunteer_equiv_capacity is None:
-                    volunteer_equiv_capacity = LEGACY_EQUIV_CAPACITY_PER_VOLUNTEER
-                if shipment["equivalent_units"] > int(volunteer_equiv_capacity):
-                    continue
-                if not volunteer_is_compatible_with_flight(volunteer, flight):
+            for volunteer in model.volunteers_by_flight[flight.index]:
+                if equivalent_units > model.volunteer_capacities[volunteer.index]:
                     continue
-                pairs.append((flight["snapshot_id"], volunteer["snapshot_id"]))
-        pairs.sort(key=lambda pair: flight_metadata.get(pair[0], (999, "")))
-        compatibility[shipment["snapshot_id"]] = pairs
+                pairs.append((flight.snapshot_id, volunteer.snapshot_id))
+        compatibility[shipment.snapshot_id] = pairs
     return compatibility
 
 
-def build_solver_diagnostics(payload: dict) -> list[dict]:
+def build_solver_diagnostics(payload: dict | PlanningPayload) -> list[dict]:
+    model = PlanningPayload.coerce(payload)
     diagnostics = []
-    for flight in payload["flights"]:
+    for flight in model.flights:
         shipment_compat_count = sum(
-            1
-            for shipment in payload["shipments"]
-            if shipment_is_compatible_with_flight(shipment, flight)
-        )
-        benevole_compat_count = sum(
-            1
-            for volunteer in payload["volunteers"]
-            if volunteer_is_compatible_with_flight(volunteer, flight)
+            mask >> flight.index & 1 for mask in model.shipment_flight_masks
         )
         diagnostics.append(
             {
-                "flight_snapshot_id": flight["snapshot_id"],
-                "flight_number": flight["flight_number"],
-                "departure_date": flight["departure_date"],
-                "departure_time": flight.get("departure_time") or "",
-                "destination_iata": flight["destination_iata"],
-                "physical_flight_key": flight.get("physical_flight_key") or "",
-                "route_pos": int(flight.get("route_pos") or 1),
+                "flight_snapshot_id": flight.snapshot_id,
+                "flight_number": flight.flight_number,
+                "departure_date": flight.departure_date,
+                "departure_time": flight.departure_time,
+                "destination_iata": flight.destination_iata,
+                "physical_flight_key": flight.physical_flight_key,
+                "route_pos": flight.route_pos,
                 "shipment_compat_count": shipment_compat_count,
-                "benevole_compat_count": benevole_compat_count,
+                "benevole_compat_count": len(model.volunteers_by_flight[flight.index]),
                 "candidate_assignment_count": 0,
                 "used": False,
             }
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from django.db import transaction
+
+from wms.models import PlanningParameterSet, PlanningRunStatus
+from wms.planning.config import (
+    PLANNING_SCENARIO_MAX_VARIANTS,
+    PLANNING_SCENARIO_MAX_WORKERS,
+)
+from wms.planning.payload_model import shipment_weight
+from wms.planning.rules import compile_run_solver_payload, materialize_solver_snapshots
+from wms.planning.solver import create_solver_version
+from wms.planning.stats import build_version_stats
+from wms.process_pools import can_use_process_pool
+from wms.process_pools.planning_scenarios import solve_scenario_payload
+
+BASELINE_SCENARIO_KEY = "baseline"
+NO_BASELINE_STATUS = "no_baseline"
+
+
+@dataclass(frozen=True)
+class PlanningScenario:
+    key: str
+    label: str
+    parameter_set_id: int | None = None
+    solver_options: dict = field(default_factory=dict)
+
+
+def build_run_scenarios(run, *, parameter_set_ids=(), random_seeds=()):
+    scenarios = [
+        PlanningScenario(
+            key=BASELINE_SCENARIO_KEY,
+            label=f"Base · {run.parameter_set or '-'}",
+        )
+    ]
+    parameter_sets = PlanningParameterSet.objects.filter(pk__in=list(parameter_set_ids)).exclude(
+        pk=run.parameter_set_id
+    )
+    for parameter_set in parameter_sets.order_by("name", "id"):
+        scenarios.append(
+            PlanningScenario(
+                key=f"parameter-set-{parameter_set.pk}",
+                label=f"Parametres · {parameter_set.name}",
+                parameter_set_id=parameter_set.pk,
+            )
+        )
+    for seed in random_seeds:
+        scenarios.append(
+            PlanningScenario(
+                key=f"seed-{seed}",
+                label=f"Graine · {seed}",
+                solver_options={"random_seed": int(seed)},
+            )
+        )
+    return scenarios[:PLANNING_SCENARIO_MAX_VARIANTS]
+
+
+def _scenario_payload(run, payload, scenario):
+    if scenario.parameter_set_id is None:
+        return payload
+    parameter_set = PlanningParameterSet.objects.get(pk=scenario.parameter_set_id)
+    variant = compile_run_solver_payload(run, parameter_set=parameter_set)
+    variant["parameter_set_id"] = parameter_set.pk
+    return variant
+
+
+def _run_scenario_payloads(jobs, *, max_workers):
+    if not can_use_process_pool(max_workers=max_workers, task_count=len(jobs)):
+        return [solve_scenario_payload(payload, options) for payload, options in jobs]
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures = [
+            executor.submit(solve_scenario_payload, payload, options) for payload, options in jobs
+        ]
+        return [future.result() for future in futures]
+
+
+def _scenario_score(*, baseline_payload, outcome, version):
+    # Every variant is scored with the baseline priorities so that scores are comparable.
+    shipment_by_id = {
+        shipment["snapshot_id"]: shipment for shipment in baseline_payload["shipments"]
+    }
+    result = outcome["result"]
+    stats = build_version_stats(version)
+    return {
+        "status": result.get("status", ""),
+        "weighted_score": sum(
+            shipment_weight(shipment_by_id[item["shipment_snapshot_id"]])
+            for item in outcome["assignments"]
+        ),
+        "assignment_count": stats["assignment_count"],
+        "unassigned_count": stats["unassigned_count"],
+        "carton_total": stats["carton_total"],
+        "flight_count": stats["flight_count"],
+        "volunteer_count": stats["volunteer_count"],
+        "candidate_count": result.get("candidate_count", 0),
+    }
+
+
+@transaction.atomic
+def _start_scenarios(run, scenarios):
+    if run.status != PlanningRunStatus.READY:
+        raise ValueError("Planning run must be ready before solving.")
+    run.status = PlanningRunStatus.SOLVING
+    run.save(update_fields=["status", "updated_at"])
+    payload = compile_run_solver_payload(run)
+    return payload, [_scenario_payload(run, payload, scenario) for scenario in scenarios]
+
+
+@transaction.atomic
+def _store_scenarios(run, scenarios, *, payload, outcomes):
+    snapshots = materialize_solver_snapshots(run)
+    rows = []
+    baseline_result = None
+    for scenario, outcome in zip(scenarios, outcomes, strict=True):
+        row = {
+            "key": scenario.key,
+            "label": scenario.label,
+            "parameter_set_id": scenario.parameter_set_id,
+            "solver_options": dict(scenario.solver_options),
+            "elapsed_seconds": round(outcome["elapsed_seconds"], 3),
+            "version_id": None,
+            "error": outcome["error"],
+        }
+        if not outcome["error"]:
+            version = create_solver_version(
+                run,
+                outcome["assignments"],
+                snapshots=snapshots,
+                change_reason=f"Scenario: {scenario.label}",
+            )
+            row["version_id"] = version.pk
+            row["version_number"] = version.number
+            row["score"] = _scenario_score(
+                baseline_payload=payload,
+                outcome=outcome,
+                version=version,
+            )
+            if scenario.key == BASELINE_SCENARIO_KEY:
+                baseline_result = dict(outcome["result"])
+        elif scenario.key == BASELINE_SCENARIO_KEY:
+            baseline_result = {"status": NO_BASELINE_STATUS, "error": outcome["error"]}
+        rows.append(row)
+
+    if not any(row["version_id"] for row in rows):
+        raise RuntimeError(rows[0]["error"] or "Planning solver found no feasible solution.")
+
+    result = baseline_result or {"status": NO_BASELINE_STATUS}
+    result["scenarios"] = rows
+    run.solver_payload = payload
+    run.solver_result = result
+    run.status = PlanningRunStatus.SOLVED
+    run.save(update_fields=["solver_payload", "solver_result", "status", "updated_at"])
+    return rows
+
+
+def solve_run_scenarios(run, scenarios, *, max_workers=None):
+    """Solve every scenario of ``run`` from one compiled payload and keep one draft per variant.
+
+    Variants are solved in a process pool outside any transaction: the run is marked as solving
+    first, then the drafts and the ``scenarios`` comparison list consumed by
+    ``build_scenario_comparison`` are stored in one transaction. The run solver result is the
+    baseline one, or a ``no_baseline`` status when the baseline scenario failed or was not run.
+    """
+    scenarios = list(scenarios)
+    if not scenarios:
+        raise ValueError("At least one planning scenario is required.")
+
+    payload, scenario_payloads = _start_scenarios(run, scenarios)
+    try:
+        if max_workers is None:
+            max_workers = min(PLANNING_SCENARIO_MAX_WORKERS, os.cpu_count() or 1)
+        outcomes = _run_scenario_payloads(
+            [
+                (scenario_payload, scenario.solver_options)
+                for scenario_payload, scenario in zip(scenario_payloads, scenarios, strict=True)
+            ],
+            max_workers=max_workers,
+        )
+        rows = _store_scenarios(run, scenarios, payload=payload, outcomes=outcomes)
+    except Exception:
+        run.status = PlanningRunStatus.READY
+        run.save(update_fields=["status", "updated_at"])
+        raise
+    return rows
+
+
+def build_scenario_comparison(run):
+    rows = [dict(row) for row in (run.solver_result or {}).get("scenarios", [])]
+    scored = [row for row in rows if row.get("score")]
+    if scored:
+        best_score = max(row["score"]["weighted_score"] for row in scored)
+        for row in scored:
+            row["is_best"] = row["score"]["weighted_score"] == best_score
+    return rows
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+from time import perf_counter
+
 from django.core.exceptions import ValidationError
 from django.db import transaction
 
+from wms.emailing import get_admin_emails, get_shipment_status_admin_emails
 from wms.models import (
     PlanningVersion,
     PlanningVersionStatus,
+    Shipment,
     ShipmentStatus,
     ShipmentTrackingEvent,
     ShipmentTrackingStatus,
+    WmsChange,
+    generate_shipment_reference,
+)
+from wms.signals import (
+    emit_shipment_status_notifications,
+    emit_tracking_event_notifications,
 )
 
 ALLOWED_SHIPMENT_UPDATE_STATUSES = {
@@ -16,6 +26,63 @@ ALLOWED_SHIPMENT_UPDATE_STATUSES = {
     ShipmentStatus.PLANNED,
 }
 DEFAULT_ACTOR_STRUCTURE = "ASF WMS Planning"
+PUBLICATION_STATS_SHIPMENT_UPDATES_KEY = "shipment_updates"
+
+
+def _record_timing(timings: dict[str, float], stage: str, started: float) -> float:
+    now = perf_counter()
+    timings[stage] = round(now - started, 6)
+    return now
+
+
+def _version_shipments(version: PlanningVersion, summary: dict[str, int]) -> list[Shipment]:
+    shipments: list[Shipment] = []
+    seen_shipments: set[int] = set()
+    assignments = version.assignments.select_related(
+        "shipment_snapshot__shipment__destination"
+    ).order_by("sequence", "id")
+    for assignment in assignments:
+        shipment_snapshot = assignment.shipment_snapshot
+        shipment = (
+            shipment_snapshot.shipment
+            if shipment_snapshot and shipment_snapshot.shipment_id
+            else None
+        )
+        if shipment is None:
+            summary["skipped_missing"] += 1
+            continue
+        if shipment.pk in seen_shipments:
+            continue
+        seen_shipments.add(shipment.pk)
+        summary["considered"] += 1
+        if shipment.status not in ALLOWED_SHIPMENT_UPDATE_STATUSES:
+            summary["skipped_locked"] += 1
+            continue
+        shipments.append(shipment)
+    return shipments
+
+
+def _emit_publication_notifications(
+    *,
+    planned_shipments: list[tuple[Shipment, str]],
+    tracking_events: list[ShipmentTrackingEvent],
+) -> None:
+    if planned_shipments:
+        admin_recipients = get_shipment_status_admin_emails()
+        for shipment, previous_status in planned_shipments:
+            emit_shipment_status_notifications(
+                shipment,
+                previous_status=previous_status,
+                source="planning_version_updates",
+                admin_recipients=admin_recipients,
+            )
+    if tracking_events:
+        tracking_admin_recipients = get_admin_emails()
+        for tracking_event in tracking_events:
+            emit_tracking_event_notifications(
+                tracking_event,
+                admin_recipients=tracking_admin_recipients,
+            )
 
 
 @transaction.atomic
@@ -26,6 +93,12 @@ def apply_version_updates(
     actor_structure: str = DEFAULT_ACTOR_STRUCTURE,
     user=None,
 ) -> dict[str, int]:
+    """Mark the shipments of a published version as planned with bulk writes.
+
+    Every change is computed up front, written with one ``bulk_update`` and one
+    ``bulk_create``, then notified in a single pass since bulk writes skip the model
+    signals. Stage timings are stored in ``version.publication_stats``.
+    """
     if version.status != PlanningVersionStatus.PUBLISHED:
         raise ValidationError(
             "Shipment updates can only be applied from a published planning version."
@@ -38,48 +111,64 @@ def apply_version_updates(
         "skipped_missing": 0,
         "skipped_locked": 0,
     }
-    seen_shipments: set[int] = set()
+    timings: dict[str, float] = {}
+    started = perf_counter()
+    stage_started = started
 
-    assignments = version.assignments.select_related("shipment_snapshot__shipment").order_by(
-        "sequence",
-        "id",
+    shipments = _version_shipments(version, summary)
+    planned_event_shipment_ids = set(
+        ShipmentTrackingEvent.objects.filter(
+            shipment_id__in=[shipment.pk for shipment in shipments],
+            status=ShipmentTrackingStatus.PLANNED,
+        ).values_list("shipment_id", flat=True)
     )
-    for assignment in assignments:
-        shipment_snapshot = assignment.shipment_snapshot
-        shipment = (
-            shipment_snapshot.shipment
-            if shipment_snapshot and shipment_snapshot.shipment_id
-            else None
-        )
-        if shipment is None:
-            summary["skipped_missing"] += 1
-            continue
-        if shipment.pk in seen_shipments:
-            continue
-        seen_shipments.add(shipment.pk)
-        summary["considered"] += 1
+    stage_started = _record_timing(timings, "load", stage_started)
 
-        if shipment.status not in ALLOWED_SHIPMENT_UPDATE_STATUSES:
-            summary["skipped_locked"] += 1
+    planned_shipments: list[tuple[Shipment, str]] = []
+    for shipment in shipments:
+        if shipment.status == ShipmentStatus.PLANNED:
             continue
+        planned_shipments.append((shipment, shipment.status))
+        shipment.status = ShipmentStatus.PLANNED
+        if shipment._should_promote_temp_reference():
+            shipment.reference = generate_shipment_reference()
+    if planned_shipments:
+        Shipment.objects.bulk_update(
+            [shipment for shipment, _previous_status in planned_shipments],
+            ["status", "reference"],
+        )
+    summary["updated"] = len(planned_shipments)
+    stage_started = _record_timing(timings, "shipments", stage_started)
 
-        if shipment.status != ShipmentStatus.PLANNED:
-            shipment.status = ShipmentStatus.PLANNED
-            shipment.save(update_fields=["status"])
-            summary["updated"] += 1
-
-        planned_event_exists = shipment.tracking_events.filter(
-            status=ShipmentTrackingStatus.PLANNED
-        ).exists()
-        if not planned_event_exists:
-            ShipmentTrackingEvent.objects.create(
-                shipment=shipment,
-                status=ShipmentTrackingStatus.PLANNED,
-                actor_name=actor_name,
-                actor_structure=actor_structure,
-                comments=f"Planning version v{version.number}",
-                created_by=user or version.created_by,
-            )
-            summary["tracking_events_created"] += 1
+    tracking_events = [
+        ShipmentTrackingEvent(
+            shipment=shipment,
+            status=ShipmentTrackingStatus.PLANNED,
+            actor_name=actor_name,
+            actor_structure=actor_structure,
+            comments=f"Planning version v{version.number}",
+            created_by=user or version.created_by,
+        )
+        for shipment in shipments
+        if shipment.pk not in planned_event_shipment_ids
+    ]
+    if tracking_events:
+        ShipmentTrackingEvent.objects.bulk_create(tracking_events)
+    summary["tracking_events_created"] = len(tracking_events)
+    stage_started = _record_timing(timings, "tracking_events", stage_started)
 
+    if planned_shipments or tracking_events:
+        WmsChange.bump()
+    _emit_publication_notifications(
+        planned_shipments=planned_shipments,
+        tracking_events=tracking_events,
+    )
+    _record_timing(timings, "notifications", stage_started)
+    timings["total"] = round(perf_counter() - started, 6)
+
+    version.publication_stats = {
+        **(version.publication_stats or {}),
+        PUBLICATION_STATS_SHIPMENT_UPDATES_KEY: {**summary, "timings": timings},
+    }
+    version.save(update_fields=["publication_stats"])
     return summary
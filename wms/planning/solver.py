@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from datetime import datetime, timedelta
-from functools import cache
+from datetime import datetime
+from time import perf_counter
 
 from django.db import transaction
 
+from wms.lazy_imports import lazy_module
 from wms.models import (
     PlanningAssignment,
     PlanningAssignmentSource,
@@ -14,10 +15,18 @@ from wms.models import (
 )
 from wms.planning.config import (
     LEGACY_EQUIV_CAPACITY_PER_VOLUNTEER,
+    PLANNING_FLIGHT_DISTRIBUTION_MAX_STATES,
     PLANNING_SOLVER_MAX_TIME_SECONDS,
     PLANNING_SOLVER_NUM_SEARCH_WORKERS,
     PLANNING_SOLVER_RANDOM_SEED,
 )
+from wms.planning.payload_model import (
+    FlightRecord,
+    PlanningPayload,
+    ShipmentRecord,
+    VolunteerRecord,
+    coerce_int,
+)
 from wms.planning.rules import (
     build_solver_diagnostics,
     compile_run_solver_payload,
@@ -25,34 +34,50 @@ from wms.planning.rules import (
     materialize_solver_snapshots,
 )
 
-try:
-    from ortools.sat.python import cp_model
-except ModuleNotFoundError:  # pragma: no cover - dependency guard
-    cp_model = None
+cp_model = lazy_module("ortools.sat.python.cp_model")
 
 LEGACY_MAX_BE_PER_FLIGHT = 5
 LEGACY_MIN_HOURS_BETWEEN_FLIGHTS = 3.0
 
 
-def configure_cp_solver(solver) -> None:
-    solver.parameters.max_time_in_seconds = PLANNING_SOLVER_MAX_TIME_SECONDS
-    solver.parameters.num_search_workers = PLANNING_SOLVER_NUM_SEARCH_WORKERS
-    solver.parameters.random_seed = PLANNING_SOLVER_RANDOM_SEED
+def configure_cp_solver(
+    solver,
+    *,
+    max_time_seconds: float | None = None,
+    num_search_workers: int | None = None,
+    random_seed: int | None = None,
+) -> None:
+    solver.parameters.max_time_in_seconds = (
+        PLANNING_SOLVER_MAX_TIME_SECONDS if max_time_seconds is None else float(max_time_seconds)
+    )
+    solver.parameters.num_search_workers = (
+        PLANNING_SOLVER_NUM_SEARCH_WORKERS
+        if num_search_workers is None
+        else int(num_search_workers)
+    )
+    solver.parameters.random_seed = (
+        PLANNING_SOLVER_RANDOM_SEED if random_seed is None else int(random_seed)
+    )
+
+
+def _record_timing(timings: dict | None, phase: str, started: float) -> None:
+    if timings is None:
+        return
+    timings[phase] = timings.get(phase, 0.0) + (perf_counter() - started)
 
 
 def summarize_solver_result(
     *,
-    payload: dict,
+    payload: dict | PlanningPayload,
     assignments: list[dict],
     unassigned: list[int],
     compatibility: dict[int, list[tuple[int, int]]],
     solver_name: str = "greedy_v1",
 ) -> dict:
+    model = PlanningPayload.coerce(payload)
     assignment_count_by_flight = defaultdict(int)
-    flight_usage = {str(flight["snapshot_id"]): 0 for flight in payload.get("flights", [])}
-    volunteer_usage = {
-        str(volunteer["snapshot_id"]): 0 for volunteer in payload.get("volunteers", [])
-    }
+    flight_usage = {str(flight.snapshot_id): 0 for flight in model.flights}
+    volunteer_usage = {str(volunteer.snapshot_id): 0 for volunteer in model.volunteers}
     assigned_shipment_ids = {item["shipment_snapshot_id"] for item in assignments}
 
     for item in assignments:
@@ -94,105 +119,10 @@ def _candidate_score(candidate: dict) -> int:
     return (weighted_priority * 1_000_000_000) + (equivalent_units * 1_000) + cartons
 
 
-def _coerce_int(value):
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return None
-
-
-def _coerce_iso_date_ordinal(value: object) -> int:
-    text = str(value or "").strip()
-    if not text:
-        return -1
-    try:
-        return datetime.fromisoformat(text).date().toordinal()
-    except ValueError:
-        return -1
-
-
-def _flight_datetime_key(flight: dict) -> datetime:
-    departure_date = str(flight.get("departure_date") or "").strip()
-    departure_time = str(flight.get("departure_time") or "").strip() or "00:00"
-    try:
-        return datetime.fromisoformat(f"{departure_date}T{departure_time}")
-    except ValueError:
-        return datetime.max
-
-
-def _shipment_weight(shipment: dict) -> int:
-    equivalent_units = int(shipment.get("equivalent_units") or 0)
-    priority = int(shipment.get("priority_rank") or shipment.get("priority") or 0)
-    legacy_priority_bonus = max(0, 10 - priority)
-    return equivalent_units * legacy_priority_bonus
-
-
-def _volunteer_availability_minutes(volunteer: dict) -> int:
-    availability = volunteer.get("availability_summary") or {}
-    total = 0
-    for slot in availability.get("slots") or []:
-        date_value = str(slot.get("date") or "").strip()
-        start_value = str(slot.get("start_time") or "").strip()
-        end_value = str(slot.get("end_time") or "").strip()
-        if not date_value or not start_value or not end_value:
-            continue
-        try:
-            start_dt = datetime.fromisoformat(f"{date_value}T{start_value}")
-            end_dt = datetime.fromisoformat(f"{date_value}T{end_value}")
-        except ValueError:
-            continue
-        delta = int((end_dt - start_dt).total_seconds() / 60)
-        if delta > 0:
-            total += delta
-    return total
-
-
-def _shipment_reference_sort_key(shipment: dict) -> tuple:
-    reference = str(shipment.get("reference") or "").strip()
-    reference_number = _coerce_int(reference)
-    if reference_number is not None:
-        return (0, reference_number, reference)
-    return (1, reference)
-
-
-def _shipment_has_legacy_tie_break_metadata(shipment: dict) -> bool:
-    payload = shipment.get("payload") or {}
-    return any(
-        str(payload.get(key) or "").strip()
-        for key in (
-            "legacy_date_depart_mag",
-            "legacy_date_impression",
-            "legacy_date_conditionnement",
-        )
-    )
-
-
-def _shipment_legacy_tie_break_key(shipment: dict) -> tuple:
-    payload = shipment.get("payload") or {}
-    return (
-        1 if str(payload.get("legacy_date_depart_mag") or "").strip() else 0,
-        _coerce_iso_date_ordinal(payload.get("legacy_date_impression")),
-        _coerce_iso_date_ordinal(payload.get("legacy_date_conditionnement")),
-        -(_coerce_int(shipment.get("reference")) or 10**9),
-        str(shipment.get("reference") or ""),
-    )
-
-
-def _shipment_legacy_assignment_key(shipment: dict) -> tuple:
-    payload = shipment.get("payload") or {}
-    return (
-        int(shipment.get("priority") or 0),
-        0 if str(payload.get("legacy_date_depart_mag") or "").strip() else 1,
-        _coerce_iso_date_ordinal(payload.get("legacy_date_conditionnement")),
-        _coerce_iso_date_ordinal(payload.get("legacy_date_impression")),
-        _shipment_reference_sort_key(shipment),
-    )
-
-
 def _select_legacy_preferred_shipment_ids(
     shipment_ids: list[int],
     *,
-    shipment_by_id: dict[int, dict],
+    shipment_by_id: dict[int, ShipmentRecord],
     selected_count: int,
 ) -> list[int]:
     if selected_count <= 0:
@@ -200,7 +130,7 @@ def _select_legacy_preferred_shipment_ids(
 
     ranked_shipment_ids = sorted(
         shipment_ids,
-        key=lambda shipment_id: _shipment_legacy_tie_break_key(shipment_by_id[shipment_id]),
+        key=lambda shipment_id: shipment_by_id[shipment_id].legacy_tie_break_key,
         reverse=True,
     )
     if selected_count >= len(ranked_shipment_ids):
@@ -208,8 +138,7 @@ def _select_legacy_preferred_shipment_ids(
 
     shipment_ids_by_shipper = defaultdict(list)
     for shipment_id in ranked_shipment_ids:
-        shipment = shipment_by_id[shipment_id]
-        shipper_key = str(shipment.get("shipper_name") or "").strip()
+        shipper_key = str(shipment_by_id[shipment_id].shipper_name).strip()
         shipment_ids_by_shipper[shipper_key].append(shipment_id)
 
     if len(shipment_ids_by_shipper) <= 1:
@@ -220,7 +149,7 @@ def _select_legacy_preferred_shipment_ids(
         representatives.append(shipper_ids[0])
     representatives = sorted(
         representatives,
-        key=lambda shipment_id: _shipment_legacy_tie_break_key(shipment_by_id[shipment_id]),
+        key=lambda shipment_id: shipment_by_id[shipment_id].legacy_tie_break_key,
         reverse=True,
     )
 
@@ -228,8 +157,9 @@ def _select_legacy_preferred_shipment_ids(
     if len(selected_shipment_ids) >= selected_count:
         return selected_shipment_ids
 
+    already_selected = set(selected_shipment_ids)
     for shipment_id in ranked_shipment_ids:
-        if shipment_id in selected_shipment_ids:
+        if shipment_id in already_selected:
             continue
         selected_shipment_ids.append(shipment_id)
         if len(selected_shipment_ids) >= selected_count:
@@ -238,18 +168,13 @@ def _select_legacy_preferred_shipment_ids(
 
 
 def _order_compatibility_pairs(
-    payload: dict, compatibility: dict[int, list[tuple[int, int]]]
+    model: PlanningPayload, compatibility: dict[int, list[tuple[int, int]]]
 ) -> dict:
-    flight_order = {
-        flight["snapshot_id"]: index for index, flight in enumerate(payload.get("flights", []))
-    }
-    volunteer_order = {
-        volunteer["snapshot_id"]: index
-        for index, volunteer in enumerate(payload.get("volunteers", []))
-    }
+    flight_order = model.flight_index
+    volunteer_order = model.volunteer_index
     ordered = {}
-    for shipment in payload.get("shipments", []):
-        shipment_id = shipment["snapshot_id"]
+    for shipment in model.shipments:
+        shipment_id = shipment.snapshot_id
         unique_pairs = list(dict.fromkeys(compatibility.get(shipment_id, [])))
         ordered[shipment_id] = sorted(
             unique_pairs,
@@ -261,76 +186,95 @@ def _order_compatibility_pairs(
     return ordered
 
 
-def _volunteer_assignment_order_key(volunteer: dict) -> tuple:
-    payload = volunteer.get("payload") or {}
-    legacy_id = _coerce_int(payload.get("legacy_id"))
-    label = str(volunteer.get("label") or "")
-    snapshot_id = _coerce_int(volunteer.get("snapshot_id")) or 0
-    if legacy_id is not None:
-        return (0, legacy_id, label, snapshot_id)
-    return (1, label, snapshot_id)
+class _FlightDistributionBoundExceeded(Exception):
+    pass
 
 
 def _solve_lexicographic_flight_distribution(
     shipment_weights: tuple[int, ...],
     volunteer_capacities: tuple[int, ...],
+    *,
+    max_states: int = PLANNING_FLIGHT_DISTRIBUTION_MAX_STATES,
 ) -> tuple[int, ...] | None:
-    @cache
-    def _assign(index: int, remaining_capacities: tuple[int, ...]) -> tuple[int, ...] | None:
+    """Return the lexicographically smallest volunteer index per shipment that fits capacities.
+
+    Whether a suffix of shipments still fits only depends on the multiset of remaining
+    capacities, so feasibility is memoized on ``(index, sorted capacities)`` and volunteers
+    left with an already-tried capacity are skipped. At most ``max_states`` states are
+    explored; ``None`` is returned when no distribution exists or the bound is reached.
+    """
+    suffix_weights = [0] * (len(shipment_weights) + 1)
+    for index in range(len(shipment_weights) - 1, -1, -1):
+        suffix_weights[index] = suffix_weights[index + 1] + shipment_weights[index]
+    feasible_by_state: dict[tuple[int, tuple[int, ...]], bool] = {}
+    explored_states = 0
+
+    def _suffix_fits(index: int, remaining_capacities: tuple[int, ...]) -> bool:
+        nonlocal explored_states
         if index >= len(shipment_weights):
-            return ()
+            return True
+        if suffix_weights[index] > sum(remaining_capacities):
+            return False
+        state = (index, remaining_capacities)
+        if state in feasible_by_state:
+            return feasible_by_state[state]
+        explored_states += 1
+        if explored_states > max_states:
+            raise _FlightDistributionBoundExceeded
 
         current_weight = shipment_weights[index]
-        for volunteer_index, remaining_capacity in enumerate(remaining_capacities):
-            if remaining_capacity < current_weight:
+        fits = False
+        tried_capacities = set()
+        for position, remaining_capacity in enumerate(remaining_capacities):
+            if remaining_capacity < current_weight or remaining_capacity in tried_capacities:
                 continue
+            tried_capacities.add(remaining_capacity)
             next_remaining = list(remaining_capacities)
-            next_remaining[volunteer_index] -= current_weight
-            tail = _assign(index + 1, tuple(next_remaining))
-            if tail is not None:
-                return (volunteer_index,) + tail
+            next_remaining[position] -= current_weight
+            if _suffix_fits(index + 1, tuple(sorted(next_remaining))):
+                fits = True
+                break
+        feasible_by_state[state] = fits
+        return fits
+
+    remaining = list(volunteer_capacities)
+    distribution = []
+    try:
+        for index, current_weight in enumerate(shipment_weights):
+            tried_capacities = set()
+            for volunteer_index, remaining_capacity in enumerate(remaining):
+                if remaining_capacity < current_weight or remaining_capacity in tried_capacities:
+                    continue
+                tried_capacities.add(remaining_capacity)
+                remaining[volunteer_index] -= current_weight
+                if _suffix_fits(index + 1, tuple(sorted(remaining))):
+                    distribution.append(volunteer_index)
+                    break
+                remaining[volunteer_index] += current_weight
+            else:
+                return None
+    except _FlightDistributionBoundExceeded:
         return None
-
-    return _assign(0, volunteer_capacities)
+    return tuple(distribution)
 
 
 def _volunteer_slot_bounds_for_flight(
-    volunteer: dict, flight: dict
+    volunteer: VolunteerRecord, flight: FlightRecord
 ) -> tuple[datetime, datetime] | None:
-    availability = volunteer.get("availability_summary") or {}
-    departure_date = str(flight.get("departure_date") or "").strip()
-    best_slot = None
-    for slot in availability.get("slots") or []:
-        if str(slot.get("date") or "").strip() != departure_date:
-            continue
-        start_value = str(slot.get("start_time") or "").strip()
-        end_value = str(slot.get("end_time") or "").strip()
-        if not start_value or not end_value:
-            continue
-        try:
-            start_dt = datetime.fromisoformat(f"{departure_date}T{start_value}")
-            end_dt = datetime.fromisoformat(f"{departure_date}T{end_value}")
-        except ValueError:
-            continue
-        if end_dt <= start_dt:
-            continue
-        candidate = (start_dt, end_dt)
-        if best_slot is None or candidate[1] > best_slot[1]:
-            best_slot = candidate
-    return best_slot
+    return volunteer.slot_bounds.get(flight.departure_date.strip())
 
 
 def _assignment_conflicts_for_volunteer(
     volunteer_id: int,
     flight_id: int,
     assignments: list[dict],
-    flight_by_id: dict[int, dict],
+    flight_by_id: dict[int, FlightRecord],
     *,
     exclude_assignment: dict | None = None,
 ) -> bool:
     target_flight = flight_by_id[flight_id]
-    target_physical_key = target_flight.get("physical_flight_key") or str(flight_id)
-    target_dt = _flight_datetime_key(target_flight)
+    target_physical_key = target_flight.physical_key
+    target_dt = target_flight.departure_key
 
     for assignment in assignments:
         if assignment is exclude_assignment:
@@ -338,15 +282,12 @@ def _assignment_conflicts_for_volunteer(
         if assignment["volunteer_snapshot_id"] != volunteer_id:
             continue
         other_flight = flight_by_id[assignment["flight_snapshot_id"]]
-        other_physical_key = other_flight.get("physical_flight_key") or str(
-            assignment["flight_snapshot_id"]
-        )
         if (
-            target_physical_key == other_physical_key
+            target_physical_key == other_flight.physical_key
             and flight_id != assignment["flight_snapshot_id"]
         ):
             return True
-        other_dt = _flight_datetime_key(other_flight)
+        other_dt = other_flight.departure_key
         if abs((other_dt - target_dt).total_seconds()) < LEGACY_MIN_HOURS_BETWEEN_FLIGHTS * 3600:
             return True
     return False
@@ -355,10 +296,10 @@ def _assignment_conflicts_for_volunteer(
 def _select_single_shipment_volunteer(
     assignment: dict,
     *,
-    assignments: list[dict],
+    assignments_by_volunteer: dict[int, list[dict]],
     compatibility: dict[int, list[tuple[int, int]]],
-    flight_by_id: dict[int, dict],
-    volunteer_by_id: dict[int, dict],
+    flight_by_id: dict[int, FlightRecord],
+    volunteer_by_id: dict[int, VolunteerRecord],
 ) -> int:
     shipment_id = assignment["shipment_snapshot_id"]
     flight_id = assignment["flight_snapshot_id"]
@@ -375,15 +316,12 @@ def _select_single_shipment_volunteer(
         volunteer = volunteer_by_id.get(volunteer_id)
         if volunteer is None:
             continue
-        max_colis_vol = volunteer.get("max_colis_vol")
-        if max_colis_vol is None:
-            max_colis_vol = LEGACY_EQUIV_CAPACITY_PER_VOLUNTEER
-        if int(assignment["equivalent_units"]) > int(max_colis_vol):
+        if int(assignment["equivalent_units"]) > volunteer.capacity:
             continue
         if _assignment_conflicts_for_volunteer(
             volunteer_id,
             flight_id,
-            assignments,
+            assignments_by_volunteer.get(volunteer_id, []),
             flight_by_id,
             exclude_assignment=assignment,
         ):
@@ -396,11 +334,7 @@ def _select_single_shipment_volunteer(
         choice = (
             end_dt,
             duration_minutes,
-            tuple(
-                -part if isinstance(part, int) else part
-                for part in _volunteer_assignment_order_key(volunteer)
-                if isinstance(part, int)
-            ),
+            tuple(-part for part in volunteer.assignment_order_key if isinstance(part, int)),
             volunteer_id,
         )
         if best_choice is None or choice > best_choice:
@@ -413,20 +347,31 @@ def _select_single_shipment_volunteer(
 
 def _rebalance_assignments_by_flight(
     assignments: list[dict],
-    payload: dict,
+    payload: dict | PlanningPayload,
     compatibility: dict[int, list[tuple[int, int]]],
 ) -> list[dict]:
     if not assignments:
         return assignments
 
-    volunteer_by_id = {
-        volunteer["snapshot_id"]: volunteer for volunteer in payload.get("volunteers", [])
-    }
-    flight_by_id = {flight["snapshot_id"]: flight for flight in payload.get("flights", [])}
+    model = PlanningPayload.coerce(payload)
+    volunteer_by_id = model.volunteer_by_id
+    flight_by_id = model.flight_by_id
     grouped_assignments = defaultdict(list)
     for assignment in assignments:
         grouped_assignments[assignment["flight_snapshot_id"]].append(assignment)
 
+    def volunteer_order_key(volunteer_id):
+        volunteer = volunteer_by_id.get(volunteer_id)
+        if volunteer is None:
+            return (1, "", volunteer_id)
+        return volunteer.assignment_order_key
+
+    def volunteer_capacity(volunteer_id):
+        volunteer = volunteer_by_id.get(volunteer_id)
+        if volunteer is None:
+            return LEGACY_EQUIV_CAPACITY_PER_VOLUNTEER
+        return volunteer.capacity
+
     rebalanced = []
     single_assignments = []
     for flight_assignments in grouped_assignments.values():
@@ -445,25 +390,15 @@ def _rebalance_assignments_by_flight(
         )
         volunteer_ids = sorted(
             {item["volunteer_snapshot_id"] for item in ordered_shipments},
-            key=lambda volunteer_id: _volunteer_assignment_order_key(
-                volunteer_by_id.get(volunteer_id, {"snapshot_id": volunteer_id})
-            ),
+            key=volunteer_order_key,
         )
         if len(volunteer_ids) <= 1:
             rebalanced.extend(ordered_shipments)
             continue
 
-        volunteer_capacities = []
-        for volunteer_id in volunteer_ids:
-            volunteer = volunteer_by_id.get(volunteer_id, {})
-            max_colis_vol = volunteer.get("max_colis_vol")
-            if max_colis_vol is None:
-                max_colis_vol = LEGACY_EQUIV_CAPACITY_PER_VOLUNTEER
-            volunteer_capacities.append(int(max_colis_vol))
-
         distribution = _solve_lexicographic_flight_distribution(
             tuple(int(item["equivalent_units"]) for item in ordered_shipments),
-            tuple(volunteer_capacities),
+            tuple(volunteer_capacity(volunteer_id) for volunteer_id in volunteer_ids),
         )
         if distribution is None:
             rebalanced.extend(ordered_shipments)
@@ -476,19 +411,33 @@ def _rebalance_assignments_by_flight(
 
     single_assignments.sort(
         key=lambda item: (
-            _flight_datetime_key(flight_by_id[item["flight_snapshot_id"]]),
+            flight_by_id[item["flight_snapshot_id"]].departure_key,
             str(item.get("reference") or ""),
         )
     )
     final_assignments = rebalanced + single_assignments
+    # Conflicts are only checked against the same volunteer, so index assignments by volunteer
+    # instead of rescanning the whole week for every single-shipment flight.
+    assignments_by_volunteer = defaultdict(list)
+    for assignment in final_assignments:
+        assignments_by_volunteer[assignment["volunteer_snapshot_id"]].append(assignment)
     for assignment in single_assignments:
-        assignment["volunteer_snapshot_id"] = _select_single_shipment_volunteer(
+        current_volunteer_id = assignment["volunteer_snapshot_id"]
+        volunteer_id = _select_single_shipment_volunteer(
             assignment,
-            assignments=final_assignments,
+            assignments_by_volunteer=assignments_by_volunteer,
             compatibility=compatibility,
             flight_by_id=flight_by_id,
             volunteer_by_id=volunteer_by_id,
         )
+        if volunteer_id != current_volunteer_id:
+            assignments_by_volunteer[current_volunteer_id] = [
+                item
+                for item in assignments_by_volunteer[current_volunteer_id]
+                if item is not assignment
+            ]
+            assignments_by_volunteer[volunteer_id].append(assignment)
+        assignment["volunteer_snapshot_id"] = volunteer_id
 
     return final_assignments
 
@@ -496,29 +445,28 @@ def _rebalance_assignments_by_flight(
 def _canonicalize_legacy_equal_weight_assignments(
     assignments: list[dict],
     *,
-    payload: dict,
+    payload: dict | PlanningPayload,
     compatibility: dict[int, list[tuple[int, int]]],
 ) -> list[dict]:
     if not assignments:
         return assignments
 
-    shipment_by_id = {
-        shipment["snapshot_id"]: shipment for shipment in payload.get("shipments", [])
-    }
-    flight_by_id = {flight["snapshot_id"]: flight for flight in payload.get("flights", [])}
-    ordered_compatibility = _order_compatibility_pairs(payload, compatibility)
+    model = PlanningPayload.coerce(payload)
+    shipment_by_id = model.shipment_by_id
+    flight_by_id = model.flight_by_id
+    ordered_compatibility = _order_compatibility_pairs(model, compatibility)
     assignment_by_shipment_id = {
         assignment["shipment_snapshot_id"]: dict(assignment) for assignment in assignments
     }
     grouped_shipment_ids = defaultdict(list)
 
-    for shipment in payload.get("shipments", []):
-        shipment_id = shipment["snapshot_id"]
+    for shipment in model.shipments:
+        shipment_id = shipment.snapshot_id
         group_key = (
-            str(shipment.get("destination_iata") or ""),
-            int(shipment.get("equivalent_units") or 0),
-            int(shipment.get("carton_count") or 0),
-            int(shipment.get("priority_rank") or shipment.get("priority") or 0),
+            str(shipment.destination_iata),
+            int(shipment.equivalent_units or 0),
+            int(shipment.carton_count or 0),
+            int(shipment.priority_rank or shipment.priority or 0),
             tuple(ordered_compatibility.get(shipment_id, [])),
         )
         grouped_shipment_ids[group_key].append(shipment_id)
@@ -533,7 +481,7 @@ def _canonicalize_legacy_equal_weight_assignments(
         if not selected_assignments or len(selected_assignments) == len(shipment_ids):
             continue
         if not any(
-            _shipment_has_legacy_tie_break_metadata(shipment_by_id[shipment_id])
+            shipment_by_id[shipment_id].has_legacy_tie_break_metadata
             for shipment_id in shipment_ids
         ):
             continue
@@ -545,51 +493,55 @@ def _canonicalize_legacy_equal_weight_assignments(
         )
         preferred_shipments = sorted(
             (shipment_by_id[shipment_id] for shipment_id in preferred_shipment_ids),
-            key=_shipment_legacy_assignment_key,
+            key=lambda shipment: shipment.legacy_assignment_key,
         )
         ordered_slots = sorted(
             selected_assignments,
             key=lambda assignment: (
-                _flight_datetime_key(flight_by_id[assignment["flight_snapshot_id"]]),
+                flight_by_id[assignment["flight_snapshot_id"]].departure_key,
                 str(assignment.get("reference") or ""),
                 int(assignment.get("shipment_snapshot_id") or 0),
             ),
         )
         for slot, shipment in zip(ordered_slots, preferred_shipments):
-            slot["shipment_snapshot_id"] = shipment["snapshot_id"]
-            slot["assigned_carton_count"] = shipment["carton_count"]
-            slot["equivalent_units"] = shipment["equivalent_units"]
-            slot["priority"] = shipment["priority"]
-            slot["priority_rank"] = shipment.get("priority_rank", shipment["priority"])
-            slot["reference"] = shipment.get("reference") or ""
+            slot["shipment_snapshot_id"] = shipment.snapshot_id
+            slot["assigned_carton_count"] = shipment.carton_count
+            slot["equivalent_units"] = shipment.equivalent_units
+            slot["priority"] = shipment.priority
+            slot["priority_rank"] = shipment.priority_rank
+            slot["reference"] = shipment.reference
 
     return canonicalized
 
 
-def _build_candidates(payload: dict, compatibility: dict[int, list[tuple[int, int]]]) -> list[dict]:
-    shipment_by_id = {
-        shipment["snapshot_id"]: shipment for shipment in payload.get("shipments", [])
+def _assignment_candidate(
+    shipment: ShipmentRecord, flight: FlightRecord, volunteer_id: int
+) -> dict:
+    return {
+        "shipment_snapshot_id": shipment.snapshot_id,
+        "flight_snapshot_id": flight.snapshot_id,
+        "volunteer_snapshot_id": volunteer_id,
+        "assigned_carton_count": shipment.carton_count,
+        "equivalent_units": shipment.equivalent_units,
+        "priority": shipment.priority,
+        "priority_rank": shipment.priority_rank,
+        "route_pos": flight.route_pos,
+        "physical_flight_key": flight.physical_key,
+        "reference": shipment.reference,
+        "departure_date": flight.departure_date,
     }
-    flight_by_id = {flight["snapshot_id"]: flight for flight in payload.get("flights", [])}
+
+
+def _build_candidates(
+    payload: dict | PlanningPayload, compatibility: dict[int, list[tuple[int, int]]]
+) -> list[dict]:
+    model = PlanningPayload.coerce(payload)
     candidates = []
     for shipment_id, pairs in compatibility.items():
-        shipment = shipment_by_id[shipment_id]
+        shipment = model.shipment_by_id[shipment_id]
         for flight_id, volunteer_id in pairs:
-            flight = flight_by_id[flight_id]
             candidates.append(
-                {
-                    "shipment_snapshot_id": shipment_id,
-                    "flight_snapshot_id": flight_id,
-                    "volunteer_snapshot_id": volunteer_id,
-                    "assigned_carton_count": shipment["carton_count"],
-                    "equivalent_units": shipment["equivalent_units"],
-                    "priority": shipment["priority"],
-                    "priority_rank": shipment.get("priority_rank", shipment["priority"]),
-                    "route_pos": int(flight.get("route_pos") or 1),
-                    "physical_flight_key": flight.get("physical_flight_key") or str(flight_id),
-                    "reference": shipment.get("reference") or "",
-                    "departure_date": flight.get("departure_date") or "",
-                }
+                _assignment_candidate(shipment, model.flight_by_id[flight_id], volunteer_id)
             )
     candidates_by_physical_key = defaultdict(list)
     for candidate in candidates:
@@ -600,27 +552,30 @@ def _build_candidates(payload: dict, compatibility: dict[int, list[tuple[int, in
         if not physical_key:
             filtered_candidates.extend(physical_candidates)
             continue
-        min_route_pos = min(int(item.get("route_pos") or 1) for item in physical_candidates)
+        min_route_pos = min(item["route_pos"] for item in physical_candidates)
         filtered_candidates.extend(
-            item for item in physical_candidates if int(item.get("route_pos") or 1) == min_route_pos
+            item for item in physical_candidates if item["route_pos"] == min_route_pos
         )
     return filtered_candidates
 
 
 def _solve_candidates(
     *,
-    payload: dict,
+    payload: dict | PlanningPayload,
     compatibility: dict[int, list[tuple[int, int]]],
     candidates: list[dict],
+    solver_options: dict | None = None,
+    timings: dict | None = None,
 ) -> tuple[list[dict], dict]:
     del candidates
-    diagnostics = build_solver_diagnostics(payload)
+    planning = PlanningPayload.coerce(payload)
+    diagnostics = build_solver_diagnostics(planning)
     diagnostics_by_flight_id = {item["flight_snapshot_id"]: item for item in diagnostics}
 
-    if cp_model is None:
+    if not cp_model:
         raise RuntimeError("ortools is required to solve planning runs.")
 
-    ordered_compatibility = _order_compatibility_pairs(payload, compatibility)
+    ordered_compatibility = _order_compatibility_pairs(planning, compatibility)
     candidate_count = sum(len(pairs) for pairs in ordered_compatibility.values())
     for pairs in ordered_compatibility.values():
         for flight_id, _ in pairs:
@@ -628,9 +583,9 @@ def _solve_candidates(
 
     if candidate_count == 0:
         result = summarize_solver_result(
-            payload=payload,
+            payload=planning,
             assignments=[],
-            unassigned=[shipment["snapshot_id"] for shipment in payload.get("shipments", [])],
+            unassigned=[shipment.snapshot_id for shipment in planning.shipments],
             compatibility=compatibility,
             solver_name="ortools_cp_sat_v1",
         )
@@ -639,7 +594,7 @@ def _solve_candidates(
                 "status": "OPTIMAL",
                 "assigned_shipment_snapshot_ids": [],
                 "vols_diagnostics": diagnostics,
-                "nb_vols_total": len(payload.get("flights", [])),
+                "nb_vols_total": len(planning.flights),
                 "nb_vols_sans_be_compatible": sum(
                     1 for item in diagnostics if item["shipment_compat_count"] == 0
                 ),
@@ -660,25 +615,19 @@ def _solve_candidates(
         )
         return [], result
 
+    build_started = perf_counter()
     model = cp_model.CpModel()
-    shipment_by_id = {
-        shipment["snapshot_id"]: shipment for shipment in payload.get("shipments", [])
-    }
-    flight_by_id = {flight["snapshot_id"]: flight for flight in payload.get("flights", [])}
-    volunteer_by_id = {
-        volunteer["snapshot_id"]: volunteer for volunteer in payload.get("volunteers", [])
-    }
-    flight_order = {
-        flight["snapshot_id"]: index
-        for index, flight in enumerate(payload.get("flights", []), start=1)
-    }
+    shipment_by_id = planning.shipment_by_id
+    flight_by_id = planning.flight_by_id
+    volunteer_by_id = planning.volunteer_by_id
+    flight_order = {flight.snapshot_id: flight.index + 1 for flight in planning.flights}
     shipment_flights = defaultdict(list)
     volunteer_flights = defaultdict(list)
     volunteers_by_shipment_flight = defaultdict(list)
     shipments_by_volunteer_flight = defaultdict(list)
 
-    for shipment in payload.get("shipments", []):
-        shipment_id = shipment["snapshot_id"]
+    for shipment in planning.shipments:
+        shipment_id = shipment.snapshot_id
         seen_flights = set()
         for flight_id, volunteer_id in ordered_compatibility.get(shipment_id, []):
             if flight_id not in seen_flights:
@@ -693,8 +642,8 @@ def _solve_candidates(
     x_vars = {}
     x_by_shipment = defaultdict(list)
     x_by_flight = defaultdict(list)
-    for shipment in payload.get("shipments", []):
-        shipment_id = shipment["snapshot_id"]
+    for shipment in planning.shipments:
+        shipment_id = shipment.snapshot_id
         for flight_id in shipment_flights.get(shipment_id, []):
             var = model.NewBoolVar(f"x_{shipment_id}_{flight_id}")
             x_vars[(shipment_id, flight_id)] = var
@@ -704,8 +653,8 @@ def _solve_candidates(
     y_vars = {}
     y_by_flight = defaultdict(list)
     y_by_volunteer = defaultdict(list)
-    for volunteer in payload.get("volunteers", []):
-        volunteer_id = volunteer["snapshot_id"]
+    for volunteer in planning.volunteers:
+        volunteer_id = volunteer.snapshot_id
         for flight_id in volunteer_flights.get(volunteer_id, []):
             var = model.NewBoolVar(f"y_{volunteer_id}_{flight_id}")
             y_vars[(volunteer_id, flight_id)] = var
@@ -716,8 +665,8 @@ def _solve_candidates(
     z_by_flight = defaultdict(list)
     z_by_shipment_flight = defaultdict(list)
     z_by_volunteer_flight = defaultdict(list)
-    for shipment in payload.get("shipments", []):
-        shipment_id = shipment["snapshot_id"]
+    for shipment in planning.shipments:
+        shipment_id = shipment.snapshot_id
         for flight_id in shipment_flights.get(shipment_id, []):
             for volunteer_id in volunteers_by_shipment_flight.get((shipment_id, flight_id), []):
                 var = model.NewBoolVar(f"z_{shipment_id}_{volunteer_id}_{flight_id}")
@@ -727,25 +676,25 @@ def _solve_candidates(
                 z_by_volunteer_flight[(volunteer_id, flight_id)].append((shipment_id, var))
 
     flight_used_vars = {
-        flight["snapshot_id"]: model.NewBoolVar(f"flight_used_{flight['snapshot_id']}")
-        for flight in payload.get("flights", [])
+        flight.snapshot_id: model.NewBoolVar(f"flight_used_{flight.snapshot_id}")
+        for flight in planning.flights
     }
     nb_be_vars = {
-        flight["snapshot_id"]: model.NewIntVar(
-            0, LEGACY_MAX_BE_PER_FLIGHT, f"nb_be_{flight['snapshot_id']}"
+        flight.snapshot_id: model.NewIntVar(
+            0, LEGACY_MAX_BE_PER_FLIGHT, f"nb_be_{flight.snapshot_id}"
         )
-        for flight in payload.get("flights", [])
+        for flight in planning.flights
     }
     charge_vars = {
-        flight["snapshot_id"]: model.NewIntVar(0, 10_000, f"charge_{flight['snapshot_id']}")
-        for flight in payload.get("flights", [])
+        flight.snapshot_id: model.NewIntVar(0, 10_000, f"charge_{flight.snapshot_id}")
+        for flight in planning.flights
     }
 
     for shipment_vars in x_by_shipment.values():
         model.Add(sum(shipment_vars) <= 1)
 
-    for flight in payload.get("flights", []):
-        flight_id = flight["snapshot_id"]
+    for flight in planning.flights:
+        flight_id = flight.snapshot_id
         flight_used = flight_used_vars[flight_id]
         shipment_vars = x_by_flight.get(flight_id, [])
         volunteer_vars = y_by_flight.get(flight_id, [])
@@ -758,21 +707,18 @@ def _solve_candidates(
             model.Add(
                 charge_vars[flight_id]
                 == sum(
-                    int(shipment_by_id[shipment_id]["equivalent_units"])
-                    * x_vars[(shipment_id, flight_id)]
+                    shipment_by_id[shipment_id].equivalent_units * x_vars[(shipment_id, flight_id)]
                     for shipment_id in shipment_flights
                     if (shipment_id, flight_id) in x_vars
                 )
             )
-            capacity_units = flight.get("capacity_units")
-            if capacity_units is not None:
-                model.Add(charge_vars[flight_id] <= int(capacity_units))
-            max_cartons_per_flight = flight.get("max_cartons_per_flight")
+            if flight.capacity_units is not None:
+                model.Add(charge_vars[flight_id] <= int(flight.capacity_units))
+            max_cartons_per_flight = flight.max_cartons_per_flight
             if max_cartons_per_flight is not None:
                 model.Add(
                     sum(
-                        int(shipment_by_id[shipment_id]["carton_count"])
-                        * x_vars[(shipment_id, flight_id)]
+                        shipment_by_id[shipment_id].carton_count * x_vars[(shipment_id, flight_id)]
                         for shipment_id in shipment_flights
                         if (shipment_id, flight_id) in x_vars
                     )
@@ -806,22 +752,20 @@ def _solve_candidates(
             for z_var in z_vars_for_pair:
                 model.Add(z_var <= y_var)
             model.Add(sum(z_vars_for_pair) >= y_var)
-            volunteer_equiv_capacity = volunteer_by_id[volunteer_id].get("max_colis_vol")
-            if volunteer_equiv_capacity is None:
-                volunteer_equiv_capacity = LEGACY_EQUIV_CAPACITY_PER_VOLUNTEER
+            volunteer_equiv_capacity = volunteer_by_id[volunteer_id].capacity
             model.Add(
                 sum(
-                    int(shipment_by_id[shipment_id]["equivalent_units"]) * z_var
+                    shipment_by_id[shipment_id].equivalent_units * z_var
                     for shipment_id, z_var in z_items
                 )
-                <= int(volunteer_equiv_capacity) * y_var
+                <= volunteer_equiv_capacity * y_var
             )
         else:
             model.Add(y_var == 0)
 
     grouped_by_volunteer_and_physical = defaultdict(list)
     for (volunteer_id, flight_id), y_var in y_vars.items():
-        physical_key = flight_by_id[flight_id].get("physical_flight_key") or str(flight_id)
+        physical_key = flight_by_id[flight_id].physical_key
         grouped_by_volunteer_and_physical[(volunteer_id, physical_key)].append(y_var)
     for y_list in grouped_by_volunteer_and_physical.values():
         if len(y_list) > 1:
@@ -830,33 +774,30 @@ def _solve_candidates(
     for volunteer_id, entries in y_by_volunteer.items():
         ordered_entries = sorted(
             entries,
-            key=lambda item: _flight_datetime_key(flight_by_id[item[0]]),
+            key=lambda item: flight_by_id[item[0]].departure_key,
         )
         for index, (flight_id_a, var_a) in enumerate(ordered_entries):
-            dt_a = _flight_datetime_key(flight_by_id[flight_id_a])
+            dt_a = flight_by_id[flight_id_a].departure_key
             for flight_id_b, var_b in ordered_entries[index + 1 :]:
-                dt_b = _flight_datetime_key(flight_by_id[flight_id_b])
+                dt_b = flight_by_id[flight_id_b].departure_key
                 if abs((dt_b - dt_a).total_seconds()) < LEGACY_MIN_HOURS_BETWEEN_FLIGHTS * 3600:
                     model.Add(var_a + var_b <= 1)
 
     flights_by_destination = defaultdict(list)
-    for flight in payload.get("flights", []):
-        flights_by_destination[str(flight.get("destination_iata") or "")].append(
-            flight["snapshot_id"]
-        )
+    for flight in planning.flights:
+        flights_by_destination[str(flight.destination_iata)].append(flight.snapshot_id)
     for destination_iata, flight_ids in flights_by_destination.items():
-        rule = payload.get("destination_rules_by_iata", {}).get(destination_iata, {})
-        weekly_frequency = _coerce_int(rule.get("weekly_frequency"))
+        rule = planning.destination_rules_by_iata.get(destination_iata, {})
+        weekly_frequency = coerce_int(rule.get("weekly_frequency"))
         if weekly_frequency and weekly_frequency > 0:
             model.Add(
                 sum(flight_used_vars[flight_id] for flight_id in flight_ids) <= weekly_frequency
             )
 
     grouped_by_physical_flight = defaultdict(list)
-    for flight in payload.get("flights", []):
-        physical_key = flight.get("physical_flight_key") or ""
-        if physical_key:
-            grouped_by_physical_flight[physical_key].append(flight["snapshot_id"])
+    for flight in planning.flights:
+        if flight.physical_flight_key:
+            grouped_by_physical_flight[flight.physical_flight_key].append(flight.snapshot_id)
 
     for flight_ids in grouped_by_physical_flight.values():
         if len(flight_ids) > 1:
@@ -868,11 +809,9 @@ def _solve_candidates(
         ]
         if len(candidate_flights) < 2:
             continue
-        min_route_pos = min(
-            int(flight_by_id[flight_id].get("route_pos") or 1) for flight_id in candidate_flights
-        )
+        min_route_pos = min(flight_by_id[flight_id].route_pos for flight_id in candidate_flights)
         for flight_id in candidate_flights:
-            if int(flight_by_id[flight_id].get("route_pos") or 1) <= min_route_pos:
+            if flight_by_id[flight_id].route_pos <= min_route_pos:
                 continue
             model.Add(flight_used_vars[flight_id] == 0)
             for var in x_by_flight.get(flight_id, []):
@@ -883,13 +822,13 @@ def _solve_candidates(
                 model.Add(var == 0)
 
     weighted_expr = sum(
-        _shipment_weight(shipment_by_id[shipment_id]) * x_var
+        shipment_by_id[shipment_id].weight * x_var
         for (shipment_id, _flight_id), x_var in x_vars.items()
     )
     mission_vars = {}
     volunteer_availability_weights = {}
-    for volunteer in payload.get("volunteers", []):
-        volunteer_id = volunteer["snapshot_id"]
+    for volunteer in planning.volunteers:
+        volunteer_id = volunteer.snapshot_id
         entries = y_by_volunteer.get(volunteer_id, [])
         max_missions = len(entries)
         mission_var = model.NewIntVar(0, max_missions, f"missions_{volunteer_id}")
@@ -900,26 +839,33 @@ def _solve_candidates(
             model.Add(mission_var == 0)
         volunteer_availability_weights[volunteer_id] = max(
             1,
-            _volunteer_availability_minutes(volunteer),
+            volunteer.availability_minutes,
         )
 
     solver = cp_model.CpSolver()
-    configure_cp_solver(solver)
+    configure_cp_solver(solver, **(solver_options or {}))
+    _record_timing(timings, "model_build", build_started)
+
+    def _solve():
+        solve_started = perf_counter()
+        solve_status = solver.Solve(model)
+        _record_timing(timings, "cp_sat_solve", solve_started)
+        return solve_status
 
     model.Maximize(weighted_expr)
-    status = solver.Solve(model)
+    status = _solve()
     if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
         raise RuntimeError("Planning solver found no feasible solution.")
     model.Add(weighted_expr >= int(round(solver.ObjectiveValue())))
 
     model.Minimize(sum(flight_used_vars.values()))
-    status = solver.Solve(model)
+    status = _solve()
     if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
         raise RuntimeError("Planning solver failed during flight minimization.")
     model.Add(sum(flight_used_vars.values()) <= int(round(solver.ObjectiveValue())))
 
     model.Minimize(sum(y_vars.values()))
-    status = solver.Solve(model)
+    status = _solve()
     if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
         raise RuntimeError("Planning solver failed during volunteer minimization.")
     model.Add(sum(y_vars.values()) <= int(round(solver.ObjectiveValue())))
@@ -934,7 +880,7 @@ def _solve_candidates(
         excess_vars.append(excess)
     if excess_vars:
         model.Minimize(sum(excess_vars))
-        status = solver.Solve(model)
+        status = _solve()
         if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
             raise RuntimeError("Planning solver failed during excess mission minimization.")
         model.Add(sum(excess_vars) <= int(round(solver.ObjectiveValue())))
@@ -944,7 +890,7 @@ def _solve_candidates(
         for (shipment_id, flight_id), x_var in x_vars.items()
     )
     model.Maximize(compatibility_option_expr)
-    status = solver.Solve(model)
+    status = _solve()
     if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
         raise RuntimeError("Planning solver failed during compatibility option maximization.")
     model.Add(compatibility_option_expr >= int(round(solver.ObjectiveValue())))
@@ -955,7 +901,7 @@ def _solve_candidates(
     ]
     if weighted_availability_terms:
         model.Minimize(sum(weighted_availability_terms))
-        status = solver.Solve(model)
+        status = _solve()
         if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
             raise RuntimeError("Planning solver failed during availability minimization.")
 
@@ -963,42 +909,32 @@ def _solve_candidates(
         flight_order[flight_id] * x_var for (_shipment_id, flight_id), x_var in x_vars.items()
     )
     model.Minimize(chronological_assignment_expr)
-    status = solver.Solve(model)
+    status = _solve()
     if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
         raise RuntimeError("Planning solver failed during chronological tie-break.")
     model.Add(chronological_assignment_expr <= int(round(solver.ObjectiveValue())))
 
     model.Minimize(sum(flight_used_vars.values()))
-    status = solver.Solve(model)
+    status = _solve()
     status_name = solver.StatusName(status)
 
     selected = []
     for (shipment_id, volunteer_id, flight_id), z_var in z_vars.items():
         if solver.Value(z_var) != 1:
             continue
-        shipment = shipment_by_id[shipment_id]
-        flight = flight_by_id[flight_id]
         selected.append(
-            {
-                "shipment_snapshot_id": shipment_id,
-                "flight_snapshot_id": flight_id,
-                "volunteer_snapshot_id": volunteer_id,
-                "assigned_carton_count": shipment["carton_count"],
-                "equivalent_units": shipment["equivalent_units"],
-                "priority": shipment["priority"],
-                "priority_rank": shipment.get("priority_rank", shipment["priority"]),
-                "route_pos": int(flight.get("route_pos") or 1),
-                "physical_flight_key": flight.get("physical_flight_key") or str(flight_id),
-                "reference": shipment.get("reference") or "",
-                "departure_date": flight.get("departure_date") or "",
-            }
+            _assignment_candidate(
+                shipment_by_id[shipment_id], flight_by_id[flight_id], volunteer_id
+            )
         )
+    post_processing_started = perf_counter()
     selected = _canonicalize_legacy_equal_weight_assignments(
         selected,
-        payload=payload,
+        payload=planning,
         compatibility=compatibility,
     )
-    selected = _rebalance_assignments_by_flight(selected, payload, compatibility)
+    selected = _rebalance_assignments_by_flight(selected, planning, compatibility)
+    _record_timing(timings, "post_processing", post_processing_started)
     selected.sort(
         key=lambda item: (
             str(item.get("departure_date") or ""),
@@ -1010,12 +946,12 @@ def _solve_candidates(
     for candidate in selected:
         diagnostics_by_flight_id[candidate["flight_snapshot_id"]]["used"] = True
     result = summarize_solver_result(
-        payload=payload,
+        payload=planning,
         assignments=selected,
         unassigned=[
-            shipment["snapshot_id"]
-            for shipment in payload.get("shipments", [])
-            if shipment["snapshot_id"] not in assigned_shipment_ids
+            shipment.snapshot_id
+            for shipment in planning.shipments
+            if shipment.snapshot_id not in assigned_shipment_ids
         ],
         compatibility=compatibility,
         solver_name="ortools_cp_sat_v1",
@@ -1025,7 +961,7 @@ def _solve_candidates(
             "status": status_name,
             "assigned_shipment_snapshot_ids": assigned_shipment_ids,
             "vols_diagnostics": list(diagnostics_by_flight_id.values()),
-            "nb_vols_total": len(payload.get("flights", [])),
+            "nb_vols_total": len(planning.flights),
             "nb_vols_sans_be_compatible": sum(
                 1 for item in diagnostics if item["shipment_compat_count"] == 0
             ),
@@ -1051,25 +987,12 @@ def _solve_candidates(
     return selected, result
 
 
-@transaction.atomic
-def solve_run(run):
-    if run.status != PlanningRunStatus.READY:
-        raise ValueError("Planning run must be ready before solving.")
-
-    run.status = PlanningRunStatus.SOLVING
-    run.save(update_fields=["status", "updated_at"])
-
-    payload = compile_run_solver_payload(run)
-    compatibility = compute_compatibility(payload)
-    assignments, solver_result = _solve_candidates(
-        payload=payload,
-        compatibility=compatibility,
-        candidates=_build_candidates(payload, compatibility),
-    )
-    snapshots = materialize_solver_snapshots(run)
+def create_solver_version(run, assignments, *, snapshots=None, change_reason=""):
+    snapshots = snapshots or materialize_solver_snapshots(run)
     version = PlanningVersion.objects.create(
         run=run,
         created_by=run.created_by,
+        change_reason=change_reason,
     )
 
     for sequence, item in enumerate(assignments, start=1):
@@ -1082,6 +1005,26 @@ def solve_run(run):
             source=PlanningAssignmentSource.SOLVER,
             sequence=sequence,
         )
+    return version
+
+
+@transaction.atomic
+def solve_run(run):
+    if run.status != PlanningRunStatus.READY:
+        raise ValueError("Planning run must be ready before solving.")
+
+    run.status = PlanningRunStatus.SOLVING
+    run.save(update_fields=["status", "updated_at"])
+
+    payload = compile_run_solver_payload(run)
+    planning = PlanningPayload.from_dict(payload)
+    compatibility = compute_compatibility(planning)
+    assignments, solver_result = _solve_candidates(
+        payload=planning,
+        compatibility=compatibility,
+        candidates=_build_candidates(planning, compatibility),
+    )
+    version = create_solver_version(run, assignments)
 
     run.solver_payload = payload
     run.solver_result = solver_result
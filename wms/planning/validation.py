@@ -1,17 +1,21 @@
 from wms.models import PlanningIssue, PlanningIssueSeverity
 
 
-def get_destination_rule_map(run):
-    if run.parameter_set_id is None:
-        return {}
+def get_parameter_set_rule_map(parameter_set):
     return {
         rule.destination_id: rule
-        for rule in run.parameter_set.destination_rules.filter(is_active=True).select_related(
+        for rule in parameter_set.destination_rules.filter(is_active=True).select_related(
             "destination"
         )
     }
 
 
+def get_destination_rule_map(run):
+    if run.parameter_set_id is None:
+        return {}
+    return get_parameter_set_rule_map(run.parameter_set)
+
+
 def create_issue(
     *,
     run,
@@ -9,6 +9,11 @@ urlpatterns = [
     path("runs/new/", views_planning.planning_run_create, name="run_create"),
     path("runs/<int:run_id>/", views_planning.planning_run_detail, name="run_detail"),
     path("runs/<int:run_id>/solve/", views_planning.planning_run_solve, name="run_solve"),
+    path(
+        "runs/<int:run_id>/scenarios/",
+        views_planning.planning_run_scenarios,
+        name="run_scenarios",
+    ),
     path(
         "versions/<int:version_id>/",
         views_planning.planning_version_detail,
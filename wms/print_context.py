@@ -12,6 +12,7 @@ from .documents import (
     resolve_carton_item_expires_on,
 )
 from .models import CartonFormat, CartonItem, RackColor
+from .qr_codes import product_qr_data_uri, shipment_qr_data_uri
 from .scan_helpers import (
     build_product_group_key,
     build_product_label,
@@ -355,11 +356,11 @@ def build_carton_picking_context(carton):
     }
 
 
-def build_label_context(shipment, *, position, total):
+def build_label_context(shipment, *, position, total, request=None):
     city, iata, _label = _build_destination_info(shipment)
     label_city = (city or shipment.destination_address or "").upper()
     label_iata = (iata or "").upper()
-    label_qr_url = shipment.qr_code_image.url if shipment.qr_code_image else ""
+    label_qr_url = shipment_qr_data_uri(shipment, request=request)
     return {
         "label_city": label_city,
         "label_iata": label_iata,
@@ -543,11 +544,11 @@ def build_sample_product_label_context():
     }
 
 
-def build_product_qr_label_context(product):
+def build_product_qr_label_context(product, *, qr_url=None):
     return {
         "product_name": product.name,
         "product_brand": product.brand,
-        "product_qr_url": product.qr_code_image.url if product.qr_code_image else "",
+        "product_qr_url": product_qr_data_uri(product) if qr_url is None else qr_url,
     }
 
 
@@ -5,9 +5,9 @@ from pathlib import Path
 from django.conf import settings
 from django.core.files.base import ContentFile
 from django.utils import timezone
-from openpyxl import load_workbook
 
 from .documents import resolve_carton_item_expires_on
+from .lazy_imports import lazy_attribute
 from .models import (
     GeneratedPrintArtifact,
     GeneratedPrintArtifactItem,
@@ -19,6 +19,8 @@ from .print_pack_excel import fill_workbook_cells
 from .print_pack_graph import convert_excel_to_pdf_via_graph
 from .print_pack_pdf import merge_pdf_documents
 
+load_workbook = lazy_attribute("openpyxl", "load_workbook")
+
 
 class PrintPackEngineError(RuntimeError):
     """Raised when pack generation cannot be completed."""
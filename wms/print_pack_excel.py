@@ -1,8 +1,9 @@
 from copy import copy
 from datetime import date, datetime
 
-from openpyxl.cell.cell import MergedCell
-from openpyxl.utils.cell import coordinate_from_string
+from .lazy_imports import lazy_attribute
+
+coordinate_from_string = lazy_attribute("openpyxl.utils.cell", "coordinate_from_string")
 
 
 class PrintPackMappingError(ValueError):
@@ -54,6 +55,8 @@ def _iter_repeating_values(payload, source_key):
 
 
 def _resolve_target_cell(worksheet, cell_ref):
+    from openpyxl.cell.cell import MergedCell
+
     cell = worksheet[cell_ref]
     if isinstance(cell, MergedCell):
         for merged_range in worksheet.merged_cells.ranges:
@@ -145,6 +148,8 @@ def _display_length(value):
 
 
 def autosize_workbook_columns(workbook, *, min_width=8, max_width=80, padding=2):
+    from openpyxl.cell.cell import MergedCell
+
     safe_min = max(1, int(min_width or 1))
     safe_max = max(safe_min, int(max_width or safe_min))
     safe_padding = max(0, int(padding or 0))
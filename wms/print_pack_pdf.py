@@ -1,10 +1,9 @@
 from io import BytesIO
 
-try:
-    from pypdf import PdfReader, PdfWriter
-except ImportError:  # pragma: no cover - optional dependency at runtime
-    PdfReader = None
-    PdfWriter = None
+from .lazy_imports import lazy_attribute
+
+PdfReader = lazy_attribute("pypdf", "PdfReader")
+PdfWriter = lazy_attribute("pypdf", "PdfWriter")
 
 
 class PrintPackPdfError(RuntimeError):
@@ -14,7 +13,7 @@ class PrintPackPdfError(RuntimeError):
 def merge_pdf_documents(pdf_list):
     if not pdf_list:
         raise PrintPackPdfError("No PDF documents were provided for merge.")
-    if PdfReader is None or PdfWriter is None:
+    if not PdfReader or not PdfWriter:
         raise PrintPackPdfError("pypdf is required to merge PDF documents.")
 
     writer = PdfWriter()
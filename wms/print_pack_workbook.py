@@ -1,6 +1,9 @@
 from functools import lru_cache
 
-from openpyxl.utils.cell import coordinate_from_string, get_column_letter
+from .lazy_imports import lazy_attribute
+
+coordinate_from_string = lazy_attribute("openpyxl.utils.cell", "coordinate_from_string")
+get_column_letter = lazy_attribute("openpyxl.utils.cell", "get_column_letter")
 
 
 @lru_cache(maxsize=1)
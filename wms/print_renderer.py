@@ -1,7 +1,12 @@
+import copy
+import hashlib
 import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 
 from django.template import Context, Template
-from django.template.loader import render_to_string
+from django.template.loader import get_template, render_to_string
 from django.utils.html import format_html
 
 from .models import PrintTemplate
@@ -60,12 +65,31 @@ BLOCK_STYLE_TEMPLATES = {
     "product_qr_label": "print/blocks/product_qr_label.html",
 }
 
+CONTACTS_ROW_TEMPLATE = "print/blocks/contacts_row.html"
+TABLE_ITEMS_TEMPLATE = "print/blocks/table_items.html"
+COMPILED_LAYOUT_CACHE_SIZE = 64
+
+_compiled_layouts = OrderedDict()
+_compiled_layouts_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class CompiledLayout:
+    blocks: tuple
+    templates: tuple
+
 
 def _render_template_string(value, context):
     template = Template(value or "")
     return template.render(Context(context))
 
 
+def _render_named_template(template_name, payload, template=None):
+    if template is None:
+        return render_to_string(template_name, payload)
+    return template.render(payload)
+
+
 def _build_style(style):
     if not style:
         return ""
@@ -103,28 +127,32 @@ def _normalize_text_tag(tag):
     return TEXT_DEFAULT_TAG
 
 
-def _render_text_block(block, context):
+def _render_text_block(block, context, template=None):
     tag = _normalize_text_tag(block.get("tag"))
-    text = _render_template_string(block.get("text", ""), context)
+    if template is None:
+        text = _render_template_string(block.get("text", ""), context)
+    else:
+        text = template.render(Context(context))
     style = _build_style(block.get("style", {}))
     return format_html('<{tag} style="{style}">{text}</{tag}>', tag=tag, style=style, text=text)
 
 
-def _render_simple_template_block(block_type, context):
+def _render_simple_template_block(block_type, context, template=None):
     template_name = SIMPLE_CONTEXT_BLOCK_TEMPLATES[block_type]
-    return render_to_string(template_name, context)
+    return _render_named_template(template_name, context, template)
 
 
-def _render_block_context_template(block_type, block, context):
+def _render_block_context_template(block_type, block, context, template=None):
     template_name = BLOCK_CONTEXT_TEMPLATES[block_type]
-    return render_to_string(template_name, {"block": block, **context})
+    return _render_named_template(template_name, {"block": block, **context}, template)
 
 
-def _render_block_style_template(block_type, block, context):
+def _render_block_style_template(block_type, block, context, template=None):
     template_name = BLOCK_STYLE_TEMPLATES[block_type]
-    return render_to_string(
+    return _render_named_template(
         template_name,
         {"block": block, "style": block.get("style", {}), **context},
+        template,
     )
 
 
@@ -142,42 +170,70 @@ def _build_contacts_row_payload(block, context):
     }
 
 
-def _render_contacts_row_block(block, context):
-    return render_to_string(
-        "print/blocks/contacts_row.html",
+def _render_contacts_row_block(block, context, template=None):
+    return _render_named_template(
+        CONTACTS_ROW_TEMPLATE,
         _build_contacts_row_payload(block, context),
+        template,
     )
 
 
-def _render_table_items_block(block, context):
+def _render_table_items_block(block, context, template=None):
     context_for_block = dict(context)
     if block.get("mode") == "aggregate":
         aggregate_rows = context.get("aggregate_rows")
         if aggregate_rows is not None:
             context_for_block["item_rows"] = aggregate_rows
-    return render_to_string(
-        "print/blocks/table_items.html",
+    return _render_named_template(
+        TABLE_ITEMS_TEMPLATE,
         {"block": block, **context_for_block},
+        template,
     )
 
 
-def _render_block(block, context):
+def _render_block(block, context, template=None):
     block_type = block.get("type")
     if block_type == "text":
-        return _render_text_block(block, context)
+        return _render_text_block(block, context, template)
     if block_type in SIMPLE_CONTEXT_BLOCK_TEMPLATES:
-        return _render_simple_template_block(block_type, context)
+        return _render_simple_template_block(block_type, context, template)
     if block_type == "contacts_row":
-        return _render_contacts_row_block(block, context)
+        return _render_contacts_row_block(block, context, template)
     if block_type in BLOCK_CONTEXT_TEMPLATES:
-        return _render_block_context_template(block_type, block, context)
+        return _render_block_context_template(block_type, block, context, template)
     if block_type == "table_items":
-        return _render_table_items_block(block, context)
+        return _render_table_items_block(block, context, template)
     if block_type in BLOCK_STYLE_TEMPLATES:
-        return _render_block_style_template(block_type, block, context)
+        return _render_block_style_template(block_type, block, context, template)
     return ""
 
 
+def _block_template_name(block_type):
+    if block_type in SIMPLE_CONTEXT_BLOCK_TEMPLATES:
+        return SIMPLE_CONTEXT_BLOCK_TEMPLATES[block_type]
+    if block_type == "contacts_row":
+        return CONTACTS_ROW_TEMPLATE
+    if block_type in BLOCK_CONTEXT_TEMPLATES:
+        return BLOCK_CONTEXT_TEMPLATES[block_type]
+    if block_type == "table_items":
+        return TABLE_ITEMS_TEMPLATE
+    return BLOCK_STYLE_TEMPLATES.get(block_type)
+
+
+def _compile_block(block):
+    if block.get("type") == "text":
+        return Template(block.get("text", "") or "")
+    template_name = _block_template_name(block.get("type"))
+    if template_name is None:
+        return None
+    return get_template(template_name)
+
+
+def _layout_cache_key(layout):
+    encoded = json.dumps(layout, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
 def _normalize_layout(layout):
     if not isinstance(layout, dict):
         return dict(EMPTY_LAYOUT)
@@ -205,16 +261,46 @@ def resolve_layout(doc_type):
     return _normalize_layout(layout)
 
 
-def render_layout_from_layout(layout, context):
+def compile_layout(layout):
+    """Return the layout with every block template parsed once, cached by layout content."""
     layout = _normalize_layout(layout)
+    cache_key = _layout_cache_key(layout)
+    with _compiled_layouts_lock:
+        compiled = _compiled_layouts.get(cache_key)
+        if compiled is not None:
+            _compiled_layouts.move_to_end(cache_key)
+            return compiled
+
+    blocks = tuple(copy.deepcopy(layout["blocks"]))
+    compiled = CompiledLayout(
+        blocks=blocks,
+        templates=tuple(_compile_block(block) for block in blocks),
+    )
+    with _compiled_layouts_lock:
+        _compiled_layouts[cache_key] = compiled
+        while len(_compiled_layouts) > COMPILED_LAYOUT_CACHE_SIZE:
+            _compiled_layouts.popitem(last=False)
+    return compiled
+
+
+def clear_compiled_layout_cache():
+    with _compiled_layouts_lock:
+        _compiled_layouts.clear()
+
+
+def render_compiled_layout(compiled, context):
     rendered = []
-    for block in layout["blocks"]:
-        rendered_block = _render_block(block, context)
+    for block, template in zip(compiled.blocks, compiled.templates, strict=True):
+        rendered_block = _render_block(block, context, template)
         if rendered_block:
             rendered.append(rendered_block)
     return rendered
 
 
+def render_layout_from_layout(layout, context):
+    return render_compiled_layout(compile_layout(layout), context)
+
+
 def render_layout(doc_type, context):
     layout = resolve_layout(doc_type)
     return render_layout_from_layout(layout, context)
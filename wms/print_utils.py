@@ -1,4 +1,4 @@
-from .print_renderer import render_layout_from_layout
+from .print_renderer import compile_layout, render_compiled_layout
 
 
 def chunked(items, size):
@@ -16,9 +16,10 @@ def extract_block_style(layout, block_type):
 
 
 def build_label_pages(layout, contexts, block_type="product_label", labels_per_page=4):
+    compiled_layout = compile_layout(layout)
     labels = []
     for context in contexts:
-        blocks = render_layout_from_layout(layout, context)
+        blocks = render_compiled_layout(compiled_layout, context)
         labels.append({"blocks": blocks})
     pages = chunked(labels, labels_per_page)
     page_style = extract_block_style(layout, block_type)
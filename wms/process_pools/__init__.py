@@ -0,0 +1,32 @@
+"""Process pools for CPU-bound work, and the worker entry points they run.
+
+Workers started with the ``spawn``/``forkserver`` methods import the submitted
+function's module before Django is configured. The worker modules in this package
+therefore import nothing from Django or the models at module level, and call
+``ensure_django_ready`` before touching the ORM.
+"""
+
+import multiprocessing
+import os
+
+
+def can_use_process_pool(*, max_workers: int, task_count: int, min_tasks: int = 2) -> bool:
+    """Whether ``task_count`` tasks should be spread over a pool of ``max_workers``.
+
+    Daemonic processes (prefork task workers, parallel test runners) cannot start
+    children, so they always run the tasks in-process.
+    """
+    return (
+        max_workers > 1 and task_count >= min_tasks and not multiprocessing.current_process().daemon
+    )
+
+
+def ensure_django_ready():
+    from django.apps import apps
+
+    if apps.ready:
+        return
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "asf_wms.settings")
+    django.setup()
@@ -0,0 +1,121 @@
+"""Process-pool entry point for BE workbook sheet parsing.
+
+Each worker opens its own read-only workbook and returns plain row tuples.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+from ..lazy_imports import lazy_attribute
+
+load_workbook = lazy_attribute("openpyxl", "load_workbook")
+
+
+class BeSheetRow(NamedTuple):
+    donor_name: str
+    transporter_name: str
+    volunteer_name: str
+    shipper_name: str
+    shipper_country: str
+    shipper_title: str
+    shipper_first_name: str
+    shipper_last_name: str
+    recipient_name: str
+    recipient_status: str
+    recipient_title: str
+    recipient_first_name: str
+    recipient_last_name: str
+    destination_city: str
+    destination_iata: str
+    correspondent_name: str
+    correspondent_country: str
+
+
+def normalize_text(value) -> str:
+    return str(value or "").strip()
+
+
+def normalize_display_name(value) -> str:
+    text = normalize_text(value)
+    if not text:
+        return ""
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def normalize_iata(value) -> str:
+    return normalize_text(value).upper()
+
+
+def _iter_sheet_rows(sheet):
+    rows = sheet.iter_rows(values_only=True)
+    headers = next(rows, ())
+    header_map: dict[str, list[int]] = {}
+    for index, header in enumerate(headers or ()):
+        key = normalize_text(header)
+        if not key:
+            continue
+        header_map.setdefault(key, []).append(index)
+    for row in rows:
+        if not any(normalize_text(value) for value in row):
+            continue
+        yield row, header_map
+
+
+def _get_cell(row, header_map, name: str) -> str:
+    for index in header_map.get(name, []):
+        value = normalize_text(row[index])
+        if value:
+            return value
+    return ""
+
+
+def extract_be_row(row, header_map) -> BeSheetRow:
+    return BeSheetRow(
+        donor_name=normalize_display_name(_get_cell(row, header_map, "BE_DONATEUR")),
+        transporter_name=normalize_display_name(_get_cell(row, header_map, "BE_TRANSPORTEUR")),
+        volunteer_name=normalize_display_name(
+            _get_cell(row, header_map, "BE_MISE_A_BORD_RESPONSABLE")
+        ),
+        shipper_name=normalize_display_name(_get_cell(row, header_map, "ASSOCIATION_NOM")),
+        shipper_country=normalize_display_name(_get_cell(row, header_map, "ASSOCIATION_PAYS")),
+        shipper_title=_get_cell(row, header_map, "ASSOCIATION_PRESIDENT_TITRE"),
+        shipper_first_name=_get_cell(row, header_map, "ASSOCIATION_PRESIDENT_PRENOM"),
+        shipper_last_name=_get_cell(row, header_map, "ASSOCIATION_PRESIDENT_NOM"),
+        recipient_name=normalize_display_name(_get_cell(row, header_map, "DESTINATAIRE_STRUCTURE")),
+        recipient_status=normalize_display_name(_get_cell(row, header_map, "DESTINATAIRE_STATUT")),
+        recipient_title=_get_cell(row, header_map, "DESTINATAIRE_STRUCTURE_REPRESENTANT_TITRE"),
+        recipient_first_name=_get_cell(
+            row, header_map, "DESTINATAIRE_STRUCTURE_REPRESENTANT_PRENOM"
+        ),
+        recipient_last_name=_get_cell(row, header_map, "DESTINATAIRE_STRUCTURE_REPRESENTANT_NOM"),
+        destination_city=normalize_display_name(_get_cell(row, header_map, "BE_DESTINATION")),
+        destination_iata=normalize_iata(_get_cell(row, header_map, "BE_CODE_IATA")),
+        correspondent_name=normalize_display_name(
+            " ".join(
+                part
+                for part in (
+                    _get_cell(row, header_map, "CORRESPONDANT_PRENOM"),
+                    _get_cell(row, header_map, "CORRESPONDANT_NOM"),
+                )
+                if part
+            )
+        ),
+        correspondent_country=normalize_display_name(
+            _get_cell(row, header_map, "CORRESPONDANT_PAYS")
+        ),
+    )
+
+
+def read_sheet_rows(sheet) -> list[BeSheetRow]:
+    return [extract_be_row(row, header_map) for row, header_map in _iter_sheet_rows(sheet)]
+
+
+def read_be_sheet(path: str, sheet_name: str) -> list[BeSheetRow]:
+    workbook = load_workbook(Path(path), read_only=True, data_only=True)
+    try:
+        return read_sheet_rows(workbook[sheet_name])
+    finally:
+        workbook.close()
@@ -0,0 +1,40 @@
+"""Process-pool entry point for planning scenario variants."""
+
+from time import perf_counter
+
+from . import ensure_django_ready
+
+
+def solve_scenario_payload(payload, solver_options=None):
+    ensure_django_ready()
+    from wms.planning.payload_model import PlanningPayload
+    from wms.planning.rules import compute_compatibility
+    from wms.planning.solver import _build_candidates, _solve_candidates
+
+    started = perf_counter()
+    timings = {}
+    try:
+        planning = PlanningPayload.from_dict(payload)
+        compatibility = compute_compatibility(planning)
+        assignments, result = _solve_candidates(
+            payload=planning,
+            compatibility=compatibility,
+            candidates=_build_candidates(planning, compatibility),
+            solver_options=solver_options,
+            timings=timings,
+        )
+    except RuntimeError as exc:
+        return {
+            "assignments": [],
+            "result": {},
+            "error": str(exc),
+            "elapsed_seconds": perf_counter() - started,
+            "timings": timings,
+        }
+    return {
+        "assignments": assignments,
+        "result": result,
+        "error": "",
+        "elapsed_seconds": perf_counter() - started,
+        "timings": timings,
+    }
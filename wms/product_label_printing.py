@@ -5,6 +5,7 @@ from .print_context import build_product_label_context, build_product_qr_label_c
 from .print_layouts import DEFAULT_LAYOUTS
 from .print_renderer import get_template_layout
 from .print_utils import build_label_pages, extract_block_style
+from .qr_codes import product_qr_payload, qr_code_data_uris
 
 
 def _ordered_products(products):
@@ -61,10 +62,7 @@ def render_product_labels_response(request, products):
 
 def render_product_qr_labels_response(request, products):
     products_list = _ordered_products(products)
-    for product in products_list:
-        if not product.qr_code_image:
-            product.generate_qr_code()
-            product.save(update_fields=["qr_code_image"])
+    qr_urls = qr_code_data_uris(product_qr_payload(product) for product in products_list)
 
     layout_override = get_template_layout("product_qr")
     layout = layout_override or DEFAULT_LAYOUTS.get("product_qr", {"blocks": []})
@@ -75,7 +73,13 @@ def render_product_qr_labels_response(request, products):
     except (TypeError, ValueError):
         rows, cols = 5, 3
     labels_per_page = max(1, rows * cols)
-    contexts = [build_product_qr_label_context(product) for product in products_list]
+    contexts = [
+        build_product_qr_label_context(
+            product,
+            qr_url=qr_urls.get(product_qr_payload(product), ""),
+        )
+        for product in products_list
+    ]
     pages, page_style = build_label_pages(
         layout,
         contexts,
@@ -0,0 +1,162 @@
+"""On-demand QR code rendering with a content-addressed cache.
+
+QR images are derived from a payload (product SKU, shipment tracking URL) at render
+time instead of being written as media files on model save. Rendered bytes are
+cached in memory and on disk under the SHA-256 of the format and payload. A disk
+hit refreshes the file's mtime, so ``prune_qr_code_cache`` can drop the files no
+page has used for a while (``purge_qr_code_images --apply`` runs it).
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import os
+import time
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+
+from django.conf import settings
+
+from .lazy_imports import lazy_attribute, lazy_module
+
+# qrcode pulls in Pillow; only pay for it when a QR code is actually rendered.
+qrcode = lazy_module("qrcode")
+SvgPathImage = lazy_attribute("qrcode.image.svg", "SvgPathImage")
+
+QR_CODE_FORMATS = {
+    "svg": "image/svg+xml",
+    "png": "image/png",
+}
+QR_CODE_DEFAULT_FORMAT = "svg"
+QR_CODE_MEMORY_CACHE_SIZE = 2048
+QR_CODE_CACHE_DIRNAME = "qr_cache"
+QR_CODE_CACHE_MAX_AGE_DAYS = 30
+
+
+def qr_code_cache_dir() -> Path:
+    configured = getattr(settings, "QR_CODE_CACHE_DIR", "")
+    if configured:
+        return Path(configured)
+    return Path(settings.MEDIA_ROOT) / QR_CODE_CACHE_DIRNAME
+
+
+def qr_code_cache_key(payload: str, fmt: str) -> str:
+    return hashlib.sha256(f"{fmt}\n{payload}".encode()).hexdigest()
+
+
+def _cache_path(payload: str, fmt: str) -> Path:
+    key = qr_code_cache_key(payload, fmt)
+    return qr_code_cache_dir() / key[:2] / f"{key}.{fmt}"
+
+
+def _render(payload: str, fmt: str) -> bytes:
+    qr = qrcode.QRCode(border=2)
+    qr.add_data(payload)
+    qr.make(fit=True)
+    buffer = BytesIO()
+    if fmt == "svg":
+        # qrcode checks ``issubclass`` on the factory, so hand it the real class.
+        qr.make_image(image_factory=SvgPathImage.resolve()).save(buffer)
+    else:
+        qr.make_image(fill_color="black", back_color="white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _write_cache_file(path: Path, content: bytes) -> None:
+    # The disk cache is best effort: a read-only media volume only loses the reuse.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(content)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+
+def _touch_cache_file(path: Path) -> None:
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def iter_stale_qr_code_files(*, max_age_days: int = QR_CODE_CACHE_MAX_AGE_DAYS):
+    """Yield the cached QR files not rendered or read for ``max_age_days``."""
+    cache_dir = qr_code_cache_dir()
+    if not cache_dir.is_dir():
+        return
+    cutoff = time.time() - max_age_days * 86400
+    for fmt in QR_CODE_FORMATS:
+        for path in cache_dir.glob(f"*/*.{fmt}"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    yield path
+            except OSError:
+                continue
+
+
+def prune_qr_code_cache(*, max_age_days: int = QR_CODE_CACHE_MAX_AGE_DAYS) -> int:
+    """Delete the stale cached QR files and return how many were removed."""
+    removed = 0
+    for path in iter_stale_qr_code_files(max_age_days=max_age_days):
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        removed += 1
+    return removed
+
+
+@lru_cache(maxsize=QR_CODE_MEMORY_CACHE_SIZE)
+def render_qr_code(payload: str, fmt: str = QR_CODE_DEFAULT_FORMAT) -> bytes:
+    if fmt not in QR_CODE_FORMATS:
+        raise ValueError(f"Unsupported QR code format: {fmt}")
+    path = _cache_path(payload, fmt)
+    try:
+        content = path.read_bytes()
+    except OSError:
+        pass
+    else:
+        _touch_cache_file(path)
+        return content
+    content = _render(payload, fmt)
+    _write_cache_file(path, content)
+    return content
+
+
+def render_qr_codes(payloads, fmt: str = QR_CODE_DEFAULT_FORMAT) -> dict[str, bytes]:
+    """Render every distinct non-empty payload once, e.g. for a label sheet."""
+    return {payload: render_qr_code(payload, fmt) for payload in dict.fromkeys(payloads) if payload}
+
+
+def qr_code_data_uri(payload: str, fmt: str = QR_CODE_DEFAULT_FORMAT) -> str:
+    if not payload:
+        return ""
+    encoded = base64.b64encode(render_qr_code(payload, fmt)).decode("ascii")
+    return f"data:{QR_CODE_FORMATS[fmt]};base64,{encoded}"
+
+
+def qr_code_data_uris(payloads, fmt: str = QR_CODE_DEFAULT_FORMAT) -> dict[str, str]:
+    return {payload: qr_code_data_uri(payload, fmt) for payload in render_qr_codes(payloads, fmt)}
+
+
+def product_qr_payload(product) -> str:
+    return product.sku or ""
+
+
+def shipment_qr_payload(shipment, *, request=None) -> str:
+    return shipment.get_tracking_url(request=request)
+
+
+def product_qr_data_uri(product, fmt: str = QR_CODE_DEFAULT_FORMAT) -> str:
+    return qr_code_data_uri(product_qr_payload(product), fmt)
+
+
+def shipment_qr_data_uri(shipment, *, request=None, fmt: str = QR_CODE_DEFAULT_FORMAT) -> str:
+    return qr_code_data_uri(shipment_qr_payload(shipment, request=request), fmt)
+
+
+def clear_qr_code_memory_cache() -> None:
+    render_qr_code.cache_clear()
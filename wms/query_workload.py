@@ -0,0 +1,101 @@
+"""Capture the SQL workload of a test or benchmark run.
+
+Statements are normalized (literals and ``IN`` lists folded into placeholders) so
+the same query shape issued with different parameters is aggregated into one
+entry with its call count and timings. The report drives the composite indexes
+declared on the hot models.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from time import perf_counter
+
+from django.db import connections
+from django.utils import timezone
+
+QUERY_WORKLOAD_FORMAT_VERSION = 1
+QUERY_WORKLOAD_DEFAULT_LIMIT = 50
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"(?<![\w.\"`])-?\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:\s*(?:%s|\?)\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    normalized = _STRING_LITERAL_RE.sub("?", sql)
+    normalized = _NUMBER_LITERAL_RE.sub("?", normalized)
+    normalized = normalized.replace("%s", "?")
+    normalized = _IN_LIST_RE.sub("IN (...)", normalized)
+    return _WHITESPACE_RE.sub(" ", normalized).strip()
+
+
+class QueryWorkload:
+    def __init__(self):
+        self.entries: dict[str, dict] = {}
+
+    def record(self, sql: str, seconds: float) -> None:
+        key = normalize_sql(sql)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = {"sql": key, "count": 0, "total_ms": 0.0, "max_ms": 0.0}
+        elapsed_ms = seconds * 1000
+        entry["count"] += 1
+        entry["total_ms"] += elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record(sql, perf_counter() - started)
+
+    @property
+    def query_count(self) -> int:
+        return sum(entry["count"] for entry in self.entries.values())
+
+    def top(self, limit: int = QUERY_WORKLOAD_DEFAULT_LIMIT) -> list[dict]:
+        ranked = sorted(self.entries.values(), key=lambda entry: entry["total_ms"], reverse=True)
+        return [
+            {
+                **entry,
+                "total_ms": round(entry["total_ms"], 3),
+                "max_ms": round(entry["max_ms"], 3),
+                "mean_ms": round(entry["total_ms"] / entry["count"], 3),
+            }
+            for entry in ranked[:limit]
+        ]
+
+    def report(self, *, label: str, limit: int = QUERY_WORKLOAD_DEFAULT_LIMIT) -> dict:
+        return {
+            "format_version": QUERY_WORKLOAD_FORMAT_VERSION,
+            "workload": label,
+            "generated_at": timezone.now().isoformat(),
+            "queries": self.query_count,
+            "distinct_queries": len(self.entries),
+            "top": self.top(limit),
+        }
+
+    def render_report(self, *, label: str, limit: int = QUERY_WORKLOAD_DEFAULT_LIMIT) -> str:
+        return json.dumps(self.report(label=label, limit=limit), indent=2, sort_keys=True)
+
+    def write_report(self, path, *, label: str, limit: int = QUERY_WORKLOAD_DEFAULT_LIMIT) -> str:
+        rendered = self.render_report(label=label, limit=limit)
+        Path(path).write_text(f"{rendered}\n", encoding="utf-8")
+        return rendered
+
+
+@contextmanager
+def capture_query_workload(*, using=None):
+    """Record every statement run on ``using`` (default: all connections) in the block."""
+    workload = QueryWorkload()
+    aliases = [using] if using else list(connections)
+    with ExitStack() as stack:
+        for alias in aliases:
+            stack.enter_context(connections[alias].execute_wrapper(workload))
+        yield workload
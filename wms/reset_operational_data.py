@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
+from time import perf_counter
 
 from django.apps import apps
 from django.db import connection, transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, pre_delete
+from django.utils import timezone
+
+from .models import OperationalResetCheckpoint
+from .shipment_party_registry import clear_shipment_party_graph_cache
 
 KEEP_MODEL_LABELS = frozenset(
     {
@@ -33,6 +42,11 @@ KEEP_MODEL_LABELS = frozenset(
     }
 )
 
+# Reset engine bookkeeping: neither preserved nor deleted by the reset itself.
+ENGINE_STATE_MODEL_LABELS = frozenset({"wms.OperationalResetCheckpoint"})
+
+DEFAULT_RESET_CHUNK_SIZE = 5000
+
 DELETE_BATCHES = (
     (
         "audit_and_generated_history",
@@ -60,6 +74,7 @@ DELETE_BATCHES = (
             "wms.PlanningRun",
             "wms.Flight",
             "wms.FlightSourceBatch",
+            "wms.FlightScheduleDay",
         ),
     ),
     (
@@ -84,6 +99,8 @@ DELETE_BATCHES = (
             "wms.ShipmentTrackingEvent",
             "wms.CartonStatusEvent",
             "wms.CartonItem",
+            "wms.StockCheckpointLine",
+            "wms.StockCheckpoint",
             "wms.StockMovement",
             "wms.ProductLot",
             "wms.Carton",
@@ -156,6 +173,20 @@ DELETE_BATCHES = (
 )
 
 
+@dataclass(frozen=True)
+class ResetTableStats:
+    label: str
+    strategy: str
+    deleted: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.seconds <= 0:
+            return float(self.deleted)
+        return self.deleted / self.seconds
+
+
 @dataclass(frozen=True)
 class ResetOperationalDataSummary:
     mode: str
@@ -164,6 +195,7 @@ class ResetOperationalDataSummary:
     keep_counts_before: dict[str, int]
     keep_counts_after: dict[str, int]
     missing_table_labels: tuple[str, ...] = ()
+    table_stats: tuple[ResetTableStats, ...] = ()
 
 
 def render_reset_summary(
@@ -179,6 +211,13 @@ def render_reset_summary(
         lines.append("Skipped missing tables:")
         for label in summary.missing_table_labels:
             lines.append(f"- {label}")
+    if summary.table_stats:
+        lines.append("Delete throughput:")
+        for stats in summary.table_stats:
+            lines.append(
+                f"- {stats.label}: {stats.deleted} row(s) in {stats.seconds:.3f}s "
+                f"({stats.rows_per_second:.0f} rows/s, {stats.strategy})"
+            )
     return lines
 
 
@@ -229,7 +268,7 @@ def _validate_configuration():
     if duplicates:
         raise ValueError(f"Models configured to both keep and delete: {sorted(duplicates)}")
 
-    configured_labels = set(KEEP_MODEL_LABELS).union(delete_labels)
+    configured_labels = set(KEEP_MODEL_LABELS).union(delete_labels, ENGINE_STATE_MODEL_LABELS)
     missing_labels = sorted(known_labels - configured_labels)
     extra_labels = sorted(configured_labels - known_labels)
     if missing_labels:
@@ -238,8 +277,140 @@ def _validate_configuration():
         raise ValueError(f"Reset configuration references unknown model labels: {extra_labels}")
 
 
-def reset_operational_data(*, apply: bool) -> ResetOperationalDataSummary:
+def _incoming_relation_labels(labels: tuple[str, ...]) -> dict[str, set[str]]:
+    incoming: dict[str, set[str]] = {label: set() for label in labels}
+    for model in apps.get_models(include_auto_created=True):
+        for field in model._meta.concrete_fields:
+            if not field.is_relation or field.related_model is None:
+                continue
+            target_label = field.related_model._meta.concrete_model._meta.label
+            if target_label in incoming:
+                incoming[target_label].add(model._meta.label)
+    return incoming
+
+
+def _delete_plan(labels: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Order labels so referencing tables are emptied first, and pick a strategy.
+
+    Ties keep the ``DELETE_BATCHES`` order. A table is deleted with raw SQL only
+    when every foreign key pointing at it comes from a table emptied earlier in the
+    plan; self references, preserved referrers and cycles go through the collector.
+    """
+    incoming = _incoming_relation_labels(labels)
+    position = {label: index for index, label in enumerate(labels)}
+    remaining = set(labels)
+    order: list[str] = []
+    while remaining:
+        ready = [
+            label
+            for label in remaining
+            if not any(source in remaining for source in incoming[label] if source != label)
+        ]
+        label = min(ready or remaining, key=position.__getitem__)
+        order.append(label)
+        remaining.discard(label)
+
+    plan = []
+    emptied: set[str] = set()
+    for label in order:
+        strategy = "raw" if incoming[label] <= emptied else "orm"
+        plan.append((label, strategy))
+        emptied.add(label)
+    return tuple(plan)
+
+
+@contextmanager
+def _muted_delete_signals() -> Iterator[None]:
+    # Per-row receivers (change bumps, contact notes) are pointless when whole
+    # tables go away; the reset is an offline command, so muting is process-wide.
+    saved_receivers = {signal: signal.receivers for signal in (pre_delete, post_delete)}
+    try:
+        for signal in saved_receivers:
+            signal.receivers = []
+            signal.sender_receivers_cache.clear()
+        yield
+    finally:
+        for signal, receivers in saved_receivers.items():
+            signal.receivers = receivers
+            signal.sender_receivers_cache.clear()
+
+
+def _delete_label_in_chunks(
+    label: str,
+    *,
+    strategy: str,
+    chunk_size: int,
+    keep_labels=KEEP_MODEL_LABELS,
+) -> ResetTableStats:
+    model = _resolve_model(label)
+    manager = model._base_manager
+    checkpoint, _created = OperationalResetCheckpoint.objects.get_or_create(model_label=label)
+    cursor = checkpoint.last_pk
+    deleted = 0
+    started = perf_counter()
+    while True:
+        pending = manager.all() if cursor is None else manager.filter(pk__gt=cursor)
+        boundary = next(
+            iter(pending.order_by("pk").values_list("pk", flat=True)[chunk_size - 1 : chunk_size]),
+            None,
+        )
+        chunk = pending if boundary is None else pending.filter(pk__lte=boundary)
+        with transaction.atomic():
+            if strategy == "raw":
+                count = chunk._raw_delete(chunk.db)
+            else:
+                deleted_by_label = chunk.delete()[1]
+                count = deleted_by_label.get(label, 0)
+                # Raised inside the chunk transaction: a cascade into preserved rows is
+                # rolled back instead of being reported after the fact.
+                for cascaded_label, cascaded in sorted(deleted_by_label.items()):
+                    if cascaded and cascaded_label in keep_labels:
+                        raise ValueError(
+                            f"Preserved model {cascaded_label} changed during reset "
+                            f"(deleting {label} cascades to {cascaded} row(s))"
+                        )
+            if boundary is None:
+                remaining = manager.count()
+                if remaining:
+                    raise ValueError(f"Model {label} still has {remaining} row(s) after reset")
+            checkpoint_updates = {"deleted_rows": F("deleted_rows") + count}
+            if boundary is None:
+                checkpoint_updates["completed_at"] = timezone.now()
+            else:
+                checkpoint_updates["last_pk"] = boundary
+            OperationalResetCheckpoint.objects.filter(pk=checkpoint.pk).update(**checkpoint_updates)
+        deleted += count
+        if boundary is None:
+            break
+        cursor = boundary
+    return ResetTableStats(
+        label=label,
+        strategy=strategy,
+        deleted=deleted,
+        seconds=round(perf_counter() - started, 6),
+    )
+
+
+def reset_operational_data(
+    *,
+    apply: bool,
+    chunk_size: int = DEFAULT_RESET_CHUNK_SIZE,
+    restart: bool = False,
+) -> ResetOperationalDataSummary:
+    """Report or apply the operational reset.
+
+    Applying deletes table by table in primary-key chunks, each committed with its
+    ``OperationalResetCheckpoint`` row, so an interrupted reset resumes where it
+    stopped on the next run unless ``restart`` discards the checkpoints.
+
+    A chunk cascading into a preserved model, or a table still holding rows after
+    its last chunk, is rolled back before commit. The row counts compared once all
+    tables are done only detect problems: the chunks are already committed, so the
+    checkpoints are kept for a resumed run.
+    """
     _validate_configuration()
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
 
     delete_labels, missing_delete_labels = _existing_table_labels(_delete_model_labels())
     keep_labels, missing_keep_labels = _existing_table_labels(KEEP_MODEL_LABELS)
@@ -257,31 +428,42 @@ def reset_operational_data(*, apply: bool) -> ResetOperationalDataSummary:
             missing_table_labels=missing_table_labels,
         )
 
-    with transaction.atomic():
-        for _batch_name, batch_labels in DELETE_BATCHES:
-            for label in batch_labels:
-                if label not in delete_labels:
-                    continue
-                _resolve_model(label)._default_manager.all().delete()
-
-        keep_counts_after = _count_labels(keep_labels)
-        delete_counts_after = _count_labels(delete_labels)
-
-        for label, count in delete_counts_after.items():
-            if count != 0:
-                raise ValueError(f"Model {label} still has {count} row(s) after reset")
-        for label, before in keep_counts_before.items():
-            after = keep_counts_after[label]
-            if after != before:
-                raise ValueError(
-                    f"Preserved model {label} changed during reset ({before} -> {after})"
+    if restart:
+        OperationalResetCheckpoint.objects.all().delete()
+    table_stats = []
+    with _muted_delete_signals():
+        for label, strategy in _delete_plan(delete_labels):
+            table_stats.append(
+                _delete_label_in_chunks(
+                    label, strategy=strategy, chunk_size=chunk_size, keep_labels=keep_labels
                 )
+            )
+    clear_shipment_party_graph_cache()
 
-        return ResetOperationalDataSummary(
-            mode="APPLY",
-            delete_counts_before=delete_counts_before,
-            delete_counts_after=delete_counts_after,
-            keep_counts_before=keep_counts_before,
-            keep_counts_after=keep_counts_after,
-            missing_table_labels=missing_table_labels,
-        )
+    keep_counts_after = _count_labels(keep_labels)
+    delete_counts_after = _count_labels(delete_labels)
+
+    for label, count in delete_counts_after.items():
+        if count != 0:
+            raise ValueError(
+                f"Model {label} still has {count} row(s) after reset "
+                "(deleted chunks are already committed)"
+            )
+    for label, before in keep_counts_before.items():
+        after = keep_counts_after[label]
+        if after != before:
+            raise ValueError(
+                f"Preserved model {label} changed during reset ({before} -> {after}; "
+                "deleted chunks are already committed)"
+            )
+
+    OperationalResetCheckpoint.objects.all().delete()
+    return ResetOperationalDataSummary(
+        mode="APPLY",
+        delete_counts_before=delete_counts_before,
+        delete_counts_after=delete_counts_after,
+        keep_counts_before=keep_counts_before,
+        keep_counts_after=keep_counts_after,
+        missing_table_labels=missing_table_labels,
+        table_stats=tuple(table_stats),
+    )
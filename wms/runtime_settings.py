@@ -36,6 +36,8 @@ class PlanningFlightApiConfig:
     origin_iata: str
     operating_airline_code: str
     time_origin_type: str
+    cache_max_age_seconds: int = 6 * 3600
+    max_concurrency: int = 4
 
 
 def _fallback_runtime_config() -> RuntimeConfig:
@@ -154,4 +156,14 @@ def get_planning_flight_api_config() -> PlanningFlightApiConfig:
         time_origin_type=(getattr(settings, "PLANNING_FLIGHT_API_TIME_ORIGIN_TYPE", "P") or "P")
         .strip()
         .upper(),
+        cache_max_age_seconds=_safe_int(
+            getattr(settings, "PLANNING_FLIGHT_API_CACHE_MAX_AGE_SECONDS", 6 * 3600),
+            default=6 * 3600,
+            minimum=0,
+        ),
+        max_concurrency=_safe_int(
+            getattr(settings, "PLANNING_FLIGHT_API_MAX_CONCURRENCY", 4),
+            default=4,
+            minimum=1,
+        ),
     )
@@ -34,17 +34,9 @@ def build_available_cartons():
     cartons = (
         Carton.objects.filter(status=CartonStatus.PACKED, shipment__isnull=True)
         .select_related("preassigned_destination")
-        .prefetch_related("cartonitem_set__product_lot__product")
         .order_by("code")
     )
-    options = []
-    for carton in cartons:
-        weight_total = 0
-        for item in carton.cartonitem_set.all():
-            product_weight = item.product_lot.product.weight_g or 0
-            weight_total += product_weight * item.quantity
-        options.append(_build_carton_option(carton, weight_total=weight_total))
-    return options
+    return [_build_carton_option(carton, weight_total=carton.total_weight_g) for carton in cartons]
 
 
 def build_carton_formats():
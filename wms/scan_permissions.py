@@ -4,6 +4,7 @@ PREPARATEUR_ALLOWED_SCAN_VIEWS = frozenset(
         "scan_root",
         "scan_pack",
         "scan_sync",
+        "scan_sync_wait",
     }
 )
 
@@ -8,6 +8,7 @@ urlpatterns = [
     path("", views.scan_root, name="scan_root"),
     path("dashboard/", views.scan_dashboard, name="scan_dashboard"),
     path("stock/", views.scan_stock, name="scan_stock"),
+    path("stock/history/", views.scan_stock_history, name="scan_stock_history"),
     path("kits/", views.scan_kits_view, name="scan_kits_view"),
     path(
         "helper/install/",
@@ -143,5 +144,6 @@ urlpatterns = [
     path("admin/design/", views.scan_admin_design, name="scan_admin_design"),
     path("out/", views.scan_out, name="scan_out"),
     path("sync/", views.scan_sync, name="scan_sync"),
+    path("sync/wait/", views.scan_sync_wait, name="scan_sync_wait"),
     path("service-worker.js", views.scan_service_worker, name="scan_service_worker"),
 ]
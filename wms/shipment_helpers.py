@@ -18,8 +18,13 @@ from .models import (
 )
 from .scan_helpers import parse_int, resolve_product
 from .shipment_party_registry import (
+    active_link_authorizations,
     eligible_shippers_for_stopover,
+    get_shipment_party_graph,
+    is_correspondent_contact_of,
     stopover_correspondent_recipient_organization,
+    validated_active_shipment_recipient_link_queryset,
+    validated_active_shipment_shipper_queryset,
 )
 from .shipment_party_rules import normalize_party_contact_to_org
 
@@ -33,37 +38,6 @@ def _is_priority_shipper_name(name):
     return (name or "").strip().casefold() == "aviation sans frontieres"
 
 
-def _validated_active_shipper_queryset():
-    return ShipmentShipper.objects.filter(
-        is_active=True,
-        validation_status=ShipmentValidationStatus.VALIDATED,
-        organization__is_active=True,
-        default_contact__is_active=True,
-    ).select_related("organization", "default_contact", "default_contact__organization")
-
-
-def _validated_active_recipient_link_queryset():
-    return ShipmentShipperRecipientLink.objects.filter(
-        is_active=True,
-        shipper__is_active=True,
-        shipper__validation_status=ShipmentValidationStatus.VALIDATED,
-        shipper__organization__is_active=True,
-        shipper__default_contact__is_active=True,
-        recipient_organization__is_active=True,
-        recipient_organization__validation_status=ShipmentValidationStatus.VALIDATED,
-        recipient_organization__organization__is_active=True,
-        recipient_organization__destination__is_active=True,
-    ).select_related(
-        "shipper",
-        "shipper__organization",
-        "shipper__default_contact",
-        "shipper__default_contact__organization",
-        "recipient_organization",
-        "recipient_organization__organization",
-        "recipient_organization__destination",
-    )
-
-
 def eligible_shipment_shipper_contacts_for_destination(destination):
     if destination is None or not destination.is_active:
         return Contact.objects.none()
@@ -77,7 +51,7 @@ def eligible_shipment_shipper_contacts_for_destination(destination):
 
 
 def active_shipment_shipper_organizations():
-    organization_ids = _validated_active_shipper_queryset().values_list(
+    organization_ids = validated_active_shipment_shipper_queryset().values_list(
         "organization_id", flat=True
     )
     return Contact.objects.filter(
@@ -90,7 +64,7 @@ def shipment_shipper_from_contact(contact):
     if contact is None or not getattr(contact, "pk", None) or not contact.is_active:
         return None
 
-    queryset = _validated_active_shipper_queryset()
+    queryset = validated_active_shipment_shipper_queryset()
     shipper = queryset.filter(default_contact=contact).first()
     if shipper is not None:
         return shipper
@@ -103,11 +77,11 @@ def eligible_shipment_recipient_links_for_shipper(*, shipper, destination):
     if shipper is None or destination is None or not destination.is_active:
         return ShipmentShipperRecipientLink.objects.none()
 
-    shipper_is_valid = _validated_active_shipper_queryset().filter(pk=shipper.pk).exists()
+    shipper_is_valid = validated_active_shipment_shipper_queryset().filter(pk=shipper.pk).exists()
     if not shipper_is_valid:
         return ShipmentShipperRecipientLink.objects.none()
 
-    return _validated_active_recipient_link_queryset().filter(
+    return validated_active_shipment_recipient_link_queryset().filter(
         shipper=shipper,
         recipient_organization__destination=destination,
     )
@@ -195,13 +169,7 @@ def shipment_correspondent_contact_for_destination(destination):
             .select_related("organization")
             .first()
         )
-    if correspondent_contact is None or not correspondent_contact.is_active:
-        return None
-
-    correspondent_organization = normalize_party_contact_to_org(correspondent_contact)
-    if correspondent_organization is None:
-        return None
-    if correspondent_organization.id != recipient_organization.organization_id:
+    if not is_correspondent_contact_of(correspondent_contact, recipient_organization):
         return None
     return correspondent_contact
 
@@ -213,19 +181,12 @@ def build_destination_label(destination):
 
 
 def build_shipment_contact_payload():
-    destinations = list(
-        Destination.objects.filter(is_active=True)
-        .select_related("correspondent_contact")
-        .order_by("city", "iata_code", "id")
-    )
+    graph = get_shipment_party_graph()
+    destinations = graph.destinations
     active_destination_ids = [destination.id for destination in destinations]
-    shippers = list(_validated_active_shipper_queryset())
-    recipient_links = list(
-        _validated_active_recipient_link_queryset().prefetch_related(
-            "authorized_recipient_contacts__recipient_contact__contact",
-            "authorized_recipient_contacts__recipient_contact__recipient_organization__organization__addresses",
-        )
-    )
+    shippers = graph.shippers
+    recipient_links = graph.recipient_links
+    correspondent_contacts = graph.correspondent_contact_by_destination_id
 
     destinations_json = [
         {
@@ -235,13 +196,18 @@ def build_shipment_contact_payload():
             "iata_code": destination.iata_code,
             "country": destination.country,
             "correspondent_contact_id": (
-                shipment_correspondent_contact_for_destination(destination).id
-                if shipment_correspondent_contact_for_destination(destination)
+                correspondent_contacts[destination.id].id
+                if destination.id in correspondent_contacts
                 else None
             ),
         }
         for destination in destinations
     ]
+    destination_ids_by_shipper_id = {}
+    for link in recipient_links:
+        destination_ids_by_shipper_id.setdefault(link.shipper_id, set()).add(
+            link.recipient_organization.destination_id
+        )
     shipper_contacts_json = []
     for shipper in shippers:
         contact = shipper.default_contact
@@ -250,13 +216,7 @@ def build_shipment_contact_payload():
         if shipper.can_send_to_all:
             allowed_destination_ids = list(active_destination_ids)
         else:
-            allowed_destination_ids = sorted(
-                {
-                    link.recipient_organization.destination_id
-                    for link in recipient_links
-                    if link.shipper_id == shipper.id
-                }
-            )
+            allowed_destination_ids = sorted(destination_ids_by_shipper_id.get(shipper.id, ()))
         shipper_contacts_json.append(
             {
                 "id": contact.id,
@@ -274,18 +234,9 @@ def build_shipment_contact_payload():
 
     recipient_entries_by_contact_id = {}
     for link in recipient_links:
-        authorized_links = getattr(link, "authorized_recipient_contacts", None)
-        if authorized_links is None:
-            continue
-        for authorization in authorized_links.all():
-            if not authorization.is_active:
-                continue
+        for authorization in active_link_authorizations(link):
             recipient_contact = authorization.recipient_contact
-            if recipient_contact is None or not recipient_contact.is_active:
-                continue
-            contact = getattr(recipient_contact, "contact", None)
-            if contact is None or not contact.is_active:
-                continue
+            contact = recipient_contact.contact
             organization = getattr(recipient_contact.recipient_organization, "organization", None)
             address_source = (
                 organization.get_effective_addresses()
@@ -350,7 +301,7 @@ def build_shipment_contact_payload():
     correspondent_recipient_labels_by_contact = {}
     correspondent_contacts_by_id = {}
     for destination in destinations:
-        correspondent_contact = shipment_correspondent_contact_for_destination(destination)
+        correspondent_contact = correspondent_contacts.get(destination.id)
         if correspondent_contact is None:
             continue
         correspondent_destination_ids_by_contact.setdefault(correspondent_contact.id, set()).add(
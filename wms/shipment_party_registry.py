@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import threading
+from dataclasses import dataclass
+
 from django.db.models import Q, QuerySet
 
+from contacts.models import ContactType
+
 from .models import (
+    Destination,
     ShipmentAuthorizedRecipientContact,
     ShipmentRecipientContact,
     ShipmentRecipientOrganization,
     ShipmentShipper,
+    ShipmentShipperRecipientLink,
     ShipmentValidationStatus,
+    WmsChange,
 )
 
+_party_graph_entry = {}
+_party_graph_lock = threading.Lock()
+
 
 def _validated_active_shippers() -> QuerySet[ShipmentShipper]:
     return ShipmentShipper.objects.filter(
@@ -116,20 +127,198 @@ def default_recipient_contact_for_link(link) -> ShipmentRecipientContact | None:
     return authorized.recipient_contact if authorized else None
 
 
+def stopover_correspondent_recipient_organizations(
+    destinations,
+) -> dict[int, ShipmentRecipientOrganization]:
+    """Map each active destination id to its correspondent organization, in one query."""
+    destination_ids = [
+        destination.id
+        for destination in destinations
+        if destination is not None and destination.is_active
+    ]
+    if not destination_ids:
+        return {}
+
+    recipient_organizations = {}
+    for recipient_organization in ShipmentRecipientOrganization.objects.filter(
+        destination_id__in=destination_ids,
+        is_correspondent=True,
+        is_active=True,
+        validation_status=ShipmentValidationStatus.VALIDATED,
+        organization__is_active=True,
+    ).order_by("id"):
+        recipient_organizations.setdefault(
+            recipient_organization.destination_id, recipient_organization
+        )
+    return recipient_organizations
+
+
 def stopover_correspondent_recipient_organization(
     destination,
 ) -> ShipmentRecipientOrganization | None:
-    if destination is None or not destination.is_active:
+    if destination is None:
         return None
+    return stopover_correspondent_recipient_organizations([destination]).get(destination.id)
 
-    return (
-        ShipmentRecipientOrganization.objects.filter(
-            destination=destination,
-            is_correspondent=True,
-            is_active=True,
-            validation_status=ShipmentValidationStatus.VALIDATED,
-            organization__is_active=True,
+
+def is_correspondent_contact_of(contact, recipient_organization) -> bool:
+    """Whether ``contact`` (or the organization of a person) is the correspondent organization."""
+    if contact is None or not contact.is_active or recipient_organization is None:
+        return False
+    organization_id = (
+        contact.organization_id
+        if contact.contact_type == ContactType.PERSON and contact.organization_id
+        else contact.id
+    )
+    return organization_id == recipient_organization.organization_id
+
+
+def validated_active_shipment_shipper_queryset() -> QuerySet[ShipmentShipper]:
+    return ShipmentShipper.objects.filter(
+        is_active=True,
+        validation_status=ShipmentValidationStatus.VALIDATED,
+        organization__is_active=True,
+        default_contact__is_active=True,
+    ).select_related("organization", "default_contact", "default_contact__organization")
+
+
+def validated_active_shipment_recipient_link_queryset() -> QuerySet[ShipmentShipperRecipientLink]:
+    return ShipmentShipperRecipientLink.objects.filter(
+        is_active=True,
+        shipper__is_active=True,
+        shipper__validation_status=ShipmentValidationStatus.VALIDATED,
+        shipper__organization__is_active=True,
+        shipper__default_contact__is_active=True,
+        recipient_organization__is_active=True,
+        recipient_organization__validation_status=ShipmentValidationStatus.VALIDATED,
+        recipient_organization__organization__is_active=True,
+        recipient_organization__destination__is_active=True,
+    ).select_related(
+        "shipper",
+        "shipper__organization",
+        "shipper__default_contact",
+        "shipper__default_contact__organization",
+        "recipient_organization",
+        "recipient_organization__organization",
+        "recipient_organization__destination",
+    )
+
+
+def active_link_authorizations(link):
+    """Yield the prefetched authorizations of ``link`` whose recipient contact is usable."""
+    for authorization in link.authorized_recipient_contacts.all():
+        if not authorization.is_active:
+            continue
+        recipient_contact = authorization.recipient_contact
+        if recipient_contact is None or not recipient_contact.is_active:
+            continue
+        contact = recipient_contact.contact
+        if contact is None or not contact.is_active:
+            continue
+        yield authorization
+
+
+@dataclass(frozen=True)
+class ShipmentPartyGraph:
+    """Active shipment parties, indexed for the shipment and portal pages.
+
+    ``get_shipment_party_graph`` shares one graph between every request of the
+    process, so the model instances it holds are read-only snapshots: read their
+    fields, but never modify or save them.
+    """
+
+    destinations: tuple
+    shippers: tuple
+    recipient_links: tuple
+    correspondent_contact_by_destination_id: dict
+    shipper_id_by_default_contact_id: dict
+    shipper_id_by_organization_id: dict
+    destination_ids_by_shipper_recipient_contact: dict
+
+    def shipper_id_for_contact(self, contact) -> int | None:
+        if contact is None or not getattr(contact, "pk", None) or not contact.is_active:
+            return None
+        shipper_id = self.shipper_id_by_default_contact_id.get(contact.pk)
+        if shipper_id is None and getattr(contact, "contact_type", "") == ContactType.ORGANIZATION:
+            shipper_id = self.shipper_id_by_organization_id.get(contact.pk)
+        return shipper_id
+
+    def allowed_destination_ids(self, *, shipper_id, recipient_contact_id) -> frozenset[int]:
+        return self.destination_ids_by_shipper_recipient_contact.get(
+            (shipper_id, recipient_contact_id), frozenset()
         )
-        .order_by("id")
-        .first()
+
+
+def build_shipment_party_graph() -> ShipmentPartyGraph:
+    """Load every active shipment party in a fixed number of queries and index it by id."""
+    destinations = tuple(
+        Destination.objects.filter(is_active=True)
+        .select_related("correspondent_contact", "correspondent_contact__organization")
+        .order_by("city", "iata_code", "id")
+    )
+    shippers = tuple(validated_active_shipment_shipper_queryset())
+    recipient_links = tuple(
+        validated_active_shipment_recipient_link_queryset().prefetch_related(
+            "authorized_recipient_contacts__recipient_contact__contact__organization",
+            "authorized_recipient_contacts__recipient_contact__recipient_organization__organization__addresses",
+        )
+    )
+    correspondent_organizations = stopover_correspondent_recipient_organizations(destinations)
+    correspondent_contact_by_destination_id = {
+        destination.id: destination.correspondent_contact
+        for destination in destinations
+        if is_correspondent_contact_of(
+            destination.correspondent_contact,
+            correspondent_organizations.get(destination.id),
+        )
+    }
+
+    shipper_id_by_default_contact_id = {}
+    shipper_id_by_organization_id = {}
+    for shipper in shippers:
+        shipper_id_by_default_contact_id.setdefault(shipper.default_contact_id, shipper.id)
+        shipper_id_by_organization_id.setdefault(shipper.organization_id, shipper.id)
+
+    destination_ids_by_shipper_recipient_contact = {}
+    for link in recipient_links:
+        for authorization in active_link_authorizations(link):
+            destination_ids_by_shipper_recipient_contact.setdefault(
+                (link.shipper_id, authorization.recipient_contact.contact_id), set()
+            ).add(link.recipient_organization.destination_id)
+
+    return ShipmentPartyGraph(
+        destinations=destinations,
+        shippers=shippers,
+        recipient_links=recipient_links,
+        correspondent_contact_by_destination_id=correspondent_contact_by_destination_id,
+        shipper_id_by_default_contact_id=shipper_id_by_default_contact_id,
+        shipper_id_by_organization_id=shipper_id_by_organization_id,
+        destination_ids_by_shipper_recipient_contact={
+            key: frozenset(destination_ids)
+            for key, destination_ids in destination_ids_by_shipper_recipient_contact.items()
+        },
     )
+
+
+def get_shipment_party_graph() -> ShipmentPartyGraph:
+    """Return the process-wide party graph, rebuilt whenever the party registry counter moves.
+
+    The counter is bumped by the party model signals; queryset ``update()``/``bulk_create()``
+    calls bypass them and must call ``WmsChange.bump(party_registry=True)`` themselves.
+    """
+    key = WmsChange.get_party_registry_key()
+    if key is None:
+        return build_shipment_party_graph()
+    with _party_graph_lock:
+        entry = _party_graph_entry.get("graph")
+    if entry is not None and entry[0] == key:
+        return entry[1]
+    graph = build_shipment_party_graph()
+    with _party_graph_lock:
+        _party_graph_entry["graph"] = (key, graph)
+    return graph
+
+
+def clear_shipment_party_graph_cache() -> None:
+    with _party_graph_lock:
+        _party_graph_entry.clear()
@@ -15,6 +15,7 @@ from .models import (
 from .shipment_party_registry import (
     eligible_recipient_organizations_for_shipper,
     eligible_shippers_for_stopover,
+    is_correspondent_contact_of,
     stopover_correspondent_recipient_organization,
 )
 
@@ -214,13 +215,8 @@ def eligible_correspondent_contacts_for_destination(destination):
     )
 
     correspondent_contact = getattr(destination, "correspondent_contact", None)
-    if correspondent_contact is not None and correspondent_contact.is_active:
-        correspondent_org = normalize_party_contact_to_org(correspondent_contact)
-        if (
-            correspondent_org is not None
-            and correspondent_org.id == recipient_organization.organization_id
-        ):
-            contact_ids.add(correspondent_contact.id)
+    if is_correspondent_contact_of(correspondent_contact, recipient_organization):
+        contact_ids.add(correspondent_contact.id)
 
     return _active_contacts_for_ids(contact_ids)
 
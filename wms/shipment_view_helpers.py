@@ -17,7 +17,13 @@ from .print_context import (
     build_label_context,
     build_shipment_document_context,
 )
-from .print_renderer import get_template_layout, render_layout_from_layout
+from .print_renderer import (
+    compile_layout,
+    get_template_layout,
+    render_compiled_layout,
+    render_layout_from_layout,
+)
+from .qr_codes import shipment_qr_data_uri
 from .shipment_helpers import build_destination_label
 from .status_badges import BADGE_TONE_PROGRESS, BADGE_TONE_READY, resolve_status_tone
 from .status_presenters import present_shipment_status
@@ -57,14 +63,6 @@ STATUS_LOCKED_SHIPMENT = {
 }
 
 
-def _carton_total_weight(carton):
-    weight_total = 0
-    for item in carton.cartonitem_set.all():
-        product_weight = item.product_lot.product.weight_g or 0
-        weight_total += product_weight * item.quantity
-    return weight_total
-
-
 def _build_carton_option(carton):
     preassigned_destination = getattr(carton, "preassigned_destination", None)
     preassigned_destination_id = getattr(carton, "preassigned_destination_id", None)
@@ -78,7 +76,7 @@ def _build_carton_option(carton):
         "id": carton.id,
         "code": carton.code,
         "label": label,
-        "weight_g": _carton_total_weight(carton),
+        "weight_g": carton.total_weight_g,
         "preassigned_destination_id": preassigned_destination_id,
         "preassigned_destination_iata": preassigned_destination_iata,
         "preassigned_destination_label": (
@@ -317,13 +315,12 @@ def render_carton_document(request, shipment, carton):
 
 
 def render_shipment_labels(request, shipment):
-    shipment.ensure_qr_code(request=request)
     cartons = list(shipment.carton_set.order_by("code"))
     total = len(cartons)
-    qr_url = shipment.qr_code_image.url if shipment.qr_code_image else ""
+    qr_url = shipment_qr_data_uri(shipment, request=request)
     labels = []
     for index, carton in enumerate(cartons, start=1):
-        label_context = build_label_context(shipment, position=index, total=total)
+        label_context = build_label_context(shipment, position=index, total=total, request=request)
         labels.append(
             _build_label_payload(
                 label_context=label_context,
@@ -334,10 +331,11 @@ def render_shipment_labels(request, shipment):
 
     layout_override = get_template_layout("shipment_label")
     if layout_override:
+        compiled_layout = compile_layout(layout_override)
         rendered_labels = []
         for label in labels:
             label_context = _build_dynamic_label_context(label)
-            blocks = render_layout_from_layout(layout_override, label_context)
+            blocks = render_compiled_layout(compiled_layout, label_context)
             rendered_labels.append({"blocks": blocks})
         return render(request, TEMPLATE_DYNAMIC_LABELS, {"labels": rendered_labels})
     return render(request, TEMPLATE_SHIPMENT_LABELS, {"labels": labels})
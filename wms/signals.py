@@ -1,3 +1,7 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from django.apps import apps
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -5,9 +9,7 @@ from django.contrib.auth.signals import user_logged_in
 from django.db import transaction
 from django.db.models import Q
 from django.db.models.signals import post_delete, post_save, pre_save
-from django.template.loader import render_to_string
 from django.urls import reverse
-from django.utils import timezone
 from django.utils.translation import gettext as _
 
 from contacts.correspondent_recipient_promotion import (
@@ -21,18 +23,22 @@ from .default_shipper_bindings import (
     ensure_default_shipper_links_for_destination_id,
     ensure_default_shipper_links_for_recipient_organization_id,
 )
+from .domain.stock import rebuild_carton_totals
 from .emailing import (
     get_admin_emails,
     get_group_emails,
-    send_or_enqueue_email_safe,
+    get_shipment_status_admin_emails,
 )
 from .models import (
     AssociationProfile,
     AssociationRecipient,
+    Carton,
     Destination,
     Order,
     OrderReviewStatus,
     OrderStatus,
+    PrintTemplate,
+    Product,
     Shipment,
     ShipmentRecipientOrganization,
     ShipmentStatus,
@@ -40,13 +46,15 @@ from .models import (
     ShipmentTrackingStatus,
     WmsChange,
 )
+from .notification_outbox import enqueue_notification
 from .notification_policy import resolve_reference_notification_emails
+from .print_renderer import clear_compiled_layout_cache
+from .shipment_party_registry import clear_shipment_party_graph_cache
 from .workflow_observability import (
     log_shipment_status_transition,
     log_shipment_tracking_event,
 )
 
-SHIPMENT_STATUS_UPDATE_GROUP_DEFAULT = "Shipment_Status_Update"
 SHIPMENT_STATUS_CORRESPONDANT_GROUP_DEFAULT = "Shipment_Status_Update_Correspondant"
 ORDER_STATUS_ASSOCIATION_TEMPLATE = "emails/order_status_association_notification.txt"
 SHIPMENT_STATUS_PARTY_TEMPLATE = "emails/shipment_status_party_notification.txt"
@@ -60,6 +68,8 @@ SHIPMENT_CONTACT_NOTIFICATION_STATUSES = {
 SHIPMENT_CORRESPONDANT_TRACKING_STATUSES = {
     ShipmentTrackingStatus.BOARDING_OK,
 }
+# Product fields that feed the stored carton totals (weights, volumes, dominant family).
+PRODUCT_CARTON_TOTAL_FIELDS = ("weight_g", "volume_cm3", "category_id")
 
 
 def _uniq_emails(values):
@@ -77,8 +87,58 @@ def _uniq_emails(values):
     return emails
 
 
+PARTY_REGISTRY_MODEL_LABELS = frozenset(
+    {
+        "contacts.Contact",
+        "contacts.ContactAddress",
+        "wms.Destination",
+        "wms.ShipmentShipper",
+        "wms.ShipmentRecipientOrganization",
+        "wms.ShipmentRecipientContact",
+        "wms.ShipmentShipperRecipientLink",
+        "wms.ShipmentAuthorizedRecipientContact",
+    }
+)
+
+
+_coalesced_bumps = threading.local()
+
+
+@contextmanager
+def coalesce_change_bumps() -> Iterator[None]:
+    """Bump the change counter once for all saves/deletes made inside the block."""
+    depth = getattr(_coalesced_bumps, "depth", 0)
+    if not depth:
+        _coalesced_bumps.pending = None
+    _coalesced_bumps.depth = depth + 1
+    try:
+        yield
+    finally:
+        _coalesced_bumps.depth = depth
+        pending = _coalesced_bumps.pending
+        if not depth and pending is not None:
+            _coalesced_bumps.pending = None
+            WmsChange.bump(party_registry=pending)
+
+
+def _request_bump(*, party_registry: bool = False) -> None:
+    if getattr(_coalesced_bumps, "depth", 0):
+        _coalesced_bumps.pending = bool(_coalesced_bumps.pending) or party_registry
+        return
+    WmsChange.bump(party_registry=party_registry)
+
+
 def _bump_change(**kwargs) -> None:
-    WmsChange.bump()
+    _request_bump()
+
+
+def _bump_party_registry_change(**kwargs) -> None:
+    _request_bump(party_registry=True)
+    clear_shipment_party_graph_cache()
+
+
+def _clear_compiled_print_layouts(**kwargs) -> None:
+    clear_compiled_layout_cache()
 
 
 def _build_site_url(path: str) -> str:
@@ -99,6 +159,31 @@ def _capture_shipment_status(sender, instance, **kwargs) -> None:
     )
 
 
+def _capture_product_carton_total_inputs(sender, instance, update_fields=None, **kwargs) -> None:
+    instance._previous_carton_total_inputs = None
+    if not instance.pk:
+        return
+    if update_fields is not None and not {"weight_g", "volume_cm3", "category"} & set(
+        update_fields
+    ):
+        return
+    instance._previous_carton_total_inputs = (
+        sender.objects.filter(pk=instance.pk).values_list(*PRODUCT_CARTON_TOTAL_FIELDS).first()
+    )
+
+
+def _refresh_product_carton_totals(sender, instance, created, **kwargs) -> None:
+    previous = getattr(instance, "_previous_carton_total_inputs", None)
+    if created or previous is None:
+        return
+    current = tuple(getattr(instance, field_name) for field_name in PRODUCT_CARTON_TOTAL_FIELDS)
+    if tuple(previous) == current:
+        return
+    rebuild_carton_totals(
+        Carton.objects.filter(cartonitem__product_lot__product_id=instance.pk).distinct()
+    )
+
+
 def _split_email_values(value: str) -> list[str]:
     normalized = (value or "").replace("\n", ";").replace(",", ";")
     return [item.strip() for item in normalized.split(";") if item.strip()]
@@ -142,36 +227,22 @@ def _notify_shipment_delivery(instance) -> None:
     recipients = _resolve_delivery_recipients(instance)
     if not recipients:
         return
-    message = render_to_string(
-        "emails/shipment_delivery_notification.txt",
-        {
+    enqueue_notification(
+        subject=_("ASF WMS - Expedition %(reference)s : livraison confirmee")
+        % {"reference": instance.reference},
+        template="emails/shipment_delivery_notification.txt",
+        context={
             "shipment_reference": instance.reference,
             "destination_label": str(instance.destination)
             if instance.destination
             else instance.destination_address,
-            "delivered_at": timezone.localtime(timezone.now()),
             "tracking_url": instance.get_tracking_url(),
         },
-    )
-    transaction.on_commit(
-        lambda: send_or_enqueue_email_safe(
-            subject=_("ASF WMS - Expedition %(reference)s : livraison confirmee")
-            % {"reference": instance.reference},
-            message=message,
-            recipient=recipients,
-        )
+        recipients=recipients,
+        timestamp_key="delivered_at",
     )
 
 
-def _shipment_status_admin_recipients():
-    group_name = getattr(
-        settings,
-        "SHIPMENT_STATUS_UPDATE_GROUP_NAME",
-        SHIPMENT_STATUS_UPDATE_GROUP_DEFAULT,
-    )
-    return _uniq_emails(get_admin_emails() + get_group_emails(group_name, require_staff=True))
-
-
 def _shipment_party_recipients(shipment):
     return []
 
@@ -246,9 +317,11 @@ def _shipment_correspondant_recipients(shipment):
 def _queue_deduped_email(
     *,
     subject,
-    message,
+    template,
+    context,
     recipients,
     dedup_registry,
+    timestamp_key="",
 ):
     filtered_recipients = []
     for recipient in recipients:
@@ -263,12 +336,12 @@ def _queue_deduped_email(
     if not filtered_recipients:
         return
 
-    transaction.on_commit(
-        lambda: send_or_enqueue_email_safe(
-            subject=subject,
-            message=message,
-            recipient=filtered_recipients,
-        )
+    enqueue_notification(
+        subject=subject,
+        template=template,
+        context=context,
+        recipients=filtered_recipients,
+        timestamp_key=timestamp_key,
     )
 
 
@@ -276,19 +349,15 @@ def _queue_shipment_party_notification(*, shipment, old_label, new_label):
     recipient_groups = _shipment_party_notification_targets(shipment)
     if not recipient_groups:
         return
-    message = render_to_string(
-        SHIPMENT_STATUS_PARTY_TEMPLATE,
-        {
-            "shipment_reference": shipment.reference,
-            "old_status": old_label,
-            "new_status": new_label,
-            "destination_label": str(shipment.destination)
-            if shipment.destination
-            else shipment.destination_address,
-            "changed_at": timezone.localtime(timezone.now()),
-            "tracking_url": shipment.get_tracking_url(),
-        },
-    )
+    context = {
+        "shipment_reference": shipment.reference,
+        "old_status": old_label,
+        "new_status": new_label,
+        "destination_label": str(shipment.destination)
+        if shipment.destination
+        else shipment.destination_address,
+        "tracking_url": shipment.get_tracking_url(),
+    }
     dedup_registry = set()
     subject = _("ASF WMS - Expédition %(reference)s : statut %(status)s") % {
         "reference": shipment.reference,
@@ -297,9 +366,11 @@ def _queue_shipment_party_notification(*, shipment, old_label, new_label):
     for recipients in recipient_groups:
         _queue_deduped_email(
             subject=subject,
-            message=message,
+            template=SHIPMENT_STATUS_PARTY_TEMPLATE,
+            context=context,
             recipients=recipients,
             dedup_registry=dedup_registry,
+            timestamp_key="changed_at",
         )
 
 
@@ -313,9 +384,14 @@ def _queue_shipment_correspondant_notification(
     recipients = _shipment_correspondant_recipients(shipment)
     if not recipients:
         return
-    message = render_to_string(
-        SHIPMENT_STATUS_CORRESPONDANT_TEMPLATE,
-        {
+    enqueue_notification(
+        subject=_("ASF WMS - Suivi correspondant %(reference)s : %(status)s")
+        % {
+            "reference": shipment.reference,
+            "status": new_label,
+        },
+        template=SHIPMENT_STATUS_CORRESPONDANT_TEMPLATE,
+        context={
             "shipment_reference": shipment.reference,
             "old_status": old_label,
             "new_status": new_label,
@@ -325,17 +401,7 @@ def _queue_shipment_correspondant_notification(
             else shipment.destination_address,
             "tracking_url": shipment.get_tracking_url(),
         },
-    )
-    transaction.on_commit(
-        lambda: send_or_enqueue_email_safe(
-            subject=_("ASF WMS - Suivi correspondant %(reference)s : %(status)s")
-            % {
-                "reference": shipment.reference,
-                "status": new_label,
-            },
-            message=message,
-            recipient=recipients,
-        )
+        recipients=recipients,
     )
 
 
@@ -345,13 +411,33 @@ def _notify_shipment_status_change(sender, instance, created, **kwargs) -> None:
     previous_status = getattr(instance, "_previous_status", None)
     if not previous_status or previous_status == instance.status:
         return
+    emit_shipment_status_notifications(
+        instance,
+        previous_status=previous_status,
+        source="shipment_post_save_signal",
+    )
+
+
+def emit_shipment_status_notifications(
+    instance,
+    *,
+    previous_status,
+    source,
+    admin_recipients=None,
+) -> None:
+    """Log a shipment status transition and queue its notifications.
+
+    Used by the post_save signal and by bulk writers that bypass it; bulk callers
+    can pass ``admin_recipients`` once for every shipment.
+    """
     log_shipment_status_transition(
         shipment=instance,
         previous_status=previous_status,
         new_status=instance.status,
-        source="shipment_post_save_signal",
+        source=source,
     )
-    admin_recipients = _shipment_status_admin_recipients()
+    if admin_recipients is None:
+        admin_recipients = get_shipment_status_admin_emails()
     if admin_recipients:
         try:
             old_label = ShipmentStatus(previous_status).label
@@ -362,27 +448,22 @@ def _notify_shipment_status_change(sender, instance, created, **kwargs) -> None:
         except ValueError:
             new_label = instance.status
         admin_url = _build_site_url(reverse("admin:wms_shipment_change", args=[instance.id]))
-        message = render_to_string(
-            "emails/shipment_status_admin_notification.txt",
-            {
+        enqueue_notification(
+            subject=_("ASF WMS - Expédition %(reference)s : statut mis à jour")
+            % {"reference": instance.reference},
+            template="emails/shipment_status_admin_notification.txt",
+            context={
                 "shipment_reference": instance.reference,
                 "old_status": old_label,
                 "new_status": new_label,
                 "destination_label": str(instance.destination)
                 if instance.destination
                 else instance.destination_address,
-                "changed_at": timezone.localtime(timezone.now()),
                 "tracking_url": instance.get_tracking_url(),
                 "admin_url": admin_url,
             },
-        )
-        transaction.on_commit(
-            lambda: send_or_enqueue_email_safe(
-                subject=_("ASF WMS - Expédition %(reference)s : statut mis à jour")
-                % {"reference": instance.reference},
-                message=message,
-                recipient=admin_recipients,
-            )
+            recipients=admin_recipients,
+            timestamp_key="changed_at",
         )
     else:
         try:
@@ -413,34 +494,34 @@ def _notify_shipment_status_change(sender, instance, created, **kwargs) -> None:
 def _notify_tracking_event(sender, instance, created, **kwargs) -> None:
     if not created:
         return
+    emit_tracking_event_notifications(instance)
+
+
+def emit_tracking_event_notifications(instance, *, admin_recipients=None) -> None:
+    """Log a new tracking event and queue its notifications (signal and bulk writers)."""
     log_shipment_tracking_event(
         tracking_event=instance,
         user=getattr(instance, "created_by", None),
     )
     shipment = instance.shipment
-    recipients = get_admin_emails()
+    recipients = get_admin_emails() if admin_recipients is None else admin_recipients
     if recipients:
         admin_url = _build_site_url(reverse("admin:wms_shipment_change", args=[shipment.id]))
-        message = render_to_string(
-            "emails/shipment_tracking_admin_notification.txt",
-            {
+        enqueue_notification(
+            subject=_("ASF WMS - Suivi expédition %(reference)s")
+            % {"reference": shipment.reference},
+            template="emails/shipment_tracking_admin_notification.txt",
+            context={
                 "shipment_reference": shipment.reference,
                 "status": instance.get_status_display(),
                 "actor_name": instance.actor_name,
                 "actor_structure": instance.actor_structure,
                 "comments": instance.comments or "-",
-                "event_time": timezone.localtime(instance.created_at),
                 "tracking_url": shipment.get_tracking_url(),
                 "admin_url": admin_url,
             },
-        )
-        transaction.on_commit(
-            lambda: send_or_enqueue_email_safe(
-                subject=_("ASF WMS - Suivi expédition %(reference)s")
-                % {"reference": shipment.reference},
-                message=message,
-                recipient=recipients,
-            )
+            recipients=recipients,
+            timestamp_key="event_time",
         )
     tracking_status = getattr(instance, "status", "")
     if tracking_status in SHIPMENT_CORRESPONDANT_TRACKING_STATUSES:
@@ -524,9 +605,11 @@ def _notify_order_status_change(sender, instance, created, **kwargs) -> None:
         return
 
     admin_url = _build_site_url(reverse("admin:wms_order_change", args=[instance.id]))
-    message = render_to_string(
-        ORDER_STATUS_ASSOCIATION_TEMPLATE,
-        {
+    enqueue_notification(
+        subject=_("ASF WMS - Commande %(reference)s : validation/statut mis à jour")
+        % {"reference": instance.reference or instance.id},
+        template=ORDER_STATUS_ASSOCIATION_TEMPLATE,
+        context={
             "order_reference": instance.reference or (_("Commande %(id)s") % {"id": instance.id}),
             "old_status": _order_state_status_label(previous_status) or "-",
             "new_status": _order_state_status_label(instance.status),
@@ -534,14 +617,7 @@ def _notify_order_status_change(sender, instance, created, **kwargs) -> None:
             "new_review_status": _order_review_status_label(instance.review_status),
             "admin_url": admin_url,
         },
-    )
-    transaction.on_commit(
-        lambda: send_or_enqueue_email_safe(
-            subject=_("ASF WMS - Commande %(reference)s : validation/statut mis à jour")
-            % {"reference": instance.reference or instance.id},
-            message=message,
-            recipient=recipients,
-        )
+        recipients=recipients,
     )
 
 
@@ -572,11 +648,12 @@ def _sync_profile_emails_on_create(sender, instance, created, **kwargs) -> None:
         get_user_model().objects.filter(pk=user.pk).update(email=contact_email)
 
 
-def _sync_profile_user_email_from_contact(sender, instance, **kwargs) -> None:
-    profiles = AssociationProfile.objects.select_related("user").filter(contact=instance)
+def sync_profile_user_email_from_contact(contact) -> None:
+    """Copy ``contact.email`` to the users of the association profiles bound to it."""
+    profiles = AssociationProfile.objects.select_related("user").filter(contact=contact)
     if not profiles.exists():
         return
-    target_email = (instance.email or "").strip()
+    target_email = (contact.email or "").strip()
     user_ids_to_update = [
         profile.user_id
         for profile in profiles
@@ -586,6 +663,10 @@ def _sync_profile_user_email_from_contact(sender, instance, **kwargs) -> None:
         get_user_model().objects.filter(pk__in=user_ids_to_update).update(email=target_email)
 
 
+def _sync_profile_user_email_from_contact(sender, instance, **kwargs) -> None:
+    sync_profile_user_email_from_contact(instance)
+
+
 def _sync_profile_contact_email_from_user(sender, instance, **kwargs) -> None:
     profile = AssociationProfile.objects.select_related("contact").filter(user=instance).first()
     if not profile:
@@ -651,13 +732,18 @@ def register_change_signals() -> None:
         for model in app_config.get_models():
             if model is WmsChange:
                 continue
+            receiver = (
+                _bump_party_registry_change
+                if model._meta.label in PARTY_REGISTRY_MODEL_LABELS
+                else _bump_change
+            )
             post_save.connect(
-                _bump_change,
+                receiver,
                 sender=model,
                 dispatch_uid=f"wms_change_save_{app_label}_{model.__name__}",
             )
             post_delete.connect(
-                _bump_change,
+                receiver,
                 sender=model,
                 dispatch_uid=f"wms_change_delete_{app_label}_{model.__name__}",
             )
@@ -671,6 +757,16 @@ def register_change_signals() -> None:
         sender=Order,
         dispatch_uid="wms_order_state_pre_save",
     )
+    pre_save.connect(
+        _capture_product_carton_total_inputs,
+        sender=Product,
+        dispatch_uid="wms_product_carton_totals_pre_save",
+    )
+    post_save.connect(
+        _refresh_product_carton_totals,
+        sender=Product,
+        dispatch_uid="wms_product_carton_totals_post_save",
+    )
     post_save.connect(
         _notify_shipment_status_change,
         sender=Shipment,
@@ -721,6 +817,16 @@ def register_change_signals() -> None:
         sender=Destination,
         dispatch_uid="wms_destination_correspondent_recipient_support_post_save",
     )
+    post_save.connect(
+        _clear_compiled_print_layouts,
+        sender=PrintTemplate,
+        dispatch_uid="wms_print_template_compiled_layouts_post_save",
+    )
+    post_delete.connect(
+        _clear_compiled_print_layouts,
+        sender=PrintTemplate,
+        dispatch_uid="wms_print_template_compiled_layouts_post_delete",
+    )
     user_logged_in.connect(
         _apply_login_session_policy,
         dispatch_uid="wms_apply_login_session_policy",
@@ -0,0 +1,105 @@
+"""Cold-start import profile of the Django project.
+
+A fresh interpreter runs ``django.setup()`` and imports the URL configuration
+under ``python -X importtime``. The report gives the wall-clock startup time,
+the slowest imports and whether any of the heavy dependencies deferred through
+``wms.lazy_imports`` was loaded anyway.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess  # nosec B404
+import sys
+from dataclasses import dataclass
+
+from django.conf import settings
+
+STARTUP_BUDGET_MS = 6000
+STARTUP_BUDGET_ENV = "WMS_STARTUP_BUDGET_MS"
+DEFERRED_HEAVY_MODULES = (
+    "numpy",
+    "openpyxl",
+    "ortools",
+    "pandas",
+    "pdfplumber",
+    "PIL",
+    "pypdf",
+    "qrcode",
+    "xlrd",
+)
+STARTUP_PROBE = (
+    "import time\n"
+    "started = time.perf_counter()\n"
+    "import django\n"
+    "django.setup()\n"
+    "from django.urls import get_resolver\n"
+    "get_resolver().url_patterns\n"
+    "print(round((time.perf_counter() - started) * 1000, 3))\n"
+)
+IMPORTTIME_PREFIX = "import time:"
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass(frozen=True)
+class StartupProfile:
+    elapsed_ms: float
+    imports: tuple[ImportTiming, ...]
+
+    @property
+    def heavy_modules(self) -> list[str]:
+        loaded = {timing.module.partition(".")[0] for timing in self.imports}
+        return [name for name in DEFERRED_HEAVY_MODULES if name in loaded]
+
+    def slowest(self, limit: int) -> list[ImportTiming]:
+        return sorted(self.imports, key=lambda timing: timing.self_us, reverse=True)[:limit]
+
+
+def startup_budget_ms() -> float:
+    return float(os.environ.get(STARTUP_BUDGET_ENV) or STARTUP_BUDGET_MS)
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        self_us, cumulative_us, module = line[len(IMPORTTIME_PREFIX) :].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # column header
+        timings.append(
+            ImportTiming(
+                module=module.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+            )
+        )
+    return timings
+
+
+def profile_startup(*, timeout: float = 120) -> StartupProfile:
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": os.environ.get(
+            "DJANGO_SETTINGS_MODULE", settings.SETTINGS_MODULE
+        ),
+    }
+    completed = subprocess.run(  # nosec B603 B607
+        [sys.executable, "-X", "importtime", "-c", STARTUP_PROBE],
+        capture_output=True,
+        check=True,
+        cwd=settings.BASE_DIR,
+        env=env,
+        text=True,
+        timeout=timeout,
+    )
+    return StartupProfile(
+        elapsed_ms=float(completed.stdout.strip().splitlines()[-1]),
+        imports=tuple(parse_importtime(completed.stderr)),
+    )
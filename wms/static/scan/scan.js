@@ -23,7 +23,9 @@
   let ocrScriptPromise = null;
   let packProductResolver = null;
   let productResolver = null;
-  const ZXING_SRC = '/static/scan/zxing.min.js';
+  // The scanner library is a separate chunk, fetched on the first camera scan only.
+  const ZXING_SRC = (document.currentScript && document.currentScript.dataset.zxingSrc)
+    || '/static/scan/zxing.min.js';
   const OCR_SRC = 'https://cdn.jsdelivr.net/npm/tesseract.js@5/dist/tesseract.min.js';
   const OCR_WORKER_SRC = 'https://cdn.jsdelivr.net/npm/tesseract.js@5/dist/worker.min.js';
   const OCR_CORE_SRC = 'https://cdn.jsdelivr.net/npm/tesseract.js-core@5/tesseract-core.wasm.js';
@@ -3503,6 +3505,7 @@
     if (!syncUrl) {
       return;
     }
+    const waitUrl = banner.dataset.syncWaitUrl;
     const intervalRaw = parseInt(banner.dataset.syncInterval, 10);
     const intervalMs = Number.isFinite(intervalRaw) && intervalRaw > 0 ? intervalRaw : 8000;
     const reloadButton = document.getElementById('scan-sync-reload');
@@ -3550,6 +3553,24 @@
       }
     };
 
+    const applySyncState = data => {
+      const version = data && data.version !== undefined && data.version !== null
+        ? Number(data.version)
+        : null;
+      if (version === null || !Number.isFinite(version)) {
+        return;
+      }
+      if (lastVersion === null) {
+        lastVersion = version;
+        hideBanner();
+        return;
+      }
+      if (version !== lastVersion) {
+        lastVersion = version;
+        handleUpdate();
+      }
+    };
+
     const fetchSync = async () => {
       if (isPolling || document.hidden) {
         return;
@@ -3563,20 +3584,7 @@
         if (!response.ok) {
           return;
         }
-        const data = await response.json();
-        const version = data && data.version ? Number(data.version) : null;
-        if (!version) {
-          return;
-        }
-        if (lastVersion === null) {
-          lastVersion = version;
-          hideBanner();
-          return;
-        }
-        if (version !== lastVersion) {
-          lastVersion = version;
-          handleUpdate();
-        }
+        applySyncState(await response.json());
       } catch (err) {
         // Ignore network issues.
       } finally {
@@ -3584,10 +3592,46 @@
       }
     };
 
+    // Long-poll: the server holds the request until the version changes or its wait
+    // expires. When it answers without waiting (busy, disabled) or fails, the next
+    // request is delayed by the polling interval instead.
+    const waitForChange = async () => {
+      if (document.hidden) {
+        document.addEventListener('visibilitychange', waitForChange, { once: true });
+        return;
+      }
+      const isFirstRequest = lastVersion === null;
+      let delayMs = intervalMs;
+      try {
+        const url = new URL(waitUrl, window.location.href);
+        if (lastVersion !== null) {
+          url.searchParams.set('version', String(lastVersion));
+        }
+        const response = await fetch(url, {
+          cache: 'no-store',
+          headers: { 'X-Requested-With': 'XMLHttpRequest' }
+        });
+        if (response.ok) {
+          const data = await response.json();
+          applySyncState(data);
+          if (data && (data.waited || data.changed || (isFirstRequest && lastVersion !== null))) {
+            delayMs = 0;
+          }
+        }
+      } catch (err) {
+        // Ignore network issues.
+      }
+      window.setTimeout(waitForChange, delayMs);
+    };
+
     if (reloadButton) {
       reloadButton.addEventListener('click', triggerReload);
     }
 
+    if (waitUrl && window.URL) {
+      waitForChange();
+      return;
+    }
     fetchSync();
     setInterval(fetchSync, intervalMs);
   }
@@ -0,0 +1,208 @@
+"""Static asset pipeline: hashed names, pre-compressed siblings and page budgets.
+
+``collectstatic`` with ``CompressedManifestStaticFilesStorage`` writes every file
+under a content-hashed name (``scan.1a2b3c4d5e6f.js``) and stores ``.gz`` (and
+``.br`` when Brotli is installed) siblings next to compressible files. Hashed
+names never change content, so ``serve_static_asset`` marks them immutable for a
+year; unhashed names are revalidated on every use.
+
+``critical_page_assets`` lists the blocking scripts and stylesheets a page
+template pulls in through ``{% static %}``; ``STATIC_PAGE_BUDGETS`` caps their
+compressed size so a new dependency on the critical path fails the budget check
+instead of silently reaching scan terminals.
+"""
+
+from __future__ import annotations
+
+import gzip
+import mimetypes
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.template.loader import get_template
+from django.utils._os import safe_join
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+from django.views.static import was_modified_since
+
+from .lazy_imports import lazy_module
+
+brotli = lazy_module("brotli")
+
+STATIC_IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+STATIC_COMPRESSIBLE_EXTENSIONS = frozenset(
+    {".css", ".js", ".json", ".map", ".svg", ".txt", ".html", ".xml"}
+)
+STATIC_COMPRESS_MIN_BYTES = 512
+STATIC_COMPRESS_MAX_RATIO = 0.95
+STATIC_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# Compressed bytes of blocking JS/CSS served from this app, per page layout.
+STATIC_PAGE_BUDGETS = {
+    "scan/base.html": 40_000,
+    "portal/base.html": 16_000,
+    "benevole/base.html": 16_000,
+    "planning/base.html": 16_000,
+}
+
+HASHED_NAME_RE = re.compile(r"\.[0-9a-f]{12}\.[^./]+$")
+TEMPLATE_REFERENCE_RE = re.compile(r"{%\s*(?:extends|include)\s+[\"']([^\"']+)[\"']")
+SCRIPT_RE = re.compile(r"<script\b(?P<attrs>[^>]*)>", re.IGNORECASE)
+STYLESHEET_RE = re.compile(r"<link\b(?P<attrs>[^>]*\brel=[\"']stylesheet[\"'][^>]*)>", re.I)
+STATIC_SRC_RE = re.compile(r"(?<![\w-])src=[\"']{%\s*static\s+[\"']([^\"']+)[\"']\s*%}")
+STATIC_HREF_RE = re.compile(r"(?<![\w-])href=[\"']{%\s*static\s+[\"']([^\"']+)[\"']\s*%}")
+
+
+def compress_gzip(content: bytes) -> bytes:
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def compress_brotli(content: bytes) -> bytes:
+    return brotli.compress(content, quality=11)
+
+
+def static_encoders():
+    encoders = [(".gz", compress_gzip)]
+    if brotli:
+        encoders.insert(0, (".br", compress_brotli))
+    return encoders
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """Manifest storage that also writes pre-compressed siblings of text assets."""
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if dry_run:
+            return
+        names = set(paths)
+        names.update(self.hashed_files.get(self.hash_key(self.clean_name(name))) for name in paths)
+        for name in sorted(filter(None, names)):
+            for compressed_name in self._write_compressed(name):
+                yield name, compressed_name, True
+
+    def _write_compressed(self, name: str) -> list[str]:
+        if Path(name).suffix.lower() not in STATIC_COMPRESSIBLE_EXTENSIONS:
+            return []
+        with self.open(name) as handle:
+            content = handle.read()
+        if len(content) < STATIC_COMPRESS_MIN_BYTES:
+            return []
+        written = []
+        for suffix, compress in static_encoders():
+            compressed = compress(content)
+            if len(compressed) > len(content) * STATIC_COMPRESS_MAX_RATIO:
+                continue
+            compressed_name = f"{name}{suffix}"
+            Path(self.path(compressed_name)).write_bytes(compressed)
+            written.append(compressed_name)
+        return written
+
+
+def is_hashed_static_name(path: str) -> bool:
+    return bool(HASHED_NAME_RE.search(path))
+
+
+def _accepted_encodings(request) -> set[str]:
+    header = request.headers.get("Accept-Encoding", "")
+    accepted = set()
+    for part in header.split(","):
+        token, _sep, params = part.strip().partition(";")
+        if params.replace(" ", "") in {"q=0", "q=0.0"}:
+            continue
+        accepted.add(token.strip().lower())
+    return accepted
+
+
+@require_safe
+def serve_static_asset(request, path):
+    """Serve a collected file, preferring a pre-compressed sibling the client accepts."""
+    try:
+        full_path = Path(safe_join(settings.STATIC_ROOT, path))
+    except SuspiciousFileOperation as exc:
+        raise Http404(path) from exc
+    if not full_path.is_file():
+        raise Http404(path)
+
+    stat = full_path.stat()
+    if not was_modified_since(request.headers.get("If-Modified-Since"), stat.st_mtime):
+        return HttpResponseNotModified()
+
+    content_type, _encoding = mimetypes.guess_type(full_path.name)
+    served_path, content_encoding = full_path, None
+    accepted = _accepted_encodings(request)
+    for encoding, suffix in STATIC_ENCODINGS:
+        candidate = full_path.with_name(full_path.name + suffix)
+        if encoding in accepted and candidate.is_file():
+            served_path, content_encoding = candidate, encoding
+            break
+
+    response = FileResponse(
+        served_path.open("rb"), content_type=content_type or "application/octet-stream"
+    )
+    response["Last-Modified"] = http_date(stat.st_mtime)
+    response["Vary"] = "Accept-Encoding"
+    if content_encoding:
+        response["Content-Encoding"] = content_encoding
+    if is_hashed_static_name(path):
+        response["Cache-Control"] = f"public, max-age={STATIC_IMMUTABLE_MAX_AGE}, immutable"
+    else:
+        response["Cache-Control"] = "no-cache"
+    return response
+
+
+@dataclass(frozen=True)
+class StaticAssetSize:
+    name: str
+    raw_bytes: int
+    compressed_bytes: int
+
+
+def _template_sources(template_name: str, seen: set[str]) -> list[str]:
+    if template_name in seen:
+        return []
+    seen.add(template_name)
+    source = get_template(template_name).template.source
+    sources = [source]
+    for referenced in TEMPLATE_REFERENCE_RE.findall(source):
+        sources.extend(_template_sources(referenced, seen))
+    return sources
+
+
+def critical_static_names(template_name: str) -> list[str]:
+    """Static names of blocking scripts and stylesheets in a template and its parents."""
+    names = []
+    for source in _template_sources(template_name, set()):
+        for match in SCRIPT_RE.finditer(source):
+            attrs = match.group("attrs")
+            if re.search(r"\b(async|defer)\b", attrs):
+                continue
+            names.extend(STATIC_SRC_RE.findall(attrs))
+        for match in STYLESHEET_RE.finditer(source):
+            names.extend(STATIC_HREF_RE.findall(match.group("attrs")))
+    return list(dict.fromkeys(names))
+
+
+def critical_page_assets(template_name: str) -> list[StaticAssetSize]:
+    sizes = []
+    for name in critical_static_names(template_name):
+        found = finders.find(name)
+        if not found:
+            raise FileNotFoundError(
+                f"Static file {name!r} referenced by {template_name} is missing."
+            )
+        content = Path(found).read_bytes()
+        sizes.append(
+            StaticAssetSize(
+                name=name,
+                raw_bytes=len(content),
+                compressed_bytes=len(compress_gzip(content)),
+            )
+        )
+    return sizes
@@ -0,0 +1,226 @@
+"""Point-in-time stock ledger.
+
+``StockMovement`` rows are the history of every lot quantity change. Answering
+"what was on hand at X" by replaying all of them grows with the history, so
+periodic ``StockCheckpoint`` rows store every non-zero lot quantity at a period
+boundary. An as-of query starts from the nearest checkpoint at or before X and
+only replays the movements created since then.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Sum, Value, When
+from django.utils import timezone
+
+from .models import (
+    MovementType,
+    ProductLot,
+    StockCheckpoint,
+    StockCheckpointLine,
+    StockCheckpointPeriod,
+    StockMovement,
+)
+
+STOCK_CHECKPOINT_LINE_BATCH_SIZE = 1000
+
+INCREASING_MOVEMENT_TYPES = (MovementType.IN, MovementType.UNPACK)
+DECREASING_MOVEMENT_TYPES = (MovementType.OUT, MovementType.PRECONDITION)
+# OUT rows the carton admin writes when a packed carton joins a shipment: the
+# stock already left with the carton's PRECONDITION movements.
+CARTON_SHIPMENT_RECORD_REASON_CODE = "carton_shipment_record"
+
+
+@dataclass(frozen=True)
+class StockLedgerDrift:
+    product_lot_id: int
+    product_id: int
+    ledger_quantity: int
+    quantity_on_hand: int
+
+    @property
+    def difference(self) -> int:
+        return self.quantity_on_hand - self.ledger_quantity
+
+
+def signed_movement_quantity():
+    """Quantity change a movement applied to its lot.
+
+    Transfers only move the lot and carton shipment records repeat a change
+    already booked, so both count as zero.
+    """
+    return Case(
+        When(reason_code=CARTON_SHIPMENT_RECORD_REASON_CODE, then=Value(0)),
+        When(movement_type__in=INCREASING_MOVEMENT_TYPES, then=F("quantity")),
+        When(movement_type__in=DECREASING_MOVEMENT_TYPES, then=-F("quantity")),
+        When(movement_type=MovementType.ADJUST, to_location__isnull=False, then=F("quantity")),
+        When(movement_type=MovementType.ADJUST, then=-F("quantity")),
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+
+
+def local_day_start(value: date) -> datetime:
+    return timezone.make_aware(datetime.combine(value, time.min))
+
+
+def checkpoint_boundary(value: datetime, period: str) -> datetime:
+    """Start of the local day or month containing ``value``."""
+    local_date = timezone.localtime(value).date()
+    if period == StockCheckpointPeriod.MONTHLY:
+        local_date = local_date.replace(day=1)
+    return local_day_start(local_date)
+
+
+def _next_boundary(boundary: datetime, period: str) -> datetime:
+    local_date = timezone.localtime(boundary).date()
+    if period == StockCheckpointPeriod.MONTHLY:
+        return local_day_start((local_date.replace(day=1) + timedelta(days=32)).replace(day=1))
+    return local_day_start(local_date + timedelta(days=1))
+
+
+def checkpoint_boundaries(period: str, *, start: datetime, end: datetime) -> list[datetime]:
+    """Period boundaries in ``(start, end]``."""
+    boundaries = []
+    boundary = _next_boundary(checkpoint_boundary(start, period), period)
+    while boundary <= end:
+        boundaries.append(boundary)
+        boundary = _next_boundary(boundary, period)
+    return boundaries
+
+
+def latest_checkpoint(at: datetime) -> StockCheckpoint | None:
+    return StockCheckpoint.objects.filter(as_of__lte=at).order_by("-as_of").first()
+
+
+def _movement_deltas(*, since, until, product_ids=None):
+    movements = StockMovement.objects.filter(created_at__lt=until)
+    if since is not None:
+        movements = movements.filter(created_at__gte=since)
+    if product_ids is not None:
+        movements = movements.filter(product_id__in=product_ids)
+    return (
+        movements.values("product_lot_id", "product_id")
+        .annotate(delta=Sum(signed_movement_quantity()))
+        .values_list("product_lot_id", "product_id", "delta")
+        .order_by()
+    )
+
+
+def lot_quantities_as_of(
+    at: datetime, *, product_ids=None, use_checkpoints: bool = True
+) -> dict[int, tuple[int, int]]:
+    """Map lot id to ``(product_id, quantity)`` for every lot with stock at ``at``."""
+    checkpoint = latest_checkpoint(at) if use_checkpoints else None
+    quantities: dict[int, tuple[int, int]] = {}
+    if checkpoint is not None:
+        lines = checkpoint.lines.all()
+        if product_ids is not None:
+            lines = lines.filter(product_id__in=product_ids)
+        for lot_id, product_id, quantity in lines.values_list(
+            "product_lot_id", "product_id", "quantity"
+        ):
+            quantities[lot_id] = (product_id, quantity)
+    for lot_id, product_id, delta in _movement_deltas(
+        since=checkpoint.as_of if checkpoint else None,
+        until=at,
+        product_ids=product_ids,
+    ):
+        quantity = quantities.get(lot_id, (product_id, 0))[1]
+        quantities[lot_id] = (product_id, quantity + (delta or 0))
+    return {lot_id: entry for lot_id, entry in quantities.items() if entry[1]}
+
+
+def product_quantities_as_of(at: datetime, *, product_ids=None) -> dict[int, int]:
+    totals: dict[int, int] = {}
+    for product_id, quantity in lot_quantities_as_of(at, product_ids=product_ids).values():
+        totals[product_id] = totals.get(product_id, 0) + quantity
+    return {product_id: total for product_id, total in totals.items() if total}
+
+
+@transaction.atomic
+def write_stock_checkpoint(
+    as_of: datetime, *, period: str = StockCheckpointPeriod.DAILY
+) -> StockCheckpoint:
+    """Write the checkpoint at ``as_of`` unless it already exists."""
+    if as_of > timezone.now():
+        raise ValueError("Stock checkpoints cannot be written in the future.")
+    existing = StockCheckpoint.objects.filter(as_of=as_of).first()
+    if existing is not None:
+        return existing
+    quantities = lot_quantities_as_of(as_of)
+    checkpoint = StockCheckpoint.objects.create(
+        as_of=as_of,
+        period=period,
+        lot_count=len(quantities),
+        total_quantity=sum(quantity for _product_id, quantity in quantities.values()),
+    )
+    StockCheckpointLine.objects.bulk_create(
+        (
+            StockCheckpointLine(
+                checkpoint=checkpoint,
+                product_lot_id=lot_id,
+                product_id=product_id,
+                quantity=quantity,
+            )
+            for lot_id, (product_id, quantity) in sorted(quantities.items())
+        ),
+        batch_size=STOCK_CHECKPOINT_LINE_BATCH_SIZE,
+    )
+    return checkpoint
+
+
+def pending_checkpoint_boundaries(
+    period: str, *, since: datetime | None = None, until: datetime | None = None
+) -> list[datetime]:
+    """Boundaries between the first movement (or ``since``) and ``until`` with no checkpoint."""
+    until = until or timezone.now()
+    if since is None:
+        since = (
+            StockMovement.objects.order_by("created_at")
+            .values_list("created_at", flat=True)
+            .first()
+        )
+        if since is None:
+            return []
+    boundaries = checkpoint_boundaries(period, start=since, end=until)
+    if not boundaries:
+        return []
+    existing = set(
+        StockCheckpoint.objects.filter(
+            as_of__gte=boundaries[0], as_of__lte=boundaries[-1]
+        ).values_list("as_of", flat=True)
+    )
+    return [boundary for boundary in boundaries if boundary not in existing]
+
+
+def backfill_stock_checkpoints(
+    period: str, *, since: datetime | None = None, until: datetime | None = None
+) -> list[StockCheckpoint]:
+    """Write the missing checkpoints oldest first, each one building on the previous."""
+    return [
+        write_stock_checkpoint(boundary, period=period)
+        for boundary in pending_checkpoint_boundaries(period, since=since, until=until)
+    ]
+
+
+def verify_stock_ledger(*, use_checkpoints: bool = True) -> list[StockLedgerDrift]:
+    """Compare ledger quantities as of now with ``ProductLot.quantity_on_hand``."""
+    ledger = lot_quantities_as_of(timezone.now(), use_checkpoints=use_checkpoints)
+    drifts = []
+    lots = ProductLot.objects.values_list("id", "product_id", "quantity_on_hand").order_by("id")
+    for lot_id, product_id, on_hand in lots.iterator():
+        ledger_quantity = ledger.get(lot_id, (product_id, 0))[1]
+        if ledger_quantity != on_hand:
+            drifts.append(
+                StockLedgerDrift(
+                    product_lot_id=lot_id,
+                    product_id=product_id,
+                    ledger_quantity=ledger_quantity,
+                    quantity_on_hand=on_hand,
+                )
+            )
+    return drifts
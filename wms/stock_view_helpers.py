@@ -1,3 +1,6 @@
+from datetime import timedelta
+
+from django.core.paginator import Paginator
 from django.db.models import (
     DateTimeField,
     F,
@@ -10,8 +13,13 @@ from django.db.models import (
 )
 from django.db.models.expressions import ExpressionWrapper
 from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 
 from .models import Product, ProductCategory, ProductLot, StockMovement, Warehouse
+from .stock_ledger import latest_checkpoint, local_day_start, product_quantities_as_of
+
+STOCK_HISTORY_PAGE_SIZE = 100
 
 
 def _parse_bool_query_param(value):
@@ -92,3 +100,57 @@ def build_stock_context(request):
         "sort": sort,
         "include_zero": include_zero,
     }
+
+
+def _parse_history_date(value, *, default):
+    try:
+        return parse_date((value or "").strip()) or default
+    except ValueError:
+        # Well-formed but impossible dates such as 2026-02-30.
+        return default
+
+
+def build_stock_history_context(request):
+    query = (request.GET.get("q") or "").strip()
+    today = timezone.localdate()
+    as_of_date = min(_parse_history_date(request.GET.get("date"), default=today), today)
+    # The report shows the stock at the end of the selected day.
+    at = min(local_day_start(as_of_date + timedelta(days=1)), timezone.now())
+
+    products = Product.objects.all()
+    if query:
+        products = products.filter(
+            Q(name__icontains=query) | Q(sku__icontains=query) | Q(barcode__icontains=query)
+        )
+        product_ids = list(products.values_list("id", flat=True))
+    else:
+        product_ids = None
+    quantities = product_quantities_as_of(at, product_ids=product_ids)
+    page = Paginator(
+        products.filter(id__in=quantities).order_by("name", "id"), STOCK_HISTORY_PAGE_SIZE
+    ).get_page(request.GET.get("page"))
+    page_products = list(page.object_list)
+    current_totals = dict(
+        ProductLot.objects.filter(product_id__in=[product.id for product in page_products])
+        .values("product_id")
+        .annotate(total=Sum("quantity_on_hand"))
+        .values_list("product_id", "total")
+        .order_by()
+    )
+    rows = [
+        {
+            "product": product,
+            "quantity": quantities[product.id],
+            "current_quantity": current_totals.get(product.id, 0),
+        }
+        for product in page_products
+    ]
+
+    return {
+        "active": "stock",
+        "rows": rows,
+        "page_obj": page,
+        "query": query,
+        "as_of_date": as_of_date,
+        "checkpoint": latest_checkpoint(at),
+    }
@@ -94,14 +94,21 @@ class ProductAdminTests(_AdminTestBase):
         admin_obj = ProductAdmin(models.Product, self.site)
         request = self._request()
 
-        self.assertEqual(admin_obj.qr_code_preview(SimpleNamespace(qr_code_image=None)), "-")
+        self.assertEqual(admin_obj.qr_code_preview(SimpleNamespace(sku="")), "-")
         self.assertEqual(admin_obj.photo_preview(SimpleNamespace(photo=None)), "-")
 
         obj_with_media = SimpleNamespace(
-            qr_code_image=SimpleNamespace(url="/media/qr.png"),
+            sku="SKU-QR",
             photo=SimpleNamespace(url="/media/photo.png"),
         )
-        self.assertIn("/media/qr.png", admin_obj.qr_code_preview(obj_with_media))
+        with mock.patch(
+            "wms.admin.product_qr_data_uri",
+            return_value="data:image/svg+xml;base64,UVI=",
+        ) as qr_mock:
+            self.assertIn(
+                "data:image/svg+xml;base64,UVI=", admin_obj.qr_code_preview(obj_with_media)
+            )
+        qr_mock.assert_called_once_with(obj_with_media)
         self.assertIn("/media/photo.png", admin_obj.photo_preview(obj_with_media))
 
         p1 = models.Product.objects.create(
@@ -129,26 +136,32 @@ class ProductAdminTests(_AdminTestBase):
         self.assertTrue(p1.is_active)
         self.assertTrue(p2.is_active)
 
-    def test_generate_qr_codes_and_empty_print_actions(self):
+    def test_warm_qr_code_cache_and_empty_print_actions(self):
         admin_obj = ProductAdmin(models.Product, self.site)
         request = self._request()
 
-        product_missing_qr = mock.Mock(qr_code_image="")
-        product_missing_qr.generate_qr_code = mock.Mock()
-        product_missing_qr.save = mock.Mock()
-        product_with_qr = mock.Mock(qr_code_image="existing")
-        product_with_qr.generate_qr_code = mock.Mock()
-        product_with_qr.save = mock.Mock()
+        products = [
+            SimpleNamespace(sku="SKU-A"),
+            SimpleNamespace(sku="SKU-A"),
+            SimpleNamespace(sku=""),
+            SimpleNamespace(sku="SKU-B"),
+        ]
 
-        with mock.patch.object(admin_obj, "message_user") as message_user_mock:
-            admin_obj.generate_qr_codes(request, [product_missing_qr, product_with_qr])
+        with (
+            mock.patch("wms.admin.render_qr_codes", return_value={"SKU-A": b"", "SKU-B": b""}) as (
+                render_mock
+            ),
+            mock.patch.object(admin_obj, "message_user") as message_user_mock,
+        ):
+            admin_obj.warm_qr_code_cache(request, products)
             admin_obj.print_product_labels(request, models.Product.objects.none())
             admin_obj.print_product_qr_labels(request, models.Product.objects.none())
 
-        product_missing_qr.generate_qr_code.assert_called_once()
-        product_missing_qr.save.assert_called_once_with(update_fields=["qr_code_image"])
-        product_with_qr.generate_qr_code.assert_not_called()
-        product_with_qr.save.assert_not_called()
+        self.assertEqual(list(render_mock.call_args.args[0]), ["SKU-A", "SKU-A", "", "SKU-B"])
+        self.assertIn(
+            "2 QR code(s) préparés dans le cache",
+            str(message_user_mock.call_args_list[0].args[1]),
+        )
         self.assertEqual(message_user_mock.call_count, 3)
 
     def test_print_product_label_actions_non_empty(self):
@@ -786,13 +799,8 @@ class ShipmentAndStockMovementAdminTests(_AdminTestBase):
         shipment = self._shipment(reference="260200")
         carton = models.Carton.objects.create(code="CART-ADM", shipment=shipment)
 
-        self.assertEqual(shipment_admin.qr_code_preview(SimpleNamespace(qr_code_image=None)), "-")
-        self.assertIn(
-            "/media/qr.png",
-            shipment_admin.qr_code_preview(
-                SimpleNamespace(qr_code_image=SimpleNamespace(url="/media/qr.png"))
-            ),
-        )
+        self.assertEqual(shipment_admin.qr_code_preview(models.Shipment()), "-")
+        self.assertIn("data:image/svg+xml;base64,", shipment_admin.qr_code_preview(shipment))
 
         with mock.patch.object(shipment_admin, "get_object", return_value=None):
             with self.assertRaises(Http404):
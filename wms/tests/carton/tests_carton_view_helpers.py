@@ -97,6 +97,8 @@ class CartonViewHelpersTests(TestCase):
             shipment_id=77,
             shipment=SimpleNamespace(reference="S-077", status="draft"),
             current_location="A1",
+            total_weight_g=1000,
+            total_volume_cm3=2000,
             cartonitem_set=SimpleNamespace(all=lambda: [item_assigned]),
         )
         carton_draft = SimpleNamespace(
@@ -107,6 +109,8 @@ class CartonViewHelpersTests(TestCase):
             shipment_id=None,
             shipment=None,
             current_location="A2",
+            total_weight_g=0,
+            total_volume_cm3=None,
             cartonitem_set=SimpleNamespace(all=lambda: [item_missing_both]),
         )
         carton_unknown_status = SimpleNamespace(
@@ -118,6 +122,8 @@ class CartonViewHelpersTests(TestCase):
             shipment=None,
             preassigned_destination=None,
             current_location="A3",
+            total_weight_g=200,
+            total_volume_cm3=None,
             cartonitem_set=SimpleNamespace(all=lambda: [item_missing_volume]),
         )
         carton_preassigned = SimpleNamespace(
@@ -129,6 +135,8 @@ class CartonViewHelpersTests(TestCase):
             shipment=None,
             preassigned_destination=SimpleNamespace(iata_code="NKC"),
             current_location="A4",
+            total_weight_g=500,
+            total_volume_cm3=1000,
             cartonitem_set=SimpleNamespace(all=lambda: [item_draft]),
         )
 
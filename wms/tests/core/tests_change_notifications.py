@@ -0,0 +1,90 @@
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from wms import change_notifications
+from wms.change_notifications import current_change_state, wait_for_change
+from wms.models import WmsChange
+
+
+class ChangeStateTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_state_is_read_only_and_reflects_bumps(self):
+        self.assertEqual(current_change_state()["version"], 0)
+        self.assertFalse(WmsChange.objects.exists())
+
+        WmsChange.bump()
+        self.assertEqual(current_change_state()["version"], 1)
+        WmsChange.bump()
+        self.assertEqual(current_change_state()["version"], 2)
+
+    def test_bump_wakes_waiters(self):
+        with mock.patch.object(change_notifications, "_change_condition") as condition_mock:
+            WmsChange.bump()
+
+        condition_mock.notify_all.assert_called_once_with()
+
+
+@override_settings(SCAN_SYNC_LONG_POLL_SECONDS=5, SCAN_SYNC_MAX_WAITERS=2)
+class WaitForChangeTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.state = {"version": 3, "changed_at": None}
+        patcher = mock.patch.object(
+            change_notifications, "current_change_state", side_effect=lambda: dict(self.state)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unknown_or_stale_version_answers_immediately(self):
+        self.assertEqual(
+            wait_for_change(None),
+            {"version": 3, "changed_at": None, "changed": False, "waited": False},
+        )
+        self.assertEqual(
+            wait_for_change(2),
+            {"version": 3, "changed_at": None, "changed": True, "waited": False},
+        )
+
+    def test_wait_returns_when_woken_by_a_change(self):
+        def publish():
+            time.sleep(0.1)
+            self.state["version"] = 4
+            change_notifications.notify_change()
+
+        thread = threading.Thread(target=publish)
+        started = time.monotonic()
+        thread.start()
+        result = wait_for_change(3)
+        thread.join()
+
+        self.assertLess(time.monotonic() - started, change_notifications.CHANGE_WAIT_SLICE_SECONDS)
+        self.assertEqual(result["version"], 4)
+        self.assertTrue(result["changed"])
+        self.assertTrue(result["waited"])
+
+    def test_wait_expires_without_change(self):
+        result = wait_for_change(3, timeout=0.05)
+
+        self.assertEqual(result["version"], 3)
+        self.assertFalse(result["changed"])
+        self.assertTrue(result["waited"])
+        self.assertEqual(change_notifications._waiter_slots.held, 0)
+
+    def test_busy_or_disabled_long_poll_answers_immediately(self):
+        with mock.patch.object(change_notifications._waiter_slots, "held", 2):
+            self.assertFalse(wait_for_change(3)["waited"])
+            self.assertEqual(change_notifications._waiter_slots.held, 2)
+        self.assertFalse(wait_for_change(3, timeout=0)["waited"])
+
+    @override_settings(SCAN_SYNC_LONG_POLL_SECONDS=0)
+    def test_long_poll_is_disabled_by_setting(self):
+        result = wait_for_change(3)
+
+        self.assertFalse(result["waited"])
+        self.assertEqual(change_notifications._waiter_slots.held, 0)
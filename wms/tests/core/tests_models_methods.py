@@ -130,9 +130,7 @@ class WmsModelMethodsTests(TestCase):
 
         self.assertEqual(str(self.product), "SKU-BASE - Base Product")
 
-        no_sku_product = Product(name="No Sku")
-        no_sku_product.generate_qr_code()
-        self.assertFalse(bool(no_sku_product.qr_code_image))
+        self.assertFalse(bool(Product.objects.create(name="No QR", sku="SKU-NO-QR").qr_code_image))
 
         tax_product = Product(
             sku="SKU-TAX",
@@ -290,31 +288,12 @@ class WmsModelMethodsTests(TestCase):
         )
         self.assertEqual(no_token.get_tracking_path(), "")
         self.assertEqual(no_token.get_tracking_url(), "")
-        no_token.generate_qr_code()
-        self.assertFalse(bool(no_token.qr_code_image))
 
         with override_settings(SITE_BASE_URL="example.org"):
             url = shipment.get_tracking_url()
         self.assertTrue(url.startswith("https://example.org/"))
 
-        shipment_no_qr = self._create_shipment(reference="260011")
-        Shipment.objects.filter(pk=shipment_no_qr.pk).update(qr_code_image="")
-        shipment_no_qr.refresh_from_db()
-
-        def _fake_generate(*, request=None):
-            shipment_no_qr.qr_code_image = "qr_codes/shipments/generated.png"
-
-        with (
-            mock.patch.object(
-                shipment_no_qr,
-                "generate_qr_code",
-                side_effect=_fake_generate,
-            ) as generate_mock,
-            mock.patch.object(shipment_no_qr, "save") as save_mock,
-        ):
-            shipment_no_qr.ensure_qr_code()
-        generate_mock.assert_called_once_with(request=None)
-        save_mock.assert_called_once_with(update_fields=["qr_code_image"])
+        self.assertFalse(bool(shipment.qr_code_image))
 
         event = ShipmentTrackingEvent.objects.create(
             shipment=shipment,
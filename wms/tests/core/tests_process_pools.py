@@ -0,0 +1,22 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from wms.process_pools import can_use_process_pool
+
+
+class ProcessPoolTests(SimpleTestCase):
+    def test_pool_needs_several_workers_and_tasks(self):
+        with mock.patch("wms.process_pools.multiprocessing.current_process") as process_mock:
+            process_mock.return_value.daemon = False
+
+            self.assertTrue(can_use_process_pool(max_workers=4, task_count=2))
+            self.assertFalse(can_use_process_pool(max_workers=1, task_count=8))
+            self.assertFalse(can_use_process_pool(max_workers=4, task_count=1))
+            self.assertFalse(can_use_process_pool(max_workers=4, task_count=5, min_tasks=6))
+
+    def test_daemonic_processes_never_use_a_pool(self):
+        with mock.patch("wms.process_pools.multiprocessing.current_process") as process_mock:
+            process_mock.return_value.daemon = True
+
+            self.assertFalse(can_use_process_pool(max_workers=4, task_count=8))
@@ -0,0 +1,121 @@
+from datetime import date, timedelta
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Max
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from wms.document_scan_queue import _base_scan_queue_queryset, _queue_claim_filter
+from wms.domain.stock import fefo_lots
+from wms.models import (
+    IntegrationDirection,
+    IntegrationEvent,
+    IntegrationStatus,
+    Location,
+    MovementType,
+    Product,
+    ProductLot,
+    Shipment,
+    ShipmentStatus,
+    StockMovement,
+    Warehouse,
+)
+from wms.notification_outbox import _base_outbox_queryset
+from wms.stock_view_helpers import build_stock_context
+
+
+@skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN output is SQLite specific")
+class HotQueryIndexPlanTests(TestCase):
+    """EXPLAIN guards: the hot queries must keep using their composite indexes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        warehouse = Warehouse.objects.create(name="Plan WH")
+        location = Location.objects.create(warehouse=warehouse, zone="P", aisle="01", shelf="001")
+        user = get_user_model().objects.create_user(username="plan-user", password="pass1234")
+        cls.products = [
+            Product.objects.create(name=f"Plan {index}", sku=f"SKU-PLAN-{index}")
+            for index in range(4)
+        ]
+        for product in cls.products:
+            for offset in range(3):
+                lot = ProductLot.objects.create(
+                    product=product,
+                    location=location,
+                    quantity_on_hand=5,
+                    expires_on=date(2027, 1, 1) + timedelta(days=offset),
+                    received_on=date(2026, 1, 1),
+                )
+                StockMovement.objects.create(
+                    movement_type=MovementType.IN,
+                    product=product,
+                    product_lot=lot,
+                    quantity=5,
+                    to_location=location,
+                    created_by=user,
+                )
+        for index in range(4):
+            Shipment.objects.create(
+                reference=f"PLAN-{index}",
+                shipper_name="Shipper",
+                recipient_name="Recipient",
+                destination_address="1 Rue Test",
+                destination_country="France",
+            )
+        for status in (IntegrationStatus.PENDING, IntegrationStatus.PROCESSED):
+            IntegrationEvent.objects.create(
+                direction=IntegrationDirection.OUTBOUND,
+                source="wms.plan",
+                event_type="plan",
+                status=status,
+            )
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, msg=f"{index_name} not used by:\n{plan}")
+
+    def test_fefo_lots_use_fefo_index(self):
+        self.assertUsesIndex(fefo_lots(self.products[0]), "wms_lot_fefo_idx")
+
+    def test_last_movement_lookup_uses_product_history_index(self):
+        request = RequestFactory().get("/scan/stock/")
+        self.assertUsesIndex(build_stock_context(request)["products"], "wms_movement_product_idx")
+        self.assertUsesIndex(
+            StockMovement.objects.filter(product=self.products[0])
+            .values("product_id")
+            .annotate(last=Max("created_at")),
+            "wms_movement_product_idx",
+        )
+
+    def test_shipment_lists_use_archive_indexes(self):
+        self.assertUsesIndex(
+            Shipment.objects.filter(archived_at__isnull=True).order_by("-created_at"),
+            "wms_shipment_list_idx",
+        )
+        self.assertUsesIndex(
+            Shipment.objects.filter(
+                archived_at__isnull=True,
+                status=ShipmentStatus.DELIVERED,
+                closed_at__isnull=True,
+            ).order_by(),
+            "wms_shipment_status_idx",
+        )
+
+    def test_queue_claims_use_claim_index(self):
+        self.assertUsesIndex(
+            _base_scan_queue_queryset()
+            .filter(
+                _queue_claim_filter(
+                    statuses=[IntegrationStatus.PENDING],
+                    stale_processing_before=timezone.now(),
+                )
+            )
+            .order_by("created_at", "id"),
+            "wms_integration_claim_idx",
+        )
+        self.assertUsesIndex(
+            _base_outbox_queryset().filter(status=IntegrationStatus.PENDING).order_by("created_at"),
+            "wms_integration_claim_idx",
+        )
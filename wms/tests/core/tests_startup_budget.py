@@ -0,0 +1,115 @@
+import json
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+from wms.lazy_imports import lazy_attribute, lazy_module
+from wms.startup_profile import (
+    STARTUP_BUDGET_ENV,
+    STARTUP_BUDGET_MS,
+    ImportTiming,
+    StartupProfile,
+    parse_importtime,
+    profile_startup,
+    startup_budget_ms,
+)
+
+
+class LazyImportTests(SimpleTestCase):
+    def test_missing_dependency_is_falsy_and_never_imported(self):
+        module = lazy_module("wms_missing_dependency.submodule")
+        attribute = lazy_attribute("wms_missing_dependency", "load")
+
+        self.assertFalse(module)
+        self.assertFalse(attribute)
+        with self.assertRaises(ModuleNotFoundError):
+            attribute()
+
+    def test_installed_dependency_resolves_on_first_use(self):
+        dumps = lazy_attribute("json", "dumps")
+
+        self.assertTrue(dumps)
+        self.assertEqual(dumps({"a": 1}), '{"a": 1}')
+        self.assertEqual(lazy_module("json.decoder").JSONDecodeError.__name__, "JSONDecodeError")
+
+
+class StartupProfileTests(SimpleTestCase):
+    def test_parse_importtime_skips_header_and_other_output(self):
+        timings = parse_importtime(
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   _io\n"
+            "Traceback noise\n"
+            "import time:      3500 |       9000 | openpyxl.cell\n"
+        )
+
+        self.assertEqual(
+            timings,
+            [
+                ImportTiming(module="_io", self_us=120, cumulative_us=120),
+                ImportTiming(module="openpyxl.cell", self_us=3500, cumulative_us=9000),
+            ],
+        )
+        profile = StartupProfile(elapsed_ms=10.0, imports=tuple(timings))
+        self.assertEqual(profile.heavy_modules, ["openpyxl"])
+        self.assertEqual(profile.slowest(1)[0].module, "openpyxl.cell")
+
+    def test_startup_does_not_import_heavy_modules(self):
+        # Wall-clock budgets are enforced by ``manage.py benchmark_startup``, not here: the
+        # probe time depends on machine load, which is unpredictable under --parallel.
+        profile = profile_startup()
+
+        self.assertEqual(profile.heavy_modules, [])
+
+    def test_startup_budget_reads_environment_override(self):
+        with mock.patch.dict("os.environ", {STARTUP_BUDGET_ENV: "1500"}):
+            self.assertEqual(startup_budget_ms(), 1500.0)
+        with mock.patch.dict("os.environ", {STARTUP_BUDGET_ENV: ""}):
+            self.assertEqual(startup_budget_ms(), float(STARTUP_BUDGET_MS))
+
+
+class BenchmarkStartupCommandTests(SimpleTestCase):
+    def _profile(self, *modules):
+        return StartupProfile(
+            elapsed_ms=42.0,
+            imports=tuple(
+                ImportTiming(module=module, self_us=1000, cumulative_us=2000) for module in modules
+            ),
+        )
+
+    def test_command_reports_json(self):
+        out = StringIO()
+        with mock.patch(
+            "wms.management.commands.benchmark_startup.profile_startup",
+            return_value=self._profile("django"),
+        ):
+            call_command("benchmark_startup", "--repeat", "2", "--budget-ms", "100", stdout=out)
+
+        report = json.loads(out.getvalue())
+        self.assertEqual(report["benchmark"], "startup")
+        self.assertEqual(len(report["runs"]), 2)
+        self.assertEqual(report["startup_ms"], 42.0)
+        self.assertEqual(report["heavy_modules"], [])
+        self.assertEqual(report["slowest_imports"][0]["module"], "django")
+
+    def test_command_fails_over_budget_or_on_heavy_import(self):
+        with mock.patch(
+            "wms.management.commands.benchmark_startup.profile_startup",
+            return_value=self._profile("django"),
+        ):
+            with self.assertRaisesMessage(CommandError, "over the 10 ms budget"):
+                call_command(
+                    "benchmark_startup", "--repeat", "1", "--budget-ms", "10", stdout=StringIO()
+                )
+        with mock.patch(
+            "wms.management.commands.benchmark_startup.profile_startup",
+            return_value=self._profile("pdfplumber.page"),
+        ):
+            with self.assertRaisesMessage(CommandError, "pdfplumber"):
+                call_command("benchmark_startup", "--repeat", "1", stdout=StringIO())
+
+    def test_command_rejects_invalid_repeat(self):
+        with self.assertRaisesMessage(CommandError, "--repeat must be at least 1."):
+            call_command("benchmark_startup", "--repeat", "0")
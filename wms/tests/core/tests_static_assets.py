@@ -0,0 +1,101 @@
+import gzip
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from wms.static_assets import (
+    STATIC_PAGE_BUDGETS,
+    CompressedManifestStaticFilesStorage,
+    critical_static_names,
+    is_hashed_static_name,
+    serve_static_asset,
+)
+
+
+class CompressedManifestStorageTests(SimpleTestCase):
+    def test_post_process_hashes_and_writes_gzip_siblings(self):
+        with tempfile.TemporaryDirectory() as source_dir, tempfile.TemporaryDirectory() as root:
+            script = "console.log('scan');\n" * 100
+            Path(source_dir, "app.js").write_text(script, encoding="utf-8")
+            Path(source_dir, "tiny.css").write_text("a{}", encoding="utf-8")
+            source = FileSystemStorage(location=source_dir)
+            storage = CompressedManifestStaticFilesStorage(location=root, base_url="/static/")
+            for name in ("app.js", "tiny.css"):
+                storage.save(name, source.open(name))
+
+            processed = list(
+                storage.post_process({name: (source, name) for name in ("app.js", "tiny.css")})
+            )
+
+            hashed = storage.stored_name("app.js")
+            self.assertTrue(is_hashed_static_name(hashed))
+            self.assertIn(("app.js", "app.js.gz", True), processed)
+            self.assertIn((hashed, f"{hashed}.gz", True), processed)
+            compressed = Path(root, f"{hashed}.gz").read_bytes()
+            self.assertEqual(gzip.decompress(compressed).decode(), script)
+            self.assertFalse(Path(root, "tiny.css.gz").exists())
+
+
+class ServeStaticAssetTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.root.cleanup)
+        Path(self.root.name, "scan.0123456789ab.js").write_text("plain", encoding="utf-8")
+        Path(self.root.name, "scan.0123456789ab.js.gz").write_bytes(gzip.compress(b"plain"))
+        Path(self.root.name, "scan.js").write_text("plain", encoding="utf-8")
+
+    def _get(self, path, **headers):
+        with override_settings(STATIC_ROOT=self.root.name):
+            request = self.factory.get(f"/static/{path}", headers=headers)
+            return serve_static_asset(request, path)
+
+    def test_hashed_asset_is_immutable_and_served_precompressed(self):
+        response = self._get("scan.0123456789ab.js", accept_encoding="gzip, deflate, br")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertEqual(gzip.decompress(b"".join(response.streaming_content)), b"plain")
+
+    def test_unhashed_asset_is_revalidated_and_served_plain(self):
+        response = self._get("scan.js", accept_encoding="gzip")
+
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(response["Cache-Control"], "no-cache")
+
+    def test_paths_outside_static_root_are_not_found(self):
+        from django.http import Http404
+
+        with self.assertRaises(Http404):
+            self._get("../secrets.txt")
+
+
+class StaticBudgetTests(SimpleTestCase):
+    def test_scanner_library_stays_off_the_critical_path(self):
+        names = critical_static_names("scan/base.html")
+
+        self.assertIn("scan/scan.js", names)
+        self.assertNotIn("scan/zxing.min.js", names)
+
+    def test_pages_fit_their_budget(self):
+        out = StringIO()
+        call_command("check_static_budget", stdout=out)
+
+        for page in STATIC_PAGE_BUDGETS:
+            self.assertIn(f"{page}: ", out.getvalue())
+        self.assertNotIn("[OVER]", out.getvalue())
+
+    def test_command_fails_over_budget(self):
+        with mock.patch.dict(
+            "wms.management.commands.check_static_budget.STATIC_PAGE_BUDGETS",
+            {"scan/base.html": 1000},
+        ):
+            with self.assertRaisesMessage(CommandError, "scan/base.html"):
+                call_command("check_static_budget", "--page", "scan/base.html", stdout=StringIO())
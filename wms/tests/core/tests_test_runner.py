@@ -1,11 +1,13 @@
+import logging
 from io import StringIO
-from unittest import FunctionTestCase
+from unittest import FunctionTestCase, mock
 from unittest.runner import _WritelnDecorator
 
 from django.test import SimpleTestCase
 from django.utils import translation
 
 from asf_wms.test_runner import (
+    LanguageResetDiscoverRunner,
     LanguageResetRemoteTestResult,
     LanguageResetTextTestResult,
 )
@@ -34,3 +36,21 @@ class LanguageResetRemoteTestResultTests(SimpleTestCase):
         result.stopTest(test)
 
         self.assertEqual(translation.get_language(), "fr")
+
+
+class LanguageResetDiscoverRunnerTests(SimpleTestCase):
+    def test_query_workload_capture_runs_serially(self):
+        with mock.patch.dict("os.environ", {"WMS_QUERY_WORKLOAD": "workload.json"}):
+            with self.assertLogs("wms.tests.runner", level="WARNING") as logs:
+                runner = LanguageResetDiscoverRunner(
+                    parallel=4, logger=logging.getLogger("wms.tests.runner")
+                )
+
+        self.assertEqual(runner.parallel, 1)
+        self.assertIn("--parallel=1", logs.output[0])
+
+    def test_parallel_is_kept_without_query_workload(self):
+        with mock.patch.dict("os.environ", {"WMS_QUERY_WORKLOAD": ""}):
+            runner = LanguageResetDiscoverRunner(parallel=4, verbosity=0)
+
+        self.assertEqual(runner.parallel, 4)
@@ -792,6 +792,83 @@ class DomainOrdersExtraTests(TestCase):
         self.assertEqual(event.new_status, CartonStatus.ASSIGNED)
         self.assertEqual(event.reason, "order_assign_ready_carton")
 
+    def test_assign_ready_cartons_to_order_batches_cartons_of_the_same_line(self):
+        order, line = self._create_order(
+            status=OrderStatus.RESERVED,
+            quantity=6,
+            reserved_quantity=6,
+        )
+        lot = self._create_lot(
+            product=self.product,
+            code="LOT-ASSIGN-BATCH",
+            quantity_on_hand=20,
+            quantity_reserved=6,
+        )
+        self._create_reservation(line=line, lot=lot, quantity=6)
+        create_shipment_for_order(order=order)
+        cartons = []
+        for index in range(4):
+            carton = Carton.objects.create(code=f"CB{index}", status=CartonStatus.PACKED)
+            CartonItem.objects.create(carton=carton, product_lot=lot, quantity=2)
+            cartons.append(carton)
+
+        with mock.patch(
+            "wms.domain.orders.release_reserved_stock",
+            wraps=release_reserved_stock,
+        ) as release_mock:
+            assigned = assign_ready_cartons_to_order(order=order)
+
+        line.refresh_from_db()
+        lot.refresh_from_db()
+        self.assertEqual(assigned, 3)
+        release_mock.assert_called_once()
+        self.assertEqual(release_mock.call_args.kwargs["quantity"], 6)
+        self.assertEqual(line.prepared_quantity, 6)
+        self.assertEqual(line.reserved_quantity, 0)
+        self.assertEqual(lot.quantity_reserved, 0)
+        self.assertEqual(
+            list(
+                Carton.objects.filter(shipment=order.shipment)
+                .order_by("code")
+                .values_list("code", flat=True)
+            ),
+            ["CB0", "CB1", "CB2"],
+        )
+        self.assertEqual(
+            CartonStatusEvent.objects.filter(reason="order_assign_ready_carton").count(),
+            3,
+        )
+        cartons[3].refresh_from_db()
+        self.assertIsNone(cartons[3].shipment_id)
+        self.assertEqual(cartons[3].status, CartonStatus.PACKED)
+
+    def test_assign_ready_cartons_releases_at_most_the_line_reservation(self):
+        order, line = self._create_order(
+            status=OrderStatus.RESERVED,
+            quantity=15,
+            reserved_quantity=10,
+        )
+        lot = self._create_lot(
+            product=self.product,
+            code="LOT-ASSIGN-PARTIAL",
+            quantity_on_hand=30,
+            quantity_reserved=10,
+        )
+        self._create_reservation(line=line, lot=lot, quantity=10)
+        for index in range(3):
+            carton = Carton.objects.create(code=f"CP{index}", status=CartonStatus.PACKED)
+            CartonItem.objects.create(carton=carton, product_lot=lot, quantity=5)
+
+        assigned = assign_ready_cartons_to_order(order=order)
+
+        line.refresh_from_db()
+        lot.refresh_from_db()
+        self.assertEqual(assigned, 3)
+        self.assertEqual(line.prepared_quantity, 15)
+        self.assertEqual(line.reserved_quantity, 0)
+        self.assertEqual(lot.quantity_reserved, 0)
+        self.assertFalse(OrderReservation.objects.filter(order_line=line).exists())
+
     def test_assign_ready_cartons_rejects_disputed_shipment(self):
         order, _line = self._create_order(
             status=OrderStatus.RESERVED,
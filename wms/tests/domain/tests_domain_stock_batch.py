@@ -0,0 +1,168 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from wms.domain.dto import (
+    AdjustStockInput,
+    ConsumeStockInput,
+    ReceiveStockInput,
+    TransferStockInput,
+)
+from wms.domain.stock_batch import (
+    RESULT_APPLIED,
+    RESULT_FAILED,
+    RESULT_ROLLED_BACK,
+    RESULT_SKIPPED,
+    STOCK_BATCH_MODE_PARTIAL,
+    StockOperation,
+    apply_stock_batch,
+    stock_operation_from_data,
+)
+from wms.models import (
+    Location,
+    Product,
+    ProductLot,
+    ProductLotStatus,
+    StockMovement,
+    Warehouse,
+    WmsChange,
+)
+from wms.signals import coalesce_change_bumps
+
+
+class StockBatchTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="stock-batch")
+        warehouse = Warehouse.objects.create(name="Batch WH", code="BWH")
+        self.location = Location.objects.create(
+            warehouse=warehouse, zone="A", aisle="01", shelf="001"
+        )
+        self.other_location = Location.objects.create(
+            warehouse=warehouse, zone="B", aisle="01", shelf="001"
+        )
+        self.product = Product.objects.create(sku="BATCH-001", name="Batch product")
+        self.lot = ProductLot.objects.create(
+            product=self.product,
+            lot_code="LOT-A",
+            status=ProductLotStatus.AVAILABLE,
+            quantity_on_hand=10,
+            location=self.location,
+        )
+
+    def _apply(self, operations, **kwargs):
+        return apply_stock_batch(user=self.user, operations=operations, **kwargs)
+
+    def test_mixed_batch_applies_every_operation_with_shared_lots(self):
+        result = self._apply(
+            [
+                StockOperation(
+                    "receive",
+                    ReceiveStockInput(
+                        product_id=self.product.id, quantity=4, location_id=self.location.id
+                    ),
+                ),
+                StockOperation("adjust", AdjustStockInput(lot_id=self.lot.id, delta=-2)),
+                StockOperation(
+                    "consume", ConsumeStockInput(product_id=self.product.id, quantity=9)
+                ),
+                StockOperation("adjust", AdjustStockInput(lot_id=self.lot.id, delta=5)),
+                StockOperation(
+                    "transfer",
+                    TransferStockInput(lot_id=self.lot.id, location_id=self.other_location.id),
+                ),
+            ]
+        )
+
+        self.assertTrue(result.committed)
+        self.assertEqual(result.count(RESULT_APPLIED), 5)
+        self.lot.refresh_from_db()
+        # 10 - 2 - 8 consumed (the older lot first) + 5, then moved.
+        self.assertEqual(self.lot.quantity_on_hand, 5)
+        self.assertEqual(self.lot.location, self.other_location)
+        received_lot = ProductLot.objects.get(pk=result.results[0].data["lot_id"])
+        self.assertEqual(received_lot.quantity_on_hand, 3)
+        self.assertEqual(StockMovement.objects.filter(product=self.product).count(), 6)
+
+    def test_atomic_mode_rejects_the_batch_when_validation_fails(self):
+        result = self._apply(
+            [
+                StockOperation("adjust", AdjustStockInput(lot_id=self.lot.id, delta=1)),
+                StockOperation("adjust", AdjustStockInput(lot_id=999999, delta=1)),
+            ]
+        )
+
+        self.assertFalse(result.committed)
+        self.assertEqual([item.status for item in result.results], [RESULT_SKIPPED, RESULT_FAILED])
+        self.assertEqual(result.results[1].detail, "Lot introuvable.")
+        self.assertFalse(StockMovement.objects.exists())
+
+    def test_atomic_mode_rolls_back_when_an_operation_fails(self):
+        result = self._apply(
+            [
+                StockOperation("adjust", AdjustStockInput(lot_id=self.lot.id, delta=1)),
+                StockOperation(
+                    "consume", ConsumeStockInput(product_id=self.product.id, quantity=50)
+                ),
+                StockOperation("adjust", AdjustStockInput(lot_id=self.lot.id, delta=1)),
+            ]
+        )
+
+        self.assertFalse(result.committed)
+        self.assertEqual(
+            [item.status for item in result.results],
+            [RESULT_ROLLED_BACK, RESULT_FAILED, RESULT_SKIPPED],
+        )
+        self.lot.refresh_from_db()
+        self.assertEqual(self.lot.quantity_on_hand, 10)
+        self.assertFalse(StockMovement.objects.exists())
+
+    def test_partial_mode_keeps_successful_operations(self):
+        result = self._apply(
+            [
+                StockOperation("adjust", AdjustStockInput(lot_id=self.lot.id, delta=1)),
+                StockOperation(
+                    "consume", ConsumeStockInput(product_id=self.product.id, quantity=50)
+                ),
+                StockOperation("adjust", AdjustStockInput(lot_id=999999, delta=1)),
+                StockOperation("adjust", AdjustStockInput(lot_id=self.lot.id, delta=1)),
+            ],
+            mode=STOCK_BATCH_MODE_PARTIAL,
+        )
+
+        self.assertTrue(result.committed)
+        self.assertEqual(
+            [item.status for item in result.results],
+            [RESULT_APPLIED, RESULT_FAILED, RESULT_FAILED, RESULT_APPLIED],
+        )
+        self.lot.refresh_from_db()
+        self.assertEqual(self.lot.quantity_on_hand, 12)
+
+    def test_batch_bumps_the_change_counter_once(self):
+        WmsChange.bump()
+        version = WmsChange.objects.get(pk=1).version
+
+        self._apply(
+            [
+                StockOperation("adjust", AdjustStockInput(lot_id=self.lot.id, delta=1))
+                for _index in range(3)
+            ]
+        )
+
+        self.assertEqual(WmsChange.objects.get(pk=1).version, version + 1)
+
+    def test_nested_coalescing_bumps_once_at_the_outer_block(self):
+        WmsChange.bump()
+        version = WmsChange.objects.get(pk=1).version
+
+        with coalesce_change_bumps():
+            with coalesce_change_bumps():
+                Product.objects.create(sku="BATCH-002", name="Other")
+            self.assertEqual(WmsChange.objects.get(pk=1).version, version)
+
+        self.assertEqual(WmsChange.objects.get(pk=1).version, version + 1)
+
+    def test_operation_from_data_ignores_fields_of_other_operations(self):
+        operation = stock_operation_from_data(
+            {"op": "transfer", "lot_id": 3, "location_id": 4, "quantity": 2}
+        )
+
+        self.assertEqual(operation, StockOperation("transfer", TransferStockInput(3, 4)))
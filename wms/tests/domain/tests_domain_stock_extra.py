@@ -3,8 +3,9 @@ from types import SimpleNamespace
 from unittest import mock
 
 from django.contrib.auth import get_user_model
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from wms.domain.dto import PackCartonInput, ReceiveStockInput
 from wms.domain.stock import (
@@ -23,9 +24,11 @@ from wms.domain.stock import (
     fefo_lots,
     generate_carton_code,
     pack_carton_from_input,
+    rebuild_carton_totals,
     receive_receipt_line,
     receive_stock,
     receive_stock_from_input,
+    refresh_carton_totals,
     transfer_stock,
     unpack_carton,
 )
@@ -173,6 +176,87 @@ class DomainStockExtraTests(TestCase):
 
         self.assertEqual(_dominant_type_code(carton), "BE")
 
+    def test_refresh_carton_totals_stores_item_aggregates(self):
+        category = ProductCategory.objects.create(name="Medical Kit")
+        product = self._create_product(
+            sku="STOCK-TOTALS",
+            name="Totals Product",
+            category=category,
+            weight_g=250,
+        )
+        product.volume_cm3 = 400
+        product.save(update_fields=["volume_cm3"])
+        carton = Carton.objects.create(code="CT-TOTALS", status=CartonStatus.PACKED)
+        CartonItem.objects.create(
+            carton=carton,
+            product_lot=self._create_lot(product=product, code="LOT-T1"),
+            quantity=2,
+        )
+        CartonItem.objects.create(
+            carton=carton,
+            product_lot=self._create_lot(product=product, code="LOT-T2"),
+            quantity=1,
+        )
+
+        refresh_carton_totals(carton)
+        carton.refresh_from_db()
+
+        self.assertEqual(carton.total_weight_g, 750)
+        self.assertEqual(carton.total_volume_cm3, 1200)
+        self.assertEqual(carton.item_count, 3)
+        self.assertEqual(carton.single_product_id, product.id)
+        self.assertEqual(carton.dominant_type_code, "MK")
+
+        CartonItem.objects.create(
+            carton=carton,
+            product_lot=self._create_lot(code="LOT-T3"),
+            quantity=1,
+        )
+        refresh_carton_totals(carton)
+        carton.refresh_from_db()
+
+        self.assertEqual(carton.total_weight_g, 850)
+        self.assertIsNone(carton.total_volume_cm3)
+        self.assertEqual(carton.item_count, 4)
+        self.assertIsNone(carton.single_product_id)
+
+    def test_rebuild_carton_totals_only_writes_stale_cartons(self):
+        lot = self._create_lot(code="LOT-REBUILD")
+        fresh = Carton.objects.create(code="CT-FRESH", status=CartonStatus.PACKED)
+        CartonItem.objects.create(carton=fresh, product_lot=lot, quantity=1)
+        refresh_carton_totals(fresh)
+        stale = Carton.objects.create(code="CT-STALE", status=CartonStatus.PACKED)
+        CartonItem.objects.create(carton=stale, product_lot=lot, quantity=3)
+
+        self.assertEqual(rebuild_carton_totals(batch_size=1), (2, 1))
+
+        stale.refresh_from_db()
+        self.assertEqual(stale.total_weight_g, 300)
+        self.assertEqual(stale.item_count, 3)
+        self.assertEqual(stale.single_product_id, self.product.id)
+        self.assertEqual(rebuild_carton_totals(), (2, 0))
+
+    def test_product_weight_or_volume_change_refreshes_its_cartons(self):
+        lot = self._create_lot(code="LOT-PRODUCT-EDIT")
+        carton = Carton.objects.create(code="CT-PRODUCT-EDIT", status=CartonStatus.PACKED)
+        CartonItem.objects.create(carton=carton, product_lot=lot, quantity=2)
+        other = Carton.objects.create(code="CT-OTHER", status=CartonStatus.PACKED)
+        refresh_carton_totals(carton)
+
+        self.product.weight_g = 250
+        self.product.volume_cm3 = 40
+        self.product.save()
+
+        carton.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(carton.total_weight_g, 500)
+        self.assertEqual(carton.total_volume_cm3, 80)
+        self.assertEqual(other.item_count, 0)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.product.save(update_fields=["name"])
+        self.assertFalse(any("wms_carton" in query["sql"] for query in queries.captured_queries))
+
     def test_next_carton_sequence_ignorés_invalid_code_and_increments(self):
         Carton.objects.create(code="XX-20260101-2", status=CartonStatus.DRAFT)
         Carton.objects.create(code="BAD-CODE", status=CartonStatus.DRAFT)
@@ -388,6 +472,7 @@ class DomainStockExtraTests(TestCase):
             shipment=shipment,
         )
         CartonItem.objects.create(carton=carton, product_lot=lot, quantity=3)
+        refresh_carton_totals(carton)
 
         unpack_carton(user=self.user, carton=carton)
 
@@ -397,6 +482,9 @@ class DomainStockExtraTests(TestCase):
         self.assertEqual(carton.status, CartonStatus.DRAFT)
         self.assertIsNone(carton.shipment_id)
         self.assertEqual(carton.cartonitem_set.count(), 0)
+        self.assertEqual(carton.total_weight_g, 0)
+        self.assertEqual(carton.item_count, 0)
+        self.assertIsNone(carton.single_product_id)
         movement = StockMovement.objects.get(
             movement_type=MovementType.UNPACK,
             product_lot=lot,
@@ -13,7 +13,6 @@ from wms.emailing import (
     EMAIL_QUEUE_SOURCE,
     EMAIL_QUEUE_TARGET,
     _brevo_settings,
-    _normalize_recipients,
     _parse_next_attempt,
     _queue_meta,
     _safe_int,
@@ -21,6 +20,7 @@ from wms.emailing import (
     enqueue_email_safe,
     get_admin_emails,
     get_order_admin_emails,
+    normalize_recipients,
     process_email_queue,
     send_email_safe,
 )
@@ -97,10 +97,10 @@ class EmailingHelpersTests(TestCase):
         )
 
     def test_recipient_and_int_helpers_cover_edge_cases(self):
-        self.assertEqual(_normalize_recipients("one@example.com"), ["one@example.com"])
-        self.assertEqual(_normalize_recipients(None), [])
+        self.assertEqual(normalize_recipients("one@example.com"), ["one@example.com"])
+        self.assertEqual(normalize_recipients(None), [])
         self.assertEqual(
-            _normalize_recipients(
+            normalize_recipients(
                 [
                     " one@example.com ",
                     "",
@@ -0,0 +1,174 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from wms.models import IntegrationEvent, IntegrationStatus
+from wms.notification_outbox import (
+    enqueue_notification,
+    notification_outbox_stats,
+    process_notification_outbox,
+)
+
+ORDER_TEMPLATE = "emails/order_status_association_notification.txt"
+DELIVERY_TEMPLATE = "emails/shipment_delivery_notification.txt"
+
+
+class NotificationOutboxTests(TestCase):
+    def _enqueue(self, *, subject="Sujet", recipients=("a@example.com",), **kwargs):
+        return enqueue_notification(
+            subject=subject,
+            template=kwargs.pop("template", ORDER_TEMPLATE),
+            context=kwargs.pop(
+                "context",
+                {"order_reference": "CMD-1", "old_status": "A", "new_status": "B"},
+            ),
+            recipients=list(recipients),
+            **kwargs,
+        )
+
+    def test_enqueue_writes_compact_row_without_sending(self):
+        with mock.patch("wms.notification_outbox.send_or_enqueue_email_safe") as send_mock:
+            with self.captureOnCommitCallbacks(execute=True):
+                event = self._enqueue(recipients=[" a@example.com ", "A@example.com", ""])
+
+        send_mock.assert_not_called()
+        self.assertEqual(event.status, IntegrationStatus.PENDING)
+        self.assertEqual(event.payload["recipients"], ["a@example.com"])
+        self.assertEqual(event.payload["template"], ORDER_TEMPLATE)
+        self.assertIsNone(self._enqueue(recipients=[]))
+
+    def test_process_coalesces_events_per_recipient_into_digest(self):
+        self._enqueue(subject="Premier", recipients=["a@example.com", "b@example.com"])
+        self._enqueue(subject="Second", recipients=["a@example.com"])
+
+        with mock.patch(
+            "wms.notification_outbox.send_or_enqueue_email_safe",
+            return_value=True,
+        ) as send_mock:
+            result = process_notification_outbox(digest_window_seconds=0)
+
+        self.assertEqual(result["selected"], 2)
+        self.assertEqual(result["processed"], 2)
+        self.assertEqual(result["emails"], 2)
+        self.assertEqual(result["fan_out_ratio"], 1.0)
+        calls = {call.kwargs["recipient"][0]: call.kwargs for call in send_mock.call_args_list}
+        self.assertEqual(calls["b@example.com"]["subject"], "Premier")
+        self.assertIn("2 notifications", calls["a@example.com"]["subject"])
+        self.assertIn("Premier", calls["a@example.com"]["message"])
+        self.assertIn("Second", calls["a@example.com"]["message"])
+        self.assertIn("CMD-1", calls["a@example.com"]["message"])
+        self.assertFalse(
+            IntegrationEvent.objects.filter(
+                source="wms.notification",
+                status=IntegrationStatus.PENDING,
+            ).exists()
+        )
+
+    def test_process_defers_rows_younger_than_digest_window(self):
+        old_event = self._enqueue(subject="Ancien")
+        IntegrationEvent.objects.filter(pk=old_event.pk).update(
+            created_at=timezone.now() - timedelta(minutes=5)
+        )
+        self._enqueue(subject="Recent")
+
+        with mock.patch(
+            "wms.notification_outbox.send_or_enqueue_email_safe",
+            return_value=True,
+        ) as send_mock:
+            result = process_notification_outbox(digest_window_seconds=60)
+
+        self.assertEqual(result["selected"], 1)
+        self.assertEqual(result["deferred"], 1)
+        self.assertGreaterEqual(result["max_lag_seconds"], 300)
+        send_mock.assert_called_once()
+        self.assertEqual(send_mock.call_args.kwargs["subject"], "Ancien")
+        self.assertEqual(notification_outbox_stats()["pending"], 1)
+
+    def test_process_renders_timestamp_from_row_creation_date(self):
+        self._enqueue(
+            template=DELIVERY_TEMPLATE,
+            context={"shipment_reference": "EXP-1", "tracking_url": "/track"},
+            timestamp_key="delivered_at",
+        )
+
+        with mock.patch(
+            "wms.notification_outbox.send_or_enqueue_email_safe",
+            return_value=True,
+        ) as send_mock:
+            process_notification_outbox(digest_window_seconds=0)
+
+        self.assertIn(
+            timezone.localtime(timezone.now()).strftime("%d/%m/%Y"),
+            send_mock.call_args.kwargs["message"],
+        )
+
+    @override_settings(EMAIL_QUEUE_MAX_ATTEMPTS=2, EMAIL_QUEUE_RETRY_BASE_SECONDS=60)
+    def test_process_retries_failed_delivery_with_backoff_then_fails(self):
+        event = self._enqueue()
+
+        with mock.patch(
+            "wms.notification_outbox.send_or_enqueue_email_safe",
+            return_value=False,
+        ) as send_mock:
+            result = process_notification_outbox(digest_window_seconds=0)
+            event.refresh_from_db()
+            self.assertEqual((result["retried"], result["failed"]), (1, 0))
+            self.assertEqual(event.status, IntegrationStatus.PENDING)
+            self.assertEqual(event.payload["attempts"], 1)
+            self.assertIn("retry 1/2", event.error_message)
+
+            result = process_notification_outbox(digest_window_seconds=0)
+            self.assertEqual((result["selected"], result["deferred"]), (0, 1))
+
+            IntegrationEvent.objects.filter(pk=event.pk).update(
+                processed_at=timezone.now() - timedelta(seconds=61)
+            )
+            result = process_notification_outbox(digest_window_seconds=0)
+
+        event.refresh_from_db()
+        self.assertEqual(send_mock.call_count, 2)
+        self.assertEqual(result["failed"], 1)
+        self.assertEqual(event.status, IntegrationStatus.FAILED)
+        self.assertEqual(event.payload["attempts"], 2)
+        self.assertIn("returned False", event.error_message)
+
+    @override_settings(EMAIL_QUEUE_MAX_ATTEMPTS=3, EMAIL_QUEUE_RETRY_BASE_SECONDS=60)
+    def test_retry_backoff_grows_with_attempts(self):
+        event = self._enqueue()
+        payload = {**event.payload, "attempts": 2}
+        IntegrationEvent.objects.filter(pk=event.pk).update(
+            payload=payload,
+            processed_at=timezone.now() - timedelta(seconds=90),
+        )
+
+        with mock.patch(
+            "wms.notification_outbox.send_or_enqueue_email_safe",
+            return_value=True,
+        ) as send_mock:
+            result = process_notification_outbox(digest_window_seconds=0)
+            self.assertEqual((result["selected"], result["deferred"]), (0, 1))
+
+            IntegrationEvent.objects.filter(pk=event.pk).update(
+                processed_at=timezone.now() - timedelta(seconds=121)
+            )
+            result = process_notification_outbox(digest_window_seconds=0)
+
+        event.refresh_from_db()
+        send_mock.assert_called_once()
+        self.assertEqual(result["processed"], 1)
+        self.assertEqual(event.status, IntegrationStatus.PROCESSED)
+
+    @override_settings(EMAIL_DELIVERY_MODE="direct_only")
+    def test_direct_only_mode_drains_row_after_commit(self):
+        with mock.patch(
+            "wms.notification_outbox.send_or_enqueue_email_safe",
+            return_value=True,
+        ) as send_mock:
+            with self.captureOnCommitCallbacks(execute=True):
+                event = self._enqueue()
+
+        event.refresh_from_db()
+        send_mock.assert_called_once()
+        self.assertEqual(event.status, IntegrationStatus.PROCESSED)
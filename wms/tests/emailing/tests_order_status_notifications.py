@@ -48,13 +48,13 @@ class OrderStatusSignalEmailQueueTests(TestCase):
 
         event = IntegrationEvent.objects.filter(
             direction=IntegrationDirection.OUTBOUND,
-            source="wms.email",
-            event_type="send_email",
+            source="wms.notification",
+            event_type="notification",
             status=IntegrationStatus.PENDING,
         ).first()
         self.assertIsNotNone(event)
         self.assertEqual(
-            set(event.payload.get("recipient", [])),
+            set(event.payload.get("recipients", [])),
             {"admin@example.com", "association@example.com"},
         )
         self.assertIn("validation/statut mis à jour", event.payload.get("subject", ""))
@@ -66,13 +66,13 @@ class OrderStatusSignalEmailQueueTests(TestCase):
 
         event = IntegrationEvent.objects.filter(
             direction=IntegrationDirection.OUTBOUND,
-            source="wms.email",
-            event_type="send_email",
+            source="wms.notification",
+            event_type="notification",
             status=IntegrationStatus.PENDING,
         ).first()
         self.assertIsNotNone(event)
         self.assertEqual(
-            set(event.payload.get("recipient", [])),
+            set(event.payload.get("recipients", [])),
             {"admin@example.com", "association@example.com"},
         )
         self.assertIn("validation/statut mis à jour", event.payload.get("subject", ""))
@@ -95,13 +95,13 @@ class OrderStatusSignalEmailQueueTests(TestCase):
 
         event = IntegrationEvent.objects.filter(
             direction=IntegrationDirection.OUTBOUND,
-            source="wms.email",
-            event_type="send_email",
+            source="wms.notification",
+            event_type="notification",
             status=IntegrationStatus.PENDING,
         ).first()
         self.assertIsNotNone(event)
         self.assertEqual(
-            set(event.payload.get("recipient", [])),
+            set(event.payload.get("recipients", [])),
             {
                 "admin@example.com",
                 "association@example.com",
@@ -85,13 +85,13 @@ class ShipmentPartyNotificationTests(TestCase):
         events = list(
             IntegrationEvent.objects.filter(
                 direction=IntegrationDirection.OUTBOUND,
-                source="wms.email",
-                event_type="send_email",
+                source="wms.notification",
+                event_type="notification",
                 status=IntegrationStatus.PENDING,
             )
         )
 
-        recipients = {tuple(event.payload.get("recipient", [])) for event in events}
+        recipients = {tuple(event.payload.get("recipients", [])) for event in events}
         self.assertIn(("shipper-old@example.com",), recipients)
         self.assertIn(("recipient-old@example.com",), recipients)
         self.assertNotIn(("shipper-new@example.com",), recipients)
@@ -146,12 +146,12 @@ class ShipmentPartyNotificationTests(TestCase):
         events = list(
             IntegrationEvent.objects.filter(
                 direction=IntegrationDirection.OUTBOUND,
-                source="wms.email",
-                event_type="send_email",
+                source="wms.notification",
+                event_type="notification",
                 status=IntegrationStatus.PENDING,
             )
         )
 
-        recipients = {tuple(event.payload.get("recipient", [])) for event in events}
+        recipients = {tuple(event.payload.get("recipients", [])) for event in events}
         self.assertIn(("correspondent-old@example.com",), recipients)
         self.assertNotIn(("correspondent-new@example.com",), recipients)
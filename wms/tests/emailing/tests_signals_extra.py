@@ -29,28 +29,23 @@ class SignalsExtraTests(SimpleTestCase):
         )
 
         with mock.patch(
-            "wms.signals._shipment_status_admin_recipients",
+            "wms.signals.get_shipment_status_admin_emails",
             return_value=["admin@example.com"],
         ):
             with mock.patch("wms.signals.reverse", return_value="/admin/url/"):
-                with mock.patch("wms.signals.render_to_string", return_value="body") as render_mock:
-                    with mock.patch(
-                        "wms.signals.send_or_enqueue_email_safe"
-                    ) as send_or_enqueue_mock:
-                        with mock.patch(
-                            "wms.signals.transaction.on_commit",
-                            side_effect=lambda callback: callback(),
-                        ):
-                            _notify_shipment_status_change(None, instance, created=False)
+                with mock.patch("wms.signals.enqueue_notification") as enqueue_mock:
+                    _notify_shipment_status_change(None, instance, created=False)
 
-        send_or_enqueue_mock.assert_called_once()
-        context = render_mock.call_args.args[1]
+        enqueue_mock.assert_called_once()
+        self.assertEqual(enqueue_mock.call_args.kwargs["recipients"], ["admin@example.com"])
+        self.assertEqual(enqueue_mock.call_args.kwargs["timestamp_key"], "changed_at")
+        context = enqueue_mock.call_args.kwargs["context"]
         self.assertEqual(context["old_status"], "legacy_old")
         self.assertEqual(context["new_status"], "legacy_new")
 
     def test_notify_shipment_status_change_returns_when_previous_status_missing(self):
         instance = SimpleNamespace(_previous_status=None, status="draft")
-        with mock.patch("wms.signals._shipment_status_admin_recipients") as emails_mock:
+        with mock.patch("wms.signals.get_shipment_status_admin_emails") as emails_mock:
             _notify_shipment_status_change(None, instance, created=False)
         emails_mock.assert_not_called()
 
@@ -64,16 +59,10 @@ class SignalsExtraTests(SimpleTestCase):
             destination_address="1 Rue Test",
             get_tracking_url=lambda: "/track/SHP-002",
         )
-        with mock.patch("wms.signals._shipment_status_admin_recipients", return_value=[]):
-            with mock.patch("wms.signals.render_to_string", return_value="body") as render_mock:
-                with mock.patch("wms.signals.send_or_enqueue_email_safe") as send_mock:
-                    with mock.patch(
-                        "wms.signals.transaction.on_commit",
-                        side_effect=lambda callback: callback(),
-                    ):
-                        _notify_shipment_status_change(None, instance, created=False)
-        render_mock.assert_not_called()
-        send_mock.assert_not_called()
+        with mock.patch("wms.signals.get_shipment_status_admin_emails", return_value=[]):
+            with mock.patch("wms.signals.enqueue_notification") as enqueue_mock:
+                _notify_shipment_status_change(None, instance, created=False)
+        enqueue_mock.assert_not_called()
 
     def test_notify_shipment_status_change_emits_structured_log(self):
         instance = SimpleNamespace(
@@ -86,7 +75,7 @@ class SignalsExtraTests(SimpleTestCase):
             get_tracking_url=lambda: "/track/SHP-003",
         )
         with mock.patch("wms.signals.log_shipment_status_transition") as log_mock:
-            with mock.patch("wms.signals._shipment_status_admin_recipients", return_value=[]):
+            with mock.patch("wms.signals.get_shipment_status_admin_emails", return_value=[]):
                 _notify_shipment_status_change(None, instance, created=False)
         log_mock.assert_called_once_with(
             shipment=instance,
@@ -109,9 +98,9 @@ class SignalsExtraTests(SimpleTestCase):
             comments="",
         )
         with mock.patch("wms.signals.get_admin_emails", return_value=[]):
-            with mock.patch("wms.signals.render_to_string") as render_mock:
+            with mock.patch("wms.signals.enqueue_notification") as enqueue_mock:
                 _notify_tracking_event(None, fake_event, created=True)
-        render_mock.assert_not_called()
+        enqueue_mock.assert_not_called()
 
     def test_notify_tracking_event_emits_structured_log(self):
         fake_event = SimpleNamespace(
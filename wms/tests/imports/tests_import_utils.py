@@ -67,6 +67,42 @@ class _TruthyThenFalsyTable(list):
         return self._calls == 1
 
 
+def _build_text_pdf(pages):
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for lines in pages:
+        stream = "\n".join(
+            f"BT /F1 12 Tf 72 {720 - index * 20} Td ({line}) Tj ET"
+            for index, line in enumerate(lines)
+        ).encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 3 0 R >> >> >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids).encode()
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref_offset,
+    )
+    return bytes(output)
+
+
 class ImportUtilsTests(SimpleTestCase):
     def test_normalize_header_and_guess_utf16_encoding(self):
         self.assertEqual(import_utils.normalize_header("  Nom Produit  "), "nom_produit")
@@ -351,6 +387,37 @@ class ImportUtilsTests(SimpleTestCase):
             ):
                 import_utils._extract_pdf_table(b"x")
 
+    def test_extract_pdf_table_parallel_page_chunks_match_sequential_pass(self):
+        data = _build_text_pdf(
+            [
+                ["Designation", *(f"Item {page}-{line}" for line in range(3))]
+                for page in range(import_utils.PDF_PARALLEL_MIN_PAGES + 5)
+            ]
+        )
+
+        sequential = import_utils._extract_pdf_table(data, max_workers=1)
+        parallel = import_utils._extract_pdf_table(data, max_workers=2)
+
+        self.assertEqual(parallel, sequential)
+        headers, rows = sequential
+        self.assertEqual(headers, ["Designation"])
+        self.assertEqual(len(rows), (import_utils.PDF_PARALLEL_MIN_PAGES + 5) * 3)
+        self.assertEqual(rows[:2], [["Item 0-0"], ["Item 0-1"]])
+        self.assertEqual(
+            import_utils._extract_pdf_table(data, page_start=2, page_end=3, max_workers=2),
+            (
+                ["Designation"],
+                [
+                    ["Item 1-0"],
+                    ["Item 1-1"],
+                    ["Item 1-2"],
+                    ["Item 2-0"],
+                    ["Item 2-1"],
+                    ["Item 2-2"],
+                ],
+            ),
+        )
+
     def test_extract_tabular_data_dispatch(self):
         with mock.patch("wms.import_utils._extract_csv_table", return_value=(["a"], [["1"]])):
             self.assertEqual(import_utils.extract_tabular_data(b"x", ".csv"), (["a"], [["1"]]))
@@ -0,0 +1,24 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+
+class BenchmarkPlanningExportCommandTests(SimpleTestCase):
+    def test_command_reports_peak_memory_for_both_writers(self):
+        output = StringIO()
+        call_command("benchmark_planning_export", "--rows=20", "--repeat=1", stdout=output)
+
+        report = json.loads(output.getvalue())
+        self.assertEqual(report["benchmark"], "planning_export")
+        self.assertEqual(report["dataset"], {"rows": 20})
+        self.assertEqual(set(report["results"]), {"in_memory", "streaming"})
+        for result in report["results"].values():
+            self.assertGreater(result["peak_bytes"], 0)
+            self.assertGreater(result["file_bytes"], 0)
+
+    def test_command_rejects_empty_dataset(self):
+        with self.assertRaisesMessage(CommandError, "--rows must be at least 1."):
+            call_command("benchmark_planning_export", "--rows=0")
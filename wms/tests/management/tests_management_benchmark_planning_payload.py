@@ -0,0 +1,33 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+
+class BenchmarkPlanningPayloadCommandTests(SimpleTestCase):
+    def test_command_reports_memory_and_compatibility_timings(self):
+        output = StringIO()
+        call_command(
+            "benchmark_planning_payload",
+            "--shipments=6",
+            "--volunteers=3",
+            "--flights=4",
+            "--repeat=1",
+            stdout=output,
+        )
+
+        report = json.loads(output.getvalue())
+        self.assertEqual(report["benchmark"], "planning_payload")
+        self.assertEqual(report["dataset"]["shipments"], 6)
+        self.assertGreater(report["dataset"]["candidate_pairs"], 0)
+        self.assertGreater(report["memory"]["dict_payload_bytes"], 0)
+        self.assertEqual(
+            set(report["timings"]),
+            {"model_build", "model_to_dict", "dict_compatibility", "model_compatibility"},
+        )
+
+    def test_command_rejects_empty_dataset(self):
+        with self.assertRaisesMessage(CommandError, "--flights must be at least 1."):
+            call_command("benchmark_planning_payload", "--flights=0")
@@ -0,0 +1,68 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from wms.models import PlanningRun, Shipment
+
+
+class BenchmarkPlanningSolverCommandTests(TestCase):
+    def _call(self, *args):
+        output = StringIO()
+        call_command("benchmark_planning_solver", *args, stdout=output)
+        return json.loads(output.getvalue())
+
+    def test_command_reports_phase_timings_per_worker_count_and_rolls_back(self):
+        report = self._call(
+            "--shipments=2",
+            "--volunteers=1",
+            "--flights=2",
+            "--workers=1,2",
+            "--max-time-seconds=5",
+        )
+
+        self.assertEqual(report["benchmark"], "planning_solver")
+        self.assertEqual(report["dataset"]["flights"], 4)
+        self.assertGreater(report["dataset"]["shipments"], 2)
+        self.assertEqual(
+            set(report["timings"]),
+            {
+                "payload_compile",
+                "payload_model",
+                "compatibility",
+                "candidate_build",
+                "snapshot_materialize",
+            },
+        )
+        self.assertEqual([entry["num_search_workers"] for entry in report["sweep"]], [1, 2])
+        for entry in report["sweep"]:
+            self.assertIn("total", entry["timings"])
+            self.assertIn("cp_sat_solve", entry["timings"])
+            self.assertIn("model_build", entry["timings"])
+        self.assertFalse(Shipment.objects.exists())
+        self.assertFalse(PlanningRun.objects.exists())
+
+    def test_command_keeps_data_and_writes_output_file_when_requested(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = Path(tmp_dir) / "bench.json"
+            self._call(
+                "--shipments=1",
+                "--volunteers=1",
+                "--flights=1",
+                "--workers=1",
+                "--max-time-seconds=5",
+                "--keep-data",
+                f"--output={output_path}",
+            )
+            written = json.loads(output_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(written["sweep"][0]["num_search_workers"], 1)
+        self.assertTrue(Shipment.objects.filter(reference__contains="-BENCH-").exists())
+
+    def test_command_rejects_invalid_worker_values(self):
+        with self.assertRaisesMessage(CommandError, "Invalid --workers value: many"):
+            call_command("benchmark_planning_solver", "--workers=many", stdout=StringIO())
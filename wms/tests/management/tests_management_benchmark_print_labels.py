@@ -0,0 +1,35 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+
+class BenchmarkPrintLabelsCommandTests(SimpleTestCase):
+    def _call(self, *args):
+        output = StringIO()
+        call_command("benchmark_print_labels", *args, stdout=output)
+        return json.loads(output.getvalue())
+
+    def test_command_reports_cold_and_warm_runs(self):
+        report = self._call("--labels=9", "--repeat=2")
+
+        self.assertEqual(report["benchmark"], "print_labels")
+        self.assertEqual(report["labels"], 9)
+        self.assertEqual([run["cold_cache"] for run in report["runs"]], [True, False])
+        self.assertEqual([run["pages"] for run in report["runs"]], [3, 3])
+
+    def test_command_writes_report_to_output_path(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = Path(tmp_dir) / "labels.json"
+
+            self._call("--labels=2", "--repeat=1", f"--output={output_path}")
+
+            self.assertEqual(json.loads(output_path.read_text())["labels"], 2)
+
+    def test_command_rejects_empty_label_count(self):
+        with self.assertRaisesMessage(CommandError, "--labels must be at least 1."):
+            self._call("--labels=0")
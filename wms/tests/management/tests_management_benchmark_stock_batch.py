@@ -0,0 +1,26 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from wms.models import ProductLot, StockMovement
+
+
+class BenchmarkStockBatchCommandTests(TestCase):
+    def test_command_reports_single_and_batch_timings_and_rolls_back(self):
+        output = StringIO()
+        call_command("benchmark_stock_batch", "--items=3", "--repeat=1", stdout=output)
+
+        report = json.loads(output.getvalue())
+        self.assertEqual(report["benchmark"], "stock_batch")
+        self.assertEqual(report["items"], 3)
+        self.assertEqual(len(report["runs"]), 1)
+        self.assertGreater(report["single_per_item_ms"], 0)
+        self.assertFalse(ProductLot.objects.exists())
+        self.assertFalse(StockMovement.objects.exists())
+
+    def test_command_rejects_empty_item_count(self):
+        with self.assertRaisesMessage(CommandError, "--items must be at least 1."):
+            call_command("benchmark_stock_batch", "--items=0")
@@ -0,0 +1,63 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from wms.models import Product
+from wms.query_workload import capture_query_workload, normalize_sql
+
+
+class QueryWorkloadTests(TestCase):
+    def test_normalize_sql_folds_literals_and_in_lists(self):
+        self.assertEqual(
+            normalize_sql(
+                'SELECT "T1"."id" FROM "wms_product" T1\n'
+                'WHERE "T1"."sku" = \'A\'\'B\' AND "T1"."id" IN (%s, %s, %s) LIMIT 21'
+            ),
+            'SELECT "T1"."id" FROM "wms_product" T1 '
+            'WHERE "T1"."sku" = ? AND "T1"."id" IN (...) LIMIT ?',
+        )
+
+    def test_capture_aggregates_queries_by_shape(self):
+        with capture_query_workload() as workload:
+            for sku in ("SKU-W-1", "SKU-W-2", "SKU-W-3"):
+                Product.objects.filter(sku=sku).exists()
+
+        report = workload.report(label="unit", limit=5)
+        self.assertEqual(report["queries"], 3)
+        self.assertEqual(report["distinct_queries"], 1)
+        self.assertEqual(report["top"][0]["count"], 3)
+        self.assertIn('"wms_product"."sku" = ?', report["top"][0]["sql"])
+
+
+class CaptureQueryWorkloadCommandTests(TestCase):
+    def test_command_writes_report_for_target_command(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "workload.json"
+            call_command(
+                "capture_query_workload",
+                "--output",
+                str(output_path),
+                "rebuild_carton_totals",
+                "--batch-size=5",
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
+            report = json.loads(output_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(report["workload"], "rebuild_carton_totals --batch-size=5")
+        self.assertGreaterEqual(report["queries"], 1)
+        self.assertEqual(
+            set(report["top"][0]),
+            {"sql", "count", "total_ms", "max_ms", "mean_ms"},
+        )
+
+    def test_command_rejects_invalid_limit_and_self_capture(self):
+        with self.assertRaisesMessage(CommandError, "--limit must be at least 1."):
+            call_command("capture_query_workload", "--limit=0", "check", stdout=StringIO())
+        with self.assertRaisesMessage(CommandError, "cannot capture itself"):
+            call_command("capture_query_workload", "capture_query_workload", stdout=StringIO())
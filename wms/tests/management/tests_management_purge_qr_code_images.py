@@ -0,0 +1,80 @@
+import os
+import tempfile
+import time
+from io import StringIO
+
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+
+from wms.models import Product
+from wms.qr_codes import _cache_path, clear_qr_code_memory_cache, render_qr_code
+
+
+class PurgeQrCodeImagesCommandTests(TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=temp_dir.name, QR_CODE_CACHE_DIR="")
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        clear_qr_code_memory_cache()
+        self.addCleanup(clear_qr_code_memory_cache)
+
+        self.products = [
+            Product.objects.create(name=f"Purge {index}", sku=f"SKU-PURGE-{index}")
+            for index in range(3)
+        ]
+        for product in self.products[:2]:
+            product.qr_code_image.save(f"{product.sku}.png", ContentFile(b"png"), save=True)
+        self.storage = Product._meta.get_field("qr_code_image").storage
+
+    def _call(self, *args):
+        output = StringIO()
+        call_command("purge_qr_code_images", *args, stdout=output)
+        return output.getvalue()
+
+    def test_new_products_do_not_store_qr_images(self):
+        self.assertFalse(self.products[2].qr_code_image)
+
+    def test_dry_run_reports_without_deleting(self):
+        output = self._call("--dry-run")
+
+        self.assertIn("Purge QR code images [DRY RUN]", output)
+        self.assertIn("wms.Product: 2 stored image(s)", output)
+        self.products[0].refresh_from_db()
+        self.assertTrue(self.storage.exists(self.products[0].qr_code_image.name))
+
+    def test_apply_deletes_files_and_clears_field(self):
+        names = [product.qr_code_image.name for product in self.products[:2]]
+
+        output = self._call("--apply", "--warm-cache", "--batch-size=1")
+
+        self.assertIn("wms.Product: 2 stored image(s), 2 file(s) deleted, 2 cached", output)
+        self.assertFalse(Product.objects.exclude(qr_code_image="").exists())
+        self.assertFalse(any(self.storage.exists(name) for name in names))
+
+    def test_apply_prunes_stale_qr_cache_files(self):
+        render_qr_code(self.products[0].sku)
+        render_qr_code(self.products[1].sku)
+        stale_path = _cache_path(self.products[0].sku, "svg")
+        stale = time.time() - 10 * 86400
+        os.utime(stale_path, (stale, stale))
+
+        self.assertIn("QR cache: 1 stale file(s)", self._call("--cache-max-age-days=7"))
+        self.assertTrue(stale_path.exists())
+
+        output = self._call("--apply", "--cache-max-age-days=7")
+
+        self.assertIn("QR cache: 1 stale file(s) deleted", output)
+        self.assertFalse(stale_path.exists())
+        self.assertTrue(_cache_path(self.products[1].sku, "svg").exists())
+
+    def test_rejects_conflicting_modes_and_empty_batch(self):
+        with self.assertRaisesMessage(CommandError, "Choose either --dry-run or --apply"):
+            self._call("--dry-run", "--apply")
+        with self.assertRaisesMessage(CommandError, "--batch-size must be at least 1."):
+            self._call("--batch-size=0")
+        with self.assertRaisesMessage(CommandError, "--cache-max-age-days must be at least 1."):
+            self._call("--cache-max-age-days=0")
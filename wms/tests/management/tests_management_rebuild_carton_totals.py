@@ -0,0 +1,55 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from wms.models import (
+    Carton,
+    CartonItem,
+    CartonStatus,
+    Location,
+    Product,
+    ProductLot,
+    Warehouse,
+)
+
+
+class RebuildCartonTotalsCommandTests(TestCase):
+    def setUp(self):
+        warehouse = Warehouse.objects.create(name="Main")
+        location = Location.objects.create(warehouse=warehouse, zone="A", aisle="01", shelf="001")
+        product = Product.objects.create(name="Item", sku="SKU-TOTALS", weight_g=120)
+        self.lot = ProductLot.objects.create(
+            product=product, quantity_on_hand=10, location=location
+        )
+        self.first = Carton.objects.create(code="C-TOT-1", status=CartonStatus.PACKED)
+        self.second = Carton.objects.create(code="C-TOT-2", status=CartonStatus.PACKED)
+        CartonItem.objects.create(carton=self.first, product_lot=self.lot, quantity=2)
+        CartonItem.objects.create(carton=self.second, product_lot=self.lot, quantity=1)
+
+    def _call(self, *args):
+        output = StringIO()
+        call_command("rebuild_carton_totals", *args, stdout=output)
+        return output.getvalue()
+
+    def test_command_rebuilds_all_cartons(self):
+        output = self._call("--batch-size=1")
+
+        self.assertIn("Cartons scanned: 2, totals updated: 2", output)
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.total_weight_g, 240)
+        self.assertEqual(self.first.item_count, 2)
+
+    def test_command_can_be_limited_to_carton_codes(self):
+        output = self._call("--code=C-TOT-2")
+
+        self.assertIn("Cartons scanned: 1, totals updated: 1", output)
+        self.first.refresh_from_db()
+        self.second.refresh_from_db()
+        self.assertEqual(self.first.item_count, 0)
+        self.assertEqual(self.second.item_count, 1)
+
+    def test_command_rejects_empty_batch_size(self):
+        with self.assertRaisesMessage(CommandError, "--batch-size must be at least 1."):
+            self._call("--batch-size=0")
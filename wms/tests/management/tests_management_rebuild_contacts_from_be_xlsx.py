@@ -3,8 +3,10 @@ from __future__ import annotations
 import tempfile
 from io import StringIO
 from pathlib import Path
+from unittest import mock
 
 from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.test import TestCase
 from openpyxl import Workbook
 
@@ -280,6 +282,35 @@ class RebuildContactsFromBeXlsxNormalizationTests(BeWorkbookMixin, TestCase):
         )
         self.assertEqual(dataset.review_items, [])
 
+    def test_build_be_contact_dataset_parallel_sheet_parsing_matches_sequential(self):
+        row = {
+            "BE_DONATEUR": "Donor A",
+            "ASSOCIATION_NOM": "AVIATION SANS FRONTIERES",
+            "ASSOCIATION_PAYS": "France",
+            "DESTINATAIRE_STRUCTURE": "Recipient A",
+            "DESTINATAIRE_STATUT": "actif",
+            "CORRESPONDANT_PRENOM": "Leontine",
+            "CORRESPONDANT_NOM": "Rahazania",
+            "CORRESPONDANT_PAYS": "Madagascar",
+            "BE_DESTINATION": "ANTANANARIVO",
+            "BE_CODE_IATA": "TNR",
+        }
+        workbook_path = self._build_be_multisheet_workbook(
+            {
+                "2024": [row],
+                "2025": [{**row, "ASSOCIATION_PAYS": "Suisse", "BE_DONATEUR": "Donor B"}],
+                "2026": [{**row, "ASSOCIATION_PAYS": "Belgique", "BE_DESTINATION": "TANA"}],
+            }
+        )
+
+        sequential = build_be_contact_dataset(workbook_path, max_workers=1)
+        parallel = build_be_contact_dataset(workbook_path, max_workers=2)
+
+        self.assertEqual(set(sequential.timings), {"read", "merge"})
+        sequential.timings = parallel.timings = {}
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(sequential.shippers[0]["country"], "Belgique")
+
     def test_build_be_contact_dataset_applies_explicit_correspondent_overrides(self):
         workbook_path = self._build_be_multisheet_workbook(
             {
@@ -732,21 +763,26 @@ class RebuildContactsFromBeXlsxCommandTests(BeWorkbookMixin, TestCase):
     def test_rebuild_contacts_from_be_xlsx_dry_run_reports_actions_without_database_writes(self):
         stdout = StringIO()
 
-        call_command(
-            "rebuild_contacts_from_be_xlsx",
-            "--source",
-            str(self.workbook_path),
-            "--dry-run",
-            "--report-path",
-            str(self.report_path),
-            stdout=stdout,
-        )
+        with mock.patch(
+            "wms.management.commands.rebuild_contacts_from_be_xlsx.apply_be_contact_dataset"
+        ) as apply_mock:
+            call_command(
+                "rebuild_contacts_from_be_xlsx",
+                "--source",
+                str(self.workbook_path),
+                "--dry-run",
+                "--report-path",
+                str(self.report_path),
+                stdout=stdout,
+            )
 
+        apply_mock.assert_not_called()
         output = stdout.getvalue()
         self.assertIn("Rebuild contacts from BE workbook [DRY RUN]", output)
         self.assertIn("Contacts:", output)
         self.assertIn("Shippers: 1", output)
         self.assertIn("Shipment links: 1", output)
+        self.assertNotIn("Write diff", output)
         self.assertFalse(Contact.objects.exists())
         self.assertTrue(self.report_path.exists())
 
@@ -808,6 +844,58 @@ class RebuildContactsFromBeXlsxCommandTests(BeWorkbookMixin, TestCase):
         self.assertTrue(Contact.objects.filter(name="Correspondant non renseigne").exists())
         self.assertIn("missing destination correspondent_key", self.report_path.read_text())
 
+    def test_rebuild_contacts_from_be_xlsx_dry_run_reports_write_diff_and_timings(self):
+        stdout = StringIO()
+
+        call_command(
+            "rebuild_contacts_from_be_xlsx",
+            "--source",
+            str(self.workbook_path),
+            "--dry-run",
+            "--diff",
+            "--workers",
+            "1",
+            "--report-path",
+            str(self.report_path),
+            stdout=stdout,
+        )
+
+        output = stdout.getvalue()
+        self.assertIn("Write diff (created / updated / unchanged):", output)
+        self.assertIn("wms.ShipmentShipper: 1 / 0 / 0", output)
+        self.assertIn("Timings: read=", output)
+        self.assertFalse(Contact.objects.exists())
+        self.assertFalse(ShipmentShipper.objects.exists())
+
+    def test_apply_be_contact_dataset_second_run_reports_unchanged_rows(self):
+        dataset = build_be_contact_dataset(self.workbook_path, max_workers=1)
+        first = apply_be_contact_dataset(dataset)
+        contact_count = Contact.objects.count()
+
+        second = apply_be_contact_dataset(dataset)
+
+        self.assertFalse(first.dry_run)
+        self.assertEqual(first.diff["contacts.Contact"]["created"], contact_count)
+        self.assertEqual(
+            second.diff["contacts.Contact"],
+            {"created": 0, "updated": 0, "unchanged": contact_count},
+        )
+        self.assertTrue(all(stats["created"] == 0 for stats in second.diff.values()))
+        self.assertEqual(Contact.objects.count(), contact_count)
+
+    def test_rebuild_contacts_from_be_xlsx_rejects_invalid_workers(self):
+        with self.assertRaisesMessage(CommandError, "--workers must be at least 1."):
+            call_command(
+                "rebuild_contacts_from_be_xlsx",
+                "--source",
+                str(self.workbook_path),
+                "--dry-run",
+                "--workers",
+                "0",
+                "--report-path",
+                str(self.report_path),
+            )
+
     def test_rebuild_contacts_from_be_xlsx_reports_selected_source_sheets(self):
         workbook_path = self._build_be_multisheet_workbook(
             {
@@ -13,6 +13,7 @@ from wms.models import (
     CartonSequence,
     Destination,
     Location,
+    OperationalResetCheckpoint,
     PlanningDestinationRule,
     PlanningParameterSet,
     PublicAccountRequest,
@@ -28,6 +29,9 @@ from wms.models import (
 )
 from wms.reset_operational_data import (
     ResetOperationalDataSummary,
+    ResetTableStats,
+    _delete_label_in_chunks,
+    _delete_plan,
     _existing_table_labels,
     _validate_configuration,
     render_reset_summary,
@@ -249,6 +253,92 @@ class ResetOperationalDataCommandTests(TestCase):
         self.assertIn("Skipped missing tables:", lines)
         self.assertIn("- wms.MissingModel", lines)
 
+    def test_render_reset_summary_lists_table_throughput(self):
+        summary = ResetOperationalDataSummary(
+            mode="APPLY",
+            delete_counts_before={"wms.Order": 10},
+            delete_counts_after={"wms.Order": 0},
+            keep_counts_before={},
+            keep_counts_after={},
+            table_stats=(ResetTableStats("wms.Order", "raw", 10, 0.5),),
+        )
+
+        lines = render_reset_summary(summary, heading="Reset")
+
+        self.assertIn("Delete throughput:", lines)
+        self.assertIn("- wms.Order: 10 row(s) in 0.500s (20 rows/s, raw)", lines)
+
+    def test_delete_plan_empties_referencing_tables_first(self):
+        plan = _delete_plan(
+            ("contacts.Contact", "wms.Destination", "wms.PlanningDestinationRule", "wms.CartonItem")
+        )
+        labels = [label for label, _strategy in plan]
+        strategies = dict(plan)
+
+        self.assertLess(
+            labels.index("wms.PlanningDestinationRule"), labels.index("wms.Destination")
+        )
+        self.assertLess(labels.index("wms.Destination"), labels.index("contacts.Contact"))
+        self.assertEqual(strategies["wms.PlanningDestinationRule"], "raw")
+        self.assertEqual(strategies["contacts.Contact"], "orm")
+
+    def test_apply_deletes_in_chunks_and_reports_throughput(self):
+        for index in range(4):
+            Contact.objects.create(name=f"Chunked {index}", contact_type=ContactType.PERSON)
+        stdout = StringIO()
+
+        call_command("reset_operational_data", "--apply", "--chunk-size", "2", stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertIn("Delete throughput:", output)
+        self.assertIn("- contacts.Contact: 10 row(s)", output)
+        self.assertFalse(Contact.objects.exists())
+        self.assertFalse(OperationalResetCheckpoint.objects.exists())
+
+    def test_interrupted_apply_resumes_from_checkpoints(self):
+        def interrupt_on_contacts(label, **kwargs):
+            if label == "contacts.Contact":
+                raise RuntimeError("interrupted")
+            return _delete_label_in_chunks(label, **kwargs)
+
+        with mock.patch(
+            "wms.reset_operational_data._delete_label_in_chunks",
+            side_effect=interrupt_on_contacts,
+        ):
+            with self.assertRaisesMessage(RuntimeError, "interrupted"):
+                reset_operational_data(apply=True, chunk_size=1)
+
+        self.assertFalse(Destination.objects.exists())
+        self.assertTrue(Contact.objects.exists())
+        checkpoint = OperationalResetCheckpoint.objects.get(model_label="wms.Destination")
+        self.assertEqual(checkpoint.deleted_rows, 1)
+        self.assertIsNotNone(checkpoint.completed_at)
+
+        summary = reset_operational_data(apply=True, chunk_size=1)
+
+        self.assertEqual(summary.mode, "APPLY")
+        self.assertFalse(Contact.objects.exists())
+        self.assertFalse(OperationalResetCheckpoint.objects.exists())
+
+    def test_chunk_cascading_into_preserved_model_is_rolled_back(self):
+        with self.assertRaisesMessage(
+            ValueError, "Preserved model wms.PlanningDestinationRule changed during reset"
+        ):
+            _delete_label_in_chunks(
+                "wms.PlanningParameterSet",
+                strategy="orm",
+                chunk_size=100,
+                keep_labels={"wms.PlanningDestinationRule"},
+            )
+
+        self.assertTrue(PlanningParameterSet.objects.filter(pk=self.parameter_set.pk).exists())
+        self.assertTrue(
+            PlanningDestinationRule.objects.filter(pk=self.destination_rule.pk).exists()
+        )
+        checkpoint = OperationalResetCheckpoint.objects.get(model_label="wms.PlanningParameterSet")
+        self.assertEqual(checkpoint.deleted_rows, 0)
+        self.assertIsNone(checkpoint.completed_at)
+
     def test_existing_table_labels_reports_missing_tables(self):
         labels = ("wms.Warehouse", "wms.Location")
 
@@ -307,8 +397,6 @@ class ResetOperationalDataCommandTests(TestCase):
                 _validate_configuration()
 
     def test_reset_operational_data_apply_raises_when_deleted_rows_remain(self):
-        model_mock = mock.Mock()
-
         with (
             mock.patch("wms.reset_operational_data._validate_configuration"),
             mock.patch(
@@ -327,17 +415,12 @@ class ResetOperationalDataCommandTests(TestCase):
                     {"wms.Contact": 1},
                 ],
             ),
-            mock.patch(
-                "wms.reset_operational_data._resolve_model",
-                return_value=model_mock,
-            ),
+            mock.patch("wms.reset_operational_data._delete_plan", return_value=()),
         ):
             with self.assertRaisesMessage(ValueError, "still has 1 row"):
                 reset_operational_data(apply=True)
 
     def test_reset_operational_data_apply_raises_when_preserved_rows_change(self):
-        model_mock = mock.Mock()
-
         with (
             mock.patch("wms.reset_operational_data._validate_configuration"),
             mock.patch(
@@ -356,10 +439,7 @@ class ResetOperationalDataCommandTests(TestCase):
                     {"wms.Contact": 0},
                 ],
             ),
-            mock.patch(
-                "wms.reset_operational_data._resolve_model",
-                return_value=model_mock,
-            ),
+            mock.patch("wms.reset_operational_data._delete_plan", return_value=()),
         ):
             with self.assertRaisesMessage(ValueError, "Preserved model wms.Warehouse changed"):
                 reset_operational_data(apply=True)
@@ -1,3 +1,5 @@
+import tempfile
+from pathlib import Path
 from types import SimpleNamespace
 from unittest import mock
 
@@ -9,8 +11,10 @@ from wms.pallet_listing import (
     build_listing_extract_options,
     build_listing_mapping_defaults,
     build_listing_review_rows,
+    discard_listing_tables,
     load_listing_table,
     pending_listing_extract_options,
+    store_listing_table,
 )
 
 
@@ -105,28 +109,61 @@ class PalletListingTests(SimpleTestCase):
             ],
         )
 
-    def test_load_listing_table_reads_file_and_passes_extract_options(self):
-        pending = {
-            "file_path": "/tmp/listing.csv",
-            "extension": ".csv",
-            "sheet_name": "",
-            "header_row": 1,
-            "pdf_pages": {"mode": "all", "start": None, "end": None},
-        }
-        with mock.patch(
-            "wms.pallet_listing.Path.read_bytes",
-            return_value=b"header1,header2\nv1,v2\n",
-        ) as read_mock:
+    def test_load_listing_table_parses_once_and_stores_table_next_to_upload(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "listing.pdf"
+            file_path.write_bytes(b"%PDF listing")
+            pending = {
+                "file_path": str(file_path),
+                "extension": ".pdf",
+                "pdf_pages": {"mode": "custom", "start": 1, "end": 2},
+            }
             with mock.patch(
                 "wms.pallet_listing.extract_tabular_data",
-                return_value=(["header1", "header2"], [["v1", "v2"]]),
+                return_value=(["Nom"], [["Masque"]]),
             ) as extract_mock:
-                headers, rows = load_listing_table(pending)
+                first = load_listing_table(pending)
+                second = load_listing_table(pending)
+                other_pages = load_listing_table(
+                    {**pending, "pdf_pages": {"mode": "custom", "start": 2, "end": 2}}
+                )
 
-        read_mock.assert_called_once()
-        extract_mock.assert_called_once_with(
-            b"header1,header2\nv1,v2\n",
-            ".csv",
-        )
+            self.assertEqual(first, (["Nom"], [["Masque"]]))
+            self.assertEqual(second, first)
+            self.assertEqual(other_pages, first)
+            self.assertEqual(
+                extract_mock.call_args_list,
+                [
+                    mock.call(b"%PDF listing", ".pdf", pdf_pages=(1, 2)),
+                    mock.call(b"%PDF listing", ".pdf", pdf_pages=(2, 2)),
+                ],
+            )
+            self.assertEqual(len(list(Path(temp_dir).glob("listing.pdf.*.json"))), 2)
+
+            discard_listing_tables(file_path)
+            self.assertEqual(list(Path(temp_dir).iterdir()), [file_path])
+
+    def test_load_listing_table_reuses_table_stored_at_upload(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "listing.csv"
+            file_path.write_bytes(b"header1,header2\nv1,v2\n")
+            store_listing_table(
+                str(file_path),
+                b"header1,header2\nv1,v2\n",
+                ".csv",
+                (["header1", "header2"], [["v1", "v2"]]),
+            )
+            with mock.patch("wms.pallet_listing.extract_tabular_data") as extract_mock:
+                headers, rows = load_listing_table(
+                    {
+                        "file_path": str(file_path),
+                        "extension": ".csv",
+                        "sheet_name": "",
+                        "header_row": 1,
+                        "pdf_pages": {"mode": "all", "start": None, "end": None},
+                    }
+                )
+
+        extract_mock.assert_not_called()
         self.assertEqual(headers, ["header1", "header2"])
         self.assertEqual(rows, [["v1", "v2"]])
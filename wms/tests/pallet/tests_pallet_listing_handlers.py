@@ -271,14 +271,25 @@ class PalletListingHandlersTests(TestCase):
                                 "wms.pallet_listing_handlers.uuid.uuid4",
                                 return_value=SimpleNamespace(hex="tok-123"),
                             ):
-                                response = handle_pallet_listing_action(
-                                    request,
-                                    action="listing_upload",
-                                    listing_form=self._listing_form(valid=True),
-                                    state=state,
-                                )
+                                with mock.patch(
+                                    "wms.pallet_listing_handlers.store_listing_table"
+                                ) as store_mock:
+                                    response = handle_pallet_listing_action(
+                                        request,
+                                        action="listing_upload",
+                                        listing_form=self._listing_form(valid=True),
+                                        state=state,
+                                    )
 
         self.assertIsNone(response)
+        store_mock.assert_called_once_with(
+            "/tmp/fake-listing.xlsx",
+            b"excel-bytes",
+            ".xlsx",
+            (["Nom", "Quantite"], [["Masque", "2"]]),
+            sheet_name="Sheet1",
+            header_row=2,
+        )
         self.assertEqual(state["listing_stage"], "mapping")
         self.assertEqual(state["listing_columns"], [{"index": 0, "mapped": "name"}])
         self.assertEqual(state["listing_file_type"], "excel")
@@ -0,0 +1,87 @@
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib import parse
+
+
+def build_operational_flight(*, flight_number, departure_iso, route, airline_code="AF"):
+    return {
+        "route": list(route),
+        "airline": {"code": airline_code},
+        "flightNumber": flight_number,
+        "flightLegs": [
+            {
+                "departureInformation": {
+                    "departureStation": route[0],
+                    "times": {"scheduled": departure_iso},
+                }
+            }
+        ],
+    }
+
+
+class FakeFlightProviderServer:
+    """Local HTTP server mimicking the AirFrance/KLM flight status API, one payload per day."""
+
+    def __init__(self):
+        self.flights_by_date = {}
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._build_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/opendata/flightstatus"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=5)
+
+    def set_day(self, service_date, flights):
+        self.flights_by_date[service_date.isoformat()] = list(flights)
+
+    def _payload_for(self, day_key):
+        return {"operationalFlights": self.flights_by_date.get(day_key, [])}
+
+    def _build_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse.parse_qs(parse.urlparse(self.path).query)
+                day_key = (query.get("startRange") or [""])[0][:10]
+                body = json.dumps(server._payload_for(day_key), sort_keys=True).encode("utf-8")
+                etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+                not_modified = self.headers.get("If-None-Match") == etag
+                with server._lock:
+                    server.requests.append(
+                        {
+                            "day": day_key,
+                            "api_key": self.headers.get("API-Key"),
+                            "not_modified": not_modified,
+                        }
+                    )
+                if not_modified:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/hal+json")
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                return
+
+        return Handler
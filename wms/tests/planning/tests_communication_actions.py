@@ -134,6 +134,17 @@ class PlanningCommunicationActionTests(TestCase):
         self.assertNotIn("subject", payload)
         self.assertEqual(payload["attachments"], [])
 
+    def test_generate_version_drafts_records_publication_stats(self):
+        version = self.make_version()
+        self.add_assignment(version)
+
+        drafts = generate_version_drafts(version)
+
+        version.refresh_from_db()
+        stats = version.publication_stats["communication_drafts"]
+        self.assertEqual(stats["drafts"], len(drafts))
+        self.assertEqual(set(stats["timings"]), {"plan", "render", "write", "total"})
+
     def test_build_draft_helper_action_payload_for_internal_emails_uses_excel_workbook(self):
         version = self.make_version()
         self.add_assignment(version)
@@ -1,6 +1,6 @@
 import json
 import tempfile
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
 from unittest import mock
 from urllib import error
@@ -9,18 +9,24 @@ from django.test import SimpleTestCase, TestCase, override_settings
 from openpyxl import Workbook
 
 from contacts.models import Contact, ContactType
-from wms.models import Destination, PlanningRunFlightMode
+from wms.models import Destination, FlightScheduleDay, PlanningRunFlightMode
 from wms.planning.flight_providers import PlanningFlightProviderError
 from wms.planning.flight_providers.airfrance_klm import (
     DEFAULT_AIRFRANCE_KLM_FLIGHT_API_BASE_URL,
     AirFranceKlmFlightProvider,
 )
+from wms.planning.flight_schedule_cache import sync_flight_schedule
 from wms.planning.flight_sources import (
     build_planning_flight_api_client,
     collect_flight_batches,
+    import_api_flights,
     import_excel_flights,
 )
 from wms.runtime_settings import get_planning_flight_api_config
+from wms.tests.planning.fake_flight_provider import (
+    FakeFlightProviderServer,
+    build_operational_flight,
+)
 
 
 class PlanningFlightApiConfigTests(SimpleTestCase):
@@ -272,3 +278,149 @@ class FlightSourceTests(TestCase):
                 end_date=date(2026, 3, 15),
                 api_client=FailingApiClient(),
             )
+
+
+class FlightScheduleCacheTests(TestCase):
+    def setUp(self):
+        correspondent = Contact.objects.create(
+            name="Correspondent NKC",
+            contact_type=ContactType.ORGANIZATION,
+            is_active=True,
+        )
+        self.destination = Destination.objects.create(
+            city="Nouakchott",
+            iata_code="NKC",
+            country="MR",
+            correspondent_contact=correspondent,
+        )
+        self.server = FakeFlightProviderServer().start()
+        self.addCleanup(self.server.stop)
+        self.start_date = date(2026, 3, 9)
+        self.end_date = date(2026, 3, 11)
+        for offset in range(3):
+            service_date = self.start_date + timedelta(days=offset)
+            self.server.set_day(
+                service_date,
+                [
+                    build_operational_flight(
+                        flight_number=700 + offset,
+                        departure_iso=f"{service_date.isoformat()}T09:45:00.000+00:00",
+                        route=["CDG", "NKC"],
+                    )
+                ],
+            )
+        self.provider = AirFranceKlmFlightProvider(
+            base_url=self.server.base_url,
+            api_key="test-api-key",  # pragma: allowlist secret
+            timeout_seconds=5,
+        )
+
+    def test_sync_fetches_each_day_once_then_reuses_fresh_days(self):
+        records, report = sync_flight_schedule(
+            client=self.provider,
+            start_date=self.start_date,
+            end_date=self.end_date,
+        )
+
+        self.assertEqual(
+            [record["flight_number"] for record in records], ["AF700", "AF701", "AF702"]
+        )
+        self.assertEqual(report.days_fetched, 3)
+        self.assertEqual(report.days_changed, 3)
+        self.assertEqual(
+            sorted(request["day"] for request in self.server.requests),
+            ["2026-03-09", "2026-03-10", "2026-03-11"],
+        )
+        self.assertEqual(FlightScheduleDay.objects.count(), 3)
+
+        cached_records, cached_report = sync_flight_schedule(
+            client=self.provider,
+            start_date=self.start_date,
+            end_date=self.end_date,
+        )
+
+        self.assertEqual(cached_records, records)
+        self.assertEqual(cached_report.days_reused, 3)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_sync_revalidates_stale_days_and_only_rewrites_changed_ones(self):
+        sync_flight_schedule(
+            client=self.provider,
+            start_date=self.start_date,
+            end_date=self.end_date,
+        )
+        unchanged_day = FlightScheduleDay.objects.get(service_date=self.start_date)
+        self.server.set_day(
+            self.end_date,
+            [
+                build_operational_flight(
+                    flight_number=990,
+                    departure_iso="2026-03-11T11:00:00.000+00:00",
+                    route=["CDG", "NKC"],
+                )
+            ],
+        )
+
+        records, report = sync_flight_schedule(
+            client=self.provider,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            max_age_seconds=0,
+        )
+
+        self.assertEqual(report.days_fetched, 3)
+        self.assertEqual(report.days_changed, 1)
+        self.assertEqual(records[-1]["flight_number"], "AF990")
+        self.assertEqual(
+            [request["not_modified"] for request in self.server.requests[3:]].count(True),
+            2,
+        )
+        self.assertEqual(
+            FlightScheduleDay.objects.get(service_date=self.start_date).changed_at,
+            unchanged_day.changed_at,
+        )
+
+    def test_import_api_flights_builds_batch_from_schedule_store(self):
+        batch = import_api_flights(
+            start_date=self.start_date,
+            end_date=self.end_date,
+            client=self.provider,
+        )
+
+        self.assertEqual(batch.source, "api")
+        self.assertEqual(batch.flights.count(), 3)
+        self.assertTrue(
+            all(flight.destination == self.destination for flight in batch.flights.all())
+        )
+        self.assertIn("3 fetched", batch.notes)
+
+        cached_batch = import_api_flights(
+            start_date=self.start_date,
+            end_date=self.end_date,
+            client=self.provider,
+        )
+
+        self.assertEqual(cached_batch.flights.count(), 3)
+        self.assertIn("3 reused", cached_batch.notes)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_sync_keeps_successful_days_when_one_day_fails(self):
+        class PartiallyFailingProvider:
+            cache_key = self.provider.cache_key
+
+            def fetch_day(inner_self, *, service_date, etag="", last_modified=""):
+                if service_date == self.end_date:
+                    raise PlanningFlightProviderError("API down")
+                return self.provider.fetch_day(service_date=service_date)
+
+        with self.assertRaisesMessage(PlanningFlightProviderError, "API down"):
+            sync_flight_schedule(
+                client=PartiallyFailingProvider(),
+                start_date=self.start_date,
+                end_date=self.end_date,
+            )
+
+        self.assertEqual(
+            list(FlightScheduleDay.objects.values_list("service_date", flat=True)),
+            [date(2026, 3, 9), date(2026, 3, 10)],
+        )
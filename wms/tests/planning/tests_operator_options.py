@@ -2,6 +2,7 @@ from datetime import date
 
 from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
 
 from wms.models import (
     PlanningAssignment,
@@ -15,8 +16,19 @@ from wms.models import (
     PlanningVersionStatus,
     PlanningVolunteerSnapshot,
 )
+from wms.planning.operator_index import (
+    OperatorIndex,
+    clear_operator_index_cache,
+    get_operator_index,
+)
+from wms.planning.operator_mutations import (
+    assign_unassigned_shipment,
+    delete_assignment,
+    update_assignment,
+)
 from wms.planning.operator_options import (
     build_assignment_editor_options,
+    build_operator_option_context,
     build_unassigned_editor_options,
 )
 
@@ -45,6 +57,8 @@ class PlanningOperatorOptionsTests(TestCase):
             status=PlanningVersionStatus.DRAFT,
             created_by=self.user,
         )
+        clear_operator_index_cache()
+        self.addCleanup(clear_operator_index_cache)
 
     def test_build_assignment_editor_options_exposes_colored_dates_flights_and_volunteers(
         self,
@@ -256,3 +270,159 @@ class PlanningOperatorOptionsTests(TestCase):
             volunteer_by_label["BRAVO Green"]["tones_by_flight"][str(late_flight.pk)],
             "green",
         )
+
+
+class PlanningOperatorIndexTests(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="operator-index")
+        self.run = PlanningRun.objects.create(
+            week_start=date(2026, 3, 9),
+            week_end=date(2026, 3, 15),
+            status=PlanningRunStatus.SOLVED,
+            created_by=user,
+        )
+        self.version = PlanningVersion.objects.create(
+            run=self.run,
+            status=PlanningVersionStatus.DRAFT,
+            created_by=user,
+        )
+        self.shipments = [
+            PlanningShipmentSnapshot.objects.create(
+                run=self.run,
+                shipment_reference=f"26030{index}",
+                destination_iata="NSI",
+                carton_count=2,
+                equivalent_units=3,
+            )
+            for index in range(3)
+        ]
+        self.volunteer = PlanningVolunteerSnapshot.objects.create(
+            run=self.run,
+            volunteer_label="COURTOIS Alain",
+            availability_summary={
+                "slots": [{"date": "2026-03-10", "start_time": "06:00", "end_time": "20:00"}]
+            },
+        )
+        self.flights = [
+            PlanningFlightSnapshot.objects.create(
+                run=self.run,
+                flight_number=flight_number,
+                departure_date=date(2026, 3, 10),
+                destination_iata="NSI",
+                capacity_units=10,
+                payload={"departure_time": departure_time, "routing": "CDG-NSI"},
+            )
+            for flight_number, departure_time in (
+                ("AF908", "10:00"),
+                ("AF910", "11:30"),
+                ("AF974", "16:00"),
+            )
+        ]
+        self.assignment = PlanningAssignment.objects.create(
+            version=self.version,
+            shipment_snapshot=self.shipments[0],
+            volunteer_snapshot=self.volunteer,
+            flight_snapshot=self.flights[0],
+            assigned_carton_count=2,
+            source=PlanningAssignmentSource.MANUAL,
+            sequence=1,
+        )
+        clear_operator_index_cache()
+        self.addCleanup(clear_operator_index_cache)
+
+    def _fresh_index(self):
+        context = build_operator_option_context(self.version)
+        return OperatorIndex.build(self.version, flights=context["flights"])
+
+    def _assert_matches_fresh_index(self, index):
+        fresh = self._fresh_index()
+        self.assertEqual(index.revision, fresh.revision)
+        self.assertEqual(index.assignments, fresh.assignments)
+        self.assertEqual(index.used_units_by_flight, fresh.used_units_by_flight)
+        self.assertEqual(index.departures_by_volunteer, fresh.departures_by_volunteer)
+
+    def test_index_lookups_follow_capacity_and_conflict_margin(self):
+        index = build_operator_option_context(self.version)["index"]
+        first, second, third = (flight.pk for flight in self.flights)
+
+        self.assertTrue(index.has_assignments(first))
+        self.assertFalse(index.has_assignments(second))
+        self.assertEqual(index.used_units(first), 3)
+        self.assertEqual(index.used_units(first, ignore_assignment_id=self.assignment.pk), 0)
+        self.assertTrue(index.volunteer_has_conflict(self.volunteer.pk, second))
+        self.assertFalse(index.volunteer_has_conflict(self.volunteer.pk, first))
+        self.assertFalse(index.volunteer_has_conflict(self.volunteer.pk, third))
+        self.assertFalse(
+            index.volunteer_has_conflict(
+                self.volunteer.pk, second, ignore_assignment_id=self.assignment.pk
+            )
+        )
+
+    def test_index_is_cached_per_version_revision(self):
+        flights = build_operator_option_context(self.version)["flights"]
+        index = get_operator_index(self.version, flights=flights)
+
+        self.assertIs(get_operator_index(self.version, flights=flights), index)
+
+        PlanningAssignment.objects.create(
+            version=self.version,
+            shipment_snapshot=self.shipments[1],
+            volunteer_snapshot=self.volunteer,
+            flight_snapshot=self.flights[2],
+            assigned_carton_count=2,
+            sequence=2,
+        )
+        rebuilt = get_operator_index(self.version, flights=flights)
+
+        self.assertIsNot(rebuilt, index)
+        self.assertEqual(rebuilt.used_units(self.flights[2].pk), 3)
+
+    def test_operator_mutations_patch_the_cached_index(self):
+        cached = build_operator_option_context(self.version)["index"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            created = assign_unassigned_shipment(
+                version=self.version,
+                shipment_snapshot=self.shipments[1],
+                volunteer_snapshot=self.volunteer,
+                flight_snapshot=self.flights[2],
+            )
+        self._assert_matches_fresh_index(cached)
+        self.assertIs(build_operator_option_context(self.version)["index"], cached)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            update_assignment(
+                version=self.version,
+                assignment=self.assignment,
+                volunteer_snapshot=self.volunteer,
+                flight_snapshot=self.flights[1],
+            )
+        self._assert_matches_fresh_index(cached)
+        self.assertEqual(cached.used_units(self.flights[0].pk), 0)
+        self.assertIs(build_operator_option_context(self.version)["index"], cached)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            delete_assignment(version=self.version, assignment=created)
+        self._assert_matches_fresh_index(cached)
+        self.assertFalse(cached.has_assignments(self.flights[2].pk))
+        self.assertIs(build_operator_option_context(self.version)["index"], cached)
+
+    def test_operator_mutations_drop_an_index_built_from_another_revision(self):
+        cached = build_operator_option_context(self.version)["index"]
+        # An edit committed elsewhere (another process) that this cache never saw.
+        PlanningAssignment.objects.filter(pk=self.assignment.pk).update(
+            flight_snapshot=self.flights[2], updated_at=timezone.now()
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            assign_unassigned_shipment(
+                version=self.version,
+                shipment_snapshot=self.shipments[1],
+                volunteer_snapshot=self.volunteer,
+                flight_snapshot=self.flights[0],
+            )
+
+        index = build_operator_option_context(self.version)["index"]
+        self.assertIsNot(index, cached)
+        self._assert_matches_fresh_index(index)
+        self.assertEqual(index.used_units(self.flights[2].pk), 3)
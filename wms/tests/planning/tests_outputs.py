@@ -205,18 +205,37 @@ class PlanningOutputTests(TestCase):
             ],
         )
 
+    @mock.patch("wms.planning.exports.os.replace")
     @mock.patch("wms.planning.exports.Workbook")
-    def test_export_version_workbook_closes_workbook_after_save(self, workbook_cls):
+    def test_export_version_workbook_closes_workbook_after_save(self, workbook_cls, replace):
         version = self.make_published_version()
         workbook = mock.MagicMock()
-        sheet = mock.MagicMock()
-        workbook.active = sheet
         workbook_cls.return_value = workbook
 
-        export_version_workbook(version)
+        artifact = export_version_workbook(version)
 
+        workbook_cls.assert_called_once_with(write_only=True)
         workbook.save.assert_called_once()
         workbook.close.assert_called_once_with()
+        replace.assert_called_once_with(workbook.save.call_args.args[0], Path(artifact.file_path))
+
+    def test_export_version_workbook_keeps_previous_file_when_save_fails(self):
+        version = self.make_published_version()
+        artifact = export_version_workbook(version)
+        workbook = mock.MagicMock()
+
+        def interrupted_save(path):
+            Path(path).write_bytes(b"PK")
+            raise OSError("disk full")
+
+        workbook.save.side_effect = interrupted_save
+        with mock.patch("wms.planning.exports.Workbook", return_value=workbook):
+            with self.assertRaises(OSError):
+                export_version_workbook(version)
+
+        workbook.close.assert_called_once_with()
+        self.assertTrue(Path(artifact.file_path).exists())
+        self.assertFalse(workbook.save.call_args.args[0].exists())
 
     def test_generate_drafts_aggregates_multiple_assignments_for_same_recipient(self):
         second_shipment = PlanningShipmentSnapshot.objects.create(
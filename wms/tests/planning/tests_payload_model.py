@@ -0,0 +1,179 @@
+import json
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+
+from wms.models import (
+    PlanningFlightSnapshot,
+    PlanningRun,
+    PlanningShipmentSnapshot,
+    PlanningVolunteerSnapshot,
+)
+from wms.planning.payload_model import PlanningPayload
+from wms.planning.rules import (
+    compile_run_solver_payload,
+    compute_compatibility,
+    shipment_is_compatible_with_flight,
+    volunteer_is_compatible_with_flight,
+)
+
+
+def _payload(*, volunteers, flights, shipments=None):
+    return {
+        "shipments": shipments
+        or [
+            {
+                "snapshot_id": 101,
+                "destination_iata": "ABJ",
+                "carton_count": 2,
+                "equivalent_units": 2,
+            }
+        ],
+        "volunteers": volunteers,
+        "flights": flights,
+    }
+
+
+class PlanningPayloadModelTests(SimpleTestCase):
+    def test_records_are_integer_indexed_with_precomputed_fields(self):
+        planning = PlanningPayload.from_dict(
+            _payload(
+                shipments=[
+                    {
+                        "snapshot_id": 101,
+                        "reference": "250705",
+                        "priority": 2,
+                        "priority_rank": 5,
+                        "carton_count": 3,
+                        "equivalent_units": 4,
+                        "payload": {"legacy_date_impression": "2025-11-17"},
+                    }
+                ],
+                volunteers=[{"snapshot_id": 201, "max_colis_vol": None}],
+                flights=[
+                    {"snapshot_id": 301, "departure_date": "2026-03-10", "departure_time": "09:45"}
+                ],
+            )
+        )
+
+        shipment = planning.shipment_by_id[101]
+        flight = planning.flight_by_id[301]
+        self.assertEqual((shipment.index, flight.index), (0, 0))
+        self.assertEqual(shipment.weight, 20)
+        self.assertEqual(shipment.legacy_tie_break_key[1], date(2025, 11, 17).toordinal())
+        self.assertEqual((flight.departure_minute, flight.mission_start_minute), (585, 405))
+        self.assertEqual(planning.volunteer_capacities.tolist(), [22])
+        self.assertEqual(planning.volunteer_flight_masks, (0b1,))
+        self.assertIs(PlanningPayload.coerce(planning), planning)
+
+    def test_availability_bitsets_match_dict_rules(self):
+        flights = [
+            {"snapshot_id": 301, "departure_date": "2026-03-10", "departure_time": "10:00"},
+            {"snapshot_id": 302, "departure_date": "2026-03-10", "departure_time": "01:30"},
+            {"snapshot_id": 303, "departure_date": "2026-03-11", "departure_time": ""},
+            {"snapshot_id": 304, "departure_date": "2026-03-12", "departure_time": "12:00"},
+        ]
+        volunteers = [
+            {
+                "snapshot_id": 201,
+                "availability_summary": {
+                    "slots": [
+                        {"date": "2026-03-10", "start_time": "07:00", "end_time": "10:00"},
+                        {"date": "2026-03-10", "start_time": "22:00", "end_time": "23:00"},
+                        {"date": "2026-03-11", "start_time": "", "end_time": ""},
+                    ],
+                    "unavailable_dates": ["2026-03-12"],
+                },
+            },
+            {"snapshot_id": 202, "availability_summary": {}},
+        ]
+        payload = _payload(volunteers=volunteers, flights=flights)
+        planning = PlanningPayload.from_dict(payload)
+
+        for volunteer in volunteers:
+            for flight in flights:
+                self.assertEqual(
+                    planning.volunteer_available_for(
+                        planning.volunteer_by_id[volunteer["snapshot_id"]],
+                        planning.flight_by_id[flight["snapshot_id"]],
+                    ),
+                    volunteer_is_compatible_with_flight(volunteer, flight),
+                    (volunteer["snapshot_id"], flight["snapshot_id"]),
+                )
+        # 10:00 fits 07:00-10:00; 01:30 wraps to a 22:30 start, compared on the same day.
+        self.assertEqual(planning.volunteer_flight_masks, (0b0011, 0b1111))
+
+    def test_shipment_masks_match_dict_rules(self):
+        flights = [
+            {"snapshot_id": 301, "departure_date": "2026-03-10", "destination_iata": "abj"},
+            {"snapshot_id": 302, "departure_date": "2026-03-10", "destination_iata": "DKR"},
+            {
+                "snapshot_id": 303,
+                "departure_date": "2026-03-10",
+                "destination_iata": "ABJ",
+                "allowed_weekdays": ["wed"],
+            },
+            {
+                "snapshot_id": 304,
+                "departure_date": "2026-03-10",
+                "destination_iata": "ABJ",
+                "capacity_units": 1,
+            },
+        ]
+        payload = _payload(volunteers=[], flights=flights)
+        planning = PlanningPayload.from_dict(payload)
+        shipment = payload["shipments"][0]
+
+        expected = sum(
+            1 << index
+            for index, flight in enumerate(flights)
+            if shipment_is_compatible_with_flight(shipment, flight)
+        )
+        self.assertEqual(planning.shipment_flight_masks, (expected,))
+        self.assertEqual(expected, 0b0001)
+
+
+class PlanningPayloadRoundTripTests(TestCase):
+    def test_compiled_payload_round_trips_through_model_and_json(self):
+        user = get_user_model().objects.create_user(username="payload-model")
+        run = PlanningRun.objects.create(
+            week_start=date(2026, 3, 9),
+            week_end=date(2026, 3, 15),
+            created_by=user,
+        )
+        PlanningShipmentSnapshot.objects.create(
+            run=run,
+            shipment_reference="EXP-PLAN-001",
+            destination_iata="ABJ",
+            carton_count=3,
+            equivalent_units=3,
+            payload={"legacy_type_priority": "2"},
+        )
+        PlanningVolunteerSnapshot.objects.create(
+            run=run,
+            volunteer_label="Ada Volunteer",
+            max_colis_vol=4,
+            availability_summary={
+                "slots": [{"date": "2026-03-10", "start_time": "06:00", "end_time": "12:00"}]
+            },
+        )
+        PlanningFlightSnapshot.objects.create(
+            run=run,
+            flight_number="AF702",
+            departure_date=date(2026, 3, 10),
+            destination_iata="ABJ",
+            capacity_units=20,
+            payload={"departure_time": "09:45", "routing": "CDG-ABJ"},
+        )
+        payload = compile_run_solver_payload(run)
+        stored = json.loads(json.dumps(payload))
+
+        planning = PlanningPayload.from_dict(stored)
+
+        self.assertEqual(planning.to_dict(), stored)
+        self.assertEqual(PlanningPayload.from_dict(payload).to_dict(), payload)
+        self.assertEqual(compute_compatibility(planning), compute_compatibility(stored))
+        self.assertEqual(
+            len(compute_compatibility(planning)[stored["shipments"][0]["snapshot_id"]]), 1
+        )
@@ -3,6 +3,7 @@ from datetime import UTC, date, datetime, time, timedelta
 from io import StringIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from zipfile import ZipFile
 
 from django.contrib.auth import get_user_model
 from django.core.management import call_command
@@ -31,7 +32,10 @@ from wms.models import (
     VolunteerProfile,
     Warehouse,
 )
-from wms.planning.recipe_export import build_planning_recipe_export
+from wms.planning.recipe_export import (
+    build_planning_recipe_export,
+    write_planning_recipe_export_stream,
+)
 
 
 class PlanningRecipeExportTests(TestCase):
@@ -360,3 +364,70 @@ class PlanningRecipeExportTests(TestCase):
         self.assertEqual(payload["summary"]["flights"], 1)
         self.assertEqual(payload["summary"]["shipments"], 1)
         self.assertIn("wrote", stdout.getvalue().lower())
+
+    def test_stream_export_writes_jsonl_sections_matching_builder(self):
+        export = build_planning_recipe_export(
+            week_start=self.week_start,
+            week_end=self.week_end,
+        ).to_dict()
+
+        with TemporaryDirectory() as tmp_dir:
+            output_path = Path(tmp_dir) / "planning_recipe.jsonl"
+            summary = write_planning_recipe_export_stream(
+                output_path,
+                week_start=self.week_start,
+                week_end=self.week_end,
+                chunk_size=1,
+            )
+            lines = [json.loads(line) for line in output_path.read_text().splitlines()]
+
+        self.assertEqual(summary, export["summary"])
+        self.assertEqual(lines[0]["section"], "meta")
+        self.assertEqual(lines[0]["data"]["format"], "jsonl")
+        self.assertEqual(lines[1]["data"]["week_start"], "2026-03-09")
+        self.assertEqual(lines[-1], {"section": "summary", "data": export["summary"]})
+        fixtures = {}
+        alias_map = {}
+        for line in lines[2:-1]:
+            if line["section"] == "alias_map":
+                alias = line["data"]
+                alias_map.setdefault(alias["kind"], {})[str(alias["source_pk"])] = alias["alias"]
+            else:
+                fixtures.setdefault(line["section"], []).append(line["data"])
+        self.assertEqual(
+            fixtures,
+            {section: items for section, items in export["fixtures"].items() if items},
+        )
+        self.assertEqual(alias_map, export["alias_map"])
+
+    def test_planning_recipe_export_command_writes_zip_archive(self):
+        stdout = StringIO()
+
+        with TemporaryDirectory() as tmp_dir:
+            output_path = Path(tmp_dir) / "planning_recipe.zip"
+            call_command(
+                "planning_recipe_export",
+                week_start=self.week_start.isoformat(),
+                week_end=self.week_end.isoformat(),
+                output=str(output_path),
+                format="zip",
+                chunk_size=2,
+                stdout=stdout,
+            )
+
+            with ZipFile(output_path) as archive:
+                manifest = json.loads(archive.read("manifest.json"))
+                shipments = [
+                    json.loads(line)
+                    for line in archive.read("fixtures/shipments.jsonl").splitlines()
+                ]
+                members = set(archive.namelist())
+
+        self.assertEqual(manifest["summary"]["shipments"], 1)
+        self.assertEqual(manifest["meta"]["format"], "zip")
+        self.assertIn("alias_map.jsonl", members)
+        self.assertIn("fixtures/carton_items.jsonl", members)
+        self.assertEqual(
+            [item["reference"] for item in shipments], [self.shipment_in_week.reference]
+        )
+        self.assertIn("shipments=1", stdout.getvalue())
@@ -0,0 +1,226 @@
+from datetime import date
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from contacts.models import Contact, ContactType
+from wms.models import (
+    Destination,
+    PlanningDestinationRule,
+    PlanningFlightSnapshot,
+    PlanningParameterSet,
+    PlanningRun,
+    PlanningRunStatus,
+    PlanningShipmentSnapshot,
+    PlanningVersion,
+    PlanningVolunteerSnapshot,
+)
+from wms.planning.rules import compile_run_solver_payload
+from wms.planning.scenarios import (
+    BASELINE_SCENARIO_KEY,
+    NO_BASELINE_STATUS,
+    build_run_scenarios,
+    build_scenario_comparison,
+    solve_run_scenarios,
+)
+from wms.process_pools.planning_scenarios import solve_scenario_payload
+
+
+class PlanningScenarioTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="planner@example.com",
+            email="planner@example.com",
+            password="pass1234",  # pragma: allowlist secret
+        )
+        correspondent = Contact.objects.create(
+            name="Correspondent ABJ",
+            contact_type=ContactType.ORGANIZATION,
+            is_active=True,
+        )
+        self.destination = Destination.objects.create(
+            city="Abidjan",
+            iata_code="ABJ",
+            country="CI",
+            correspondent_contact=correspondent,
+        )
+        self.parameter_set = PlanningParameterSet.objects.create(name="Semaine 11")
+        PlanningDestinationRule.objects.create(
+            parameter_set=self.parameter_set,
+            destination=self.destination,
+            priority=5,
+            max_cartons_per_flight=10,
+        )
+        self.alternative_set = PlanningParameterSet.objects.create(name="Semaine 11 bis")
+        PlanningDestinationRule.objects.create(
+            parameter_set=self.alternative_set,
+            destination=self.destination,
+            priority=2,
+            max_cartons_per_flight=4,
+            weekly_frequency=1,
+            allowed_weekdays=["tue"],
+        )
+        self.run = PlanningRun.objects.create(
+            week_start="2026-03-09",
+            week_end="2026-03-15",
+            parameter_set=self.parameter_set,
+            status=PlanningRunStatus.READY,
+            created_by=self.user,
+        )
+        PlanningShipmentSnapshot.objects.create(
+            run=self.run,
+            shipment_reference="EXP-PLAN-001",
+            shipper_name="Association shipper",
+            destination_iata="ABJ",
+            priority=5,
+            carton_count=3,
+            equivalent_units=6,
+        )
+        PlanningVolunteerSnapshot.objects.create(
+            run=self.run,
+            volunteer_label="Ada Volunteer",
+            max_colis_vol=8,
+            availability_summary={
+                "slot_count": 1,
+                "slots": [
+                    {
+                        "date": "2026-03-10",
+                        "start_time": "07:00",
+                        "end_time": "12:00",
+                    }
+                ],
+            },
+        )
+        PlanningFlightSnapshot.objects.create(
+            run=self.run,
+            flight_number="AF702",
+            departure_date=date(2026, 3, 10),
+            destination_iata="ABJ",
+            capacity_units=12,
+        )
+
+    def test_build_run_scenarios_starts_with_baseline_and_skips_run_parameter_set(self):
+        scenarios = build_run_scenarios(
+            self.run,
+            parameter_set_ids=[self.parameter_set.pk, self.alternative_set.pk],
+            random_seeds=[7],
+        )
+
+        self.assertEqual(
+            [scenario.key for scenario in scenarios],
+            [BASELINE_SCENARIO_KEY, f"parameter-set-{self.alternative_set.pk}", "seed-7"],
+        )
+        self.assertEqual(scenarios[2].solver_options, {"random_seed": 7})
+
+    def test_compile_run_solver_payload_applies_parameter_set_rules(self):
+        PlanningShipmentSnapshot.objects.create(
+            run=self.run,
+            shipment_reference="EXP-PLAN-002",
+            destination_iata="DKR",
+            priority=4,
+            carton_count=1,
+            equivalent_units=1,
+        )
+        PlanningShipmentSnapshot.objects.create(
+            run=self.run,
+            shipment_reference="EXP-PLAN-003",
+            destination_iata="ABJ",
+            priority=5,
+            carton_count=1,
+            equivalent_units=1,
+            payload={"legacy_type_priority": "9"},
+        )
+        payload = compile_run_solver_payload(self.run)
+
+        variant = compile_run_solver_payload(self.run, parameter_set=self.alternative_set)
+
+        self.assertEqual(variant["flights"][0]["max_cartons_per_flight"], 4)
+        self.assertEqual(variant["flights"][0]["allowed_weekdays"], ["tue"])
+        self.assertEqual(
+            [
+                (shipment["reference"], shipment["priority"], shipment["priority_rank"])
+                for shipment in variant["shipments"]
+            ],
+            [("EXP-PLAN-001", 2, 2), ("EXP-PLAN-003", 2, 9), ("EXP-PLAN-002", 0, 0)],
+        )
+        self.assertEqual(payload["flights"][0]["max_cartons_per_flight"], 10)
+        self.assertEqual(
+            [(shipment["reference"], shipment["priority"]) for shipment in payload["shipments"]],
+            [("EXP-PLAN-001", 5), ("EXP-PLAN-003", 5), ("EXP-PLAN-002", 4)],
+        )
+
+    def test_solve_run_scenarios_creates_one_draft_version_per_variant(self):
+        scenarios = build_run_scenarios(
+            self.run,
+            parameter_set_ids=[self.alternative_set.pk],
+            random_seeds=[7],
+        )
+
+        rows = solve_run_scenarios(self.run, scenarios, max_workers=1)
+
+        self.run.refresh_from_db()
+        self.assertEqual(self.run.status, PlanningRunStatus.SOLVED)
+        self.assertEqual(PlanningVersion.objects.filter(run=self.run).count(), 3)
+        self.assertEqual([row["error"] for row in rows], ["", "", ""])
+        self.assertEqual(self.run.solver_result["assignment_count"], 1)
+        self.assertEqual(len(self.run.solver_result["scenarios"]), 3)
+        baseline_version = PlanningVersion.objects.get(pk=rows[0]["version_id"])
+        self.assertTrue(baseline_version.change_reason.startswith("Scenario: Base"))
+
+        comparison = build_scenario_comparison(self.run)
+
+        self.assertEqual(comparison[0]["score"]["assignment_count"], 1)
+        # Variants are scored with the baseline priorities, so equal plans score equally.
+        self.assertEqual(
+            [row["score"]["weighted_score"] for row in comparison],
+            [30, 30, 30],
+        )
+        self.assertTrue(all(row["is_best"] for row in comparison))
+
+    def test_solve_run_scenarios_runs_variants_in_a_process_pool(self):
+        scenarios = build_run_scenarios(self.run, random_seeds=[7])
+
+        rows = solve_run_scenarios(self.run, scenarios, max_workers=2)
+
+        self.assertEqual(len(rows), 2)
+        self.assertTrue(all(row["version_id"] for row in rows))
+        self.assertEqual(
+            [row["score"]["assignment_count"] for row in rows],
+            [1, 1],
+        )
+
+    def test_solve_run_scenarios_requires_ready_run(self):
+        self.run.status = PlanningRunStatus.DRAFT
+        self.run.save(update_fields=["status", "updated_at"])
+
+        with self.assertRaisesMessage(ValueError, "Planning run must be ready"):
+            solve_run_scenarios(self.run, build_run_scenarios(self.run), max_workers=1)
+
+    def test_solve_run_scenarios_reports_no_baseline_when_baseline_fails(self):
+        scenarios = build_run_scenarios(self.run, random_seeds=[7])
+        failed = {"assignments": [], "result": {}, "error": "baseline failed", "elapsed_seconds": 0}
+
+        with mock.patch(
+            "wms.planning.scenarios.solve_scenario_payload",
+            side_effect=[failed, solve_scenario_payload(compile_run_solver_payload(self.run))],
+        ):
+            rows = solve_run_scenarios(self.run, scenarios, max_workers=1)
+
+        self.run.refresh_from_db()
+        self.assertEqual(self.run.status, PlanningRunStatus.SOLVED)
+        self.assertEqual(self.run.solver_result["status"], NO_BASELINE_STATUS)
+        self.assertEqual(self.run.solver_result["error"], "baseline failed")
+        self.assertIsNone(rows[0]["version_id"])
+        self.assertTrue(rows[1]["version_id"])
+
+    def test_solve_run_scenarios_restores_ready_status_when_every_scenario_fails(self):
+        failed = {"assignments": [], "result": {}, "error": "no solution", "elapsed_seconds": 0}
+
+        with mock.patch("wms.planning.scenarios.solve_scenario_payload", return_value=failed):
+            with self.assertRaisesMessage(RuntimeError, "no solution"):
+                solve_run_scenarios(self.run, build_run_scenarios(self.run), max_workers=1)
+
+        self.run.refresh_from_db()
+        self.assertEqual(self.run.status, PlanningRunStatus.READY)
+        self.assertFalse(PlanningVersion.objects.filter(run=self.run).exists())
@@ -1,7 +1,10 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 
 from wms.models import (
+    IntegrationEvent,
     PlanningAssignment,
     PlanningAssignmentSource,
     PlanningFlightSnapshot,
@@ -117,3 +120,69 @@ class PlanningShipmentUpdateTests(TestCase):
         )
         self.assertEqual(summary["updated"], 0)
         self.assertEqual(summary["skipped_locked"], 1)
+
+    def test_apply_version_updates_bulk_writes_and_records_publication_stats(self):
+        get_user_model().objects.create_superuser(
+            username="planning-admin",
+            email="admin@example.com",
+            password="pass1234",  # pragma: allowlist secret
+        )
+        version = PlanningVersion.objects.create(
+            run=self.run,
+            status=PlanningVersionStatus.PUBLISHED,
+            created_by=self.user,
+        )
+        shipments = [self.make_shipment(status=ShipmentStatus.PACKED) for _index in range(3)]
+        already_planned = self.make_shipment(status=ShipmentStatus.PLANNED)
+        ShipmentTrackingEvent.objects.create(
+            shipment=already_planned,
+            status=ShipmentTrackingStatus.PLANNED,
+            actor_name="planner",
+            actor_structure="ASF",
+        )
+        for sequence, shipment in enumerate([*shipments, already_planned], start=1):
+            PlanningAssignment.objects.create(
+                version=version,
+                shipment_snapshot=PlanningShipmentSnapshot.objects.create(
+                    run=self.run,
+                    shipment=shipment,
+                    shipment_reference=shipment.reference,
+                    carton_count=1,
+                    equivalent_units=1,
+                ),
+                volunteer_snapshot=self.volunteer_snapshot,
+                flight_snapshot=self.flight_snapshot,
+                assigned_carton_count=1,
+                source=PlanningAssignmentSource.MANUAL,
+                sequence=sequence,
+            )
+
+        IntegrationEvent.objects.filter(source="wms.notification").delete()
+
+        with mock.patch.object(Shipment, "save") as save_mock:
+            summary = apply_version_updates(version, actor_name="planner")
+
+        save_mock.assert_not_called()
+        self.assertEqual(summary["considered"], 4)
+        self.assertEqual(summary["updated"], 3)
+        self.assertEqual(summary["tracking_events_created"], 3)
+        self.assertEqual(
+            Shipment.objects.filter(
+                pk__in=[shipment.pk for shipment in shipments],
+                status=ShipmentStatus.PLANNED,
+            ).count(),
+            3,
+        )
+        admin_rows = [
+            event
+            for event in IntegrationEvent.objects.filter(source="wms.notification")
+            if event.payload["recipients"] == ["admin@example.com"]
+        ]
+        self.assertEqual(len(admin_rows), 6)
+        version.refresh_from_db()
+        stats = version.publication_stats["shipment_updates"]
+        self.assertEqual(stats["updated"], 3)
+        self.assertEqual(
+            set(stats["timings"]),
+            {"load", "shipments", "tracking_events", "notifications", "total"},
+        )
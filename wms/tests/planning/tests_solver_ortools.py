@@ -31,6 +31,23 @@ class SolverOrtoolsTests(TestCase):
         self.assertEqual(solver.parameters.num_search_workers, 8)
         self.assertEqual(solver.parameters.random_seed, 0)
 
+    def test_configure_cp_solver_accepts_benchmark_overrides(self):
+        if planning_solver.cp_model is None:
+            self.skipTest("ortools is not installed")
+
+        solver = planning_solver.cp_model.CpSolver()
+
+        planning_solver.configure_cp_solver(
+            solver,
+            max_time_seconds=5,
+            num_search_workers=2,
+            random_seed=7,
+        )
+
+        self.assertEqual(solver.parameters.max_time_in_seconds, 5.0)
+        self.assertEqual(solver.parameters.num_search_workers, 2)
+        self.assertEqual(solver.parameters.random_seed, 7)
+
     def test_canonicalize_equal_weight_assignments_spans_multiple_shippers(self):
         payload = {
             "shipments": [
@@ -236,6 +253,30 @@ class SolverOrtoolsTests(TestCase):
             ],
         )
 
+    def test_lexicographic_flight_distribution_prefers_earliest_volunteers(self):
+        self.assertEqual(
+            planning_solver._solve_lexicographic_flight_distribution((10, 8, 6, 4), (12, 16)),
+            (1, 0, 1, 0),
+        )
+        self.assertIsNone(
+            planning_solver._solve_lexicographic_flight_distribution((10, 10, 10), (12, 12))
+        )
+
+    def test_lexicographic_flight_distribution_stays_bounded_on_equal_weight_weeks(self):
+        distribution = planning_solver._solve_lexicographic_flight_distribution(
+            tuple([3] * 40 + [5] * 20),
+            tuple([22] * 12),
+        )
+
+        self.assertEqual(len(distribution), 60)
+        self.assertIsNone(
+            planning_solver._solve_lexicographic_flight_distribution(
+                (7, 7, 7, 7, 7, 7, 7, 7),
+                (15, 15, 15, 15),
+                max_states=3,
+            )
+        )
+
     def _create_parameter_set_with_destination_rules(self, *, user):
         parameter_set = PlanningParameterSet.objects.create(
             name="Legacy parity mini case",
@@ -348,12 +348,17 @@ class PrintContextTests(SimpleTestCase):
             reference="SHP-60",
             destination=SimpleNamespace(city="abidjan", iata_code="abj"),
             destination_address="ignored",
-            qr_code_image=SimpleNamespace(url="/media/qr.png"),
         )
-        context = build_label_context(shipment, position=2, total=8)
+        request = object()
+        with mock.patch(
+            "wms.print_context.shipment_qr_data_uri",
+            return_value="data:image/svg+xml;base64,UVI=",
+        ) as qr_mock:
+            context = build_label_context(shipment, position=2, total=8, request=request)
+        qr_mock.assert_called_once_with(shipment, request=request)
         self.assertEqual(context["label_city"], "ABIDJAN")
         self.assertEqual(context["label_iata"], "ABJ")
-        self.assertEqual(context["label_qr_url"], "/media/qr.png")
+        self.assertEqual(context["label_qr_url"], "data:image/svg+xml;base64,UVI=")
         self.assertEqual(context["label_position"], 2)
         self.assertEqual(context["label_total"], 8)
 
@@ -361,7 +366,7 @@ class PrintContextTests(SimpleTestCase):
             reference="SHP-61",
             destination=None,
             destination_address="Bamako Hub",
-            qr_code_image=None,
+            get_tracking_url=lambda request=None: "",
         )
         context_no_destination = build_label_context(shipment_no_destination, position=1, total=1)
         self.assertEqual(context_no_destination["label_city"], "BAMAKO HUB")
@@ -430,13 +435,16 @@ class PrintContextTests(SimpleTestCase):
         self.assertTrue(temp_context["product_shelf_hidden"])
 
     def test_build_product_qr_and_sample_context_builders(self):
-        product = SimpleNamespace(
-            name="Mask",
-            brand="BrandX",
-            qr_code_image=SimpleNamespace(url="/media/qr-mask.png"),
-        )
-        qr_context = build_product_qr_label_context(product)
-        self.assertEqual(qr_context["product_qr_url"], "/media/qr-mask.png")
+        product = SimpleNamespace(name="Mask", brand="BrandX", sku="ASF-MASK")
+        with mock.patch(
+            "wms.print_context.product_qr_data_uri",
+            return_value="data:image/svg+xml;base64,TUFTSw==",
+        ) as qr_mock:
+            qr_context = build_product_qr_label_context(product)
+            batched_context = build_product_qr_label_context(product, qr_url="data:batched")
+        qr_mock.assert_called_once_with(product)
+        self.assertEqual(qr_context["product_qr_url"], "data:image/svg+xml;base64,TUFTSw==")
+        self.assertEqual(batched_context["product_qr_url"], "data:batched")
 
         sample_label = build_sample_label_context()
         self.assertEqual(sample_label["label_city"], "BAMAKO")
@@ -91,6 +91,7 @@ class PrintRendererTests(TestCase):
         text_block_mock.assert_called_once_with(
             {"type": "text", "text": "Hello"},
             {"name": "ASF"},
+            None,
         )
 
     def test_render_block_contacts_row_sets_defaults(self):
@@ -235,6 +236,48 @@ class PrintRendererTests(TestCase):
         self.assertEqual(rendered, ["first", "third"])
         self.assertEqual(render_block_mock.call_count, 3)
 
+    def test_compile_layout_parses_text_blocks_once_per_layout(self):
+        print_renderer.clear_compiled_layout_cache()
+        layout = {"blocks": [{"type": "text", "text": "Ref {{ ref }}"}]}
+
+        with mock.patch(
+            "wms.print_renderer.Template",
+            wraps=print_renderer.Template,
+        ) as template_mock:
+            rendered = [
+                print_renderer.render_layout_from_layout(layout, {"ref": ref})
+                for ref in ("A", "B", "C")
+            ]
+
+        self.assertEqual(template_mock.call_count, 1)
+        self.assertEqual(
+            [blocks[0] for blocks in rendered],
+            [
+                '<div style="">Ref A</div>',
+                '<div style="">Ref B</div>',
+                '<div style="">Ref C</div>',
+            ],
+        )
+        self.assertIs(print_renderer.compile_layout(layout), print_renderer.compile_layout(layout))
+
+    def test_compiled_layout_is_not_shared_after_layout_content_changes(self):
+        layout = {"blocks": [{"type": "text", "text": "Avant"}]}
+        first = print_renderer.render_layout_from_layout(layout, {})
+
+        layout["blocks"][0]["text"] = "Apres"
+        second = print_renderer.render_layout_from_layout(layout, {})
+
+        self.assertIn("Avant", first[0])
+        self.assertIn("Apres", second[0])
+
+    def test_saving_print_template_clears_compiled_layouts(self):
+        print_renderer.compile_layout({"blocks": [{"type": "text", "text": "Cache"}]})
+        self.assertTrue(print_renderer._compiled_layouts)
+
+        PrintTemplate.objects.create(doc_type="shipment_note", layout={"blocks": []})
+
+        self.assertFalse(print_renderer._compiled_layouts)
+
     def test_render_layout_uses_resolved_layout(self):
         with mock.patch(
             "wms.print_renderer.resolve_layout",
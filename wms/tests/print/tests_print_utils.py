@@ -40,7 +40,7 @@ class PrintUtilsTests(TestCase):
         contexts = [{"sku": "A"}, {"sku": "B"}, {"sku": "C"}]
 
         with mock.patch(
-            "wms.print_utils.render_layout_from_layout",
+            "wms.print_utils.render_compiled_layout",
             side_effect=[["A"], ["B"], ["C"]],
         ) as render_mock:
             pages, page_style = print_utils.build_label_pages(
@@ -51,6 +51,8 @@ class PrintUtilsTests(TestCase):
             )
 
         self.assertEqual(render_mock.call_count, 3)
+        compiled_layouts = {id(call.args[0]) for call in render_mock.call_args_list}
+        self.assertEqual(len(compiled_layouts), 1)
         self.assertEqual(
             pages,
             [
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from wms import qr_codes
+
+
+class QrCodeRenderingTests(SimpleTestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = Path(temp_dir.name)
+        settings_override = override_settings(QR_CODE_CACHE_DIR=str(self.cache_dir))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        qr_codes.clear_qr_code_memory_cache()
+        self.addCleanup(qr_codes.clear_qr_code_memory_cache)
+
+    def test_render_writes_content_addressed_cache_file(self):
+        content = qr_codes.render_qr_code("SKU-QR-1")
+
+        self.assertTrue(content.lstrip().startswith(b"<?xml"))
+        key = qr_codes.qr_code_cache_key("SKU-QR-1", "svg")
+        self.assertEqual((self.cache_dir / key[:2] / f"{key}.svg").read_bytes(), content)
+
+    def test_render_reuses_memory_then_disk_cache(self):
+        with mock.patch("wms.qr_codes._render", wraps=qr_codes._render) as render_mock:
+            first = qr_codes.render_qr_code("SKU-QR-2", "png")
+            self.assertEqual(qr_codes.render_qr_code("SKU-QR-2", "png"), first)
+            qr_codes.clear_qr_code_memory_cache()
+            self.assertEqual(qr_codes.render_qr_code("SKU-QR-2", "png"), first)
+
+        render_mock.assert_called_once_with("SKU-QR-2", "png")
+        self.assertTrue(first.startswith(b"\x89PNG"))
+
+    def test_render_rejects_unknown_format(self):
+        with self.assertRaisesMessage(ValueError, "Unsupported QR code format: gif"):
+            qr_codes.render_qr_code("SKU-QR-3", "gif")
+
+    def test_batch_renders_each_distinct_payload_once(self):
+        with mock.patch("wms.qr_codes._render", return_value=b"<svg/>") as render_mock:
+            uris = qr_codes.qr_code_data_uris(["SKU-A", "", "SKU-B", "SKU-A"])
+
+        self.assertEqual(list(uris), ["SKU-A", "SKU-B"])
+        self.assertEqual(uris["SKU-A"], "data:image/svg+xml;base64,PHN2Zy8+")
+        self.assertEqual(render_mock.call_count, 2)
+
+    def test_data_uri_is_empty_without_payload(self):
+        self.assertEqual(qr_codes.qr_code_data_uri(""), "")
+        self.assertEqual(
+            qr_codes.shipment_qr_data_uri(mock.Mock(get_tracking_url=mock.Mock(return_value=""))),
+            "",
+        )
+
+    def test_prune_deletes_files_unused_for_max_age(self):
+        with mock.patch("wms.qr_codes._render", return_value=b"<svg/>"):
+            qr_codes.render_qr_code("SKU-OLD")
+            qr_codes.render_qr_code("SKU-USED")
+        old_path, used_path = (
+            qr_codes._cache_path(payload, "svg") for payload in ("SKU-OLD", "SKU-USED")
+        )
+        stale = time.time() - 40 * 86400
+        for path in (old_path, used_path):
+            os.utime(path, (stale, stale))
+        qr_codes.clear_qr_code_memory_cache()
+        # A disk hit marks the file as used again.
+        qr_codes.render_qr_code("SKU-USED")
+
+        self.assertEqual(list(qr_codes.iter_stale_qr_code_files()), [old_path])
+        self.assertEqual(qr_codes.prune_qr_code_cache(max_age_days=30), 1)
+        self.assertFalse(old_path.exists())
+        self.assertTrue(used_path.exists())
@@ -1,6 +1,7 @@
 from django.test import TestCase
 
 from contacts.models import Contact
+from wms.domain.stock import refresh_carton_totals
 from wms.models import (
     Carton,
     CartonFormat,
@@ -45,6 +46,7 @@ class ScanCartonHelpersTests(TestCase):
             preassigned_destination=destination,
         )
         CartonItem.objects.create(carton=ready, product_lot=lot, quantity=2)
+        refresh_carton_totals(ready)
         Carton.objects.create(code="C-OUT", status=CartonStatus.PICKING)
         shipment = Shipment.objects.create(
             shipper_name="Sender",
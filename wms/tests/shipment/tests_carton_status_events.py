@@ -2,8 +2,8 @@ from unittest import mock
 
 from django.test import TestCase
 
-from wms.carton_status_events import set_carton_status
-from wms.models import Carton, CartonStatus
+from wms.carton_status_events import bulk_set_carton_status, set_carton_status
+from wms.models import Carton, CartonStatus, CartonStatusEvent
 
 
 class CartonStatusEventsLoggingTests(TestCase):
@@ -26,3 +26,35 @@ class CartonStatusEventsLoggingTests(TestCase):
             user=None,
             source="set_carton_status",
         )
+
+    def test_bulk_set_carton_status_updates_records_events_and_logs_once_per_carton(self):
+        first = Carton.objects.create(code="CT-OBS-2", status=CartonStatus.PACKED)
+        second = Carton.objects.create(code="CT-OBS-3", status=CartonStatus.PACKED)
+        unchanged = Carton.objects.create(code="CT-OBS-4", status=CartonStatus.ASSIGNED)
+
+        with mock.patch("wms.carton_status_events.log_carton_status_transition") as log_mock:
+            with self.assertNumQueries(3):
+                changed = bulk_set_carton_status(
+                    cartons=[first, second, unchanged],
+                    new_status=CartonStatus.ASSIGNED,
+                    reason="unit_test_bulk",
+                )
+
+        self.assertEqual(changed, 2)
+        self.assertEqual(log_mock.call_count, 2)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.status, CartonStatus.ASSIGNED)
+        self.assertEqual(second.status, CartonStatus.ASSIGNED)
+        self.assertEqual(
+            set(
+                CartonStatusEvent.objects.filter(reason="unit_test_bulk").values_list(
+                    "carton__code", "previous_status", "new_status"
+                )
+            ),
+            {
+                ("CT-OBS-2", CartonStatus.PACKED, CartonStatus.ASSIGNED),
+                ("CT-OBS-3", CartonStatus.PACKED, CartonStatus.ASSIGNED),
+            },
+        )
+        self.assertFalse(CartonStatusEvent.objects.filter(carton=unchanged).exists())
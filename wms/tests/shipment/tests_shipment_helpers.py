@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from contacts.models import Contact, ContactAddress, ContactType
 from wms.models import (
@@ -15,6 +17,10 @@ from wms.shipment_helpers import (
     build_shipment_contact_payload,
     parse_shipment_lines,
 )
+from wms.shipment_party_registry import (
+    clear_shipment_party_graph_cache,
+    get_shipment_party_graph,
+)
 
 
 class ShipmentHelpersTests(TestCase):
@@ -279,6 +285,61 @@ class ShipmentHelpersTests(TestCase):
         self.assertTrue(priority_flags[asf_shipper.organization_id])
         self.assertFalse(priority_flags[regional_shipper.organization_id])
 
+    def _payload_query_count(self):
+        clear_shipment_party_graph_cache()
+        with CaptureQueriesContext(connection) as queries:
+            build_shipment_contact_payload()
+        return len(queries)
+
+    def test_build_shipment_contact_payload_query_count_does_not_grow_with_destinations(self):
+        shipper, _ = self._create_shipper("ASF")
+        destination, _correspondent = self._create_destination_with_correspondent("ABJ")
+        self._create_linked_recipient_contact(
+            shipper=shipper,
+            destination=destination,
+            recipient_name="Hopital Abidjan",
+            referent_name="Alice Martin",
+        )
+        single_destination_queries = self._payload_query_count()
+
+        for code in ("BKO", "DKR", "NIM"):
+            destination, _correspondent = self._create_destination_with_correspondent(code)
+            self._create_linked_recipient_contact(
+                shipper=shipper,
+                destination=destination,
+                recipient_name=f"Hopital {code}",
+                referent_name=f"Referent {code}",
+            )
+
+        self.assertEqual(self._payload_query_count(), single_destination_queries)
+
+    def test_shipment_party_graph_is_reused_until_a_party_record_changes(self):
+        destination, _correspondent = self._create_destination_with_correspondent("ABJ")
+        self._create_shipper("ASF", can_send_to_all=True)
+        graph = get_shipment_party_graph()
+
+        with self.assertNumQueries(1):
+            self.assertIs(get_shipment_party_graph(), graph)
+
+        new_shipper, _ = self._create_shipper("MSF", can_send_to_all=True)
+        _destinations_json, shippers_json, _recipients_json, _correspondents_json = (
+            build_shipment_contact_payload()
+        )
+
+        self.assertIsNot(get_shipment_party_graph(), graph)
+        self.assertIn(
+            new_shipper.organization_id,
+            {entry["organization_id"] for entry in shippers_json},
+        )
+        self.assertEqual(
+            {entry["id"] for entry in shippers_json if entry["allowed_destination_ids"]},
+            {entry["id"] for entry in shippers_json},
+        )
+        self.assertEqual(
+            [entry["allowed_destination_ids"] for entry in shippers_json],
+            [[destination.id], [destination.id]],
+        )
+
     def test_parse_shipment_lines_accepts_valid_carton_and_product_lines(self):
         product = type("Product", (), {"id": 7, "name": "Produit test"})()
 
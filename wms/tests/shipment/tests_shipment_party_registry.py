@@ -11,11 +11,13 @@ from wms.models import (
     ShipmentValidationStatus,
 )
 from wms.shipment_party_registry import (
+    build_shipment_party_graph,
     default_recipient_contact_for_link,
     eligible_recipient_contacts_for_link,
     eligible_recipient_organizations_for_shipper,
     eligible_shippers_for_stopover,
     stopover_correspondent_recipient_organization,
+    stopover_correspondent_recipient_organizations,
 )
 
 
@@ -380,3 +382,93 @@ class ShipmentPartyRegistryTests(TestCase):
             stopover_correspondent_recipient_organization(destination),
             correspondent,
         )
+
+    def test_shipment_party_graph_maps_destinations_to_their_correspondent_contact(self):
+        destination = self._create_destination("NKC")
+        correspondent = ShipmentRecipientOrganization.objects.create(
+            organization=destination.correspondent_contact,
+            destination=destination,
+            validation_status=ShipmentValidationStatus.VALIDATED,
+            is_correspondent=True,
+            is_active=True,
+        )
+        mismatched_destination = self._create_destination("NDJ")
+        mismatched = self._create_recipient_organization(
+            name="Other correspondent NDJ",
+            destination=mismatched_destination,
+            is_correspondent=True,
+        )
+        bare_destination = self._create_destination("OUA")
+
+        self.assertEqual(
+            stopover_correspondent_recipient_organizations(
+                [destination, mismatched_destination, bare_destination]
+            ),
+            {destination.id: correspondent, mismatched_destination.id: mismatched},
+        )
+        graph = build_shipment_party_graph()
+        self.assertEqual(
+            graph.correspondent_contact_by_destination_id,
+            {destination.id: destination.correspondent_contact},
+        )
+
+    def test_shipment_party_graph_indexes_authorized_recipient_contacts_by_shipper(self):
+        destination = self._create_destination("ABJ")
+        other_destination = self._create_destination("DKR")
+        shipper = self._create_shipper(name="Shipper ABJ")
+        recipient = self._create_recipient_organization(
+            name="Recipient ABJ", destination=destination
+        )
+        link = ShipmentShipperRecipientLink.objects.create(
+            shipper=shipper,
+            recipient_organization=recipient,
+            is_active=True,
+        )
+        authorized = ShipmentRecipientContact.objects.create(
+            recipient_organization=recipient,
+            contact=self._create_person(
+                organization=recipient.organization,
+                first_name="Awa",
+                last_name="Active",
+            ),
+            is_active=True,
+        )
+        revoked = ShipmentRecipientContact.objects.create(
+            recipient_organization=recipient,
+            contact=self._create_person(
+                organization=recipient.organization,
+                first_name="Remi",
+                last_name="Revoked",
+            ),
+            is_active=True,
+        )
+        ShipmentAuthorizedRecipientContact.objects.create(
+            link=link,
+            recipient_contact=authorized,
+            is_active=True,
+        )
+        ShipmentAuthorizedRecipientContact.objects.create(
+            link=link,
+            recipient_contact=revoked,
+            is_active=False,
+        )
+
+        graph = build_shipment_party_graph()
+
+        self.assertEqual(graph.shipper_id_for_contact(shipper.default_contact), shipper.id)
+        self.assertEqual(graph.shipper_id_for_contact(shipper.organization), shipper.id)
+        self.assertEqual(
+            graph.allowed_destination_ids(
+                shipper_id=shipper.id,
+                recipient_contact_id=authorized.contact_id,
+            ),
+            {destination.id},
+        )
+        self.assertEqual(
+            graph.allowed_destination_ids(
+                shipper_id=shipper.id,
+                recipient_contact_id=revoked.contact_id,
+            ),
+            frozenset(),
+        )
+        self.assertNotIn(other_destination.id, graph.correspondent_contact_by_destination_id)
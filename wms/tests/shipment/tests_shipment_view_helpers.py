@@ -73,6 +73,7 @@ class ShipmentViewHelpersTests(TestCase):
             SimpleNamespace(
                 id=1,
                 code="C-001",
+                total_weight_g=600,
                 cartonitem_set=item_set_a,
                 preassigned_destination_id=10,
                 preassigned_destination=preassigned_destination,
@@ -80,6 +81,7 @@ class ShipmentViewHelpersTests(TestCase):
             SimpleNamespace(
                 id=2,
                 code="C-002",
+                total_weight_g=0,
                 cartonitem_set=item_set_b,
                 preassigned_destination_id=None,
                 preassigned_destination=None,
@@ -277,12 +279,13 @@ class ShipmentViewHelpersTests(TestCase):
 
     def test_render_shipment_labels_uses_fallback_qr_url_without_layout(self):
         shipment = self._create_shipment()
-        shipment.qr_code_image = "qr_codes/fallback.png"
-        shipment.save(update_fields=["qr_code_image"])
         carton1 = Carton.objects.create(code="A-CARTON", shipment=shipment)
         carton2 = Carton.objects.create(code="B-CARTON", shipment=shipment)
 
-        with mock.patch.object(shipment, "ensure_qr_code") as ensure_mock:
+        with mock.patch(
+            "wms.shipment_view_helpers.shipment_qr_data_uri",
+            return_value="data:image/svg+xml;base64,RkFMTEJBQ0s=",
+        ) as qr_mock:
             with mock.patch(
                 "wms.shipment_view_helpers.build_label_context",
                 side_effect=[
@@ -317,14 +320,14 @@ class ShipmentViewHelpersTests(TestCase):
         self.assertEqual(response.content.decode(), "print/etiquette_expedition.html")
         labels = render_mock.call_args.args[2]["labels"]
         self.assertEqual([labels[0]["carton_id"], labels[1]["carton_id"]], [carton1.id, carton2.id])
-        self.assertTrue(labels[0]["qr_url"].endswith("/media/qr_codes/fallback.png"))
-        ensure_mock.assert_called_once_with(request=self.request)
+        self.assertEqual(labels[0]["qr_url"], "data:image/svg+xml;base64,RkFMTEJBQ0s=")
+        qr_mock.assert_called_once_with(shipment, request=self.request)
 
     def test_render_shipment_labels_uses_dynamic_layout(self):
         shipment = self._create_shipment()
         carton = Carton.objects.create(code="ONLY-CARTON", shipment=shipment)
 
-        with mock.patch.object(shipment, "ensure_qr_code"):
+        with mock.patch("wms.shipment_view_helpers.shipment_qr_data_uri", return_value=""):
             with mock.patch(
                 "wms.shipment_view_helpers.build_label_context",
                 return_value={
@@ -341,7 +344,7 @@ class ShipmentViewHelpersTests(TestCase):
                     return_value={"blocks": [{"id": "label"}]},
                 ):
                     with mock.patch(
-                        "wms.shipment_view_helpers.render_layout_from_layout",
+                        "wms.shipment_view_helpers.render_compiled_layout",
                         return_value=[{"type": "label"}],
                     ) as render_layout_mock:
                         with mock.patch(
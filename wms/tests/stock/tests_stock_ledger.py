@@ -0,0 +1,276 @@
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from wms.admin import CartonAdmin
+from wms.models import (
+    Carton,
+    Location,
+    MovementType,
+    Product,
+    ProductLot,
+    Shipment,
+    StockCheckpoint,
+    StockCheckpointPeriod,
+    StockMovement,
+    Warehouse,
+)
+from wms.services import (
+    adjust_stock,
+    consume_stock,
+    pack_carton,
+    receive_stock,
+    transfer_stock,
+)
+from wms.stock_ledger import (
+    CARTON_SHIPMENT_RECORD_REASON_CODE,
+    backfill_stock_checkpoints,
+    checkpoint_boundaries,
+    local_day_start,
+    lot_quantities_as_of,
+    product_quantities_as_of,
+    verify_stock_ledger,
+    write_stock_checkpoint,
+)
+
+
+def _day(day):
+    return local_day_start(date(2026, 3, day))
+
+
+class StockLedgerTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="ledger-user",
+            password="pass1234",
+            is_staff=True,
+        )
+        warehouse = Warehouse.objects.create(name="Ledger WH")
+        self.location = Location.objects.create(
+            warehouse=warehouse, zone="L", aisle="01", shelf="001"
+        )
+        self.other_location = Location.objects.create(
+            warehouse=warehouse, zone="L", aisle="01", shelf="002"
+        )
+        self.product = Product.objects.create(name="Ledger item", sku="SKU-LEDGER")
+
+    def _backdate_latest(self, when):
+        movement = StockMovement.objects.order_by("-id").first()
+        StockMovement.objects.filter(pk=movement.pk).update(created_at=when)
+
+    def _build_history(self):
+        """10 received on day 1, +2 adjusted day 2, transfer day 3, 5 consumed day 4."""
+        lot = receive_stock(
+            user=self.user, product=self.product, quantity=10, location=self.location
+        )
+        self._backdate_latest(_day(1) + timedelta(hours=9))
+        adjust_stock(user=self.user, lot=lot, delta=2, reason_code="count", reason_notes="")
+        self._backdate_latest(_day(2) + timedelta(hours=9))
+        lot.refresh_from_db()
+        transfer_stock(user=self.user, lot=lot, to_location=self.other_location)
+        self._backdate_latest(_day(3) + timedelta(hours=9))
+        consume_stock(
+            user=self.user, product=self.product, quantity=5, movement_type=MovementType.OUT
+        )
+        self._backdate_latest(_day(4) + timedelta(hours=9))
+        return lot
+
+    def test_as_of_replays_signed_movements(self):
+        lot = self._build_history()
+
+        self.assertEqual(lot_quantities_as_of(_day(1)), {})
+        self.assertEqual(lot_quantities_as_of(_day(2)), {lot.id: (self.product.id, 10)})
+        self.assertEqual(product_quantities_as_of(_day(4)), {self.product.id: 12})
+        self.assertEqual(product_quantities_as_of(_day(5)), {self.product.id: 7})
+
+    def test_checkpoint_plus_delta_matches_full_replay(self):
+        lot = self._build_history()
+        checkpoint = write_stock_checkpoint(_day(3))
+
+        self.assertEqual((checkpoint.lot_count, checkpoint.total_quantity), (1, 12))
+        self.assertEqual(write_stock_checkpoint(_day(3)).pk, checkpoint.pk)
+        for at in (_day(3), _day(4), _day(5)):
+            self.assertEqual(
+                lot_quantities_as_of(at),
+                lot_quantities_as_of(at, use_checkpoints=False),
+            )
+        # Quantities come from the checkpoint lines, not a replay of older movements.
+        checkpoint.lines.filter(product_lot=lot).update(quantity=100)
+        self.assertEqual(product_quantities_as_of(_day(5)), {self.product.id: 95})
+
+    def test_write_checkpoint_rejects_future_dates(self):
+        with self.assertRaisesMessage(ValueError, "cannot be written in the future"):
+            write_stock_checkpoint(timezone.now() + timedelta(days=1))
+
+    def test_backfill_writes_missing_daily_checkpoints(self):
+        self._build_history()
+        write_stock_checkpoint(_day(3))
+
+        checkpoints = backfill_stock_checkpoints(
+            StockCheckpointPeriod.DAILY, until=_day(5) + timedelta(hours=1)
+        )
+
+        self.assertEqual(
+            [checkpoint.as_of for checkpoint in checkpoints], [_day(2), _day(4), _day(5)]
+        )
+        self.assertEqual(
+            list(
+                StockCheckpoint.objects.order_by("as_of").values_list("total_quantity", flat=True)
+            ),
+            [10, 12, 12, 7],
+        )
+
+    def test_monthly_boundaries(self):
+        boundaries = checkpoint_boundaries(
+            StockCheckpointPeriod.MONTHLY,
+            start=_day(15),
+            end=local_day_start(date(2026, 5, 1)),
+        )
+        self.assertEqual(
+            [timezone.localtime(boundary).date() for boundary in boundaries],
+            [date(2026, 4, 1), date(2026, 5, 1)],
+        )
+
+    def test_verify_reports_lots_drifting_from_the_ledger(self):
+        lot = self._build_history()
+        write_stock_checkpoint(_day(3))
+        self.assertEqual(verify_stock_ledger(), [])
+
+        ProductLot.objects.filter(pk=lot.pk).update(quantity_on_hand=9)
+
+        drifts = verify_stock_ledger()
+        self.assertEqual(len(drifts), 1)
+        self.assertEqual((drifts[0].ledger_quantity, drifts[0].difference), (7, 2))
+
+    def test_admin_shipment_assignment_of_a_packed_carton_is_not_counted_twice(self):
+        lot = receive_stock(
+            user=self.user, product=self.product, quantity=10, location=self.location
+        )
+        carton = pack_carton(user=self.user, product=self.product, quantity=4)
+        shipment = Shipment.objects.create(
+            reference="260900",
+            shipper_name="Shipper",
+            recipient_name="Recipient",
+            destination_address="1 rue Ledger",
+        )
+        request = RequestFactory().post("/admin/wms/carton/")
+        request.user = self.user
+
+        carton = Carton.objects.get(pk=carton.pk)
+        carton.shipment = shipment
+        CartonAdmin(Carton, admin.site).save_model(request, carton, form=mock.Mock(), change=True)
+
+        record = StockMovement.objects.get(movement_type=MovementType.OUT, related_carton=carton)
+        self.assertEqual(
+            (record.quantity, record.reason_code), (4, CARTON_SHIPMENT_RECORD_REASON_CODE)
+        )
+        lot.refresh_from_db()
+        self.assertEqual(lot.quantity_on_hand, 6)
+        self.assertEqual(verify_stock_ledger(), [])
+        self.assertEqual(
+            product_quantities_as_of(timezone.now() + timedelta(seconds=1)),
+            {self.product.id: 6},
+        )
+
+
+class StockLedgerCommandTests(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="ledger-cmd", password="pass1234")
+        warehouse = Warehouse.objects.create(name="Ledger CMD")
+        location = Location.objects.create(warehouse=warehouse, zone="C", aisle="01", shelf="001")
+        product = Product.objects.create(name="Ledger cmd", sku="SKU-LEDGER-CMD")
+        self.lot = receive_stock(user=user, product=product, quantity=4, location=location)
+        StockMovement.objects.update(created_at=timezone.now() - timedelta(days=3))
+
+    def _call(self, name, *args):
+        output = StringIO()
+        call_command(name, *args, stdout=output)
+        return output.getvalue()
+
+    def test_backfill_dry_run_then_apply(self):
+        output = self._call("backfill_stock_checkpoints", "--dry-run")
+        self.assertIn("Stock checkpoints [DRY RUN] (daily)", output)
+        self.assertIn("Missing checkpoints: 3", output)
+        self.assertFalse(StockCheckpoint.objects.exists())
+
+        output = self._call("backfill_stock_checkpoints", "--apply")
+        self.assertIn("Checkpoints written: 3", output)
+        self.assertIn("1 lot(s), 4 unit(s)", output)
+        self.assertIn("Missing checkpoints: 0", self._call("backfill_stock_checkpoints"))
+
+    def test_backfill_rejects_invalid_options(self):
+        with self.assertRaisesMessage(CommandError, "Invalid --since date."):
+            self._call("backfill_stock_checkpoints", "--since=yesterday")
+        with self.assertRaisesMessage(CommandError, "--until must be after or equal to --since."):
+            self._call("backfill_stock_checkpoints", "--since=2026-03-02", "--until=2026-03-01")
+
+    def test_verify_command_lists_drift_and_can_fail(self):
+        self.assertIn("Stock ledger drift: 0 lot(s)", self._call("verify_stock_ledger"))
+
+        ProductLot.objects.filter(pk=self.lot.pk).update(quantity_on_hand=1)
+        output = self._call("verify_stock_ledger", "--full-replay")
+        self.assertIn(f"- lot #{self.lot.id}", output)
+        self.assertIn("ledger 4, on hand 1 (-3)", output)
+        with self.assertRaisesMessage(CommandError, "1 lot(s) drift from the stock ledger."):
+            self._call("verify_stock_ledger", "--fail-on-drift")
+
+
+class ScanStockHistoryViewTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="ledger-scan",
+            password="pass1234",
+            is_staff=True,
+        )
+        self.client.force_login(self.user)
+        warehouse = Warehouse.objects.create(name="Ledger Scan")
+        location = Location.objects.create(warehouse=warehouse, zone="S", aisle="01", shelf="001")
+        self.product = Product.objects.create(name="Historic mask", sku="SKU-HISTORY")
+        lot = receive_stock(user=self.user, product=self.product, quantity=6, location=location)
+        StockMovement.objects.update(created_at=_day(10) + timedelta(hours=8))
+        adjust_stock(user=self.user, lot=lot, delta=-2, reason_code="loss", reason_notes="")
+
+    def test_report_shows_stock_at_end_of_selected_day(self):
+        response = self.client.get(reverse("scan:scan_stock_history"), {"date": "2026-03-10"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "scan/stock_history.html")
+        rows = response.context["rows"]
+        self.assertEqual([(row["product"], row["quantity"]) for row in rows], [(self.product, 6)])
+        self.assertEqual(rows[0]["current_quantity"], 4)
+
+    def test_report_is_empty_before_first_movement(self):
+        response = self.client.get(
+            reverse("scan:scan_stock_history"), {"date": "2026-03-09", "q": "mask"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["rows"], [])
+        self.assertEqual(response.context["as_of_date"], date(2026, 3, 9))
+
+    def test_report_falls_back_to_today_on_impossible_date(self):
+        response = self.client.get(reverse("scan:scan_stock_history"), {"date": "2026-02-30"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["as_of_date"], timezone.localdate())
+
+    def test_report_is_paginated(self):
+        with mock.patch("wms.stock_view_helpers.STOCK_HISTORY_PAGE_SIZE", 1):
+            other = Product.objects.create(name="Historic gloves", sku="SKU-HISTORY-2")
+            lot = ProductLot.objects.get(product=self.product)
+            receive_stock(user=self.user, product=other, quantity=3, location=lot.location)
+
+            response = self.client.get(reverse("scan:scan_stock_history"), {"page": "2"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["page_obj"].paginator.count, 2)
+        self.assertEqual([row["product"] for row in response.context["rows"]], [self.product])
+        self.assertContains(response, "page=1")
@@ -467,6 +467,69 @@ class PlanningViewTests(TestCase):
         self.assertRedirects(response, reverse("planning:run_detail", args=[run.pk]))
         self.assertContains(response, "Destination rule missing")
 
+    @mock.patch("wms.views_planning.solve_run_scenarios")
+    def test_run_scenarios_post_solves_selected_variants_and_returns_to_run(
+        self,
+        solve_run_scenarios_mock,
+    ):
+        alternative_set = PlanningParameterSet.objects.create(name="Semaine 11 bis")
+        run = PlanningRun.objects.create(
+            week_start="2026-03-09",
+            week_end="2026-03-15",
+            parameter_set=self.parameter_set,
+            status=PlanningRunStatus.READY,
+            created_by=self.staff_user,
+        )
+        solve_run_scenarios_mock.return_value = [{"version_id": 1}, {"version_id": 2}]
+        self.client.force_login(self.staff_user)
+
+        response = self.client.post(
+            reverse("planning:run_scenarios", args=[run.pk]),
+            {"parameter_sets": [alternative_set.pk], "seeds": "7, 42"},
+        )
+
+        self.assertRedirects(response, reverse("planning:run_detail", args=[run.pk]))
+        scenarios = solve_run_scenarios_mock.call_args.args[1]
+        self.assertEqual(
+            [scenario.key for scenario in scenarios],
+            ["baseline", f"parameter-set-{alternative_set.pk}", "seed-7", "seed-42"],
+        )
+
+    def test_run_detail_shows_scenario_comparison(self):
+        run = PlanningRun.objects.create(
+            week_start="2026-03-09",
+            week_end="2026-03-15",
+            parameter_set=self.parameter_set,
+            status=PlanningRunStatus.SOLVED,
+            created_by=self.staff_user,
+            solver_result={
+                "scenarios": [
+                    {
+                        "key": "baseline",
+                        "label": "Base · Semaine 11",
+                        "elapsed_seconds": 0.5,
+                        "version_id": None,
+                        "error": "",
+                        "score": {"weighted_score": 30, "assignment_count": 1},
+                    },
+                    {
+                        "key": "seed-7",
+                        "label": "Graine · 7",
+                        "elapsed_seconds": 0.4,
+                        "version_id": None,
+                        "error": "Planning solver failed.",
+                    },
+                ]
+            },
+        )
+        self.client.force_login(self.staff_user)
+
+        response = self.client.get(reverse("planning:run_detail", args=[run.pk]))
+
+        self.assertContains(response, reverse("planning:run_scenarios", args=[run.pk]))
+        self.assertContains(response, "Base · Semaine 11")
+        self.assertContains(response, "Planning solver failed.")
+
     def test_staff_can_update_draft_version_assignments(self):
         version, assignment, volunteer_bob, flight_af456 = self.make_version_with_assignment()
         self.client.force_login(self.staff_user)
@@ -1,3 +1,7 @@
+import os
+import tempfile
+import time
+from pathlib import Path
 from types import SimpleNamespace
 from unittest import mock
 
@@ -6,6 +10,7 @@ from django.http import HttpResponse
 from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 
+from wms.local_document_helper import purge_expired_helper_jobs
 from wms.models import Carton, Shipment
 from wms.print_pack_engine import PrintPackEngineError
 from wms.print_pack_graph import GraphPdfConversionError
@@ -26,6 +31,12 @@ class PrintLabelsViewsTests(TestCase):
         )
         self.client.force_login(self.user)
         self.factory = RequestFactory()
+        helper_job_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(helper_job_dir.cleanup)
+        self.helper_job_dir = Path(helper_job_dir.name)
+        helper_job_settings = override_settings(LOCAL_DOCUMENT_HELPER_JOB_DIR=helper_job_dir.name)
+        helper_job_settings.enable()
+        self.addCleanup(helper_job_settings.disable)
 
     def _create_shipment(self):
         return Shipment.objects.create(
@@ -135,6 +146,78 @@ class PrintLabelsViewsTests(TestCase):
         )
         self.assertEqual(response.content, b"xlsx-data")
 
+    def test_scan_shipment_labels_serves_helper_documents_from_the_rendered_job(self):
+        shipment = self._create_shipment()
+        url = reverse("scan:scan_shipment_labels", kwargs={"shipment_id": shipment.id})
+        with mock.patch(
+            "wms.views_print_labels.render_pack_xlsx_documents",
+            return_value=[
+                SimpleNamespace(filename="labels-1.xlsx", payload=b"first-xlsx"),
+                SimpleNamespace(filename="labels-2.xlsx", payload=b"second-xlsx"),
+            ],
+        ) as render_mock:
+            payload = self.client.get(url, {"helper": "1"}).json()
+            first = self.client.get(payload["documents"][0]["download_url"])
+            second = self.client.get(
+                payload["documents"][1]["download_url"],
+                HTTP_RANGE="bytes=7-",
+            )
+
+        render_mock.assert_called_once()
+        self.assertIn("helper_job=", payload["documents"][0]["download_url"])
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(b"".join(first.streaming_content), b"first-xlsx")
+        self.assertEqual(first["Accept-Ranges"], "bytes")
+        self.assertEqual(first["Content-Disposition"], 'attachment; filename="labels-1.xlsx"')
+        self.assertEqual(second.status_code, 206)
+        self.assertEqual(second["Content-Range"], "bytes 7-10/11")
+        self.assertEqual(b"".join(second.streaming_content), b"xlsx")
+
+    def test_scan_shipment_labels_rejects_unsatisfiable_helper_document_range(self):
+        shipment = self._create_shipment()
+        url = reverse("scan:scan_shipment_labels", kwargs={"shipment_id": shipment.id})
+        with mock.patch(
+            "wms.views_print_labels.render_pack_xlsx_documents",
+            return_value=[SimpleNamespace(filename="labels.xlsx", payload=b"xlsx-data")],
+        ):
+            payload = self.client.get(url, {"helper": "1"}).json()
+            response = self.client.get(
+                payload["documents"][0]["download_url"],
+                HTTP_RANGE="bytes=50-60",
+            )
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */9")
+
+    def test_scan_shipment_labels_rerenders_when_helper_job_token_is_invalid(self):
+        shipment = self._create_shipment()
+        with mock.patch(
+            "wms.views_print_labels.render_pack_xlsx_documents",
+            return_value=[SimpleNamespace(filename="labels.xlsx", payload=b"xlsx-data")],
+        ) as render_mock:
+            response = self.client.get(
+                reverse("scan:scan_shipment_labels", kwargs={"shipment_id": shipment.id}),
+                {"helper_document": "0", "helper_job": "tampered"},
+            )
+
+        render_mock.assert_called_once()
+        self.assertEqual(response.content, b"xlsx-data")
+
+    @override_settings(LOCAL_DOCUMENT_HELPER_JOB_TTL_SECONDS=60)
+    def test_purge_expired_helper_jobs_removes_stale_job_directories(self):
+        stale_dir = self.helper_job_dir / ("a" * 32)
+        fresh_dir = self.helper_job_dir / ("b" * 32)
+        stale_dir.mkdir()
+        fresh_dir.mkdir()
+        stale_time = time.time() - 120
+        os.utime(stale_dir, (stale_time, stale_time))
+
+        removed = purge_expired_helper_jobs()
+
+        self.assertEqual(removed, 1)
+        self.assertFalse(stale_dir.exists())
+        self.assertTrue(fresh_dir.exists())
+
     def test_scan_shipment_labels_falls_back_to_legacy_renderer_when_pack_is_missing(self):
         shipment = self._create_shipment()
         with (
@@ -398,13 +398,8 @@ class PrintTemplateViewsTests(TestCase):
 
     def test_scan_print_template_preview_product_qr_with_product(self):
         product = Product.objects.create(name="Produit QR")
-        product.qr_code_image = ""
-        product.save(update_fields=["qr_code_image"])
 
-        with mock.patch(
-            "wms.models.Product.generate_qr_code",
-            autospec=True,
-        ) as generate_qr_mock:
+        with mock.patch("wms.models.Product.save", autospec=True) as save_mock:
             with mock.patch(
                 "wms.views_print_templates.build_preview_context",
                 return_value={"sku": product.sku},
@@ -432,7 +427,7 @@ class PrintTemplateViewsTests(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.content.decode(), "print/product_qr_labels.html")
-        generate_qr_mock.assert_called_once()
+        save_mock.assert_not_called()
         preview_context_mock.assert_called_once()
         build_pages_kwargs = build_pages_mock.call_args.kwargs
         self.assertEqual(build_pages_kwargs["block_type"], "product_qr_label")
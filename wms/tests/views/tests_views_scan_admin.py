@@ -344,7 +344,7 @@ class ScanAdminViewTests(TestCase):
         self.assertContains(response, self.kit.name)
         self.assertNotContains(response, self.component.name)
 
-    def test_scan_product_labels_print_qr_generates_missing_qr(self):
+    def test_scan_product_labels_print_qr_renders_missing_qr_on_demand(self):
         self.client.force_login(self.superuser)
         product_without_qr = Product.objects.create(
             sku="SCAN-ADMIN-NO-QR",
@@ -363,8 +363,9 @@ class ScanAdminViewTests(TestCase):
         )
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "print/product_qr_labels.html")
+        self.assertContains(response, "data:image/svg+xml;base64,")
         product_without_qr.refresh_from_db()
-        self.assertTrue(bool(product_without_qr.qr_code_image))
+        self.assertFalse(product_without_qr.qr_code_image)
 
     def test_scan_product_labels_print_labels_supports_all_filtered_mode(self):
         self.client.force_login(self.superuser)
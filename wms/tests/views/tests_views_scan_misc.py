@@ -1,5 +1,6 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
-from django.http import HttpResponse
 from django.test import TestCase
 from django.urls import reverse
 
@@ -64,16 +65,38 @@ class ScanMiscViewsTests(TestCase):
         self.assertEqual(response["Cache-Control"], "no-cache")
         self.assertEqual(response["Service-Worker-Allowed"], "/scan/")
         self.assertIn("CACHE_NAME", response.content.decode())
-        self.assertIn("wms-scan-v52", response.content.decode())
+        self.assertIn("wms-scan-v54-", response.content.decode())
+        self.assertIn(
+            'const ASSETS = ["/static/scan/scan.css", "/static/scan/scan.js"',
+            response.content.decode(),
+        )
+        self.assertIn(
+            'const RUNTIME_ASSETS = new Set(["/static/scan/zxing.min.js"]);',
+            response.content.decode(),
+        )
         self.assertEqual(response["Content-Type"], "application/javascript")
 
+    def test_scan_service_worker_cache_name_follows_asset_urls(self):
+        with mock.patch(
+            "wms.views_scan_misc.staticfiles_storage.url",
+            side_effect=lambda name: f"/static/{name}",
+        ):
+            first = self.client.get(reverse("scan:scan_service_worker")).content.decode()
+        with mock.patch(
+            "wms.views_scan_misc.staticfiles_storage.url",
+            side_effect=lambda name: f"/static/{name}?h=2",
+        ):
+            second = self.client.get(reverse("scan:scan_service_worker")).content.decode()
+
+        self.assertNotEqual(first.splitlines()[0], second.splitlines()[0])
+
     def test_scan_base_registers_versioned_service_worker_url(self):
         response = self.client.get(reverse("scan:scan_dashboard"))
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(
             response,
-            f'{reverse("scan:scan_service_worker")}?v=53',
+            f"{reverse('scan:scan_service_worker')}?v=55",
         )
 
     def test_scan_faq_requires_staff(self):
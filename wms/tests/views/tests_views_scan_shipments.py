@@ -916,7 +916,7 @@ class ScanShipmentsViewsTests(TestCase):
         initial = {"destination": "", "carton_count": 1}
         helper_install = {"available": True, "install_url": "/scan/helper/install/"}
 
-        with mock.patch("wms.views_scan_shipments.Shipment.ensure_qr_code"):
+        with mock.patch("wms.views_scan_shipments.shipment_qr_data_uri", return_value=""):
             with mock.patch(
                 "wms.views_scan_shipments.build_carton_options",
                 return_value=[{"id": carton.id, "code": carton.code}],
@@ -975,7 +975,7 @@ class ScanShipmentsViewsTests(TestCase):
         fake_form = object()
         initial = {"destination": "", "carton_count": 1}
 
-        with mock.patch("wms.views_scan_shipments.Shipment.ensure_qr_code"):
+        with mock.patch("wms.views_scan_shipments.shipment_qr_data_uri", return_value=""):
             with mock.patch(
                 "wms.views_scan_shipments.build_carton_options",
                 return_value=[],
@@ -1016,7 +1016,7 @@ class ScanShipmentsViewsTests(TestCase):
         initial = {"destination": "", "carton_count": 2}
         helper_install = {"available": True, "install_url": "/scan/helper/install/"}
 
-        with mock.patch("wms.views_scan_shipments.Shipment.ensure_qr_code"):
+        with mock.patch("wms.views_scan_shipments.shipment_qr_data_uri", return_value=""):
             with mock.patch(
                 "wms.views_scan_shipments.build_carton_options",
                 return_value=[],
@@ -1069,7 +1069,7 @@ class ScanShipmentsViewsTests(TestCase):
     def test_scan_shipment_track_get_renders_tracking_context(self):
         shipment = self._create_shipment(status=ShipmentStatus.DRAFT)
         fake_form = object()
-        with mock.patch("wms.views_scan_shipments.Shipment.ensure_qr_code"):
+        with mock.patch("wms.views_scan_shipments.shipment_qr_data_uri", return_value=""):
             with mock.patch(
                 "wms.views_scan_shipments.build_shipment_document_links",
                 return_value=(["doc"], ["carton"], ["additional"]),
@@ -1107,7 +1107,7 @@ class ScanShipmentsViewsTests(TestCase):
 
     def test_scan_shipment_track_post_returns_handler_response(self):
         shipment = self._create_shipment(status=ShipmentStatus.DRAFT)
-        with mock.patch("wms.views_scan_shipments.Shipment.ensure_qr_code"):
+        with mock.patch("wms.views_scan_shipments.shipment_qr_data_uri", return_value=""):
             with mock.patch(
                 "wms.views_scan_shipments.build_shipment_document_links",
                 return_value=([], [], []),
@@ -1139,7 +1139,7 @@ class ScanShipmentsViewsTests(TestCase):
 
     def test_scan_shipment_track_post_passes_return_to_list_flag(self):
         shipment = self._create_shipment(status=ShipmentStatus.DRAFT)
-        with mock.patch("wms.views_scan_shipments.Shipment.ensure_qr_code"):
+        with mock.patch("wms.views_scan_shipments.shipment_qr_data_uri", return_value=""):
             with mock.patch(
                 "wms.views_scan_shipments.build_shipment_document_links",
                 return_value=([], [], []),
@@ -1174,7 +1174,7 @@ class ScanShipmentsViewsTests(TestCase):
 
     def test_scan_shipment_track_get_uses_ready_return_target(self):
         shipment = self._create_shipment(status=ShipmentStatus.DRAFT)
-        with mock.patch("wms.views_scan_shipments.Shipment.ensure_qr_code"):
+        with mock.patch("wms.views_scan_shipments.shipment_qr_data_uri", return_value=""):
             with mock.patch(
                 "wms.views_scan_shipments.build_shipment_document_links",
                 return_value=([], [], []),
@@ -1207,7 +1207,7 @@ class ScanShipmentsViewsTests(TestCase):
 
     def test_scan_shipment_track_legacy_renders_read_only_tracking(self):
         shipment = self._create_shipment(status=ShipmentStatus.DRAFT)
-        with mock.patch("wms.views_scan_shipments.Shipment.ensure_qr_code"):
+        with mock.patch("wms.views_scan_shipments.shipment_qr_data_uri", return_value=""):
             with mock.patch(
                 "wms.views_scan_shipments.build_shipment_document_links",
                 return_value=(["doc"], ["carton"], ["additional"]),
@@ -2,9 +2,13 @@ from datetime import datetime
 from unittest import mock
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.http import HttpResponse
 from django.test import TestCase
 from django.urls import reverse
+from django.utils import timezone
+
+from wms.models import WmsChange
 
 
 class ScanStockViewsTests(TestCase):
@@ -120,15 +124,32 @@ class ScanStockViewsTests(TestCase):
         self.assertEqual(response.content.decode(), "out-post")
 
     def test_scan_sync_returns_json_state(self):
-        fake_state = mock.Mock()
-        fake_state.version = 12
-        fake_state.last_changed_at = datetime(2026, 1, 5, 10, 30, 0)
-        with mock.patch("wms.views_scan_stock.WmsChange.get_state", return_value=fake_state):
-            response = self.client.get(reverse("scan:scan_sync"))
+        WmsChange.objects.create(
+            pk=1,
+            version=12,
+            last_changed_at=timezone.make_aware(datetime(2026, 1, 5, 10, 30, 0)),
+        )
+        cache.clear()
+
+        response = self.client.get(reverse("scan:scan_sync"))
+
         self.assertEqual(response.status_code, 200)
         payload = response.json()
         self.assertEqual(payload["version"], 12)
-        self.assertEqual(payload["changed_at"], "2026-01-05T10:30:00")
+        self.assertEqual(payload["changed_at"], "2026-01-05T09:30:00+00:00")
+
+    def test_scan_sync_wait_passes_known_version(self):
+        with mock.patch(
+            "wms.views_scan_stock.wait_for_change",
+            return_value={"version": 4, "changed_at": None, "changed": True, "waited": True},
+        ) as wait_mock:
+            response = self.client.get(reverse("scan:scan_sync_wait"), {"version": "3"})
+            invalid_response = self.client.get(reverse("scan:scan_sync_wait"), {"version": "x"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["version"], 4)
+        self.assertEqual(invalid_response.status_code, 200)
+        self.assertEqual(wait_mock.call_args_list, [mock.call(3), mock.call(None)])
 
     def test_scan_stock_hides_category_and_warehouse_shortcuts(self):
         response = self.client.get(reverse("scan:scan_stock"))
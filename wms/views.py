@@ -71,8 +71,10 @@ from .views_scan import (
     scan_shipments_ready,
     scan_shipments_tracking,
     scan_stock,
+    scan_stock_history,
     scan_stock_update,
     scan_sync,
+    scan_sync_wait,
     scan_ui_lab,
 )
 from .views_volunteer import (
@@ -141,6 +143,7 @@ SCAN_FLOW_EXPORTS = (
     "scan_root",
     "scan_dashboard",
     "scan_stock",
+    "scan_stock_history",
     "scan_kits_view",
     "scan_local_document_helper_installer",
     "scan_cartons_ready",
@@ -191,6 +194,7 @@ SCAN_MISC_EXPORTS = (
     "scan_product_labels_print_qr",
     "scan_out",
     "scan_sync",
+    "scan_sync_wait",
     "scan_faq",
     "scan_settings",
     "scan_ui_lab",
@@ -11,6 +11,7 @@ from django.views.decorators.http import require_http_methods
 
 from .forms_planning import (
     PlanningRunForm,
+    PlanningScenarioForm,
     PlanningVersionCloneForm,
     build_assignment_formset,
     build_communication_draft_formset,
@@ -48,6 +49,11 @@ from .planning.operator_options import (
     build_operator_option_context,
     build_unassigned_editor_options,
 )
+from .planning.scenarios import (
+    build_run_scenarios,
+    build_scenario_comparison,
+    solve_run_scenarios,
+)
 from .planning.shipment_updates import apply_version_updates
 from .planning.snapshots import prepare_run_inputs
 from .planning.solver import solve_run
@@ -280,6 +286,8 @@ def planning_run_detail(request, run_id):
             "issues": run.issues.all(),
             "versions": run.versions.all(),
             "solve_url": None if run.status != "ready" else request.build_absolute_uri(),
+            "scenario_form": PlanningScenarioForm(run=run),
+            "scenario_rows": build_scenario_comparison(run),
         },
     )
 
@@ -307,6 +315,48 @@ def planning_run_solve(request, run_id):
     return redirect("planning:version_detail", version.pk)
 
 
+@scan_staff_required
+@require_http_methods(["POST"])
+def planning_run_scenarios(request, run_id):
+    run = get_object_or_404(PlanningRun, pk=run_id)
+    if run.status in {PlanningRunStatus.VALIDATING, PlanningRunStatus.SOLVING}:
+        messages.error(request, "Le run est deja en cours de traitement.")
+        return redirect("planning:run_detail", run.pk)
+
+    form = PlanningScenarioForm(request.POST, run=run)
+    if not form.is_valid():
+        messages.error(request, "Scenarios invalides. Verifiez les graines saisies.")
+        return redirect("planning:run_detail", run.pk)
+
+    if run.status != PlanningRunStatus.READY:
+        prepare_run_inputs(run)
+        run.refresh_from_db()
+    if run.status != PlanningRunStatus.READY:
+        messages.error(
+            request,
+            "La validation du run a echoue. Corrigez les issues puis relancez.",
+        )
+        return redirect("planning:run_detail", run.pk)
+
+    scenarios = build_run_scenarios(
+        run,
+        parameter_set_ids=[
+            parameter_set.pk for parameter_set in form.cleaned_data["parameter_sets"]
+        ],
+        random_seeds=form.cleaned_data["seeds"],
+    )
+    try:
+        rows = solve_run_scenarios(run, scenarios)
+    except RuntimeError as exc:
+        messages.error(request, f"Aucun scenario n'a abouti : {exc}")
+        return redirect("planning:run_detail", run.pk)
+    messages.success(
+        request,
+        f"{sum(1 for row in rows if row['version_id'])} scenario(s) genere(s) en brouillon.",
+    )
+    return redirect("planning:run_detail", run.pk)
+
+
 @scan_staff_required
 @require_http_methods(["GET", "POST"])
 def planning_version_detail(request, version_id):
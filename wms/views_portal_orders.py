@@ -45,6 +45,7 @@ from .shipment_helpers import (
     shipment_link_for_recipient_contact,
     shipment_shipper_from_contact,
 )
+from .shipment_party_registry import get_shipment_party_graph
 from .status_presenters import (
     present_order_review_status,
     present_order_shipment_status,
@@ -241,29 +242,22 @@ def _allowed_destination_ids_by_recipient(profile, recipients, destinations):
         for recipient in recipients
     }
     allowed_destination_ids_by_recipient = {str(recipient.id): set() for recipient in recipients}
-    shipper = shipment_shipper_from_contact(profile.contact)
-    if shipper is None:
-        return {
-            recipient_id: sorted(destination_ids)
-            for recipient_id, destination_ids in allowed_destination_ids_by_recipient.items()
-        }
-
-    for destination in destinations:
+    # Resolving recipients may sync party records, so the graph is read afterwards.
+    graph = get_shipment_party_graph()
+    shipper_id = graph.shipper_id_for_contact(profile.contact)
+    if shipper_id is not None:
+        destination_ids = {destination.id for destination in destinations}
         for recipient in recipients:
-            if recipient.destination_id not in {destination.id, None}:
-                continue
             recipient_contact = recipient_contact_by_id.get(recipient.id)
             if recipient_contact is None:
                 continue
-            if (
-                shipment_link_for_recipient_contact(
-                    shipper=shipper,
-                    recipient_contact=recipient_contact,
-                    destination=destination,
-                )
-                is not None
-            ):
-                allowed_destination_ids_by_recipient[str(recipient.id)].add(destination.id)
+            allowed_ids = destination_ids & graph.allowed_destination_ids(
+                shipper_id=shipper_id,
+                recipient_contact_id=recipient_contact.id,
+            )
+            if recipient.destination_id is not None:
+                allowed_ids &= {recipient.destination_id}
+            allowed_destination_ids_by_recipient[str(recipient.id)].update(allowed_ids)
 
     return {
         recipient_id: sorted(destination_ids)
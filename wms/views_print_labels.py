@@ -238,7 +238,6 @@ def scan_shipment_label(request, shipment_id, carton_id):
                 carton=carton,
                 variant=pack_route.variant,
             )
-        shipment.ensure_qr_code(request=request)
         cartons = list(shipment.carton_set.order_by("code"))
         position = _find_carton_position(cartons, carton_id)
         if position is None:
@@ -247,12 +246,12 @@ def scan_shipment_label(request, shipment_id, carton_id):
             shipment,
             position=position,
             total=len(cartons),
+            request=request,
         )
         label_context["label_qr_url"] = label_context.get("label_qr_url") or ""
         label_context["carton_id"] = carton_id
         return _render_shipment_label(request, label_context=label_context)
     except PrintPackEngineError:
-        shipment.ensure_qr_code(request=request)
         cartons = list(shipment.carton_set.order_by("code"))
         position = _find_carton_position(cartons, carton_id)
         if position is None:
@@ -261,6 +260,7 @@ def scan_shipment_label(request, shipment_id, carton_id):
             shipment,
             position=position,
             total=len(cartons),
+            request=request,
         )
         label_context["label_qr_url"] = label_context.get("label_qr_url") or ""
         label_context["carton_id"] = carton_id
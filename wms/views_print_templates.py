@@ -12,9 +12,8 @@ from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils.translation import gettext as _
 from django.views.decorators.http import require_http_methods
-from openpyxl import load_workbook
-from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
 
+from .lazy_imports import lazy_attribute
 from .models import (
     BillingDocument,
     PrintCellMapping,
@@ -45,6 +44,10 @@ from .view_permissions import (
     scan_staff_required,
 )
 
+load_workbook = lazy_attribute("openpyxl", "load_workbook")
+column_index_from_string = lazy_attribute("openpyxl.utils.cell", "column_index_from_string")
+coordinate_from_string = lazy_attribute("openpyxl.utils.cell", "coordinate_from_string")
+
 TEMPLATE_PRINT_TEMPLATE_LIST = "scan/print_template_list.html"
 TEMPLATE_PRINT_TEMPLATE_EDIT = "scan/print_template_edit.html"
 TEMPLATE_DYNAMIC_LABELS = "print/dynamic_labels.html"
@@ -323,7 +326,9 @@ def _render_shipment_label_preview(request, *, layout_data, shipment):
         total = shipment.carton_set.count() or 1
         if cartons:
             for index, _carton in enumerate(cartons, start=1):
-                label_context = build_label_context(shipment, position=index, total=total)
+                label_context = build_label_context(
+                    shipment, position=index, total=total, request=request
+                )
                 blocks = render_layout_from_layout(layout_data, label_context)
                 labels.append({"blocks": blocks})
         else:
@@ -368,9 +373,6 @@ def _resolve_product_qr_grid(layout_data):
 
 def _render_product_qr_preview(request, *, layout_data, product):
     if product:
-        if not product.qr_code_image:
-            product.generate_qr_code()
-            product.save(update_fields=["qr_code_image"])
         base_context = build_preview_context("product_qr", product=product)
     else:
         base_context = build_preview_context("product_qr")
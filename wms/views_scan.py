@@ -38,12 +38,20 @@ from .views_scan_shipments import (
     scan_shipments_ready,
     scan_shipments_tracking,
 )
-from .views_scan_stock import scan_out, scan_stock, scan_stock_update, scan_sync
+from .views_scan_stock import (
+    scan_out,
+    scan_stock,
+    scan_stock_history,
+    scan_stock_update,
+    scan_sync,
+    scan_sync_wait,
+)
 
 SCAN_FLOW_EXPORTS = (
     "scan_root",
     "scan_dashboard",
     "scan_stock",
+    "scan_stock_history",
     "scan_kits_view",
     "scan_local_document_helper_installer",
     "scan_cartons_ready",
@@ -69,6 +77,7 @@ SCAN_FLOW_EXPORTS = (
     "scan_shipment_track_legacy",
     "scan_out",
     "scan_sync",
+    "scan_sync_wait",
     "scan_admin_contacts",
     "scan_admin_products",
     "scan_product_labels",
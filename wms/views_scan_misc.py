@@ -1,3 +1,7 @@
+import hashlib
+import json
+
+from django.contrib.staticfiles.storage import staticfiles_storage
 from django.http import HttpResponse
 from django.shortcuts import render
 from django.utils.html import format_html
@@ -13,16 +17,23 @@ ACTIVE_UI_LAB = "ui_lab"
 SHELL_CLASS_WIDE = "scan-shell-wide"
 SCAN_SW_ALLOWED_SCOPE = "/scan/"
 CACHE_CONTROL_NO_CACHE = "no-cache"
-SCAN_SERVICE_WORKER_VERSION = "52"
-
-SERVICE_WORKER_JS = """const CACHE_NAME = 'wms-scan-v__VERSION__';
-const ASSETS = [
-  '/static/scan/scan.css',
-  '/static/scan/scan.js',
-  '/static/scan/zxing.min.js',
-  '/static/scan/manifest.json',
-  '/static/scan/icon.png'
-];
+# Bump only when the worker logic changes: asset changes rename the cache through their
+# hashed URLs.
+SCAN_SERVICE_WORKER_VERSION = "54"
+# Critical shell assets, cached at install.
+SCAN_SERVICE_WORKER_PRECACHE = (
+    "scan/scan.css",
+    "scan/scan.js",
+    "scan/manifest.json",
+    "scan/icon-192.png",
+)
+# Cached on first use so that install does not download them: the scanner library is only
+# fetched when a camera is opened.
+SCAN_SERVICE_WORKER_RUNTIME_CACHE = ("scan/zxing.min.js",)
+
+SERVICE_WORKER_JS = """const CACHE_NAME = '__CACHE_NAME__';
+const ASSETS = __ASSETS__;
+const RUNTIME_ASSETS = new Set(__RUNTIME_ASSETS__);
 
 self.addEventListener('install', event => {
   self.skipWaiting();
@@ -50,11 +61,27 @@ self.addEventListener('fetch', event => {
     );
     return;
   }
+  if (RUNTIME_ASSETS.has(new URL(event.request.url).pathname)) {
+    event.respondWith(
+      caches.open(CACHE_NAME).then(cache => cache.match(event.request).then(cached => {
+        if (cached) {
+          return cached;
+        }
+        return fetch(event.request).then(response => {
+          if (response.ok) {
+            cache.put(event.request, response.clone());
+          }
+          return response;
+        });
+      }))
+    );
+    return;
+  }
   event.respondWith(
     caches.match(event.request).then(response => response || fetch(event.request))
   );
 });
-""".replace("__VERSION__", SCAN_SERVICE_WORKER_VERSION)
+"""
 
 
 def _build_faq_context():
@@ -76,8 +103,27 @@ def _build_ui_lab_context():
     }
 
 
+def _service_worker_cache_name(asset_urls) -> str:
+    digest = hashlib.sha256(json.dumps(asset_urls).encode()).hexdigest()[:12]
+    return f"wms-scan-v{SCAN_SERVICE_WORKER_VERSION}-{digest}"
+
+
+def _build_service_worker_js():
+    # Resolved per request so that the worker caches the hashed asset names and a new
+    # collectstatic build switches to a new cache.
+    assets = [staticfiles_storage.url(name) for name in SCAN_SERVICE_WORKER_PRECACHE]
+    runtime_assets = [staticfiles_storage.url(name) for name in SCAN_SERVICE_WORKER_RUNTIME_CACHE]
+    return (
+        SERVICE_WORKER_JS.replace(
+            "__CACHE_NAME__", _service_worker_cache_name(assets + runtime_assets)
+        )
+        .replace("__ASSETS__", json.dumps(assets))
+        .replace("__RUNTIME_ASSETS__", json.dumps(runtime_assets))
+    )
+
+
 def _build_service_worker_response():
-    response = HttpResponse(SERVICE_WORKER_JS, content_type="application/javascript")
+    response = HttpResponse(_build_service_worker_js(), content_type="application/javascript")
     response["Cache-Control"] = CACHE_CONTROL_NO_CACHE
     response["Service-Worker-Allowed"] = SCAN_SW_ALLOWED_SCOPE
     return response
@@ -1,6 +1,7 @@
 import logging
 
 from django.contrib import messages
+from django.core.paginator import Paginator
 from django.db.models import Count, Q
 from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect, render
@@ -36,6 +37,7 @@ from .prepare_kits_helpers import (
     build_prepare_kits_picking_context,
     prepare_kits,
 )
+from .qr_codes import shipment_qr_data_uri
 from .runtime_settings import is_shipment_track_legacy_enabled
 from .scan_helpers import (
     build_carton_formats,
@@ -97,6 +99,7 @@ from .workflow_observability import log_shipment_case_closed
 logger = logging.getLogger(__name__)
 
 TEMPLATE_CARTONS_READY = "scan/cartons_ready.html"
+CARTONS_READY_PAGE_SIZE = 100
 TEMPLATE_KITS_VIEW = "scan/kits_view.html"
 TEMPLATE_PREPARE_KITS = "scan/prepare_kits.html"
 TEMPLATE_SHIPMENTS_READY = "scan/shipments_ready.html"
@@ -297,13 +300,13 @@ def scan_cartons_ready(request):
     carton_capacity_cm3 = get_carton_capacity_cm3()
 
     cartons_qs = (
-        Carton.objects.filter(cartonitem__isnull=False)
+        Carton.objects.filter(item_count__gt=0)
         .select_related("shipment", "current_location", "preassigned_destination")
         .prefetch_related("cartonitem_set__product_lot__product")
-        .distinct()
-        .order_by("-created_at")
+        .order_by("-created_at", "-id")
     )
-    cartons = build_cartons_ready_rows(cartons_qs, carton_capacity_cm3=carton_capacity_cm3)
+    page = Paginator(cartons_qs, CARTONS_READY_PAGE_SIZE).get_page(request.GET.get("page"))
+    cartons = build_cartons_ready_rows(page.object_list, carton_capacity_cm3=carton_capacity_cm3)
 
     return render(
         request,
@@ -311,6 +314,7 @@ def scan_cartons_ready(request):
         {
             "active": ACTIVE_CARTONS_READY,
             "cartons": cartons,
+            "page_obj": page,
             "carton_status_choices": sorted_choices(
                 [
                     (CartonStatus.DRAFT, CartonStatus.DRAFT.label),
@@ -715,11 +719,9 @@ def scan_shipment_edit(request, shipment_id):
         messages.error(request, _("Expédition non modifiable."))
         return redirect("scan:scan_shipments_ready")
 
-    shipment.ensure_qr_code(request=request)
-
-    assigned_cartons_qs = shipment.carton_set.prefetch_related(
-        "cartonitem_set__product_lot__product"
-    ).order_by("code")
+    assigned_cartons_qs = shipment.carton_set.select_related("preassigned_destination").order_by(
+        "code"
+    )
     assigned_cartons = list(assigned_cartons_qs)
     assigned_carton_options = build_carton_options(assigned_cartons)
     related_order = None
@@ -788,6 +790,7 @@ def scan_shipment_edit(request, shipment_id):
             "is_edit": True,
             "shipment": shipment,
             "tracking_url": shipment.get_tracking_url(request=request),
+            "shipment_qr_url": shipment_qr_data_uri(shipment, request=request),
             "documents": documents,
             "carton_docs": carton_docs,
             "receipt_allocations": _build_receipt_allocation_summary(shipment),
@@ -798,7 +801,6 @@ def scan_shipment_edit(request, shipment_id):
 @require_http_methods(["GET", "POST"])
 def scan_shipment_track(request, tracking_token):
     shipment = get_object_or_404(Shipment, tracking_token=tracking_token)
-    shipment.ensure_qr_code(request=request)
     source = request.POST if request.method == "POST" else request.GET
     return_to = _normalize_return_to(source.get("return_to"))
     last_event = shipment.tracking_events.order_by("-created_at").first()
@@ -854,7 +856,6 @@ def scan_shipment_track_legacy(request, shipment_ref):
             "path": request.path,
         },
     )
-    shipment.ensure_qr_code(request=request)
     response = _render_shipment_tracking(
         request,
         shipment=shipment,
@@ -2,15 +2,16 @@ from django.http import JsonResponse
 from django.shortcuts import render
 from django.views.decorators.http import require_http_methods
 
+from .change_notifications import current_change_state, wait_for_change
 from .forms import ScanOutForm, ScanStockUpdateForm
-from .models import WmsChange
 from .scan_helpers import build_location_data, build_product_options
 from .stock_out_handlers import handle_stock_out_post
 from .stock_update_handlers import handle_stock_update_post
-from .stock_view_helpers import build_stock_context
+from .stock_view_helpers import build_stock_context, build_stock_history_context
 from .view_permissions import scan_staff_required
 
 TEMPLATE_STOCK = "scan/stock.html"
+TEMPLATE_STOCK_HISTORY = "scan/stock_history.html"
 TEMPLATE_STOCK_UPDATE = "scan/stock_update.html"
 TEMPLATE_OUT = "scan/out.html"
 
@@ -45,11 +46,11 @@ def _render_scan_out(request, *, form, product_options):
     )
 
 
-def _serialize_sync_state(state):
-    return {
-        "version": state.version,
-        "changed_at": state.last_changed_at.isoformat(),
-    }
+def _parse_known_version(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
 
 
 @scan_staff_required
@@ -57,6 +58,12 @@ def scan_stock(request):
     return render(request, TEMPLATE_STOCK, build_stock_context(request))
 
 
+@scan_staff_required
+@require_http_methods(["GET"])
+def scan_stock_history(request):
+    return render(request, TEMPLATE_STOCK_HISTORY, build_stock_history_context(request))
+
+
 @scan_staff_required
 @require_http_methods(["GET", "POST"])
 def scan_stock_update(request):
@@ -90,5 +97,11 @@ def scan_out(request):
 @scan_staff_required
 @require_http_methods(["GET"])
 def scan_sync(request):
-    state = WmsChange.get_state()
-    return JsonResponse(_serialize_sync_state(state))
+    return JsonResponse(current_change_state())
+
+
+@scan_staff_required
+@require_http_methods(["GET"])
+def scan_sync_wait(request):
+    known_version = _parse_known_version(request.GET.get("version"))
+    return JsonResponse(wait_for_change(known_version))